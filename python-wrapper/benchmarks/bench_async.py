@@ -0,0 +1,98 @@
+"""
+Benchmark: event-loop responsiveness and requests/sec under concurrent load
+
+Runs the same number of concurrent create_presentation_with_theme requests
+two ways inside one event loop: calling the sync client directly from the
+coroutines, and awaiting AsyncDocLayerClient. A ticker task sleeps 1 ms in a
+loop and records how late each wake-up is; that lag is how long any other
+request on the loop would have been stalled.
+
+Run from the python-wrapper directory:
+
+    python benchmarks/bench_async.py [requests] [concurrency]
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from doclayer_python import AsyncDocLayerClient, DocLayerClient
+
+TICK = 0.001
+
+
+async def _ticker(lags: list, stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(TICK)
+        lags.append((loop.time() - start - TICK) * 1000.0)
+
+
+async def _measure(requests: int, concurrency: int, call) -> tuple:
+    lags: list = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(lags, stop))
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with gate:
+            await call(i)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await ticker
+    return requests / elapsed, sorted(lags) or [0.0]
+
+
+async def bench_blocking(client: DocLayerClient, requests: int, concurrency: int) -> tuple:
+    async def call(i: int) -> None:
+        client.create_presentation_with_theme(None, title=f"Deck {i}", font_name="Arial")
+
+    return await _measure(requests, concurrency, call)
+
+
+async def bench_async(client: AsyncDocLayerClient, requests: int, concurrency: int) -> tuple:
+    async def call(i: int) -> None:
+        await client.create_presentation_with_theme(None, title=f"Deck {i}", font_name="Arial")
+
+    return await _measure(requests, concurrency, call)
+
+
+def _summary(name: str, result: tuple) -> None:
+    throughput, lags = result
+    p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))]
+    print(f"{name:<22} {throughput:8.1f} req/s   loop lag p50 {lags[len(lags) // 2]:7.2f} ms"
+          f"   p99 {p99:7.2f} ms   max {lags[-1]:7.2f} ms")
+
+
+async def _main(requests: int, concurrency: int) -> None:
+    sync_client = DocLayerClient()
+    sync_client.warmup()
+
+    async with AsyncDocLayerClient(max_workers=os.cpu_count(), max_concurrency=concurrency) as async_client:
+        await async_client.warmup()
+
+        _summary("sync in coroutine", await bench_blocking(sync_client, requests, concurrency))
+        _summary("AsyncDocLayerClient", await bench_async(async_client, requests, concurrency))
+
+
+def main(requests: int = 200, concurrency: int = 16) -> None:
+    print("DocLayer asyncio benchmark")
+    print("=" * 50)
+    print(f"{requests} requests, {concurrency} concurrent, {os.cpu_count()} pool threads")
+    asyncio.run(_main(requests, concurrency))
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    )
@@ -0,0 +1,48 @@
+"""
+Benchmark: batch deck generation throughput vs number of worker processes
+
+Run from the python-wrapper directory:
+
+    python benchmarks/bench_batch.py [decks]
+"""
+
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import the package
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import doclayer_python
+
+
+def _specs(count: int):
+    for i in range(count):
+        yield {
+            "title": f"Deck {i}",
+            "subtitle": "Batch benchmark",
+            "font_name": "Arial",
+            "accent_colors": ["FF5733", "33FF57", "3357FF", "F3FF33"],
+        }
+
+
+def main(decks: int = 2000) -> None:
+    print("DocLayer batch benchmark")
+    print("=" * 50)
+
+    baseline = None
+    workers = 1
+    while workers <= multiprocessing.cpu_count():
+        start = time.perf_counter()
+        failures = sum(1 for result in doclayer_python.generate_batch(_specs(decks), workers=workers) if not result.ok)
+        elapsed = time.perf_counter() - start
+
+        throughput = decks / elapsed
+        baseline = baseline or throughput
+        print(f"workers={workers:<3} {throughput:9.1f} decks/s   speedup {throughput / baseline:5.2f}x   failures {failures}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
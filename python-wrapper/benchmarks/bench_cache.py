@@ -0,0 +1,58 @@
+"""
+Benchmark: latency of identical requests with and without the output cache
+
+Run from the python-wrapper directory:
+
+    python benchmarks/bench_cache.py [iterations]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path to import the package
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from doclayer_python import DocLayerClient, OutputCache
+
+DECK = {
+    "font_name": "Arial",
+    "accent_colors": ["FF5733", "33FF57", "3357FF", "F3FF33"],
+    "slides": [{"title": f"Slide {i}", "textboxes": [{"text": "Body text"}]} for i in range(20)],
+}
+
+
+def _median_ms(client: DocLayerClient, iterations: int) -> float:
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        client.render_deck(None, DECK)
+        timings.append((time.perf_counter() - start) * 1000.0)
+    return sorted(timings)[len(timings) // 2]
+
+
+def main(iterations: int = 200) -> None:
+    print("DocLayer output cache benchmark")
+    print("=" * 50)
+
+    uncached = DocLayerClient()
+    uncached.warmup()
+    build_ms = _median_ms(uncached, iterations)
+
+    memory_cache = OutputCache()
+    memory_ms = _median_ms(DocLayerClient(output_cache=memory_cache), iterations)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        DocLayerClient(output_cache=OutputCache(disk_dir=cache_dir)).render_deck(None, DECK)
+        # max_bytes=0 keeps nothing in memory, so every lookup is served from disk
+        disk_ms = _median_ms(DocLayerClient(output_cache=OutputCache(max_bytes=0, disk_dir=cache_dir)), iterations)
+
+    print(f"Rebuild every request (p50):  {build_ms:8.3f} ms")
+    print(f"Memory cache hit (p50):       {memory_ms:8.3f} ms   {build_ms / memory_ms:6.1f}x")
+    print(f"Disk cache hit (p50):         {disk_ms:8.3f} ms   {build_ms / disk_ms:6.1f}x")
+    print(f"Memory cache stats: {memory_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
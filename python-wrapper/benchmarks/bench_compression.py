@@ -0,0 +1,72 @@
+"""
+Benchmark: save time against output size for each package compression mode
+
+Renders a deck of text, table and picture slides with each mode. The
+pictures are random bytes, which deflate cannot shrink, like real PNG and
+JPEG data. Run from the python-wrapper directory:
+
+    python benchmarks/bench_compression.py [iterations]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path to import the package
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from doclayer_python import DocLayerClient
+
+MODES = [
+    ("optimal", {}),
+    ("fastest", {"compression": "fastest"}),
+    ("maximum", {"compression": "maximum"}),
+    ("store images", {"image_compression": "store"}),
+    ("store", {"compression": "store"}),
+]
+
+
+def _deck(images, options) -> dict:
+    deck = dict(options)
+    deck["slides"] = [
+        {
+            "title": f"Slide {i}",
+            "textboxes": [{"text": " ".join([f"Body text for slide {i}."] * 20)}],
+            "tables": [{"data": [[f"Row {r}", str(r * i), str(r + i)] for r in range(10)]}],
+            "pictures": [{"path": images[i % len(images)], "hpos": 7, "vpos": 2, "height": 3, "width": 4}],
+        }
+        for i in range(50)
+    ]
+    return deck
+
+
+def main(iterations: int = 20) -> None:
+    print("DocLayer package compression benchmark")
+    print("=" * 50)
+
+    client = DocLayerClient()
+    client.warmup()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        images = []
+        for i in range(5):
+            path = Path(tmp_dir) / f"image_{i}.png"
+            path.write_bytes(os.urandom(64 * 1024))
+            images.append(str(path))
+
+        print(f"{'Mode':<14}{'p50 (ms)':>10}{'Size (KB)':>12}")
+        for name, options in MODES:
+            deck = _deck(images, options)
+            timings = []
+            for _ in range(iterations):
+                start = time.perf_counter()
+                content = client.render_deck(None, deck)
+                timings.append((time.perf_counter() - start) * 1000.0)
+            median_ms = sorted(timings)[len(timings) // 2]
+            print(f"{name:<14}{median_ms:>10.2f}{len(content) / 1024:>12.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,101 @@
+"""
+Benchmark: the presentation build hot paths as seen from Python
+
+Covers presentation creation, theme application, N title slides, N
+rectangles and textboxes, an R x C table fill, N pictures and saving to
+disk, each through the public API. Time and allocations are recorded per
+case and can be checked against a stored baseline (see harness.py). The
+picture grid layout (DistributeAsGridInShape) has no Python entry point and
+is covered by the .NET PictureGridBenchmarks.
+
+Run from the python-wrapper directory:
+
+    python benchmarks/bench_extensions.py [--filter text] [--save-baseline | --check-baseline] [--threshold 10]
+"""
+
+import struct
+import sys
+import tempfile
+import zlib
+from pathlib import Path
+
+# Add parent directory to path to import the package
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import doclayer_python
+from harness import Case, run
+
+ACCENT_COLORS = ["FF5733", "33FF57", "3357FF", "F3FF33"]
+
+
+def _write_png(path: Path, width: int = 64, height: int = 48) -> None:
+    """Write a small solid-color PNG so picture cases need no fixture files"""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    rows = b"".join(b"\x00" + b"\x33\x66\x99" * width for _ in range(height))
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        f.write(chunk(b"IDAT", zlib.compress(rows)))
+        f.write(chunk(b"IEND", b""))
+
+
+def _slides_deck(count: int) -> dict:
+    return {"slides": [{"title": f"Slide {i}", "subtitle": "Benchmark"} for i in range(count)]}
+
+
+def _shapes_deck(count: int, kind: str) -> dict:
+    if kind == "textboxes":
+        items = [{"text": "Body text", "hpos": i % 10, "vpos": i // 10 % 5} for i in range(count)]
+    else:
+        items = [{"hpos": i % 10, "vpos": i // 10 % 5, "height": 1, "width": 1} for i in range(count)]
+    return {"slides": [{"title": "Shapes", kind: items}]}
+
+
+def _table_deck(rows: int, cols: int) -> dict:
+    data = [[f"{r},{c}" for c in range(cols)] for r in range(rows)]
+    return {"slides": [{"title": "Table", "tables": [doclayer_python.table_spec(data)]}]}
+
+
+def _pictures_deck(count: int, image: Path) -> dict:
+    pictures = [{"path": str(image), "hpos": i % 8, "vpos": i // 8 % 5, "width": 1} for i in range(count)]
+    return {"slides": [{"title": "Pictures", "pictures": pictures}]}
+
+
+def build_cases(tmp_dir: Path) -> list:
+    image = tmp_dir / "picture.png"
+    _write_png(image)
+    output = tmp_dir / "save.pptx"
+
+    def render(deck: dict):
+        return lambda: doclayer_python.render_deck(None, deck)
+
+    cases = [
+        Case("create_presentation", lambda: doclayer_python.create_title_slide(None, "Benchmark")),
+        Case("apply_theme", lambda: doclayer_python.create_presentation_with_theme(
+            None, "Benchmark", font_name="Arial", accent_colors=ACCENT_COLORS)),
+    ]
+    for count in (10, 100):
+        cases.append(Case(f"title_slides[n={count}]", render(_slides_deck(count)), rounds=10))
+    for count in (10, 100, 500):
+        cases.append(Case(f"rectangles[n={count}]", render(_shapes_deck(count, "shapes")), rounds=10))
+        cases.append(Case(f"textboxes[n={count}]", render(_shapes_deck(count, "textboxes")), rounds=10))
+    for rows, cols in ((50, 5), (200, 20)):
+        cases.append(Case(f"table_fill[{rows}x{cols}]", render(_table_deck(rows, cols)), rounds=10))
+    for count in (4, 16, 64):
+        cases.append(Case(f"pictures[n={count}]", render(_pictures_deck(count, image)), rounds=10))
+
+    save_deck = _slides_deck(100)
+    cases.append(Case("save_to_file[n=100]", lambda: doclayer_python.render_deck(str(output), save_deck), rounds=10))
+    return cases
+
+
+def main() -> int:
+    doclayer_python.preload()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        return run("DocLayer extension hot path benchmark", build_cases(Path(tmp_dir)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
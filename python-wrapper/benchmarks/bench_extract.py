@@ -0,0 +1,65 @@
+"""
+Benchmark: text extraction throughput over a corpus of decks, in files/sec
+
+Builds a corpus with render_deck, then runs extract_text with one reader and
+with one reader per core.
+
+Run from the python-wrapper directory:
+
+    python benchmarks/bench_extract.py [files]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from doclayer_python import extract_text, render_deck
+
+
+def build_corpus(directory: Path, files: int) -> list:
+    deck = {"slides": [
+        {
+            "title": f"Slide {i}",
+            "textboxes": [{"text": "Body text for the slide"}],
+            "tables": [{"data": [[f"{r},{c}" for c in range(5)] for r in range(10)]}],
+            "footnote": "Source: generated",
+        }
+        for i in range(20)
+    ]}
+    content = render_deck(None, deck)
+
+    paths = []
+    for i in range(files):
+        path = directory / f"deck{i}.pptx"
+        path.write_bytes(content)
+        paths.append(path)
+    return paths
+
+
+def bench(paths: list, workers: int) -> float:
+    start = time.perf_counter()
+    count = sum(1 for deck in extract_text(paths, workers=workers) if "error" not in deck)
+    elapsed = time.perf_counter() - start
+    assert count == len(paths)
+    return len(paths) / elapsed
+
+
+def main(files: int = 200) -> None:
+    print("DocLayer text extraction benchmark")
+    print("=" * 50)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = build_corpus(Path(tmp_dir), files)
+        # Warm up the runtime and JIT before timing
+        bench(paths[:4], 1)
+
+        cores = os.cpu_count() or 1
+        for workers in sorted({1, cores}):
+            print(f"{workers:>3} worker(s)   {bench(paths, workers):9.1f} files/s   ({files} files x 20 slides)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
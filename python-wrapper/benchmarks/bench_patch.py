@@ -0,0 +1,90 @@
+"""
+Benchmark: refreshing two figures in a large image-heavy deck
+
+Builds a 500-slide deck with a distinct random 32 KB image on every slide,
+then changes one title and one table cell. Compares rebuilding the whole
+deck from its spec with patch_deck, which writes only the two changed
+slides, and with a plain file copy as the floor. The .NET side is compared
+with an SDK open, edit and save in PatchSessionBenchmarks.
+Run from the python-wrapper directory:
+
+    python benchmarks/bench_patch.py [iterations]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path to import the package
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from doclayer_python import DocLayerClient
+
+SLIDES = 500
+
+
+def _deck(images, title: str) -> dict:
+    return {"slides": [
+        {
+            "title": title if i == SLIDES // 2 else f"Region {i}",
+            "tables": [{"data": [["Metric", "Value"], ["Revenue", "1.0"]]}],
+            "pictures": [{"path": images[i], "hpos": 6, "vpos": 2, "height": 3, "width": 3}],
+        }
+        for i in range(SLIDES)
+    ]}
+
+
+def _median(timings) -> float:
+    return sorted(timings)[len(timings) // 2]
+
+
+def main(iterations: int = 10) -> None:
+    print(f"DocLayer patch benchmark ({SLIDES} slides, one image each)")
+    print("=" * 50)
+
+    client = DocLayerClient()
+    client.warmup()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        images = []
+        for i in range(SLIDES):
+            path = Path(tmp_dir) / f"image_{i}.png"
+            path.write_bytes(os.urandom(32 * 1024))
+            images.append(str(path))
+
+        source = Path(tmp_dir) / "source.pptx"
+        output = Path(tmp_dir) / "patched.pptx"
+        client.render_deck(str(source), _deck(images, f"Region {SLIDES // 2}"))
+        print(f"Deck size: {source.stat().st_size / 1024 / 1024:.1f} MB")
+
+        rebuild = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            client.render_deck(str(output), _deck(images, "Refreshed"))
+            rebuild.append((time.perf_counter() - start) * 1000.0)
+
+        copy = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            shutil.copyfile(source, output)
+            copy.append((time.perf_counter() - start) * 1000.0)
+
+        patch = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            with client.patch_deck(source, output=output) as deck:
+                deck.set_title(SLIDES // 2 + 1, "Refreshed")
+                deck.set_table_cell(SLIDES // 2 + 2, 2, 2, "2.5")
+            patch.append((time.perf_counter() - start) * 1000.0)
+
+        print(f"{'Method':<22}{'p50 (ms)':>10}")
+        print(f"{'rebuild whole deck':<22}{_median(rebuild):>10.2f}")
+        print(f"{'patch_deck':<22}{_median(patch):>10.2f}")
+        print(f"{'file copy (floor)':<22}{_median(copy):>10.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
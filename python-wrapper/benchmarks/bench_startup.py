@@ -0,0 +1,81 @@
+"""
+Benchmark: import, runtime load, first-call and steady-state latency of the DocLayer Python wrapper
+
+Import time is measured in a fresh interpreter with `python -X importtime`;
+importing doclayer_python must not start the .NET runtime.
+
+Run from the python-wrapper directory:
+
+    python benchmarks/bench_startup.py [iterations]
+"""
+
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path to import the package
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import doclayer_python
+
+
+def measure_import_ms() -> float:
+    """Cumulative import time of doclayer_python in a fresh interpreter, from -X importtime"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import doclayer_python"],
+        cwd=str(Path(__file__).parent.parent),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == "doclayer_python":
+            return int(parts[1]) / 1000.0
+    raise RuntimeError(f"doclayer_python not found in -X importtime output:\n{result.stderr}")
+
+
+def _time_call(output_path: Path) -> float:
+    start = time.perf_counter()
+    doclayer_python.create_presentation_with_theme(
+        filepath=str(output_path),
+        title="Benchmark",
+        subtitle="Startup latency",
+        font_name="Arial",
+        accent_colors=["FF5733", "33FF57", "3357FF", "F3FF33"]
+    )
+    return (time.perf_counter() - start) * 1000.0
+
+
+def main(iterations: int = 50) -> None:
+    print("DocLayer startup benchmark")
+    print("=" * 50)
+
+    import_ms = measure_import_ms()
+
+    start = time.perf_counter()
+    doclayer_python.preload()
+    preload_ms = (time.perf_counter() - start) * 1000.0
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_path = Path(tmp_dir) / "bench.pptx"
+
+        first_ms = _time_call(output_path)
+
+        steady = sorted(_time_call(output_path) for _ in range(iterations))
+        p50 = steady[len(steady) // 2]
+        p99 = steady[min(len(steady) - 1, int(len(steady) * 0.99))]
+
+    print(f"import doclayer_python (fresh process):     {import_ms:8.2f} ms")
+    print(f"preload() (runtime + assembly load):        {preload_ms:8.2f} ms")
+    print(f"First call after preload (JIT):             {first_ms:8.2f} ms")
+    print(f"Steady state p50 over {iterations} calls:        {p50:8.2f} ms")
+    print(f"Steady state p99 over {iterations} calls:        {p99:8.2f} ms")
+    print(f"First call / steady p50:                     {first_ms / p50:8.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
@@ -0,0 +1,116 @@
+"""
+Benchmark: spawn-per-call bridge vs persistent doclayer_python.worker process
+
+Mirrors what the TypeScript bridge does: the spawn path starts a fresh
+interpreter for every deck, the worker path reuses one warm process and
+receives the PPTX bytes over the length-prefixed stdin/stdout protocol.
+
+Run from the python-wrapper directory:
+
+    python benchmarks/bench_worker.py [iterations]
+"""
+
+import json
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+WRAPPER_DIR = Path(__file__).parent.parent
+
+SPAWN_SCRIPT = """
+import sys
+from doclayer_python import create_presentation_with_theme
+create_presentation_with_theme(sys.argv[1], title="Benchmark", subtitle="Spawn per call")
+"""
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(WRAPPER_DIR), env.get("PYTHONPATH")]))
+    return env
+
+
+def bench_spawn(iterations: int) -> list:
+    timings = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_path = str(Path(tmp_dir) / "bench.pptx")
+        for _ in range(iterations):
+            start = time.perf_counter()
+            subprocess.run(
+                [sys.executable, "-c", SPAWN_SCRIPT, output_path],
+                check=True, env=_env(), stdout=subprocess.DEVNULL
+            )
+            with open(output_path, "rb") as f:
+                f.read()
+            timings.append((time.perf_counter() - start) * 1000.0)
+    return timings
+
+
+def _read_exact(stream, size: int) -> bytes:
+    data = b""
+    while len(data) < size:
+        chunk = stream.read(size - len(data))
+        if not chunk:
+            raise EOFError("Worker closed its output")
+        data += chunk
+    return data
+
+
+def bench_worker(iterations: int) -> list:
+    worker = subprocess.Popen(
+        [sys.executable, "-m", "doclayer_python.worker"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=_env()
+    )
+
+    def call(request_id: int) -> bytes:
+        payload = json.dumps({
+            "id": request_id,
+            "method": "create_presentation_with_theme",
+            "params": {"title": "Benchmark", "subtitle": "Persistent worker"}
+        }).encode("utf-8")
+        worker.stdin.write(struct.pack(">I", len(payload)) + payload)
+        worker.stdin.flush()
+
+        (header_length,) = struct.unpack(">I", _read_exact(worker.stdout, 4))
+        header = json.loads(_read_exact(worker.stdout, header_length))
+        (body_length,) = struct.unpack(">I", _read_exact(worker.stdout, 4))
+        body = _read_exact(worker.stdout, body_length)
+        if not header["ok"]:
+            raise RuntimeError(header["error"])
+        return body
+
+    try:
+        # First call absorbs worker startup, as it would once per pool process
+        call(0)
+
+        timings = []
+        for i in range(iterations):
+            start = time.perf_counter()
+            call(i + 1)
+            timings.append((time.perf_counter() - start) * 1000.0)
+        return timings
+    finally:
+        worker.stdin.close()
+        worker.wait()
+
+
+def _summary(name: str, timings: list) -> None:
+    timings = sorted(timings)
+    p50 = timings[len(timings) // 2]
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+    print(f"{name:<20} p50 {p50:9.2f} ms   p99 {p99:9.2f} ms   {1000.0 / p50:8.1f} decks/s")
+
+
+def main(iterations: int = 20) -> None:
+    print("DocLayer bridge benchmark")
+    print("=" * 50)
+    _summary("spawn per call", bench_spawn(iterations))
+    _summary("persistent worker", bench_worker(iterations))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,221 @@
+"""
+Benchmark harness with stored baselines and a regression threshold
+
+A small stand-in for pytest-benchmark that needs no extra dependencies.
+Each case is timed over several rounds after a warmup, then run once more
+to measure allocations: Python-side with tracemalloc and .NET-side with
+GC.GetTotalAllocatedBytes. Results can be saved as a baseline and later
+runs checked against it:
+
+    python benchmarks/bench_extensions.py --save-baseline
+    python benchmarks/bench_extensions.py --check-baseline --threshold 10
+
+A case regresses when its median time or either allocation figure exceeds
+the baseline by more than the threshold. Baselines are only comparable on
+the machine they were recorded on.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_BASELINE_PATH = Path(__file__).parent / "baselines" / "python.json"
+DEFAULT_THRESHOLD_PERCENT = 10.0
+
+# Allocation differences below this are interpreter/runtime noise, not our code
+ALLOCATION_NOISE_BYTES = 1024
+
+
+class Case:
+    """One named benchmark: a zero-argument callable and how often to run it"""
+
+    __slots__ = ("name", "func", "rounds", "warmup")
+
+    def __init__(self, name: str, func: Callable[[], Any], rounds: int = 20, warmup: int = 3):
+        self.name = name
+        self.func = func
+        self.rounds = rounds
+        self.warmup = warmup
+
+
+def _dotnet_allocated_bytes() -> Optional[int]:
+    """Bytes allocated by the .NET runtime so far, or None before it is loaded"""
+    if "System" not in sys.modules:
+        return None
+    import System
+    return int(System.GC.GetTotalAllocatedBytes(True))
+
+
+def measure(case: Case) -> Dict[str, Any]:
+    """Time a case and measure the allocations of a single run"""
+    for _ in range(case.warmup):
+        case.func()
+
+    timings = []
+    for _ in range(case.rounds):
+        start = time.perf_counter_ns()
+        case.func()
+        timings.append(time.perf_counter_ns() - start)
+
+    # Allocations are measured on a separate run so tracemalloc does not skew the timings
+    dotnet_before = _dotnet_allocated_bytes()
+    tracemalloc.start()
+    try:
+        case.func()
+        _, python_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    dotnet_after = _dotnet_allocated_bytes()
+
+    return {
+        "median_ns": int(statistics.median(timings)),
+        "mean_ns": int(statistics.fmean(timings)),
+        "min_ns": min(timings),
+        "stdev_ns": int(statistics.stdev(timings)) if len(timings) > 1 else 0,
+        "rounds": case.rounds,
+        "python_peak_bytes": python_peak,
+        "dotnet_allocated_bytes": (
+            dotnet_after - dotnet_before if dotnet_before is not None and dotnet_after is not None else None
+        ),
+    }
+
+
+def _format_ns(ns: float) -> str:
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.2f} {unit}"
+    return f"{ns:.0f} ns"
+
+
+def _format_bytes(count: Optional[int]) -> str:
+    if count is None:
+        return "-"
+    for unit, scale in (("MB", 1 << 20), ("KB", 1 << 10)):
+        if count >= scale:
+            return f"{count / scale:.1f} {unit}"
+    return f"{count} B"
+
+
+def _load(path: Path) -> Optional[Dict[str, Any]]:
+    if not path.exists():
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _save(path: Path, results: Dict[str, Dict[str, Any]]) -> None:
+    # Merge so a filtered run only replaces the cases it ran
+    baseline = _load(path) or {"benchmarks": {}}
+    baseline["environment"] = f"{platform.platform()}, Python {platform.python_version()}"
+    baseline["recorded_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    baseline["benchmarks"].update(results)
+    baseline["benchmarks"] = dict(sorted(baseline["benchmarks"].items()))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2)
+        f.write("\n")
+    print(f"Saved {len(results)} benchmark(s) to {path}")
+
+
+def _grew(current: Optional[int], previous: Optional[int], limit: float) -> bool:
+    if current is None or previous is None:
+        return False
+    return current - previous > ALLOCATION_NOISE_BYTES and current > previous * limit
+
+
+def compare(baseline: Dict[str, Any], results: Dict[str, Dict[str, Any]], threshold_percent: float) -> bool:
+    """
+    Print each case's time and allocation ratios against the baseline
+
+    Returns:
+        True if any case regressed
+    """
+    limit = 1 + threshold_percent / 100
+    regressed = False
+
+    print()
+    print(f"Baseline comparison (threshold {threshold_percent:g}%, "
+          f"recorded {baseline.get('recorded_at')} on {baseline.get('environment')})")
+    print(f"{'Benchmark':<44} {'Time':>8} {'Py alloc':>9} {'.NET alloc':>10}  Status")
+
+    for name, current in sorted(results.items()):
+        previous = baseline["benchmarks"].get(name)
+        if previous is None:
+            print(f"{name:<44} {'':>8} {'':>9} {'':>10}  new")
+            continue
+
+        time_ratio = current["median_ns"] / previous["median_ns"]
+        reasons = []
+        if time_ratio > limit:
+            reasons.append("time")
+        for key, label in (("python_peak_bytes", "py alloc"), ("dotnet_allocated_bytes", ".NET alloc")):
+            if _grew(current.get(key), previous.get(key), limit):
+                reasons.append(label)
+
+        def ratio(key: str) -> str:
+            if not current.get(key) or not previous.get(key):
+                return "-"
+            return f"{current[key] / previous[key]:.2f}x"
+
+        if reasons:
+            status = f"REGRESSED ({', '.join(reasons)})"
+            regressed = True
+        else:
+            status = "improved" if time_ratio < 1 / limit else "ok"
+
+        print(f"{name:<44} {time_ratio:>7.2f}x {ratio('python_peak_bytes'):>9} "
+              f"{ratio('dotnet_allocated_bytes'):>10}  {status}")
+
+    print("Benchmarks regressed against the baseline" if regressed else "No regressions against the baseline")
+    return regressed
+
+
+def run(title: str, cases: List[Case], argv: Optional[List[str]] = None) -> int:
+    """
+    Run the cases and handle --filter, --save-baseline, --check-baseline and --threshold
+
+    Returns:
+        Process exit code: 1 if --check-baseline found a regression, otherwise 0
+    """
+    parser = argparse.ArgumentParser(description=title)
+    parser.add_argument("--filter", help="only run cases whose name contains this text")
+    parser.add_argument("--save-baseline", action="store_true", help="record the results as the baseline")
+    parser.add_argument("--check-baseline", action="store_true", help="fail if a case regressed against the baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD_PERCENT,
+                        help="allowed slowdown or allocation growth, in percent (default: %(default)s)")
+    parser.add_argument("--baseline-path", type=Path, default=DEFAULT_BASELINE_PATH)
+    args = parser.parse_args(argv)
+
+    print(title)
+    print("=" * 50)
+    print(f"{'Benchmark':<44} {'Median':>10} {'Stdev':>10} {'Py alloc':>9} {'.NET alloc':>10}")
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for case in cases:
+        if args.filter and args.filter not in case.name:
+            continue
+        result = measure(case)
+        results[case.name] = result
+        print(f"{case.name:<44} {_format_ns(result['median_ns']):>10} {_format_ns(result['stdev_ns']):>10} "
+              f"{_format_bytes(result['python_peak_bytes']):>9} {_format_bytes(result['dotnet_allocated_bytes']):>10}")
+
+    exit_code = 0
+    if args.check_baseline:
+        baseline = _load(args.baseline_path)
+        if baseline is None:
+            print(f"\nNo baseline at {args.baseline_path}; run with --save-baseline first")
+        elif compare(baseline, results, args.threshold):
+            exit_code = 1
+
+    if args.save_baseline:
+        _save(args.baseline_path, results)
+
+    return exit_code
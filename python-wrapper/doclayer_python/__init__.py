@@ -3,29 +3,44 @@ DocLayer Python Client Library
 Provides Python bindings for the C# DocLayer.Core library
 """
 
+import json
 import os
 import sys
-from typing import Dict, List, Optional, Union
+import threading
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
 from pathlib import Path
 
-try:
-    from pathlib import Path as _Path
-    from clr_loader import get_coreclr
-    from pythonnet import set_runtime
-    
-    # Set up .NET runtime
-    _bin_path = _Path(__file__).parent / "bin"
-    _runtime = get_coreclr()
-    set_runtime(_runtime)
-    
-    import clr
-    # Add the bin directory to assembly search path
-    import sys
-    sys.path.append(str(_bin_path.absolute()))
-except ImportError:
-    raise ImportError(
-        "pythonnet is required. Install with: pip install pythonnet"
-    )
+__version__ = "0.1.0"
+
+from . import instrumentation as _instrumentation
+from .cache import OutputCache, spec_key as _spec_key
+from .instrumentation import instrument
+from .tables import table_spec
+
+# Nothing .NET is loaded at import time: the runtime and DocLayer.Core are
+# loaded by the first call that needs them, or up front by preload().
+_bin_path = Path(__file__).parent / "bin"
+
+# Public names whose modules are only imported when first used
+# (asyncio and multiprocessing alone add tens of milliseconds to import)
+_LAZY_EXPORTS = {
+    'AsyncDocLayerClient': '.aio',
+    'BatchResult': '.batch',
+    'DeckTemplate': '.template',
+    'DeckPatch': '.patch',
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 
 class DocLayerError(Exception):
@@ -33,93 +48,339 @@ class DocLayerError(Exception):
     pass
 
 
+class _AssemblyCache:
+    """Process-wide holder for the loaded DocLayer.Core assemblies and types"""
+
+    def __init__(self, bin_path: Path):
+        self.bin_path = bin_path
+
+        import clr
+        import System
+
+        # Add bin directory to .NET assembly search path (registered once per process)
+        System.AppDomain.CurrentDomain.AssemblyResolve += _assembly_resolver
+
+        # Add references to key assemblies with full paths
+        clr.AddReference(str((bin_path / "DocumentFormat.OpenXml.dll").absolute()))
+        clr.AddReference(str((bin_path / "DocLayer.Core.dll").absolute()))
+
+        # Now import the .NET namespaces
+        from DocumentFormat.OpenXml.Packaging import PresentationDocument
+        from DocumentFormat.OpenXml.Presentation import Slide
+        from OpenXMLExtensions import SlideExtensions, ShapeTreeExtensions, PresentationExtensions, PresentationHelperMethods
+        from DocLayer.Core import (
+            PresentationBuilder, PresentationHelper, PresentationTemplateCache, PresentationTextExtractor, StreamingDeckWriter,
+            ThemeRegistry, DocLayerDiagnostics, PackageCompression, DeckMerger, LayoutMergeMode, DeckTemplate,
+            TermStyler, DeckPatchSession
+        )
+
+        self.PresentationDocument = PresentationDocument
+        self.Slide = Slide
+        self.SlideExtensions = SlideExtensions
+        self.ShapeTreeExtensions = ShapeTreeExtensions
+        self.PresentationExtensions = PresentationExtensions
+        self.PresentationHelperMethods = PresentationHelperMethods
+        self.PresentationBuilder = PresentationBuilder
+        self.PresentationHelper = PresentationHelper
+        self.PresentationTemplateCache = PresentationTemplateCache
+        self.StreamingDeckWriter = StreamingDeckWriter
+        self.PresentationTextExtractor = PresentationTextExtractor
+        self.ThemeRegistry = ThemeRegistry
+        self.DocLayerDiagnostics = DocLayerDiagnostics
+        self.PackageCompression = PackageCompression
+        self.DeckMerger = DeckMerger
+        self.LayoutMergeMode = LayoutMergeMode
+        self.DeckTemplate = DeckTemplate
+        self.TermStyler = TermStyler
+        self.DeckPatchSession = DeckPatchSession
+
+
+_assembly_cache: Optional[_AssemblyCache] = None
+_assembly_cache_lock = threading.Lock()
+
+
+def _assembly_resolver(sender, args):
+    """Resolve assembly dependencies from bin directory"""
+    try:
+        import System
+        assembly_name = System.Reflection.AssemblyName(args.Name)
+        dll_path = _bin_path / f"{assembly_name.Name}.dll"
+        if dll_path.exists():
+            return System.Reflection.Assembly.LoadFrom(str(dll_path.absolute()))
+    except:
+        pass
+    return None
+
+
+def _load_runtime() -> None:
+    """
+    Start CoreCLR for pythonnet, unless the host process already chose a runtime
+
+    Raises:
+        DocLayerError: If pythonnet or the .NET runtime is not available
+    """
+    try:
+        import pythonnet
+        from clr_loader import get_coreclr
+    except ImportError as e:
+        raise DocLayerError(f"pythonnet is required. Install with: pip install pythonnet ({e})")
+
+    if pythonnet.get_runtime_info() is None:
+        try:
+            pythonnet.set_runtime(get_coreclr())
+        except Exception as e:
+            raise DocLayerError(f"Failed to start the .NET runtime: {e}")
+
+    # Add the bin directory to assembly search path
+    sys.path.append(str(_bin_path.absolute()))
+
+
+def _get_assembly_cache() -> _AssemblyCache:
+    """
+    Start the .NET runtime and load the C# DocLayer.Core assembly once per process
+
+    Safe to call from multiple threads; only the first caller pays for
+    runtime startup, AddReference and namespace resolution.
+    """
+    global _assembly_cache
+
+    cache = _assembly_cache
+    if cache is not None:
+        return cache
+
+    with _assembly_cache_lock:
+        if _assembly_cache is None:
+            start = time.perf_counter()
+            _load_runtime()
+
+            try:
+                dll_path = _bin_path / "DocLayer.Core.dll"
+                if not dll_path.exists():
+                    raise FileNotFoundError(f"DocLayer.Core.dll not found at {dll_path}")
+
+                _assembly_cache = _AssemblyCache(_bin_path)
+                _instrumentation.set_runtime_init_ms((time.perf_counter() - start) * 1000.0)
+
+            except Exception as e:
+                import traceback
+                error_details = traceback.format_exc()
+                raise DocLayerError(f"Failed to load C# assembly: {e}\n\nDetails:\n{error_details}")
+
+        return _assembly_cache
+
+
+def preload() -> None:
+    """
+    Start the .NET runtime and load DocLayer.Core now instead of on the first call
+
+    Importing doclayer_python does not touch .NET; use this at service
+    startup to move that cost (and any missing-runtime error) out of the
+    first request. warmup() additionally pre-JITs the build path.
+
+    Raises:
+        DocLayerError: If pythonnet, the .NET runtime or the assemblies are missing
+
+    Example:
+        >>> import doclayer_python
+        >>> doclayer_python.preload()
+    """
+    _get_assembly_cache()
+
+
+def _stream_to_bytes(stream) -> bytes:
+    """
+    Copy the contents of a .NET MemoryStream into Python bytes with a single copy
+
+    The stream's backing buffer is pinned and read directly through ctypes
+    rather than being marshalled element by element.
+    """
+    import ctypes
+    from System.Runtime.InteropServices import GCHandle, GCHandleType
+
+    length = int(stream.Length)
+    if length == 0:
+        return b""
+
+    buffer = stream.GetBuffer()
+    handle = GCHandle.Alloc(buffer, GCHandleType.Pinned)
+    try:
+        address = handle.AddrOfPinnedObject().ToInt64()
+        return ctypes.string_at(address, length)
+    finally:
+        handle.Free()
+
+
 class DocLayerClient:
-    """Python wrapper for C# DocLayer.Core library"""
+    """
+    Python wrapper for C# DocLayer.Core library
+    
+    Args:
+        on_metrics: Called after each create/render call with a dict of
+            per-phase timings and package sizes (see instrumentation.py).
+            Leave unset for no instrumentation overhead.
+        output_cache: OutputCache that serves repeated identical
+            create/render calls without rebuilding them (see cache.py)
+    """
     
-    def __init__(self):
+    def __init__(
+        self,
+        on_metrics: Optional[Callable[[Dict], None]] = None,
+        output_cache: Optional[OutputCache] = None
+    ):
+        self._on_metrics = on_metrics
+        self.output_cache = output_cache
+        
         # Load the C# assembly
         self._load_assembly()
         
     def _load_assembly(self):
-        """Load the C# DocLayer.Core assembly"""
-        try:
-            # Add reference to DocLayer.Core DLL
-            bin_path = Path(__file__).parent / "bin"
-            dll_path = bin_path / "DocLayer.Core.dll"
-            
-            if not dll_path.exists():
-                raise FileNotFoundError(f"DocLayer.Core.dll not found at {dll_path}")
-            
-            # Store bin path for assembly resolver
-            self._bin_path = bin_path
-            
-            # Add bin directory to .NET assembly search path
-            import System
-            System.AppDomain.CurrentDomain.AssemblyResolve += self._assembly_resolver
-            
-            # Add all DLLs from bin directory
-            import sys
-            sys.path.append(str(bin_path.absolute()))
-            
-            # Add references to key assemblies with full paths
-            clr.AddReference(str((bin_path / "DocumentFormat.OpenXml.dll").absolute()))
-            clr.AddReference(str((bin_path / "DocLayer.Core.dll").absolute()))
-            
-            # Now import the .NET namespaces
-            from DocumentFormat.OpenXml.Packaging import PresentationDocument
-            from DocumentFormat.OpenXml.Presentation import Slide
-            from OpenXMLExtensions import SlideExtensions, ShapeTreeExtensions, PresentationExtensions, PresentationHelperMethods
-            from DocLayer.Core import PresentationBuilder, PresentationHelper
-            
-            self.PresentationDocument = PresentationDocument
-            self.Slide = Slide
-            self.SlideExtensions = SlideExtensions
-            self.ShapeTreeExtensions = ShapeTreeExtensions
-            self.PresentationExtensions = PresentationExtensions
-            self.PresentationHelperMethods = PresentationHelperMethods
-            self.PresentationBuilder = PresentationBuilder
-            self.PresentationHelper = PresentationHelper
-            
-            
-        except Exception as e:
-            import traceback
-            error_details = traceback.format_exc()
-            raise DocLayerError(f"Failed to load C# assembly: {e}\n\nDetails:\n{error_details}")
-    
-    def _assembly_resolver(self, sender, args):
-        """Resolve assembly dependencies from bin directory"""
-        try:
-            import System
-            assembly_name = System.Reflection.AssemblyName(args.Name)
-            dll_path = self._bin_path / f"{assembly_name.Name}.dll"
-            if dll_path.exists():
-                return System.Reflection.Assembly.LoadFrom(str(dll_path.absolute()))
-        except:
-            pass
-        return None
-    
+        """Bind the process-wide DocLayer.Core types to this client"""
+        cache = _get_assembly_cache()
+
+        self._bin_path = cache.bin_path
+        self.PresentationDocument = cache.PresentationDocument
+        self.Slide = cache.Slide
+        self.SlideExtensions = cache.SlideExtensions
+        self.ShapeTreeExtensions = cache.ShapeTreeExtensions
+        self.PresentationExtensions = cache.PresentationExtensions
+        self.PresentationHelperMethods = cache.PresentationHelperMethods
+        self.PresentationBuilder = cache.PresentationBuilder
+        self.PresentationHelper = cache.PresentationHelper
+        self.PresentationTemplateCache = cache.PresentationTemplateCache
+        self.StreamingDeckWriter = cache.StreamingDeckWriter
+        self.PresentationTextExtractor = cache.PresentationTextExtractor
+        self.ThemeRegistry = cache.ThemeRegistry
+        self.DocLayerDiagnostics = cache.DocLayerDiagnostics
+        self.PackageCompression = cache.PackageCompression
+        self.DeckMerger = cache.DeckMerger
+        self.LayoutMergeMode = cache.LayoutMergeMode
+        self.DeckTemplate = cache.DeckTemplate
+        self.TermStyler = cache.TermStyler
+        self.DeckPatchSession = cache.DeckPatchSession
+
+    def warmup(self) -> None:
+        """
+        Pre-JIT the PresentationBuilder path by building and discarding a themed deck
+
+        Call once at service startup so the first real request does not pay
+        for JIT compilation of DocLayer.Core and the OpenXML SDK.
+        """
+        self.create_presentation_with_theme(
+            None,
+            title="warmup",
+            subtitle="warmup",
+            font_name="Calibri",
+            accent_colors=["4472C4", "ED7D31", "A5A5A5", "FFC000"]
+        )
+
+    def _create_in_memory(
+        self,
+        font_name: Optional[str] = None,
+        net_colors=None,
+        compression: Optional[str] = None,
+        image_compression: Optional[str] = None
+    ):
+        """Create a presentation backed by a .NET MemoryStream from the cached base package"""
+        import System
+        stream = System.IO.MemoryStream()
+        presentation_doc = self.PresentationTemplateCache.Shared.CreatePresentation(
+            stream, True, font_name, net_colors, self.PackageCompression.Parse(compression, image_compression)
+        )
+        return presentation_doc, stream
+
+    def _start_call(self, method: str):
+        """Recorder for the metrics of one call; a no-op unless on_metrics or instrument() is active"""
+        return _instrumentation.start_call(method, self.DocLayerDiagnostics, self._on_metrics)
+
+    def _lookup_cached(self, method: str, spec: Union[Dict, str], filepath: Optional[str], recorder):
+        """
+        Look a call up in the output cache
+
+        Returns:
+            (key, content): content is the cached package, already written to
+            filepath, or None on a miss; key is None when caching is off or
+            the call cannot be cached
+        """
+        cache = self.output_cache
+        if cache is None:
+            return None, None
+
+        with recorder.phase("cache"):
+            key = _spec_key(method, spec)
+            if key is None:
+                return None, None
+            content = cache.get(key)
+
+        if content is not None and filepath is not None:
+            with recorder.phase("io"):
+                with open(filepath, 'wb') as f:
+                    f.write(content)
+        return key, content
+
+    def _store_cached(self, key: Optional[str], content: bytes) -> None:
+        cache = self.output_cache
+        if key is not None and cache is not None:
+            cache.put(key, content)
+
+    def _finish(self, stream, filepath: Optional[str], recorder=_instrumentation.NULL_RECORDER) -> bytes:
+        """Copy the package bytes out of the stream and optionally write them to filepath"""
+        with recorder.phase("marshal"):
+            content = _stream_to_bytes(stream)
+            stream.Dispose()
+
+        if filepath is not None:
+            with recorder.phase("io"):
+                with open(filepath, 'wb') as f:
+                    f.write(content)
+
+        return content
+
     def create_title_slide(
         self, 
-        filepath: str, 
+        filepath: Optional[str], 
         title: str, 
         subtitle: Optional[str] = None,
-        footnote: Optional[str] = "Source:"
+        footnote: Optional[str] = "Source:",
+        compression: Optional[str] = None,
+        image_compression: Optional[str] = None
     ) -> bytes:
         """
         Create a PowerPoint presentation with a title slide
         
         Args:
-            filepath: Path where the presentation will be saved
+            filepath: Path where the presentation will be saved, or None to
+                only return the bytes without touching the filesystem
             title: Main title text
             subtitle: Subtitle text (optional)
             footnote: Footnote text (optional, defaults to "Source:")
+            compression: ZIP compression of the package parts: "optimal"
+                (default), "fastest", "store" (no compression, fastest save,
+                largest file) or "maximum" - optional
+            image_compression: Compression of PNG, JPEG and GIF parts, which
+                are already compressed; "store" skips deflating them -
+                optional, defaults to compression
             
         Returns:
             Bytes content of the created presentation file
         """
+        recorder = self._start_call("create_title_slide")
         try:
-            # Create presentation using PresentationHelper
-            presentation_doc = self.PresentationHelper.CreatePresentation(filepath, True)
+            cache_key, cached = self._lookup_cached(
+                "create_title_slide", {
+                    "title": title,
+                    "subtitle": subtitle,
+                    "footnote": footnote,
+                    "compression": compression,
+                    "image_compression": image_compression,
+                }, filepath, recorder
+            )
+            if cached is not None:
+                return cached
+
+            # Create presentation in memory using PresentationHelper
+            presentation_doc, stream = self._create_in_memory(
+                compression=compression, image_compression=image_compression
+            )
             
             try:
                 # Create PresentationBuilder
@@ -128,40 +389,48 @@ class DocLayerClient:
                 # Create title slide
                 builder.CreateTitleSlide(title, subtitle, footnote)
                 
-                # Save and dispose
-                presentation_doc.Save()
-                presentation_doc.Dispose()
+                # Close flushes the package into the stream
+                self.PresentationHelper.Close(presentation_doc, stream)
                 
             except Exception as e:
                 presentation_doc.Dispose()
+                stream.Dispose()
                 raise
                 
-            # Read and return file content
-            with open(filepath, 'rb') as f:
-                return f.read()
+            # Return the package bytes, writing them out only if a path was given
+            content = self._finish(stream, filepath, recorder)
+            self._store_cached(cache_key, content)
+            return content
                 
         except Exception as e:
             raise DocLayerError(f"Failed to create title slide: {e}")
+        finally:
+            recorder.finish()
     
     def create_presentation_with_theme(
         self,
-        filepath: str,
+        filepath: Optional[str],
         title: str,
         subtitle: Optional[str] = None,
         footnote: Optional[str] = "Source:",
         font_name: Optional[str] = None,
-        accent_colors: Optional[List[str]] = None
+        accent_colors: Optional[List[str]] = None,
+        compression: Optional[str] = None,
+        image_compression: Optional[str] = None
     ) -> bytes:
         """
         Create a PowerPoint presentation with custom theme and title slide
         
         Args:
-            filepath: Path where the presentation will be saved
+            filepath: Path where the presentation will be saved, or None to
+                only return the bytes without touching the filesystem
             title: Main title text
             subtitle: Subtitle text (optional)
             footnote: Footnote text (optional, defaults to "Source:")
             font_name: Font typeface name (e.g., "Arial", "Calibri") - optional
             accent_colors: List of 4 hex color codes for accent colors - optional
+            compression: Package compression, as for create_title_slide - optional
+            image_compression: Image part compression, as for create_title_slide - optional
             
         Returns:
             Bytes content of the created presentation file
@@ -175,62 +444,536 @@ class DocLayerClient:
             ...     accent_colors=["FF5733", "33FF57", "3357FF", "F3FF33"]
             ... )
         """
+        recorder = self._start_call("create_presentation_with_theme")
         try:
-            # Create presentation using PresentationHelper
-            presentation_doc = self.PresentationHelper.CreatePresentation(filepath, True)
+            if accent_colors and len(accent_colors) != 4:
+                raise ValueError("Must provide exactly 4 accent colors")
+
+            cache_key, cached = self._lookup_cached("create_presentation_with_theme", {
+                "title": title,
+                "subtitle": subtitle,
+                "footnote": footnote,
+                "font_name": font_name,
+                "accent_colors": list(accent_colors) if accent_colors else None,
+                "compression": compression,
+                "image_compression": image_compression,
+            }, filepath, recorder)
+            if cached is not None:
+                return cached
+
+            # Convert Python list to .NET List for accent colors
+            net_colors = None
+            if accent_colors:
+                with recorder.phase("marshal"):
+                    import System.Collections.Generic as Generic
+                    net_colors = Generic.List[str]()
+                    for color in accent_colors:
+                        net_colors.Add(color)
+            
+            # Clone the cached base package for this theme instead of building it from scratch
+            presentation_doc, stream = self._create_in_memory(font_name, net_colors, compression, image_compression)
             
             try:
                 # Create PresentationBuilder
                 builder = self.PresentationBuilder(presentation_doc)
                 
-                # Set theme if any theme parameters provided
-                if font_name or accent_colors:
-                    # Convert Python list to .NET List for accent colors
-                    net_colors = None
-                    if accent_colors:
-                        if len(accent_colors) != 4:
-                            raise ValueError("Must provide exactly 4 accent colors")
-                        import System.Collections.Generic as Generic
-                        net_colors = Generic.List[str]()
-                        for color in accent_colors:
-                            net_colors.Add(color)
-                    
-                    builder.SetPresentationTheme(font_name, net_colors)
-                
                 # Create title slide
                 builder.CreateTitleSlide(title, subtitle, footnote)
                 
-                # Save and dispose
-                presentation_doc.Save()
-                presentation_doc.Dispose()
+                # Close flushes the package into the stream
+                self.PresentationHelper.Close(presentation_doc, stream)
                 
             except Exception as e:
                 presentation_doc.Dispose()
+                stream.Dispose()
                 raise
                 
-            # Read and return file content
-            with open(filepath, 'rb') as f:
-                return f.read()
+            # Return the package bytes, writing them out only if a path was given
+            content = self._finish(stream, filepath, recorder)
+            self._store_cached(cache_key, content)
+            return content
                 
         except Exception as e:
             raise DocLayerError(f"Failed to create presentation with theme: {e}")
+        finally:
+            recorder.finish()
+
+    def render_deck(self, filepath: Optional[str], deck: Union[Dict, str]) -> bytes:
+        """
+        Render a multi-slide deck from a declarative spec in a single .NET call
+        
+        The whole deck is built in memory and saved once, so the cost of
+        crossing into .NET is paid once per deck rather than once per element.
+        
+        Args:
+            filepath: Path where the presentation will be saved, or None to
+                only return the bytes without touching the filesystem
+            deck: Deck spec as a dict or JSON string. Top-level keys are
+                "slides" (required), "font_name", "accent_colors",
+                "widescreen", "compression" and "image_compression" (see
+                create_title_slide). Each slide may have "title", "subtitle",
+                "footnote", "textboxes", "shapes", "tables" and "pictures";
+                positions and sizes are in inches
+            
+        Returns:
+            Bytes content of the created presentation file
+            
+        Example:
+            >>> pptx_bytes = client.render_deck("deck.pptx", {
+            ...     "font_name": "Arial",
+            ...     "slides": [
+            ...         {"title": "Q3 Review", "subtitle": "Board update"},
+            ...         {"title": "Revenue",
+            ...          "tables": [{"data": [["Region", "Q3"], ["EMEA", "4.2"]]}],
+            ...          "shapes": [{"type": "rectangle", "hpos": 8, "vpos": 2,
+            ...                      "height": 1, "width": 3, "text": "Up 12%", "fill": "4472C4"}]}
+            ...     ]
+            ... })
+        """
+        recorder = self._start_call("render_deck")
+        try:
+            if isinstance(deck, str):
+                deck_json = deck
+            else:
+                if not deck.get("slides"):
+                    raise ValueError("Deck spec must contain at least one slide")
+                accent_colors = deck.get("accent_colors")
+                if accent_colors and len(accent_colors) != 4:
+                    raise ValueError("Must provide exactly 4 accent colors")
+                with recorder.phase("marshal"):
+                    deck_json = json.dumps(deck)
+            
+            cache_key, cached = self._lookup_cached("render_deck", deck, filepath, recorder)
+            if cached is not None:
+                return cached
+
+            # One boundary crossing: parse, build and save happen entirely in .NET
+            stream = self.PresentationHelper.RenderDeck(deck_json)
+            content = self._finish(stream, filepath, recorder)
+            self._store_cached(cache_key, content)
+            return content
+                
+        except Exception as e:
+            raise DocLayerError(f"Failed to render deck: {e}")
+        finally:
+            recorder.finish()
+
+    def stream_deck(self, filepath: str, deck: Dict) -> int:
+        """
+        Write a very large deck to disk one slide at a time
+        
+        Each slide is sent to .NET on its own, written to its package part
+        and released, so memory stays bounded regardless of the slide count.
+        "slides" may be any iterable, including a generator.
+        
+        Args:
+            filepath: Path where the presentation will be saved
+            deck: Deck spec dict with the same keys as render_deck
+            
+        Returns:
+            Number of slides written
+            
+        Example:
+            >>> client.stream_deck("big.pptx", {
+            ...     "font_name": "Arial",
+            ...     "slides": ({"title": f"Store {i}"} for i in range(5000))
+            ... })
+            5000
+        """
+        try:
+            accent_colors = deck.get("accent_colors")
+            net_colors = None
+            if accent_colors:
+                if len(accent_colors) != 4:
+                    raise ValueError("Must provide exactly 4 accent colors")
+                import System.Collections.Generic as Generic
+                net_colors = Generic.List[str]()
+                for color in accent_colors:
+                    net_colors.Add(color)
+
+            slides = iter(deck.get("slides") or ())
+            first = next(slides, None)
+            if first is None:
+                raise ValueError("Deck spec must contain at least one slide")
+
+            writer = self.StreamingDeckWriter.Create(
+                str(filepath), deck.get("widescreen", True), deck.get("font_name"), net_colors,
+                self.PackageCompression.Parse(deck.get("compression"), deck.get("image_compression"))
+            )
+            try:
+                writer.WriteSlide(json.dumps(first))
+                for slide in slides:
+                    writer.WriteSlide(json.dumps(slide))
+                writer.Complete()
+                return writer.SlideCount
+            finally:
+                writer.Dispose()
+                
+        except Exception as e:
+            raise DocLayerError(f"Failed to stream deck: {e}")
+
+    def extract_text(self, paths: Iterable[Union[str, Path]], workers: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Extract titles, body text, table cells and picture names from existing decks
+        
+        Files are read in parallel on .NET threads with a streaming reader
+        (no slide DOM is built). Each deck is yielded as soon as it is done.
+        Stopping the iteration early stops the remaining work.
+        
+        Args:
+            paths: Iterable of .pptx file paths
+            workers: Number of files read at once (defaults to the CPU count)
+            
+        Yields:
+            One dict per deck, in completion order, with "path", "title",
+            "author", "modified" and "slides"; each slide has "number",
+            "title", "body" (paragraphs), "tables" (rows of cell text) and
+            "pictures" (names). Unreadable files have an "error" instead.
+            
+        Example:
+            >>> for deck in client.extract_text(Path("decks").glob("**/*.pptx")):
+            ...     print(deck["path"], [slide.get("title") for slide in deck["slides"]])
+        """
+        import System.Collections.Generic as Generic
+        net_paths = Generic.List[str]()
+        for path in paths:
+            net_paths.Add(str(path))
+        
+        enumerator = self.PresentationTextExtractor.ExtractFilesJson(net_paths, workers or 0).GetEnumerator()
+        try:
+            while enumerator.MoveNext():
+                yield json.loads(enumerator.Current)
+        finally:
+            # Cancels the readers if the caller stops early
+            enumerator.Dispose()
+
+    def register_theme(
+        self,
+        name: str,
+        theme_path: Union[str, Path],
+        font_name: Optional[str] = None,
+        accent_colors: Optional[List[str]] = None
+    ) -> None:
+        """
+        Register a theme once so it can be applied to many decks by name
+        
+        The theme presentation is read and any font or accent overrides are
+        applied a single time; apply_theme then only copies the prepared
+        master, theme and layouts into each deck. Registering the same name
+        again replaces the theme. Themes are shared by all clients in the
+        process.
+        
+        Args:
+            name: Name to apply the theme by
+            theme_path: Presentation whose first slide master provides the theme
+            font_name: Font typeface name overriding the theme fonts (optional)
+            accent_colors: List of 4 hex color codes overriding accents 1-4 (optional)
+            
+        Example:
+            >>> client.register_theme("corporate", "templates/corporate.pptx", font_name="Arial")
+        """
+        try:
+            net_colors = None
+            if accent_colors:
+                import System.Collections.Generic as Generic
+                net_colors = Generic.List[str]()
+                for color in accent_colors:
+                    net_colors.Add(color)
+            
+            self.ThemeRegistry.Shared.Register(name, str(theme_path), font_name, net_colors)
+            
+        except Exception as e:
+            raise DocLayerError(f"Failed to register theme: {e}")
+
+    def apply_theme(
+        self,
+        name: str,
+        paths: Iterable[Union[str, Path]],
+        workers: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Re-theme existing decks in place with a registered theme
+        
+        Files are processed in parallel on .NET threads. Each slide keeps a
+        layout of the same name from the new theme, or "Title and Content"
+        when the theme has no such layout.
+        
+        Args:
+            name: Theme registered with register_theme
+            paths: Iterable of .pptx file paths, modified in place
+            workers: Number of files processed at once (defaults to the CPU count)
+            
+        Returns:
+            One dict per file, in input order, with "path" and "error"
+            (None on success)
+            
+        Example:
+            >>> failed = [r for r in client.apply_theme("corporate", Path("decks").glob("*.pptx")) if r["error"]]
+        """
+        try:
+            import System.Collections.Generic as Generic
+            net_paths = Generic.List[str]()
+            for path in paths:
+                net_paths.Add(str(path))
+            
+            results = self.ThemeRegistry.Shared.ApplyToFiles(name, net_paths, workers or 0)
+            return [{"path": result.Path, "error": result.Error} for result in results]
+            
+        except Exception as e:
+            raise DocLayerError(f"Failed to apply theme: {e}")
+
+    def merge_decks(
+        self,
+        filepath: Union[str, Path],
+        paths: Iterable[Union[str, Path]],
+        keep_source_formatting: bool = True
+    ) -> int:
+        """
+        Merge existing decks into one file, saved once
+        
+        The first deck is the base and the slides of the others are appended
+        in order. Slides are copied as whole parts with their images, charts
+        and layouts, without re-parsing their XML. Slide masters shared by
+        several decks and repeated images are stored once. Speaker notes and
+        comments of the appended slides are not copied.
+        
+        Args:
+            filepath: Path of the merged presentation (overwritten)
+            paths: Iterable of .pptx file paths, in order
+            keep_source_formatting: Keep each deck's own master and layouts
+                (default); False maps slides onto the base deck's layouts
+                with the same name
+            
+        Returns:
+            Number of slides in the merged presentation
+            
+        Example:
+            >>> client.merge_decks("board_pack.pptx", sorted(Path("sections").glob("*.pptx")))
+            212
+        """
+        try:
+            import System.Collections.Generic as Generic
+            net_paths = Generic.List[str]()
+            for path in paths:
+                net_paths.Add(str(path))
+            
+            mode = self.LayoutMergeMode.KeepSourceFormatting if keep_source_formatting \
+                else self.LayoutMergeMode.UseDestinationTheme
+            return self.DeckMerger.MergeFiles(net_paths, str(filepath), mode)
+            
+        except Exception as e:
+            raise DocLayerError(f"Failed to merge decks: {e}")
+
+    def compile_template(self, template: Union[str, Path, bytes]) -> "DeckTemplate":
+        """
+        Compile a presentation with {{token}} placeholders for mail merge
+        
+        The template is scanned once; each record is then rendered by
+        patching only the token positions. Tokens may be in shape text,
+        table cells or alt text, and may be split across runs.
+        
+        Args:
+            template: Path to the template presentation, or its bytes
+            
+        Returns:
+            DeckTemplate with render(values, filepath=None) and
+            render_many(records, workers=None)
+            
+        Example:
+            >>> template = client.compile_template("templates/statement.pptx")
+            >>> template.tokens
+            ['name', 'period', 'balance']
+            >>> template.render({"name": "Ada", "period": "Q3", "balance": 1200}, "ada.pptx")
+        """
+        from .template import DeckTemplate
+        
+        try:
+            if isinstance(template, (bytes, bytearray)):
+                import System
+                compiled = self.DeckTemplate.Compile(System.Array[System.Byte](template))
+            else:
+                compiled = self.DeckTemplate.Compile(str(template))
+            return DeckTemplate(compiled)
+            
+        except Exception as e:
+            raise DocLayerError(f"Failed to compile template: {e}")
+
+    def style_terms(
+        self,
+        filepath: Union[str, Path],
+        terms: Dict[str, Dict],
+        output: Optional[Union[str, Path]] = None
+    ) -> int:
+        """
+        Style every occurrence of many terms across a whole deck in one pass
+        
+        The terms are compiled into a single matcher and each text run of
+        every slide, text box and table is scanned once, however many terms
+        there are. Matching is case-insensitive; where terms overlap the
+        longest wins. Runs are split around matches and keep their formatting.
+        
+        Args:
+            filepath: Path to an existing .pptx file
+            terms: Dict of term to style, with any of "bold", "italic",
+                "color" (hex), "accent_color" (1-6) and "size" (points)
+            output: Where to save the styled deck; None edits filepath in place
+            
+        Returns:
+            Number of occurrences styled
+            
+        Example:
+            >>> client.style_terms("report.pptx", {
+            ...     "EBITDA": {"bold": True, "color": "1F4E79"},
+            ...     "churn": {"italic": True},
+            ... })
+            37
+        """
+        try:
+            styler = self.TermStyler.FromJson(json.dumps(terms))
+            return styler.ApplyToFile(str(filepath), str(output) if output is not None else None)
+            
+        except Exception as e:
+            raise DocLayerError(f"Failed to style terms: {e}")
+
+    def patch_deck(
+        self,
+        filepath: Union[str, Path],
+        output: Optional[Union[str, Path]] = None
+    ) -> "DeckPatch":
+        """
+        Open an existing deck for small edits without re-saving the whole package
+        
+        Slides are parsed on first edit and only the slides that changed are
+        written on commit; untouched slides and media are copied byte for
+        byte. Use it as a context manager to commit when the block ends.
+        
+        Args:
+            filepath: Path to an existing .pptx file
+            output: Where to save the patched deck; None patches filepath in place
+            
+        Returns:
+            DeckPatch with set_title, set_text, set_table_cell,
+            replace_entry and commit
+            
+        Example:
+            >>> with client.patch_deck("board_pack.pptx") as deck:
+            ...     deck.set_title(12, "Q3 revenue: $4.2M")
+            ...     deck.set_table_cell(40, row=3, col=2, text="17.5%")
+        """
+        from .patch import DeckPatch
+        
+        try:
+            return DeckPatch(self.DeckPatchSession.Open(str(filepath)), output)
+            
+        except Exception as e:
+            raise DocLayerError(f"Failed to open deck for patching: {e}")
+
+    def generate_batch(
+        self,
+        specs: Iterable[Dict],
+        workers: Optional[int] = None
+    ) -> Iterator["BatchResult"]:
+        """
+        Generate many decks in parallel across worker processes
+        
+        Args:
+            specs: Iterable of deck spec dicts with "title" and optionally
+                "subtitle", "footnote", "font_name", "accent_colors" and
+                "output" (file path; omit to receive the bytes)
+            workers: Number of worker processes, each holding one warm .NET
+                runtime (defaults to the CPU count; 1 runs in this process)
+            
+        Yields:
+            BatchResult per spec as it finishes; a failed deck, or one whose
+            worker crashed, sets result.error instead of aborting the batch
+            
+        Raises:
+            DocLayerError: If the workers cannot load the .NET runtime
+            
+        Example:
+            >>> specs = ({"title": f"Deck {i}", "output": f"out/{i}.pptx"} for i in range(1000))
+            >>> for result in client.generate_batch(specs, workers=8):
+            ...     if not result.ok:
+            ...         print(result.index, result.error)
+        """
+        from .batch import generate_batch
+        return generate_batch(self, specs, workers)
 
 
 # Convenience functions
+_default_client: Optional[DocLayerClient] = None
+_default_client_lock = threading.Lock()
+
+
+_default_output_cache: Optional[OutputCache] = None
+
+
+def _get_default_client() -> DocLayerClient:
+    """Return the shared client used by the module-level convenience functions"""
+    global _default_client
+
+    client = _default_client
+    if client is not None:
+        return client
+
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = DocLayerClient(output_cache=_default_output_cache)
+        return _default_client
+
+
+def set_output_cache(cache: Optional[OutputCache]) -> None:
+    """
+    Serve repeated identical calls of the module-level functions from a cache
+
+    Args:
+        cache: OutputCache to use, or None to turn caching off
+
+    Example:
+        >>> import doclayer_python
+        >>> cache = doclayer_python.OutputCache(max_bytes=128 * 1024 * 1024)
+        >>> doclayer_python.set_output_cache(cache)
+        >>> doclayer_python.create_presentation_with_theme(None, "Cover", font_name="Arial")
+        >>> cache.stats()
+    """
+    global _default_output_cache
+
+    with _default_client_lock:
+        _default_output_cache = cache
+        if _default_client is not None:
+            _default_client.output_cache = cache
+
+
+def warmup() -> None:
+    """
+    Load the DocLayer.Core assemblies and pre-JIT the presentation build path
+
+    Example:
+        >>> import doclayer_python
+        >>> doclayer_python.warmup()  # at service startup
+    """
+    _get_default_client().warmup()
+
+
 def create_title_slide(
-    filepath: str,
+    filepath: Optional[str],
     title: str,
     subtitle: Optional[str] = None,
-    footnote: Optional[str] = "Source:"
+    footnote: Optional[str] = "Source:",
+    compression: Optional[str] = None,
+    image_compression: Optional[str] = None
 ) -> bytes:
     """
     Convenience function to create a title slide presentation
     
     Args:
-        filepath: Path where the presentation will be saved
+        filepath: Path where the presentation will be saved, or None to
+            only return the bytes without touching the filesystem
         title: Main title text
         subtitle: Subtitle text (optional)
         footnote: Footnote text (optional, defaults to "Source:")
+        compression: "optimal" (default), "fastest", "store" or "maximum" - optional
+        image_compression: Compression of PNG, JPEG and GIF parts - optional
         
     Returns:
         Bytes content of the created presentation file
@@ -244,28 +987,33 @@ def create_title_slide(
         ...     footnote="Source: DocLayer.Core"
         ... )
     """
-    client = DocLayerClient()
-    return client.create_title_slide(filepath, title, subtitle, footnote)
+    client = _get_default_client()
+    return client.create_title_slide(filepath, title, subtitle, footnote, compression, image_compression)
 
 
 def create_presentation_with_theme(
-    filepath: str,
+    filepath: Optional[str],
     title: str,
     subtitle: Optional[str] = None,
     footnote: Optional[str] = "Source:",
     font_name: Optional[str] = None,
-    accent_colors: Optional[List[str]] = None
+    accent_colors: Optional[List[str]] = None,
+    compression: Optional[str] = None,
+    image_compression: Optional[str] = None
 ) -> bytes:
     """
     Convenience function to create a presentation with custom theme
     
     Args:
-        filepath: Path where the presentation will be saved
+        filepath: Path where the presentation will be saved, or None to
+            only return the bytes without touching the filesystem
         title: Main title text
         subtitle: Subtitle text (optional)
         footnote: Footnote text (optional, defaults to "Source:")
         font_name: Font typeface name (e.g., "Arial", "Calibri") - optional
         accent_colors: List of 4 hex color codes for accent colors - optional
+        compression: "optimal" (default), "fastest", "store" or "maximum" - optional
+        image_compression: Compression of PNG, JPEG and GIF parts - optional
         
     Returns:
         Bytes content of the created presentation file
@@ -280,16 +1028,186 @@ def create_presentation_with_theme(
         ...     accent_colors=["FF5733", "33FF57", "3357FF", "F3FF33"]
         ... )
     """
-    client = DocLayerClient()
+    client = _get_default_client()
     return client.create_presentation_with_theme(
-        filepath, title, subtitle, footnote, font_name, accent_colors
+        filepath, title, subtitle, footnote, font_name, accent_colors, compression, image_compression
     )
 
 
+def render_deck(filepath: Optional[str], deck: Union[Dict, str]) -> bytes:
+    """
+    Convenience function to render a multi-slide deck from a declarative spec
+    
+    See DocLayerClient.render_deck for the spec format.
+    
+    Example:
+        >>> from doclayer_python import render_deck
+        >>> pptx_bytes = render_deck(None, {"slides": [{"title": "Hello"}, {"title": "World"}]})
+    """
+    client = _get_default_client()
+    return client.render_deck(filepath, deck)
+
+
+def stream_deck(filepath: str, deck: Dict) -> int:
+    """
+    Convenience function to write a very large deck to disk one slide at a time
+    
+    See DocLayerClient.stream_deck for details.
+    
+    Example:
+        >>> from doclayer_python import stream_deck
+        >>> stream_deck("big.pptx", {"slides": ({"title": f"Slide {i}"} for i in range(2000))})
+    """
+    client = _get_default_client()
+    return client.stream_deck(filepath, deck)
+
+
+def extract_text(paths: Iterable[Union[str, Path]], workers: Optional[int] = None) -> Iterator[Dict]:
+    """
+    Convenience function to extract text and metadata from many decks in parallel
+    
+    See DocLayerClient.extract_text for the record format.
+    
+    Example:
+        >>> from doclayer_python import extract_text
+        >>> titles = {deck["path"]: deck.get("title") for deck in extract_text(["a.pptx", "b.pptx"])}
+    """
+    client = _get_default_client()
+    return client.extract_text(paths, workers)
+
+
+def register_theme(
+    name: str,
+    theme_path: Union[str, Path],
+    font_name: Optional[str] = None,
+    accent_colors: Optional[List[str]] = None
+) -> None:
+    """
+    Convenience function to register a theme for apply_theme
+    
+    See DocLayerClient.register_theme for details.
+    """
+    client = _get_default_client()
+    client.register_theme(name, theme_path, font_name, accent_colors)
+
+
+def apply_theme(name: str, paths: Iterable[Union[str, Path]], workers: Optional[int] = None) -> List[Dict]:
+    """
+    Convenience function to re-theme many decks in place with a registered theme
+    
+    Example:
+        >>> from doclayer_python import register_theme, apply_theme
+        >>> register_theme("corporate", "templates/corporate.pptx")
+        >>> apply_theme("corporate", ["a.pptx", "b.pptx"])
+    """
+    client = _get_default_client()
+    return client.apply_theme(name, paths, workers)
+
+
+def merge_decks(
+    filepath: Union[str, Path],
+    paths: Iterable[Union[str, Path]],
+    keep_source_formatting: bool = True
+) -> int:
+    """
+    Convenience function to merge existing decks into one file
+    
+    See DocLayerClient.merge_decks.
+    
+    Example:
+        >>> from doclayer_python import merge_decks
+        >>> merge_decks("merged.pptx", ["intro.pptx", "results.pptx", "appendix.pptx"])
+    """
+    client = _get_default_client()
+    return client.merge_decks(filepath, paths, keep_source_formatting)
+
+
+def compile_template(template: Union[str, Path, bytes]) -> "DeckTemplate":
+    """
+    Convenience function to compile a {{token}} template for mail merge
+    
+    See DocLayerClient.compile_template.
+    
+    Example:
+        >>> from doclayer_python import compile_template
+        >>> template = compile_template("statement.pptx")
+        >>> template.render_many({"output": f"out/{i}.pptx", "values": {"name": n}} for i, n in enumerate(names))
+    """
+    client = _get_default_client()
+    return client.compile_template(template)
+
+
+def style_terms(
+    filepath: Union[str, Path],
+    terms: Dict[str, Dict],
+    output: Optional[Union[str, Path]] = None
+) -> int:
+    """
+    Convenience function to style many terms across a deck in one pass
+    
+    See DocLayerClient.style_terms.
+    
+    Example:
+        >>> from doclayer_python import style_terms
+        >>> style_terms("report.pptx", {"EBITDA": {"bold": True}}, output="report_styled.pptx")
+    """
+    client = _get_default_client()
+    return client.style_terms(filepath, terms, output)
+
+
+def patch_deck(
+    filepath: Union[str, Path],
+    output: Optional[Union[str, Path]] = None
+) -> "DeckPatch":
+    """
+    Convenience function to open an existing deck for small edits
+    
+    See DocLayerClient.patch_deck.
+    
+    Example:
+        >>> from doclayer_python import patch_deck
+        >>> with patch_deck("board_pack.pptx") as deck:
+        ...     deck.set_title(12, "Q3 revenue: $4.2M")
+    """
+    client = _get_default_client()
+    return client.patch_deck(filepath, output)
+
+
+def generate_batch(specs: Iterable[Dict], workers: Optional[int] = None) -> Iterator["BatchResult"]:
+    """
+    Convenience function to generate many decks in parallel across worker processes
+    
+    See DocLayerClient.generate_batch for the spec format. The calling
+    process only loads the .NET runtime when running in-process (workers=1).
+    """
+    from .batch import generate_batch as _generate_batch
+    return _generate_batch(None, specs, workers)
+
+
 # Export public API
 __all__ = [
     'DocLayerClient',
+    'AsyncDocLayerClient',
+    'OutputCache',
+    'set_output_cache',
     'create_title_slide',
     'create_presentation_with_theme',
+    'render_deck',
+    'stream_deck',
+    'table_spec',
+    'extract_text',
+    'register_theme',
+    'apply_theme',
+    'merge_decks',
+    'compile_template',
+    'DeckTemplate',
+    'style_terms',
+    'patch_deck',
+    'DeckPatch',
+    'preload',
+    'warmup',
+    'instrument',
+    'generate_batch',
+    'BatchResult',
     'DocLayerError'
 ]
@@ -0,0 +1,207 @@
+"""
+asyncio API for DocLayer
+
+AsyncDocLayerClient runs every .NET call on a bounded thread pool so the
+event loop keeps serving other tasks while a deck is built and saved.
+pythonnet releases the GIL while managed code runs, so several decks build
+at once. Results are the in-memory package bytes; when a path is given the
+file is written from the pool thread too, never from the loop.
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import methodcaller
+from typing import Any, Callable, Dict, List, Optional, Union
+
+
+def _release_on_loop(loop: asyncio.AbstractEventLoop, semaphore: asyncio.Semaphore, _future) -> None:
+    """Done callback run on the pool thread: hand the semaphore release back to its loop"""
+    try:
+        loop.call_soon_threadsafe(semaphore.release)
+    except RuntimeError:
+        # The loop has been closed; nobody is left waiting for the slot
+        pass
+
+
+class AsyncDocLayerClient:
+    """
+    Awaitable wrapper around DocLayerClient
+
+    Args:
+        max_workers: Threads that run .NET work (defaults to the CPU count)
+        max_concurrency: Calls admitted at once, running or queued on the
+            pool (defaults to max_workers); further callers wait their turn
+        timeout: Default per-call timeout in seconds; None waits forever
+        on_metrics: Per-call metrics callback passed to DocLayerClient; it
+            runs on the pool thread that made the call
+        output_cache: OutputCache passed to DocLayerClient
+
+    A call that times out or is cancelled while still queued never runs.
+    One that has already started in .NET cannot be interrupted: the awaiting
+    task is released immediately, and the call keeps its concurrency slot
+    until the build finishes so the limit is never exceeded.
+
+    Example:
+        >>> async with AsyncDocLayerClient(max_concurrency=8, timeout=30) as client:
+        ...     pptx = await client.create_presentation_with_theme(None, title="Q3 Review")
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        on_metrics: Optional[Callable[[Dict], None]] = None,
+        output_cache=None
+    ):
+        self._on_metrics = on_metrics
+        self._output_cache = output_cache
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._max_concurrency = max_concurrency or self._max_workers
+        self._timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="doclayer"
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._client = None
+        self._client_lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    def _get_client(self):
+        """Create the sync client on a pool thread, so loading the CLR never blocks the loop"""
+        client = self._client
+        if client is not None:
+            return client
+
+        with self._client_lock:
+            if self._client is None:
+                from doclayer_python import DocLayerClient
+                self._client = DocLayerClient(on_metrics=self._on_metrics, output_cache=self._output_cache)
+            return self._client
+
+    def _invoke(self, work: Callable[[Any], Any]) -> Any:
+        return work(self._get_client())
+
+    async def _run(self, work: Callable[[Any], Any], timeout: Optional[float]) -> Any:
+        if self._closed:
+            raise RuntimeError("AsyncDocLayerClient is closed")
+
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        semaphore = self._semaphore
+        timeout = self._timeout if timeout is None else timeout
+        deadline = None if timeout is None else loop.time() + timeout
+
+        # Waiting for a slot counts against the timeout. The acquire runs as its own task, so a
+        # timeout or cancellation that races with the slot being granted still sees the grant
+        # and gives the slot back instead of leaking it
+        acquire = asyncio.ensure_future(semaphore.acquire())
+        try:
+            await asyncio.wait_for(asyncio.shield(acquire), timeout)
+        except BaseException:
+            if acquire.done() and not acquire.cancelled() and acquire.exception() is None:
+                semaphore.release()
+            else:
+                acquire.cancel()
+            raise
+
+        try:
+            future = self._executor.submit(self._invoke, work)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        # The slot is returned when the work ends, not when the caller stops waiting
+        future.add_done_callback(partial(_release_on_loop, loop, semaphore))
+
+        remaining = None if deadline is None else max(0.0, deadline - loop.time())
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future, loop=loop), remaining)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            # Drops the call if it has not started yet
+            future.cancel()
+            raise
+
+    async def warmup(self) -> None:
+        """Load the runtime and pre-JIT the build path on a pool thread"""
+        await self._run(methodcaller("warmup"), None)
+
+    async def create_title_slide(
+        self,
+        filepath: Optional[str],
+        title: str,
+        subtitle: Optional[str] = None,
+        footnote: Optional[str] = "Source:",
+        compression: Optional[str] = None,
+        image_compression: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> bytes:
+        """Awaitable DocLayerClient.create_title_slide; timeout overrides the client default"""
+        return await self._run(
+            methodcaller(
+                "create_title_slide", filepath, title, subtitle, footnote, compression, image_compression
+            ),
+            timeout
+        )
+
+    async def create_presentation_with_theme(
+        self,
+        filepath: Optional[str],
+        title: str,
+        subtitle: Optional[str] = None,
+        footnote: Optional[str] = "Source:",
+        font_name: Optional[str] = None,
+        accent_colors: Optional[List[str]] = None,
+        compression: Optional[str] = None,
+        image_compression: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> bytes:
+        """Awaitable DocLayerClient.create_presentation_with_theme; timeout overrides the client default"""
+        return await self._run(
+            methodcaller(
+                "create_presentation_with_theme", filepath, title, subtitle, footnote,
+                font_name, accent_colors, compression, image_compression
+            ),
+            timeout
+        )
+
+    async def render_deck(
+        self,
+        filepath: Optional[str],
+        deck: Union[Dict, str],
+        timeout: Optional[float] = None
+    ) -> bytes:
+        """Awaitable DocLayerClient.render_deck; timeout overrides the client default"""
+        return await self._run(methodcaller("render_deck", filepath, deck), timeout)
+
+    async def run(self, func: Callable[..., Any], *args, timeout: Optional[float] = None) -> Any:
+        """
+        Run func(client, *args) on the pool under the same limit and timeout
+
+        Use this for DocLayerClient methods without an async counterpart.
+
+        Example:
+            >>> count = await client.run(lambda c: c.stream_deck("big.pptx", deck))
+        """
+        return await self._run(lambda client: func(client, *args), timeout)
+
+    async def close(self) -> None:
+        """Stop accepting calls and wait for running ones to finish, off the loop"""
+        if self._closed:
+            return
+        self._closed = True
+        await asyncio.get_running_loop().run_in_executor(None, partial(self._executor.shutdown, wait=True))
+
+    async def __aenter__(self) -> "AsyncDocLayerClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
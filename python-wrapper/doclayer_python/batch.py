@@ -0,0 +1,213 @@
+"""
+Parallel batch deck generation for DocLayer
+
+Fans deck specs out across a pool of worker processes. Each worker loads the
+.NET runtime and DocLayer.Core once and then builds every deck it is given,
+so throughput scales with cores instead of being bound to one CLR.
+"""
+
+import multiprocessing
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, Iterator, Optional, Tuple
+
+# Keys accepted in a deck spec, mapped onto create_presentation_with_theme
+SPEC_KEYS = ("title", "subtitle", "footnote", "font_name", "accent_colors", "output")
+
+
+class BatchResult:
+    """Outcome of one deck in a batch"""
+
+    __slots__ = ("index", "spec", "output", "data", "size", "error")
+
+    def __init__(
+        self,
+        index: int,
+        spec: Dict[str, Any],
+        output: Optional[str] = None,
+        data: Optional[bytes] = None,
+        size: int = 0,
+        error: Optional[str] = None
+    ):
+        self.index = index
+        self.spec = spec
+        self.output = output
+        self.data = data
+        self.size = size
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"BatchResult(index={self.index}, size={self.size}, {status})"
+
+
+_worker_client = None
+_worker_startup_error: Optional[str] = None
+
+
+class _WorkerStartupError(RuntimeError):
+    """Raised by a task when its worker could not load the runtime"""
+
+
+def _init_worker() -> None:
+    """Process pool initializer: load the CLR and pre-JIT once per worker"""
+    global _worker_client, _worker_startup_error
+    try:
+        from doclayer_python import DocLayerClient
+
+        _worker_client = DocLayerClient()
+        _worker_client.warmup()
+    except Exception as e:
+        # Raising here would break the pool; hand the error to the first task instead
+        _worker_startup_error = f"{type(e).__name__}: {e}"
+
+
+def build_deck(client, index: int, spec: Dict[str, Any]) -> BatchResult:
+    """Build one deck, capturing any failure on the result instead of raising"""
+    unknown = set(spec) - set(SPEC_KEYS)
+    if unknown:
+        return BatchResult(index, spec, error=f"Unknown spec keys: {sorted(unknown)}")
+    if "title" not in spec:
+        return BatchResult(index, spec, error="Deck spec requires a 'title'")
+
+    output = spec.get("output")
+    try:
+        data = client.create_presentation_with_theme(
+            output,
+            title=spec["title"],
+            subtitle=spec.get("subtitle"),
+            footnote=spec.get("footnote", "Source:"),
+            font_name=spec.get("font_name"),
+            accent_colors=spec.get("accent_colors")
+        )
+    except Exception as e:
+        return BatchResult(index, spec, output=output, error=str(e))
+
+    # Decks written to disk are not shipped back across the process boundary
+    return BatchResult(index, spec, output=output, data=None if output else data, size=len(data))
+
+
+def _build_in_worker(index: int, spec: Dict[str, Any]) -> BatchResult:
+    if _worker_startup_error is not None:
+        raise _WorkerStartupError(_worker_startup_error)
+    return build_deck(_worker_client, index, spec)
+
+
+def _new_pool(workers: int) -> ProcessPoolExecutor:
+    # The CLR cannot survive fork(), so workers are always spawned fresh
+    context = multiprocessing.get_context("spawn")
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker)
+
+
+def _submit(
+    pool: ProcessPoolExecutor,
+    pending: Dict[Future, Tuple[int, Dict[str, Any]]],
+    index: int,
+    spec: Dict[str, Any]
+) -> bool:
+    """Submit a deck to the pool, returning False if the pool is already broken"""
+    try:
+        pending[pool.submit(_build_in_worker, index, spec)] = (index, spec)
+    except BrokenProcessPool:
+        return False
+    return True
+
+
+def generate_batch(
+    client,
+    specs: Iterable[Dict[str, Any]],
+    workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None
+) -> Iterator[BatchResult]:
+    """
+    Build decks from specs across a process pool, yielding results as they finish
+
+    Args:
+        client: DocLayerClient used when running in-process (workers=1);
+            None uses the shared default client
+        specs: Iterable of deck spec dicts, consumed lazily
+        workers: Number of worker processes (defaults to the CPU count)
+        max_in_flight: Maximum number of submitted but unfinished decks
+            (defaults to 4 per worker)
+
+    Yields:
+        BatchResult for each spec, in completion order
+    """
+    workers = workers or multiprocessing.cpu_count()
+
+    if workers <= 1:
+        if client is None:
+            from doclayer_python import _get_default_client
+            client = _get_default_client()
+        for index, spec in enumerate(specs):
+            yield build_deck(client, index, spec)
+        return
+
+    max_in_flight = max_in_flight or workers * 4
+    numbered = enumerate(specs)
+
+    # When a worker dies the pool breaks and every deck in flight fails with it, so
+    # those decks are retried one at a time on a fresh pool: a deck that breaks
+    # the pool while running alone is the one that crashed and is reported as such
+    suspects: Deque[Tuple[int, Dict[str, Any]]] = deque()
+    pending: Dict[Future, Tuple[int, Dict[str, Any]]] = {}
+    pool = _new_pool(workers)
+    try:
+        while True:
+            isolated = bool(suspects)
+            broken = False
+            if isolated:
+                if not pending:
+                    broken = not _submit(pool, pending, *suspects[0])
+                    if not broken:
+                        suspects.popleft()
+            else:
+                for index, spec in islice(numbered, max_in_flight - len(pending)):
+                    if not _submit(pool, pending, index, spec):
+                        suspects.append((index, spec))
+                        broken = True
+                        break
+
+            if not pending and not broken:
+                return
+
+            crashed = []
+            if pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                while done:
+                    for future in done:
+                        index, spec = pending.pop(future)
+                        try:
+                            yield future.result()
+                        except BrokenProcessPool:
+                            broken = True
+                            crashed.append((index, spec))
+                        except _WorkerStartupError as e:
+                            from doclayer_python import DocLayerError
+                            raise DocLayerError(f"Batch workers could not load the DocLayer runtime: {e}") from None
+                        except Exception as e:
+                            yield BatchResult(index, spec, output=spec.get("output"), error=str(e))
+                    # Once the pool is broken, the other decks in flight finish or fail with it
+                    done = wait(pending)[0] if broken else set()
+
+            if broken:
+                pool.shutdown(wait=True)
+                pool = _new_pool(workers)
+
+                if isolated and len(crashed) == 1:
+                    index, spec = crashed[0]
+                    yield BatchResult(
+                        index, spec, output=spec.get("output"),
+                        error="Worker process crashed while building the deck"
+                    )
+                else:
+                    suspects.extend(crashed)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
@@ -0,0 +1,289 @@
+"""
+Spec-keyed output cache for DocLayer
+
+Identical requests produce identical packages, so the bytes of a built deck
+can be served again without touching .NET. Entries are keyed on a canonical
+hash of the call (method and full spec) and the library version, held in an
+in-memory LRU bounded by total size, and optionally written through to a
+directory that survives restarts and can be shared by worker processes.
+
+Pictures referenced by path are keyed on the path, size and modification
+time of the file, so replacing an image invalidates the decks using it.
+Decks with http(s) pictures are not cached, since nothing local tells when
+the remote image changes.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_REMOTE_PREFIXES = ("http://", "https://")
+
+_library_version: Optional[str] = None
+
+
+def library_version() -> str:
+    """
+    Version string that changes whenever generated output may change
+
+    Combines the package version with a hash of the bundled DocLayer.Core.dll,
+    so a rebuilt assembly never serves packages cached by an older one.
+    """
+    global _library_version
+    if _library_version is None:
+        from . import __version__
+
+        dll_path = Path(__file__).parent / "bin" / "DocLayer.Core.dll"
+        try:
+            digest = hashlib.sha256(dll_path.read_bytes()).hexdigest()[:16]
+        except OSError:
+            digest = "no-assembly"
+        _library_version = f"{__version__}+{digest}"
+    return _library_version
+
+
+def _picture_paths(spec: Any) -> Iterator[str]:
+    """Path of every picture referenced by a deck spec"""
+    slides = spec.get("slides") if isinstance(spec, dict) else None
+    for slide in slides or ():
+        for picture in slide.get("pictures") or ():
+            path = picture.get("path")
+            if path:
+                yield path
+
+
+def _file_stamps(spec: Any) -> Dict[str, Any]:
+    """Size and mtime of every picture file referenced by a deck spec"""
+    stamps = {}
+    for path in _picture_paths(spec):
+        if path not in stamps:
+            try:
+                stat = os.stat(path)
+                stamps[path] = [stat.st_size, stat.st_mtime_ns]
+            except OSError:
+                stamps[path] = None
+    return stamps
+
+
+def spec_key(method: str, spec: Union[Dict[str, Any], str]) -> Optional[str]:
+    """
+    Canonical hash of a call: equal keys mean byte-identical output
+
+    Args:
+        method: Client method that builds the output, e.g. "render_deck"
+        spec: All arguments that affect the output, as a dict or JSON string;
+            key order and whitespace do not matter
+
+    Returns:
+        Hex SHA-256 digest, or None when the spec references http(s)
+        pictures and so must not be cached
+    """
+    if isinstance(spec, str):
+        spec = json.loads(spec)
+    if any(path.lower().startswith(_REMOTE_PREFIXES) for path in _picture_paths(spec)):
+        return None
+    canonical = json.dumps(
+        {"method": method, "spec": spec, "files": _file_stamps(spec), "version": library_version()},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class OutputCache:
+    """
+    Thread-safe LRU of built packages with an optional on-disk tier
+
+    Decks with http(s) pictures are always built, never served from the cache.
+
+    Args:
+        max_bytes: Memory budget for cached packages; least recently used
+            entries are evicted past it. Packages larger than the budget
+            are not kept in memory
+        disk_dir: Directory for the on-disk tier, or None for memory only.
+            Every stored package is written through to it, and memory
+            misses fall back to it
+        disk_max_bytes: Budget for the on-disk tier, or None for unbounded;
+            the least recently used files are deleted past it
+
+    Example:
+        >>> cache = OutputCache(max_bytes=256 * 1024 * 1024, disk_dir="/var/cache/doclayer")
+        >>> client = DocLayerClient(output_cache=cache)
+        >>> client.create_presentation_with_theme(None, "Cover", font_name="Arial")
+        >>> cache.stats()["hits"]
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        disk_dir: Optional[Union[str, Path]] = None,
+        disk_max_bytes: Optional[int] = None
+    ):
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir is not None else None
+        self.disk_max_bytes = disk_max_bytes
+
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._disk_evictions = 0
+
+        self._disk_bytes = 0
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            self._disk_bytes = sum(size for _, size, _ in self._disk_files())
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached package for key, or None on a miss"""
+        with self._lock:
+            content = self._entries.get(key)
+            if content is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return content
+
+        content = self._read_disk(key)
+        with self._lock:
+            if content is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._disk_hits += 1
+            self._store_memory(key, content)
+        return content
+
+    def put(self, key: str, content: bytes) -> None:
+        """Cache a package under key, in memory and on disk"""
+        with self._lock:
+            self._store_memory(key, content)
+        if self.disk_dir is not None:
+            self._write_disk(key, content)
+
+    def clear(self) -> None:
+        """Drop every entry from memory and disk; statistics are kept"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if self.disk_dir is not None:
+            with self._disk_lock:
+                for path, _, _ in self._disk_files():
+                    path.unlink(missing_ok=True)
+                self._disk_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache statistics
+
+        Returns:
+            Dict with "hits" (of which "disk_hits" were served from disk),
+            "misses", "hit_rate", "evictions" (from memory),
+            "disk_evictions", "entries" and "bytes" (in memory) and
+            "disk_bytes"
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "disk_evictions": self._disk_evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "disk_bytes": self._disk_bytes,
+            }
+
+    def _store_memory(self, key: str, content: bytes) -> None:
+        """Insert under self._lock and evict down to the budget"""
+        if len(content) > self.max_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous)
+        self._entries[key] = content
+        self._bytes += len(content)
+
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self._evictions += 1
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / key[:2] / f"{key}.pptx"
+
+    def _disk_files(self):
+        """(path, size, mtime) of every package in the on-disk tier"""
+        for path in self.disk_dir.glob("*/*.pptx"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            yield path, stat.st_size, stat.st_mtime
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        if self.disk_dir is None:
+            return None
+        path = self._disk_path(key)
+        try:
+            content = path.read_bytes()
+            # Bump the mtime so disk eviction is least recently used, not least recently written
+            os.utime(path)
+        except OSError:
+            return None
+        return content
+
+    def _write_disk(self, key: str, content: bytes) -> None:
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(exist_ok=True)
+            existing = path.stat().st_size if path.exists() else 0
+
+            # Write to a temporary file and rename, so readers never see a partial package
+            import tempfile
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(content)
+                os.replace(tmp_path, path)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            # The disk tier is best effort; the memory tier still holds the entry
+            return
+
+        with self._disk_lock:
+            self._disk_bytes += len(content) - existing
+            if self.disk_max_bytes is not None and self._disk_bytes > self.disk_max_bytes:
+                self._prune_disk()
+
+    def _prune_disk(self) -> None:
+        """Delete the least recently used files until the disk tier fits its budget (under _disk_lock)"""
+        files = sorted(self._disk_files(), key=lambda item: item[2])
+        total = sum(size for _, size, _ in files)
+        for path, size, _ in files:
+            if total <= self.disk_max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            self._disk_evictions += 1
+        self._disk_bytes = total
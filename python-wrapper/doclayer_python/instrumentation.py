@@ -0,0 +1,154 @@
+"""
+Per-call instrumentation for DocLayer
+
+Reports where the time of a client call goes, phase by phase:
+
+    runtime_init    loading the CLR and DocLayer.Core (first call in the process only)
+    package_create  cloning the cached base package for the theme
+    theme_edit      editing theme fonts and accent colors (template cache misses only)
+    slide_build     adding slides and their content
+    serialize       writing parts and closing the package
+    marshal         converting arguments and copying the package bytes into Python
+    io              writing the file, when a path was given
+
+The .NET phases come from DocLayer.Core's DocLayerDiagnostics, which also
+publishes them on an ActivitySource and a Meter named "DocLayer.Core".
+Nothing is measured unless a client has an on_metrics callback or the call
+runs inside instrument(); otherwise each call only checks one flag.
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+_local = threading.local()
+
+# Set once by the assembly loader; reported on the first instrumented call
+_runtime_init_ms: Optional[float] = None
+_runtime_init_reported = False
+_runtime_init_lock = threading.Lock()
+
+
+def set_runtime_init_ms(milliseconds: float) -> None:
+    global _runtime_init_ms
+    _runtime_init_ms = milliseconds
+
+
+def _take_runtime_init_ms() -> Optional[float]:
+    global _runtime_init_reported
+    if _runtime_init_reported or _runtime_init_ms is None:
+        return None
+    with _runtime_init_lock:
+        if _runtime_init_reported:
+            return None
+        _runtime_init_reported = True
+        return _runtime_init_ms
+
+
+def _active_sinks() -> List[List[Dict[str, Any]]]:
+    return getattr(_local, "sinks", None) or []
+
+
+@contextmanager
+def instrument() -> Iterator[List[Dict[str, Any]]]:
+    """
+    Collect the metrics of every DocLayer call made on this thread inside the block
+
+    Yields:
+        List that receives one metrics dict per call, with "method",
+        "total_ms", "phases" (phase name to milliseconds),
+        "bytes_written" and "parts_written"
+
+    Example:
+        >>> with instrument() as calls:
+        ...     create_presentation_with_theme(None, title="Q3", font_name="Arial")
+        >>> calls[0]["phases"]
+        {'package_create': 0.41, 'slide_build': 1.9, 'serialize': 2.3, 'marshal': 0.05}
+    """
+    calls: List[Dict[str, Any]] = []
+    sinks = getattr(_local, "sinks", None)
+    if sinks is None:
+        sinks = _local.sinks = []
+    sinks.append(calls)
+    try:
+        yield calls
+    finally:
+        sinks.remove(calls)
+
+
+class _NullRecorder:
+    """Recorder used when nobody is listening"""
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        yield
+
+    def finish(self) -> None:
+        pass
+
+
+NULL_RECORDER = _NullRecorder()
+
+
+class _Recorder:
+    """Times the Python-side phases of one call and merges in the .NET capture"""
+
+    def __init__(
+        self,
+        method: str,
+        diagnostics,
+        callback: Optional[Callable[[Dict[str, Any]], None]],
+        sinks: List[List[Dict[str, Any]]]
+    ):
+        self._method = method
+        self._callback = callback
+        self._sinks = list(sinks)
+        self._phases: Dict[str, float] = {}
+        self._start = time.perf_counter()
+        self._capture = diagnostics.BeginCapture()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phases[name] = self._phases.get(name, 0.0) + (time.perf_counter() - start) * 1000.0
+
+    def finish(self) -> None:
+        total_ms = (time.perf_counter() - self._start) * 1000.0
+        try:
+            captured = json.loads(self._capture.ToJson())
+        finally:
+            self._capture.Dispose()
+
+        phases: Dict[str, float] = {}
+        runtime_init_ms = _take_runtime_init_ms()
+        if runtime_init_ms is not None:
+            phases["runtime_init"] = runtime_init_ms
+        phases.update(captured["phases"])
+        for name, milliseconds in self._phases.items():
+            phases[name] = phases.get(name, 0.0) + milliseconds
+
+        metrics = {
+            "method": self._method,
+            "total_ms": total_ms,
+            "phases": phases,
+            "bytes_written": captured["bytes_written"],
+            "parts_written": captured["parts_written"],
+        }
+
+        for sink in self._sinks:
+            sink.append(metrics)
+        if self._callback is not None:
+            self._callback(metrics)
+
+
+def start_call(method: str, diagnostics, callback: Optional[Callable[[Dict[str, Any]], None]]):
+    """Return a recorder for one call, or the no-op recorder when nobody is listening"""
+    sinks = _active_sinks()
+    if callback is None and not sinks:
+        return NULL_RECORDER
+    return _Recorder(method, diagnostics, callback, sinks)
@@ -0,0 +1,103 @@
+"""
+Patch sessions for editing existing decks in place
+
+A session opened by DocLayerClient.patch_deck reads only the package
+directory and the slide order. Slides are parsed by DocLayer.Core's
+DeckPatchSession the first time they are edited, and committing writes
+back only the slides that actually changed; every other ZIP entry, media
+included, is copied byte for byte. Slide, row and column numbers are
+1-based, as in the rest of DocLayer.
+"""
+
+from pathlib import Path
+from typing import List, Optional, Union
+
+
+class DeckPatch:
+    """An open patch session; create one with DocLayerClient.patch_deck"""
+
+    def __init__(self, net_session, output: Optional[Union[str, Path]] = None):
+        self._session = net_session
+        self._output = output
+        self._closed = False
+
+    @property
+    def slide_count(self) -> int:
+        """Number of slides in the deck"""
+        return self._session.SlideCount
+
+    @property
+    def loaded_slide_count(self) -> int:
+        """Number of slides parsed so far"""
+        return self._session.LoadedSlideCount
+
+    def set_title(self, slide: int, text: str) -> None:
+        """Replace a slide's title text, keeping its formatting"""
+        self._call("set title", lambda: self._session.SetTitleText(slide, str(text)))
+
+    def set_text(self, slide: int, shape_name: str, text: str) -> None:
+        """Replace the text of a named shape, keeping its formatting"""
+        self._call("set shape text", lambda: self._session.SetShapeText(slide, shape_name, str(text)))
+
+    def set_table_cell(self, slide: int, row: int, col: int, text, table: int = 1) -> None:
+        """
+        Replace the text of a table cell, keeping its formatting
+
+        Args:
+            slide: Slide number
+            row: Row number
+            col: Column number
+            text: New text; numbers are converted with str()
+            table: Which table on the slide, in document order
+        """
+        self._call("set table cell", lambda: self._session.SetTableCell(slide, row, col, str(text), table))
+
+    def replace_entry(self, entry_name: str, content: bytes) -> None:
+        """Replace an existing package entry, e.g. "ppt/media/image4.png", with new bytes"""
+        import System
+        self._call("replace entry", lambda: self._session.ReplaceEntry(entry_name, System.Array[System.Byte](content)))
+
+    def modified_entries(self) -> List[str]:
+        """Entry names that will be written on commit"""
+        return list(self._call("list modified entries", self._session.GetModifiedEntries))
+
+    def commit(self) -> int:
+        """
+        Write the modified entries and close the session
+
+        Returns:
+            Number of entries written
+        """
+        written = self._call("commit patch", lambda: self._session.Commit(
+            str(self._output) if self._output is not None else None))
+        self._closed = True
+        return written
+
+    def close(self) -> None:
+        """Close the session, discarding uncommitted changes"""
+        if not self._closed:
+            self._session.Dispose()
+            self._closed = True
+
+    def _call(self, action: str, work):
+        from . import DocLayerError
+
+        if self._closed:
+            raise DocLayerError(f"Failed to {action}: the patch session is closed")
+        try:
+            return work()
+        except Exception as e:
+            raise DocLayerError(f"Failed to {action}: {e}")
+
+    def __enter__(self) -> "DeckPatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # Commit only when the block finished cleanly
+        if exc_type is None and not self._closed:
+            self.commit()
+        self.close()
+
+    def __repr__(self) -> str:
+        state = "closed" if self._closed else f"{self.loaded_slide_count} of {self.slide_count} slides loaded"
+        return f"DeckPatch({state})"
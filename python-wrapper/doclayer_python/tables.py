@@ -0,0 +1,104 @@
+"""
+Table helpers for DocLayer deck specs
+
+Turns 2D arrays, lists of rows, dicts of columns and DataFrame-like objects
+into the "tables" entries of a render_deck spec. The cells are filled in
+.NET in a single pass (TableExtensions.SetTableData), so large tables cost
+one boundary crossing with the rest of the deck.
+"""
+
+import math
+from itertools import zip_longest
+from typing import Any, Dict, List, Optional, Sequence
+
+# Keys accepted in a per-column format, mapped onto TableColumnFormat
+COLUMN_FORMAT_KEYS = ("number_format", "alignment", "font_size", "bold", "font_color", "fill", "scheme_fill")
+
+
+def _cell(value: Any) -> Any:
+    """Convert a cell to a JSON-safe value: numbers stay numbers so .NET number formats apply"""
+    if value is None:
+        return None
+    if hasattr(value, "item") and not isinstance(value, (str, bytes)):
+        # numpy / pandas scalars
+        value = value.item()
+    if isinstance(value, bool):
+        return str(value)
+    if isinstance(value, float) and (math.isnan(value) or math.isinf(value)):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    return str(value)
+
+
+def _rows_from_columns(columns: Dict[str, Sequence[Any]], header: bool) -> List[List[Any]]:
+    rows = [[str(name) for name in columns]] if header else []
+    rows.extend(list(row) for row in zip_longest(*columns.values()))
+    return rows
+
+
+def table_spec(
+    data: Any,
+    hpos: Optional[int] = None,
+    vpos: Optional[int] = None,
+    column_formats: Optional[List[Optional[Dict[str, Any]]]] = None,
+    header: bool = True
+) -> Dict[str, Any]:
+    """
+    Build a deck spec table entry from tabular data
+
+    Args:
+        data: A list of rows (list-of-lists or 2D array with .tolist()),
+            a dict of column name to values, or a DataFrame-like object
+            with .columns and column indexing (pandas, polars)
+        hpos: Horizontal position in inches (optional)
+        vpos: Vertical position in inches (optional)
+        column_formats: Per-column formats, each a dict with any of
+            "number_format" (.NET format string such as "N2" or "P1"),
+            "alignment", "font_size", "bold", "font_color", "fill" and
+            "scheme_fill"; None leaves a column unformatted
+        header: For columnar input, whether the column names form a
+            header row (formats are not applied to it)
+
+    Returns:
+        Dict suitable for a slide's "tables" list in render_deck
+
+    Example:
+        >>> table = table_spec(
+        ...     {"Region": ["EMEA", "APAC"], "Revenue": [4200.5, 3100]},
+        ...     column_formats=[None, {"number_format": "N0", "alignment": "right"}]
+        ... )
+        >>> render_deck(None, {"slides": [{"title": "Revenue", "tables": [table]}]})
+    """
+    header_rows = 0
+    if hasattr(data, "columns") and not isinstance(data, dict):
+        rows = _rows_from_columns({name: list(data[name]) for name in data.columns}, header)
+        header_rows = 1 if header else 0
+    elif isinstance(data, dict):
+        rows = _rows_from_columns({name: list(values) for name, values in data.items()}, header)
+        header_rows = 1 if header else 0
+    else:
+        if hasattr(data, "tolist"):
+            data = data.tolist()
+        rows = [list(row) for row in data]
+
+    if not rows:
+        raise ValueError("Table data is empty")
+
+    spec: Dict[str, Any] = {
+        "data": [[_cell(value) for value in row] for row in rows],
+        "header_rows": header_rows,
+    }
+
+    if column_formats is not None:
+        for column_format in column_formats:
+            unknown = set(column_format or {}) - set(COLUMN_FORMAT_KEYS)
+            if unknown:
+                raise ValueError(f"Unknown column format keys: {sorted(unknown)}")
+        spec["column_formats"] = column_formats
+    if hpos is not None:
+        spec["hpos"] = hpos
+    if vpos is not None:
+        spec["vpos"] = vpos
+
+    return spec
@@ -0,0 +1,92 @@
+"""
+Precompiled {{token}} templates for DocLayer
+
+A template presentation is scanned once by DocLayer.Core's DeckTemplate,
+which records where each {{token}} sits, including tokens that PowerPoint
+split across runs. Each record is then rendered by copying the template
+package and rewriting only the slides that hold tokens, so no slide is
+parsed per record. render_many renders records on .NET threads in parallel.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+
+def _text(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+class DeckTemplate:
+    """A compiled template; create one with DocLayerClient.compile_template"""
+
+    def __init__(self, net_template):
+        self._template = net_template
+
+    @property
+    def tokens(self) -> List[str]:
+        """Distinct token names, in order of first appearance"""
+        return list(self._template.Tokens)
+
+    def render(self, values: Dict[str, Any], filepath: Optional[Union[str, Path]] = None) -> bytes:
+        """
+        Render the template for one record
+
+        Args:
+            values: Token values; values are converted with str() and
+                missing tokens render as empty text
+            filepath: Path where the presentation will be saved, or None to
+                only return the bytes
+
+        Returns:
+            Bytes content of the rendered presentation
+        """
+        from . import DocLayerError, _stream_to_bytes
+
+        try:
+            stream = self._template.RenderJson(json.dumps({k: _text(v) for k, v in values.items()}))
+            content = _stream_to_bytes(stream)
+            stream.Dispose()
+        except Exception as e:
+            raise DocLayerError(f"Failed to render template: {e}")
+
+        if filepath is not None:
+            with open(filepath, 'wb') as f:
+                f.write(content)
+        return content
+
+    def render_many(self, records: Iterable[Dict[str, Any]], workers: Optional[int] = None) -> List[Dict]:
+        """
+        Render many records to files in parallel on .NET threads
+
+        Args:
+            records: Iterable of dicts with "output" (file path) and
+                "values" (token values)
+            workers: Number of records rendered at once (defaults to the CPU count)
+
+        Returns:
+            One dict per record, in input order, with "path" and "error"
+            (None on success)
+
+        Example:
+            >>> template.render_many(
+            ...     {"output": f"out/{c.id}.pptx", "values": {"name": c.name}} for c in customers
+            ... )
+        """
+        from . import DocLayerError
+
+        try:
+            records_json = json.dumps([
+                {
+                    "output": str(record["output"]),
+                    "values": {k: _text(v) for k, v in (record.get("values") or {}).items()},
+                }
+                for record in records
+            ])
+            results = self._template.RenderFilesJson(records_json, workers or 0)
+            return [{"path": result.Path, "error": result.Error} for result in results]
+        except Exception as e:
+            raise DocLayerError(f"Failed to render template: {e}")
+
+    def __repr__(self) -> str:
+        return f"DeckTemplate(tokens={self.tokens!r})"
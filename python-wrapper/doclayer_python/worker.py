@@ -0,0 +1,156 @@
+"""
+Long-lived DocLayer worker process
+
+Keeps one warm DocLayerClient and serves requests over stdin/stdout so callers
+in other languages (e.g. the TypeScript bridge) pay interpreter, CoreCLR and
+assembly startup once per process instead of once per presentation.
+
+Run with:
+
+    python -m doclayer_python.worker
+
+Protocol (all integers are unsigned 32-bit big-endian):
+
+    request:   <length><UTF-8 JSON>
+               {"id": 1, "method": "create_title_slide", "params": {...}}
+
+    response:  <header length><UTF-8 JSON header><body length><body bytes>
+               header is {"id": 1, "ok": true} with the PPTX bytes as the body,
+               or {"id": 1, "ok": false, "error": "..."} with an empty body
+
+Supported methods are "ping", "create_title_slide",
+"create_presentation_with_theme" and "render_deck"; params match the keyword
+arguments of the DocLayerClient methods of the same name, without "filepath".
+An oversized or malformed request gets an error response with a null id; the
+worker exits cleanly when stdin is closed.
+"""
+
+import json
+import os
+import struct
+import sys
+from typing import BinaryIO, Optional
+
+_LENGTH = struct.Struct(">I")
+
+# Requests larger than this are rejected rather than buffered
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+
+def _read_exact(stream: BinaryIO, size: int) -> Optional[bytes]:
+    """Read exactly size bytes, or return None on a clean EOF before the first byte"""
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = stream.read(remaining)
+        if not chunk:
+            if remaining == size:
+                return None
+            raise EOFError("Unexpected end of stream inside a frame")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+class ProtocolError(ValueError):
+    """A request frame that cannot be served; the stream is still in sync"""
+
+
+def _skip(stream: BinaryIO, size: int) -> None:
+    """Discard size bytes without buffering them"""
+    while size:
+        chunk = stream.read(min(size, 64 * 1024))
+        if not chunk:
+            raise EOFError("Unexpected end of stream inside a frame")
+        size -= len(chunk)
+
+
+def read_request(stream: BinaryIO) -> Optional[dict]:
+    """
+    Read one length-prefixed JSON request, or None when the stream is closed
+
+    Raises ProtocolError for an oversized or malformed request, after consuming
+    its frame, and EOFError when the stream ends inside a frame.
+    """
+    prefix = _read_exact(stream, _LENGTH.size)
+    if prefix is None:
+        return None
+
+    (length,) = _LENGTH.unpack(prefix)
+    if length > MAX_REQUEST_BYTES:
+        _skip(stream, length)
+        raise ProtocolError(f"Request of {length} bytes exceeds the {MAX_REQUEST_BYTES} byte limit")
+
+    payload = _read_exact(stream, length) or b""
+    try:
+        request = json.loads(payload.decode("utf-8"))
+    except ValueError as e:
+        raise ProtocolError(f"Malformed request: {e}") from None
+    if not isinstance(request, dict):
+        raise ProtocolError("Malformed request: expected a JSON object")
+    return request
+
+
+def write_response(stream: BinaryIO, header: dict, body: bytes = b"") -> None:
+    """Write one response frame: JSON header followed by the binary body"""
+    encoded = json.dumps(header).encode("utf-8")
+    stream.write(_LENGTH.pack(len(encoded)))
+    stream.write(encoded)
+    stream.write(_LENGTH.pack(len(body)))
+    stream.write(body)
+    stream.flush()
+
+
+def _dispatch(client, method: str, params: dict) -> bytes:
+    if method == "ping":
+        return b""
+    if method == "create_title_slide":
+        return client.create_title_slide(None, **params)
+    if method == "create_presentation_with_theme":
+        return client.create_presentation_with_theme(None, **params)
+    if method == "render_deck":
+        return client.render_deck(None, params["deck"])
+    raise ValueError(f"Unknown method: {method}")
+
+
+def serve(stdin: BinaryIO, stdout: BinaryIO) -> None:
+    """Serve requests from stdin until it is closed"""
+    from doclayer_python import DocLayerClient
+
+    client = DocLayerClient()
+    client.warmup()
+
+    # Bad requests are answered with an error; only EOF or a broken stream ends the loop
+    while True:
+        try:
+            request = read_request(stdin)
+        except ProtocolError as e:
+            write_response(stdout, {"id": None, "ok": False, "error": str(e)})
+            continue
+        if request is None:
+            return
+
+        request_id = request.get("id")
+        try:
+            params = dict(request.get("params") or {})
+            params.pop("filepath", None)
+            body = _dispatch(client, request.get("method", ""), params)
+            write_response(stdout, {"id": request_id, "ok": True}, body)
+        except Exception as e:
+            write_response(stdout, {"id": request_id, "ok": False, "error": str(e)})
+
+
+def main() -> None:
+    # Keep the protocol stream private: anything else written to stdout,
+    # including .NET Console output, is redirected to stderr
+    protocol_out = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    try:
+        serve(sys.stdin.buffer, protocol_out)
+    finally:
+        protocol_out.close()
+
+
+if __name__ == "__main__":
+    main()
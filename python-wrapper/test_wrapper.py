@@ -8,7 +8,8 @@ from pathlib import Path
 # Add parent directory to path to import the package
 sys.path.insert(0, str(Path(__file__).parent))
 
-from doclayer_python import create_title_slide, create_presentation_with_theme, DocLayerError
+import doclayer_python
+from doclayer_python import create_title_slide, create_presentation_with_theme, DocLayerClient, DocLayerError
 
 def test_create_title_slide():
     """Test creating a title slide presentation"""
@@ -79,16 +80,891 @@ def test_create_presentation_with_theme():
         traceback.print_exc()
         return False
 
+def test_shared_runtime_cache():
+    """Test that clients share one process-wide assembly cache"""
+    print("\n[Test 3] Shared Runtime Cache")
+    print("-" * 50)
+    
+    try:
+        doclayer_python.warmup()
+        
+        client_a = DocLayerClient()
+        client_b = DocLayerClient()
+        
+        assert client_a.PresentationBuilder is client_b.PresentationBuilder
+        assert doclayer_python._get_assembly_cache() is doclayer_python._get_assembly_cache()
+        
+        print("✓ Success! Clients share the cached assemblies")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Unexpected Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_create_in_memory():
+    """Test creating a presentation without touching the filesystem"""
+    print("\n[Test 4] In-Memory Presentation")
+    print("-" * 50)
+    
+    try:
+        pptx_bytes = create_presentation_with_theme(
+            filepath=None,
+            title="In-Memory Test",
+            subtitle="Bytes straight from the .NET buffer",
+            font_name="Arial"
+        )
+        
+        # A PPTX package is a ZIP archive
+        assert pptx_bytes[:2] == b"PK"
+        
+        print(f"✓ Success! Created presentation in memory")
+        print(f"✓ Size: {len(pptx_bytes)} bytes")
+        
+        return True
+        
+    except DocLayerError as e:
+        print(f"✗ DocLayer Error: {e}")
+        return False
+    except Exception as e:
+        print(f"✗ Unexpected Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_generate_batch():
+    """Test parallel batch generation with a per-item failure"""
+    print("\n[Test 5] Batch Generation")
+    print("-" * 50)
+    
+    try:
+        specs = [
+            {"title": "Batch Deck 1"},
+            {"title": "Batch Deck 2", "font_name": "Arial"},
+            {"title": "Bad Deck", "accent_colors": ["FF5733"]},
+        ]
+        
+        results = sorted(doclayer_python.generate_batch(specs, workers=2), key=lambda r: r.index)
+        
+        assert len(results) == 3
+        assert results[0].ok and results[0].data[:2] == b"PK"
+        assert results[1].ok
+        assert not results[2].ok
+        
+        print("✓ Success! Batch completed with one reported failure")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Unexpected Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_render_deck():
+    """Test rendering a multi-slide deck spec in one call"""
+    print("\n[Test 6] Render Deck Spec")
+    print("-" * 50)
+    
+    try:
+        import io
+        import zipfile
+        
+        deck = {
+            "font_name": "Arial",
+            "slides": [
+                {"title": "Deck Spec", "subtitle": "Rendered in one pass"},
+                {
+                    "title": "Details",
+                    "footnote": "Source: test",
+                    "textboxes": [{"text": "Body text", "hpos": 1, "vpos": 3}],
+                    "shapes": [{"type": "rectangle", "hpos": 6, "vpos": 3, "height": 1, "width": 2,
+                                "text": "Callout", "fill": "4472C4"},
+                               {"type": "line", "hpos": 1, "vpos": 5, "height": 0, "width": 8}],
+                    "tables": [{"data": [["Region", "Q3"], ["EMEA", "4.2"]]}],
+                },
+            ],
+        }
+        
+        pptx_bytes = doclayer_python.render_deck(None, deck)
+        
+        with zipfile.ZipFile(io.BytesIO(pptx_bytes)) as package:
+            slides = [n for n in package.namelist() if n.startswith("ppt/slides/slide") and n.endswith(".xml")]
+            slide_xml = "".join(package.read(n).decode("utf-8") for n in slides)
+        assert len(slides) == 2, f"Expected 2 slides, found {len(slides)}"
+        assert ":cxnSp>" in slide_xml, "Line shape missing from the deck"
+        
+        print(f"✓ Success! Deck with {len(slides)} slides rendered ({len(pptx_bytes)} bytes)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Unexpected Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_table_spec():
+    """Test bulk-filling a large table from columnar data"""
+    print("\n[Test 7] Bulk Table Fill")
+    print("-" * 50)
+    
+    try:
+        import io
+        import zipfile
+        
+        columns = {f"Col {c}": [r * 1.5 + c for r in range(200)] for c in range(20)}
+        table = doclayer_python.table_spec(
+            columns,
+            column_formats=[{"number_format": "N2", "alignment": "right"}] * 20
+        )
+        
+        pptx_bytes = doclayer_python.render_deck(None, {"slides": [{"title": "Large table", "tables": [table]}]})
+        
+        with zipfile.ZipFile(io.BytesIO(pptx_bytes)) as package:
+            slide_xml = "".join(
+                package.read(n).decode("utf-8") for n in package.namelist()
+                if n.startswith("ppt/slides/slide") and n.endswith(".xml")
+            )
+        assert slide_xml.count("<a:tc>") == 201 * 20, "Expected a header row plus 200 data rows"
+        assert "298.50" in slide_xml, "Number format not applied"
+        
+        print(f"✓ Success! 201x20 table rendered ({len(pptx_bytes)} bytes)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Unexpected Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_stream_deck():
+    """Test streaming a large deck to disk one slide at a time"""
+    print("\n[Test 8] Stream Large Deck")
+    print("-" * 50)
+    
+    try:
+        import zipfile
+        
+        output_file = Path(__file__).parent / "test_outputs" / "python_test_stream_deck.pptx"
+        output_file.parent.mkdir(exist_ok=True)
+        slides = ({"title": f"Slide {i}", "footnote": "Source: generated"} for i in range(2000))
+        
+        count = doclayer_python.stream_deck(output_file, {"font_name": "Arial", "slides": slides})
+        assert count == 2000, f"Expected 2000 slides, wrote {count}"
+        
+        with zipfile.ZipFile(output_file) as package:
+            slide_names = [n for n in package.namelist() if n.startswith("ppt/slides/slide") and n.endswith(".xml")]
+            presentation_xml = package.read("ppt/presentation.xml").decode("utf-8")
+            last_slide_xml = package.read(max(slide_names, key=lambda n: int(n[len("ppt/slides/slide"):-4]))).decode("utf-8")
+        assert len(slide_names) == 2000, "Starter slide should be replaced"
+        assert presentation_xml.count("<p:sldId ") == 2000, "Slide id list does not match the slides"
+        assert "Slide 1999" in last_slide_xml, "Last slide content not written"
+        
+        print(f"✓ Success! {count} slides streamed to {output_file}")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Unexpected Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_image_dedup():
+    """Test that a repeated image is embedded once, from a local file and from a url"""
+    print("\n[Test 9] Image Dedup")
+    print("-" * 50)
+    
+    import base64
+    import io
+    import tempfile
+    import threading
+    import uuid
+    import zipfile
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    
+    logo = base64.b64decode(
+        "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR4nGP4z8DwHwAFAAH/iZk9HQAAAABJRU5ErkJggg=="
+    )
+    requests = []
+    
+    class ImageHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests.append(self.path)
+            self.send_response(200)
+            self.send_header("Content-Type", "image/png")
+            self.send_header("Content-Length", str(len(logo)))
+            self.end_headers()
+            self.wfile.write(logo)
+        
+        def log_message(self, *args):
+            pass
+    
+    # Local stand-in for an image host
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ImageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            logo_path = Path(tmp_dir) / "logo.png"
+            logo_path.write_bytes(logo)
+            # Unique per run so the on-disk fetch cache starts cold
+            logo_url = f"http://127.0.0.1:{server.server_port}/logo.png?run={uuid.uuid4().hex}"
+            
+            slides = [
+                {"title": f"Slide {i}", "pictures": [
+                    {"path": str(logo_path), "hpos": 1, "vpos": 1},
+                    {"path": logo_url, "hpos": 5, "vpos": 1},
+                ]}
+                for i in range(100)
+            ]
+            pptx_bytes = doclayer_python.render_deck(None, {"slides": slides})
+        
+        with zipfile.ZipFile(io.BytesIO(pptx_bytes)) as package:
+            media = [n for n in package.namelist() if n.startswith("ppt/media/")]
+        assert len(media) == 1, f"Expected one embedded image, found {len(media)}"
+        assert len(requests) == 1, f"Expected one download, got {len(requests)}"
+        
+        print(f"✓ Success! 200 pictures share {len(media)} image part ({len(requests)} download)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Unexpected Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        server.shutdown()
+
+def test_extract_text():
+    """Test parallel text extraction from a set of decks"""
+    print("\n[Test 10] Text Extraction")
+    print("-" * 50)
+    
+    try:
+        import tempfile
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = []
+            for i in range(12):
+                path = Path(tmp_dir) / f"deck{i}.pptx"
+                doclayer_python.render_deck(str(path), {"slides": [
+                    {"title": f"Deck {i}", "subtitle": "Overview"},
+                    {"title": "Revenue", "tables": [{"data": [["Region", "Q3"], ["EMEA", 4.2]]}]},
+                ]})
+                paths.append(path)
+            
+            decks = {deck["path"]: deck for deck in doclayer_python.extract_text(paths, workers=4)}
+        
+        assert len(decks) == 12, f"Expected 12 records, got {len(decks)}"
+        deck = decks[str(paths[3])]
+        assert "error" not in deck, deck.get("error")
+        assert [slide.get("title") for slide in deck["slides"]] == ["Deck 3", "Revenue"]
+        assert deck["slides"][1]["tables"][0][1] == ["EMEA", "4.2"]
+        
+        print(f"✓ Success! {len(decks)} decks extracted")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Unexpected Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_theme_registry():
+    """Test registering a theme once and applying it to many decks"""
+    print("\n[Test 11] Theme Registry")
+    print("-" * 50)
+    
+    try:
+        import tempfile
+        import zipfile
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            theme_path = Path(tmp_dir) / "theme.pptx"
+            doclayer_python.create_presentation_with_theme(str(theme_path), "Theme")
+            doclayer_python.register_theme(
+                "corporate", theme_path, font_name="Georgia",
+                accent_colors=["FF5733", "33FF57", "3357FF", "F3FF33"]
+            )
+            
+            paths = []
+            for i in range(8):
+                path = Path(tmp_dir) / f"deck{i}.pptx"
+                doclayer_python.render_deck(str(path), {"slides": [{"title": f"Deck {i}"}, {"title": "Details"}]})
+                paths.append(path)
+            missing = Path(tmp_dir) / "missing.pptx"
+            
+            results = doclayer_python.apply_theme("corporate", paths + [missing], workers=4)
+            
+            assert [result["path"] for result in results] == [str(path) for path in paths + [missing]]
+            assert all(result["error"] is None for result in results[:-1]), results
+            assert results[-1]["error"], "Missing file should be reported"
+            
+            with zipfile.ZipFile(paths[0]) as package:
+                themes = [name for name in package.namelist() if name.startswith("ppt/theme/")]
+                assert any(b"Georgia" in package.read(name) for name in themes), "Theme font not applied"
+        
+        print(f"✓ Success! Theme applied to {len(paths)} decks")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Unexpected Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_async_client():
+    """Test the asyncio client: concurrent builds, concurrency limit and timeouts"""
+    print("\n[Test 12] Async Client")
+    print("-" * 50)
+    
+    try:
+        import asyncio
+        
+        async def run():
+            async with doclayer_python.AsyncDocLayerClient(max_workers=2, max_concurrency=3) as client:
+                ticks = 0
+                
+                async def ticker():
+                    nonlocal ticks
+                    while True:
+                        await asyncio.sleep(0.001)
+                        ticks += 1
+                
+                ticking = asyncio.create_task(ticker())
+                decks = await asyncio.gather(*(
+                    client.create_presentation_with_theme(None, title=f"Async {i}", font_name="Arial")
+                    for i in range(8)
+                ))
+                ticking.cancel()
+                
+                assert all(deck[:2] == b"PK" for deck in decks), "Expected PPTX bytes"
+                assert ticks > 0, "Event loop was blocked while decks were built"
+                
+                output_path = Path(__file__).parent / "test_outputs" / "python_test_async_client.pptx"
+                output_path.parent.mkdir(exist_ok=True)
+                written = await client.render_deck(str(output_path), {"slides": [{"title": "Async"}]})
+                assert output_path.read_bytes() == written
+                
+                try:
+                    await client.create_title_slide(None, "Too slow", timeout=0)
+                    raise AssertionError("Expected a timeout")
+                except asyncio.TimeoutError:
+                    pass
+                
+                return len(decks)
+        
+        count = asyncio.run(run())
+        print(f"✓ Success! {count} decks built concurrently without blocking the loop")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Unexpected Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_instrumentation():
+    """Test per-call metrics through instrument() and the on_metrics callback"""
+    print("\n[Test 13] Instrumentation")
+    print("-" * 50)
+    
+    try:
+        with doclayer_python.instrument() as calls:
+            data = doclayer_python.create_presentation_with_theme(None, "Instrumented", font_name="Verdana")
+        
+        assert len(calls) == 1, f"Expected 1 call, got {len(calls)}"
+        metrics = calls[0]
+        assert metrics["method"] == "create_presentation_with_theme"
+        for phase in ("package_create", "slide_build", "serialize", "marshal"):
+            assert phase in metrics["phases"], f"Missing phase {phase}: {metrics['phases']}"
+        assert metrics["bytes_written"] == len(data)
+        assert metrics["parts_written"] > 0
+        
+        received = []
+        client = doclayer_python.DocLayerClient(on_metrics=received.append)
+        output_path = Path(__file__).parent / "test_outputs" / "python_test_instrumentation.pptx"
+        output_path.parent.mkdir(exist_ok=True)
+        client.render_deck(str(output_path), {"slides": [{"title": "Instrumented"}]})
+        assert received and "io" in received[0]["phases"], received
+        
+        # No listener: nothing is recorded
+        doclayer_python.create_title_slide(None, "Not instrumented")
+        assert len(calls) == 1
+        
+        phases = ", ".join(f"{name} {ms:.2f} ms" for name, ms in metrics["phases"].items())
+        print(f"✓ Success! {phases}")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Unexpected Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_import_time():
+    """Test that importing the package stays within budget and does not start .NET"""
+    print("\n[Test 14] Import Time Budget")
+    print("-" * 50)
+    
+    import subprocess
+    
+    # Generous enough for slow CI machines; a module-level runtime load costs far more
+    budget_ms = 150.0
+    
+    try:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c",
+             "import sys, doclayer_python; "
+             "print(','.join(m for m in ('clr', 'pythonnet', 'clr_loader', 'asyncio') if m in sys.modules))"],
+            cwd=str(Path(__file__).parent),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        
+        loaded = result.stdout.strip()
+        assert not loaded, f"Importing doclayer_python loaded: {loaded}"
+        
+        import_us = None
+        for line in result.stderr.splitlines():
+            parts = [part.strip() for part in line.split("|")]
+            if len(parts) == 3 and parts[2] == "doclayer_python":
+                import_us = int(parts[1])
+        assert import_us is not None, "doclayer_python missing from -X importtime output"
+        
+        import_ms = import_us / 1000.0
+        assert import_ms < budget_ms, f"import took {import_ms:.1f} ms, budget is {budget_ms:.0f} ms"
+        
+        print(f"✓ Success! import doclayer_python: {import_ms:.1f} ms (budget {budget_ms:.0f} ms)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Unexpected Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_output_cache():
+    """Test that identical calls are served from the output cache, in memory and on disk"""
+    print("\n[Test 15] Output Cache")
+    print("-" * 50)
+    
+    import tempfile
+    
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = doclayer_python.OutputCache(max_bytes=16 * 1024 * 1024, disk_dir=cache_dir)
+            client = DocLayerClient(output_cache=cache)
+            colors = ["FF5733", "33FF57", "3357FF", "F3FF33"]
+            
+            first = client.create_presentation_with_theme(None, "Cover", font_name="Arial", accent_colors=colors)
+            second = client.create_presentation_with_theme(None, "Cover", font_name="Arial", accent_colors=colors)
+            assert first == second
+            stats = cache.stats()
+            assert stats["misses"] == 1 and stats["hits"] == 1, stats
+            
+            # Any change to the spec is a different entry
+            client.create_presentation_with_theme(None, "Cover", font_name="Verdana", accent_colors=colors)
+            assert cache.stats()["misses"] == 2
+            
+            # A hit with a path still writes the file
+            output_path = Path(__file__).parent / "test_outputs" / "python_test_output_cache.pptx"
+            output_path.parent.mkdir(exist_ok=True)
+            deck = {"slides": [{"title": "Cached deck"}]}
+            rendered = client.render_deck(None, deck)
+            assert client.render_deck(str(output_path), deck) == rendered
+            assert output_path.read_bytes() == rendered
+            
+            # A new cache on the same directory starts cold in memory and hits on disk
+            restarted = doclayer_python.OutputCache(disk_dir=cache_dir)
+            assert DocLayerClient(output_cache=restarted).render_deck(None, deck) == rendered
+            assert restarted.stats()["disk_hits"] == 1
+            
+            # Remote pictures can change without notice, so their decks are not cached
+            remote = {"slides": [{"title": "Remote", "pictures": [{"path": "https://example.com/logo.png"}]}]}
+            assert doclayer_python.cache.spec_key("render_deck", remote) is None
+        
+        print(f"✓ Success! {cache.stats()}")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Unexpected Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_package_compression():
+    """Test the store and image-only compression modes against the default"""
+    print("\n[Test 16] Package Compression")
+    print("-" * 50)
+    
+    import base64
+    import io
+    import tempfile
+    import zipfile
+    
+    def stored(content, prefix):
+        with zipfile.ZipFile(io.BytesIO(content)) as package:
+            return {
+                info.filename: info.compress_type == zipfile.ZIP_STORED
+                for info in package.infolist() if info.filename.startswith(prefix)
+            }
+    
+    try:
+        default = create_title_slide(None, "Compression")
+        store = create_title_slide(None, "Compression", compression="store")
+        assert not any(stored(default, "ppt/slides/").values())
+        assert all(stored(store, "ppt/").values()), "Expected every part to be stored"
+        assert len(store) > len(default)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            image_path = Path(tmp_dir) / "red.png"
+            image_path.write_bytes(base64.b64decode(
+                "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR4nGP4z8DwHwAFAAH/iZk9HQAAAABJRU5ErkJggg=="
+            ))
+            output_path = Path(__file__).parent / "test_outputs" / "python_test_compression.pptx"
+            output_path.parent.mkdir(exist_ok=True)
+            content = doclayer_python.render_deck(str(output_path), {
+                "image_compression": "store",
+                "slides": [{"title": "Picture", "pictures": [{"path": str(image_path), "hpos": 1, "vpos": 2}]}],
+            })
+        assert all(stored(content, "ppt/media/").values()), "Expected the image to be stored"
+        assert not any(stored(content, "ppt/slides/").values()), "Expected the slide XML to be deflated"
+        
+        try:
+            create_title_slide(None, "Compression", compression="zip")
+            print("✗ An unknown compression level was accepted")
+            return False
+        except DocLayerError:
+            pass
+        
+        print(f"✓ Success! default {len(default)} bytes, store {len(store)} bytes")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Unexpected Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_merge_decks():
+    """Test merging decks into one file with shared masters and images"""
+    print("\n[Test 17] Merge Decks")
+    print("-" * 50)
+    
+    import base64
+    import tempfile
+    import zipfile
+    
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            image_path = Path(tmp_dir) / "red.png"
+            image_path.write_bytes(base64.b64decode(
+                "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR4nGP4z8DwHwAFAAH/iZk9HQAAAABJRU5ErkJggg=="
+            ))
+            paths = []
+            for i in range(5):
+                path = Path(tmp_dir) / f"deck{i}.pptx"
+                doclayer_python.render_deck(str(path), {"slides": [
+                    {"title": f"Deck {i}"},
+                    {"title": "Picture", "pictures": [{"path": str(image_path), "hpos": 1, "vpos": 2}]},
+                ]})
+                paths.append(path)
+            
+            output_path = Path(__file__).parent / "test_outputs" / "python_test_merge.pptx"
+            output_path.parent.mkdir(exist_ok=True)
+            count = doclayer_python.merge_decks(output_path, paths)
+        
+        assert count == 10, f"Expected 10 slides, got {count}"
+        with zipfile.ZipFile(output_path) as package:
+            names = package.namelist()
+        slides = [n for n in names if n.startswith("ppt/slides/slide")]
+        masters = [n for n in names if n.startswith("ppt/slideMasters/slideMaster")]
+        media = [n for n in names if n.startswith("ppt/media/")]
+        assert len(slides) == 10, slides
+        assert len(masters) == 1, f"Expected one shared master, found {masters}"
+        assert len(media) == 1, f"Expected one shared image, found {media}"
+        
+        print(f"✓ Success! Merged {len(paths)} decks into {output_path} ({count} slides)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Unexpected Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_deck_template():
+    """Test compiling a {{token}} template once and rendering records in parallel"""
+    print("\n[Test 18] Deck Template")
+    print("-" * 50)
+    
+    import io
+    import tempfile
+    import zipfile
+    
+    def slide_xml(content):
+        with zipfile.ZipFile(io.BytesIO(content)) as package:
+            return "".join(package.read(n).decode("utf-8") for n in package.namelist()
+                           if n.startswith("ppt/slides/slide"))
+    
+    try:
+        template_bytes = doclayer_python.render_deck(None, {"slides": [
+            {"title": "Dear {{name}}", "subtitle": "Balance: {{balance}}"},
+            {"title": "Details", "tables": [{"data": [["Account", "{{account}}"]]}]},
+        ]})
+        template = doclayer_python.compile_template(template_bytes)
+        assert sorted(template.tokens) == ["account", "balance", "name"], template.tokens
+        
+        content = template.render({"name": "Ada & Co", "balance": 1200.5, "account": "ACC-1"})
+        xml = slide_xml(content)
+        assert "Dear Ada &amp; Co" in xml and "1200.5" in xml and "ACC-1" in xml
+        assert "{{" not in xml
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            records = [
+                {"output": Path(tmp_dir) / f"customer{i}.pptx", "values": {"name": f"Customer {i}", "balance": i}}
+                for i in range(100)
+            ]
+            results = template.render_many(records, workers=4)
+            assert len(results) == 100 and all(r["error"] is None for r in results), results[:3]
+            assert "Dear Customer 42" in slide_xml(Path(results[42]["path"]).read_bytes())
+        
+        output_path = Path(__file__).parent / "test_outputs" / "python_test_template.pptx"
+        output_path.parent.mkdir(exist_ok=True)
+        template.render({"name": "Grace", "balance": 99, "account": "ACC-2"}, output_path)
+        
+        print(f"✓ Success! {template} rendered 100 records")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Unexpected Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_style_terms():
+    """Test styling a glossary of terms across a whole deck in one pass"""
+    print("\n[Test 19] Style Terms")
+    print("-" * 50)
+    
+    import io
+    import zipfile
+    
+    try:
+        source_path = Path(__file__).parent / "test_outputs" / "python_test_terms_source.pptx"
+        output_path = Path(__file__).parent / "test_outputs" / "python_test_terms.pptx"
+        source_path.parent.mkdir(exist_ok=True)
+        doclayer_python.render_deck(source_path, {"slides": [
+            {"title": "EBITDA and EBIT bridge", "subtitle": "Churn fell as ebitda rose"},
+            {"title": "Detail", "tables": [{"data": [["Metric", "Value"], ["EBITDA", "12.4"]]}]},
+        ]})
+        
+        styled = doclayer_python.style_terms(source_path, {
+            "EBITDA": {"bold": True, "color": "1F4E79"},
+            "EBIT": {"italic": True},
+            "churn": {"accent_color": 2},
+            "bridge": {"accent_color": 5},
+        }, output=output_path)
+        assert styled == 6, styled
+        
+        with zipfile.ZipFile(io.BytesIO(output_path.read_bytes())) as package:
+            xml = "".join(package.read(n).decode("utf-8") for n in package.namelist()
+                          if n.startswith("ppt/slides/slide"))
+        assert 'val="1F4E79"' in xml and '<a:t>EBITDA</a:t>' in xml
+        assert 'val="accent5"' in xml
+        
+        try:
+            doclayer_python.style_terms(source_path, {"EBITDA": {"accent_color": 7}}, output=output_path)
+            assert False, "Accent color 7 should be rejected"
+        except DocLayerError as e:
+            assert "1-6" in str(e), e
+        
+        print(f"✓ Success! Styled {styled} occurrences in one pass")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Unexpected Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_patch_deck():
+    """Test patching two slides of an existing deck without rewriting the rest"""
+    print("\n[Test 20] Patch Deck")
+    print("-" * 50)
+    
+    import zipfile
+    
+    try:
+        source_path = Path(__file__).parent / "test_outputs" / "python_test_patch_source.pptx"
+        output_path = Path(__file__).parent / "test_outputs" / "python_test_patch.pptx"
+        source_path.parent.mkdir(exist_ok=True)
+        doclayer_python.render_deck(str(source_path), {"slides": [
+            {"title": f"Slide {i}", "tables": [{"data": [["Metric", "Value"], ["Revenue", f"{i}.0"]]}]}
+            for i in range(1, 21)
+        ]})
+        
+        with doclayer_python.patch_deck(source_path, output=output_path) as deck:
+            assert deck.slide_count == 20 and deck.loaded_slide_count == 0
+            deck.set_title(5, "Patched title")
+            deck.set_table_cell(7, 2, 2, 99.9)
+            modified = deck.modified_entries()
+            assert len(modified) == 2 and deck.loaded_slide_count == 2, modified
+        
+        with zipfile.ZipFile(source_path) as before, zipfile.ZipFile(output_path) as after:
+            for info in before.infolist():
+                if info.filename in modified:
+                    continue
+                copy = after.getinfo(info.filename)
+                assert (copy.CRC, copy.compress_size) == (info.CRC, info.compress_size), info.filename
+            patched_xml = "".join(after.read(name).decode("utf-8") for name in modified)
+        assert "Patched title" in patched_xml and "99.9" in patched_xml
+        
+        print(f"✓ Success! Wrote {len(modified)} slides, copied the other entries unchanged")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Unexpected Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def _init_worker_without_runtime():
+    """Batch worker initializer for tests that do not build real decks"""
+
+def _build_or_crash(index, spec):
+    """Batch task that kills its worker process for specs marked crash"""
+    import os
+    from doclayer_python.batch import BatchResult
+    if spec.get("crash"):
+        os._exit(1)
+    return BatchResult(index, spec, size=1)
+
+def test_batch_worker_crash():
+    """Test that a worker dying mid-batch is reported against its deck without aborting the batch"""
+    print("\n[Test 21] Batch Worker Crash")
+    print("-" * 50)
+    
+    from doclayer_python import batch
+    
+    init_worker, build_in_worker = batch._init_worker, batch._build_in_worker
+    batch._init_worker, batch._build_in_worker = _init_worker_without_runtime, _build_or_crash
+    try:
+        specs = [{"title": f"Deck {i}", "crash": i == 7} for i in range(20)]
+        results = sorted(batch.generate_batch(None, specs, workers=2), key=lambda r: r.index)
+        
+        assert [r.index for r in results] == list(range(20)), [r.index for r in results]
+        failed = [r.index for r in results if not r.ok]
+        assert failed == [7], failed
+        
+        print(f"✓ Success! {len(results) - 1} decks built, the crashed one reported: {results[7].error}")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Unexpected Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        batch._init_worker, batch._build_in_worker = init_worker, build_in_worker
+
+def test_async_timeout_race():
+    """Test that a timeout racing with a slot being released does not shrink the concurrency limit"""
+    print("\n[Test 22] Async Timeout Race")
+    print("-" * 50)
+    
+    try:
+        import asyncio
+        import threading
+        import time
+        
+        async def run():
+            async with doclayer_python.AsyncDocLayerClient(max_workers=2, max_concurrency=1) as client:
+                await client.warmup()
+                loop = asyncio.get_running_loop()
+                blocked = threading.Event()
+                
+                # Stall the loop so the holder's slot is released in one iteration and the
+                # waiter's deadline passes in the next, right as the waiter is granted the slot
+                def stall_loop():
+                    blocked.set()
+                    time.sleep(0.05)
+                    loop.call_soon(time.sleep, 0.05)
+                
+                def hold(_client):
+                    loop.call_soon_threadsafe(stall_loop)
+                    blocked.wait()
+                
+                holder = client.run(hold)
+                waiter = client.run(lambda _client: None, timeout=0.075)
+                await asyncio.gather(holder, waiter, return_exceptions=True)
+                
+                # The only slot must be free again
+                return await client.run(lambda _client: "free", timeout=5)
+        
+        assert asyncio.run(run()) == "free"
+        print("✓ Success! Concurrency slot returned after a racing timeout")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Unexpected Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
 if __name__ == "__main__":
     print("Testing DocLayer Python Wrapper")
     print("=" * 50)
     print()
     
-    success1 = test_create_title_slide()
-    success2 = test_create_presentation_with_theme()
+    results = [
+        test_create_title_slide(),
+        test_create_presentation_with_theme(),
+        test_shared_runtime_cache(),
+        test_create_in_memory(),
+        test_generate_batch(),
+        test_render_deck(),
+        test_table_spec(),
+        test_stream_deck(),
+        test_image_dedup(),
+        test_extract_text(),
+        test_theme_registry(),
+        test_async_client(),
+        test_instrumentation(),
+        test_import_time(),
+        test_output_cache(),
+        test_package_compression(),
+        test_merge_decks(),
+        test_deck_template(),
+        test_style_terms(),
+        test_patch_deck(),
+        test_batch_worker_crash(),
+        test_async_timeout_race(),
+    ]
     
     print("\n" + "=" * 50)
-    if success1 and success2:
+    if all(results):
         print("✓ All tests passed!")
         print("\nOpen the files in PowerPoint to view the results!")
         sys.exit(0)
@@ -0,0 +1,381 @@
+using System.Runtime.CompilerServices;
+using System.Security.Cryptography;
+using DocumentFormat.OpenXml;
+using DocumentFormat.OpenXml.Packaging;
+using OpenXMLExtensions;
+using P = DocumentFormat.OpenXml.Presentation;
+
+namespace DocLayer.Core
+{
+    /// <summary>
+    /// How copied slides get their layouts
+    /// </summary>
+    public enum LayoutMergeMode
+    {
+        /// <summary>
+        /// Import the source slide master, theme and layouts; identical masters are imported once
+        /// </summary>
+        KeepSourceFormatting,
+
+        /// <summary>
+        /// Use the target's layout with the same name, falling back to "Title and Content" (or the first layout)
+        /// </summary>
+        UseDestinationTheme,
+    }
+
+    /// <summary>
+    /// Copies whole slides between presentations at the part level
+    /// </summary>
+    /// <remarks>
+    /// Slide XML is copied as a raw part stream and every relationship is recreated under its source relId,
+    /// so the slide is never parsed or re-serialized. Related parts are shared instead of copied where
+    /// possible:
+    /// <list type="bullet">
+    /// <item>slide masters (with their theme and layouts) are keyed on a hash of all their parts, so decks
+    /// built from the same template share one imported master, and the target's own masters are reused;</item>
+    /// <item>images go through the target's <see cref="ImagePartCache"/>, so an image is stored once however
+    /// many decks and slides use it; audio and video are deduplicated the same way;</item>
+    /// <item>charts, embedded objects, diagrams and tags are deep-copied with the slide.</item>
+    /// </list>
+    /// Speaker notes and comments are not copied. Slide-to-slide hyperlinks are kept when the linked slide
+    /// is copied too (by the same <see cref="AppendPresentation"/> call or earlier); otherwise they point at
+    /// the copied slide itself.
+    ///
+    /// Nothing is saved until the target is closed, so many decks can be merged with a single save
+    /// (see <see cref="MergeFiles"/>). Not thread-safe.
+    /// </remarks>
+    public sealed class DeckMerger
+    {
+        private const string DefaultLayoutName = "Title and Content";
+        private const uint MinMasterId = 2147483648;
+
+        private readonly PresentationDocument _target;
+        private readonly PresentationPart _presentationPart;
+        private readonly SlideIndex _slides;
+        private readonly ImagePartCache _images;
+        private readonly LayoutMergeMode _mode;
+
+        // Keyed weakly on source parts so merged source packages can be collected
+        private readonly ConditionalWeakTable<SlideLayoutPart, SlideLayoutPart> _layouts = new();
+        private readonly ConditionalWeakTable<SlideMasterPart, SlideMasterPart> _masters = new();
+        private readonly ConditionalWeakTable<SlidePart, SlidePart> _copies = new();
+        private readonly Dictionary<string, MediaDataPart> _media = new();
+        private Dictionary<string, SlideMasterPart>? _mastersByHash;
+        private Dictionary<string, SlideLayoutPart>? _layoutsByName;
+        private uint _maxMasterId;
+
+        public DeckMerger(PresentationDocument target, LayoutMergeMode mode = LayoutMergeMode.KeepSourceFormatting)
+        {
+            _target = target ?? throw new ArgumentNullException(nameof(target));
+            _presentationPart = target.PresentationPart
+                ?? throw new InvalidOperationException("PresentationPart not found");
+            _slides = new SlideIndex(_presentationPart);
+            _images = ImagePartCache.For(_presentationPart);
+            _mode = mode;
+        }
+
+        /// <summary>
+        /// Number of slides in the target presentation
+        /// </summary>
+        public int SlideCount => _slides.Count;
+
+        /// <summary>
+        /// Number of slide masters imported into the target
+        /// </summary>
+        public int MastersImported { get; private set; }
+
+        /// <summary>
+        /// Copies the slide to the end of the target presentation
+        /// </summary>
+        /// <param name="sourceSlide">Slide part of another presentation</param>
+        /// <returns>The new slide part</returns>
+        public SlidePart AppendSlide(SlidePart sourceSlide)
+        {
+            if (sourceSlide == null) throw new ArgumentNullException(nameof(sourceSlide));
+
+            List<SlideLink> links = new();
+            SlidePart slidePart = CopySlide(sourceSlide, links);
+            RelateLinks(links);
+            return slidePart;
+        }
+
+        /// <summary>
+        /// Copies every slide of the source presentation, in order, to the end of the target presentation
+        /// </summary>
+        /// <returns>Number of slides copied</returns>
+        public int AppendPresentation(PresentationDocument source)
+        {
+            if (source == null) throw new ArgumentNullException(nameof(source));
+
+            PresentationPart sourcePart = source.PresentationPart
+                ?? throw new ArgumentException("The source presentation is empty", nameof(source));
+
+            IReadOnlyList<SlidePart> sourceSlides = new SlideIndex(sourcePart).SlideParts;
+            List<SlideLink> links = new();
+            foreach (SlidePart sourceSlide in sourceSlides)
+            {
+                CopySlide(sourceSlide, links);
+            }
+
+            // Links are related once every slide they may point at has been copied
+            RelateLinks(links);
+            return sourceSlides.Count;
+        }
+
+        /// <summary>
+        /// Merges presentation files into one, saving the output once. The first file is the base: its
+        /// slides, masters, notes and properties are kept as they are, and the slides of the other files
+        /// are appended in order.
+        /// </summary>
+        /// <param name="sourceFiles">Presentations to merge, in order</param>
+        /// <param name="outputFile">Path of the merged presentation; overwritten if it exists</param>
+        /// <param name="mode">How appended slides get their layouts</param>
+        /// <returns>Number of slides in the merged presentation</returns>
+        public static int MergeFiles(IEnumerable<string> sourceFiles, string outputFile, LayoutMergeMode mode = LayoutMergeMode.KeepSourceFormatting)
+        {
+            if (sourceFiles == null) throw new ArgumentNullException(nameof(sourceFiles));
+
+            List<string> files = sourceFiles.ToList();
+            if (files.Count == 0) throw new ArgumentException("At least one presentation is required", nameof(sourceFiles));
+
+            File.Copy(files[0], outputFile, overwrite: true);
+
+            using PresentationDocument target = PresentationDocument.Open(outputFile, true);
+            DeckMerger merger = new DeckMerger(target, mode);
+            foreach (string file in files.Skip(1))
+            {
+                using PresentationDocument source = PresentationDocument.Open(file, false);
+                merger.AppendPresentation(source);
+            }
+            return merger.SlideCount;
+        }
+
+        private SlidePart CopySlide(SlidePart sourceSlide, List<SlideLink> links)
+        {
+            SlidePart slidePart = _presentationPart.AddNewPart<SlidePart>();
+            using (Stream stream = sourceSlide.GetStream(FileMode.Open, FileAccess.Read))
+            {
+                slidePart.FeedData(stream);
+            }
+
+            foreach (IdPartPair pair in sourceSlide.Parts)
+            {
+                switch (pair.OpenXmlPart)
+                {
+                    case SlideLayoutPart layoutPart:
+                        slidePart.AddPart(MapLayout(layoutPart), pair.RelationshipId);
+                        break;
+                    case ImagePart imagePart:
+                        _images.ImportImage(slidePart, imagePart, pair.RelationshipId);
+                        break;
+                    case SlidePart linkedSlide:
+                        links.Add(new SlideLink(slidePart, linkedSlide, pair.RelationshipId));
+                        break;
+                    case NotesSlidePart:
+                    case SlideCommentsPart:
+                    case PowerPointCommentPart:
+                        break;
+                    default:
+                        // Charts, embedded objects, diagrams and tags are copied with their own parts
+                        slidePart.AddPart(pair.OpenXmlPart, pair.RelationshipId);
+                        break;
+                }
+            }
+
+            foreach (HyperlinkRelationship hyperlink in sourceSlide.HyperlinkRelationships)
+            {
+                slidePart.AddHyperlinkRelationship(hyperlink.Uri, hyperlink.IsExternal, hyperlink.Id);
+            }
+            foreach (ExternalRelationship external in sourceSlide.ExternalRelationships)
+            {
+                slidePart.AddExternalRelationship(external.RelationshipType, external.Uri, external.Id);
+            }
+            foreach (DataPartReferenceRelationship reference in sourceSlide.DataPartReferenceRelationships)
+            {
+                MediaDataPart media = ImportMedia(reference.DataPart);
+                switch (reference)
+                {
+                    case VideoReferenceRelationship:
+                        slidePart.AddVideoReferenceRelationship(media, reference.Id);
+                        break;
+                    case AudioReferenceRelationship:
+                        slidePart.AddAudioReferenceRelationship(media, reference.Id);
+                        break;
+                    default:
+                        slidePart.AddMediaReferenceRelationship(media, reference.Id);
+                        break;
+                }
+            }
+
+            _slides.Append(slidePart);
+            _copies.AddOrUpdate(sourceSlide, slidePart);
+            return slidePart;
+        }
+
+        private void RelateLinks(List<SlideLink> links)
+        {
+            foreach (SlideLink link in links)
+            {
+                SlidePart linked = _copies.TryGetValue(link.Source, out SlidePart? copy) ? copy : link.From;
+                link.From.AddPart(linked, link.RelationshipId);
+            }
+        }
+
+        private SlideLayoutPart MapLayout(SlideLayoutPart sourceLayout)
+        {
+            if (_layouts.TryGetValue(sourceLayout, out SlideLayoutPart? mapped))
+            {
+                return mapped;
+            }
+
+            mapped = _mode == LayoutMergeMode.UseDestinationTheme
+                ? FindLayoutByName(ThemeRegistry.ReadLayoutName(sourceLayout))
+                : ImportLayout(sourceLayout);
+            _layouts.Add(sourceLayout, mapped);
+            return mapped;
+        }
+
+        private SlideLayoutPart ImportLayout(SlideLayoutPart sourceLayout)
+        {
+            SlideMasterPart sourceMaster = sourceLayout.SlideMasterPart
+                ?? throw new InvalidOperationException("Slide layout has no slide master");
+
+            if (!_masters.TryGetValue(sourceMaster, out SlideMasterPart? master))
+            {
+                _mastersByHash ??= _presentationPart.SlideMasterParts.ToDictionary(HashMaster, part => part);
+
+                string hash = HashMaster(sourceMaster);
+                if (!_mastersByHash.TryGetValue(hash, out master))
+                {
+                    master = ImportMaster(sourceMaster);
+                    _mastersByHash.Add(hash, master);
+                }
+                _masters.Add(sourceMaster, master);
+            }
+
+            // Equal masters relate their layouts under the same relIds; the SDK keeps relIds on import
+            string relId = sourceMaster.GetIdOfPart(sourceLayout);
+            if (master.TryGetPartById(relId, out OpenXmlPart? part) && part is SlideLayoutPart layoutPart)
+            {
+                return layoutPart;
+            }
+
+            string? layoutName = ThemeRegistry.ReadLayoutName(sourceLayout);
+            return master.SlideLayoutParts.FirstOrDefault(layout => ThemeRegistry.ReadLayoutName(layout) == layoutName)
+                ?? master.SlideLayoutParts.First();
+        }
+
+        private SlideMasterPart ImportMaster(SlideMasterPart sourceMaster)
+        {
+            P.Presentation presentation = _presentationPart.Presentation;
+            presentation.SlideMasterIdList ??= new P.SlideMasterIdList();
+
+            if (_maxMasterId == 0)
+            {
+                // Master and layout ids share one id space across the presentation
+                _maxMasterId = MinMasterId - 1;
+                foreach (P.SlideMasterId masterId in presentation.SlideMasterIdList.Elements<P.SlideMasterId>())
+                {
+                    _maxMasterId = Math.Max(_maxMasterId, masterId.Id?.Value ?? 0);
+                }
+                foreach (SlideMasterPart masterPart in _presentationPart.SlideMasterParts)
+                {
+                    foreach (P.SlideLayoutId layoutId in masterPart.SlideMaster.SlideLayoutIdList?.Elements<P.SlideLayoutId>() ?? Enumerable.Empty<P.SlideLayoutId>())
+                    {
+                        _maxMasterId = Math.Max(_maxMasterId, layoutId.Id?.Value ?? 0);
+                    }
+                }
+            }
+
+            // Copies the master with its theme, layouts and their images
+            SlideMasterPart master = _presentationPart.AddPart(sourceMaster);
+            presentation.SlideMasterIdList.Append(new P.SlideMasterId
+            {
+                Id = ++_maxMasterId,
+                RelationshipId = _presentationPart.GetIdOfPart(master),
+            });
+            foreach (P.SlideLayoutId layoutId in master.SlideMaster.SlideLayoutIdList?.Elements<P.SlideLayoutId>() ?? Enumerable.Empty<P.SlideLayoutId>())
+            {
+                layoutId.Id = ++_maxMasterId;
+            }
+
+            MastersImported++;
+            return master;
+        }
+
+        private SlideLayoutPart FindLayoutByName(string? layoutName)
+        {
+            SlideMasterPart master = _presentationPart.SlideMasterParts.FirstOrDefault()
+                ?? throw new InvalidOperationException("The target presentation has no slide master");
+
+            _layoutsByName ??= master.SlideLayoutParts
+                .Select(layoutPart => (Name: ThemeRegistry.ReadLayoutName(layoutPart), Part: layoutPart))
+                .Where(layout => layout.Name != null)
+                .GroupBy(layout => layout.Name!)
+                .ToDictionary(group => group.Key, group => group.First().Part);
+
+            return layoutName != null && _layoutsByName.TryGetValue(layoutName, out SlideLayoutPart? byName) ? byName
+                : _layoutsByName.TryGetValue(DefaultLayoutName, out SlideLayoutPart? fallback) ? fallback
+                : master.SlideLayoutParts.First();
+        }
+
+        private MediaDataPart ImportMedia(DataPart sourceMedia)
+        {
+            string hash;
+            using (Stream stream = sourceMedia.GetStream(FileMode.Open, FileAccess.Read))
+            {
+                hash = Convert.ToHexString(SHA256.HashData(stream));
+            }
+
+            if (!_media.TryGetValue(hash, out MediaDataPart? media))
+            {
+                media = _target.CreateMediaDataPart(sourceMedia.ContentType, Path.GetExtension(sourceMedia.Uri.OriginalString));
+                using (Stream stream = sourceMedia.GetStream(FileMode.Open, FileAccess.Read))
+                {
+                    media.FeedData(stream);
+                }
+                _media.Add(hash, media);
+            }
+            return media;
+        }
+
+        /// <summary>
+        /// Hash of the master and every part reachable from it (theme, layouts, images), in relId order
+        /// </summary>
+        private static string HashMaster(SlideMasterPart master)
+        {
+            using IncrementalHash hash = IncrementalHash.CreateHash(HashAlgorithmName.SHA256);
+            HashSet<OpenXmlPart> seen = new();
+            Stack<OpenXmlPart> pending = new();
+            pending.Push(master);
+            seen.Add(master);
+
+            byte[] buffer = new byte[81920];
+            while (pending.Count > 0)
+            {
+                OpenXmlPart part = pending.Pop();
+                hash.AppendData(System.Text.Encoding.UTF8.GetBytes(part.ContentType));
+                using (Stream stream = part.GetStream(FileMode.Open, FileAccess.Read))
+                {
+                    int read;
+                    while ((read = stream.Read(buffer, 0, buffer.Length)) > 0)
+                    {
+                        hash.AppendData(buffer, 0, read);
+                    }
+                }
+
+                foreach (IdPartPair pair in part.Parts.OrderByDescending(pair => pair.RelationshipId, StringComparer.Ordinal))
+                {
+                    if (seen.Add(pair.OpenXmlPart))
+                    {
+                        hash.AppendData(System.Text.Encoding.UTF8.GetBytes(pair.RelationshipId));
+                        pending.Push(pair.OpenXmlPart);
+                    }
+                }
+            }
+            return Convert.ToHexString(hash.GetHashAndReset());
+        }
+
+        private readonly record struct SlideLink(SlidePart From, SlidePart Source, string RelationshipId);
+    }
+}
@@ -0,0 +1,418 @@
+using System.IO.Compression;
+using System.Text;
+using System.Xml;
+using DocumentFormat.OpenXml;
+using OpenXMLExtensions;
+using D = DocumentFormat.OpenXml.Drawing;
+using P = DocumentFormat.OpenXml.Presentation;
+
+namespace DocLayer.Core
+{
+    /// <summary>
+    /// Edits a few slides of an existing presentation without re-serializing the rest of the package
+    /// </summary>
+    /// <remarks>
+    /// Opening a session reads only the ZIP directory, the presentation part and its relationships, to
+    /// learn the slide order. A slide is parsed the first time it is accessed, and <see cref="Commit"/>
+    /// compares each loaded slide with its state as loaded, so only slides that actually changed are
+    /// written back. The other entries - untouched slides, layouts, media - keep their compressed bytes;
+    /// they are copied byte for byte, never inflated.
+    ///
+    /// The session works on slide XML alone: edits that need new parts or relationships (adding
+    /// slides or pictures) still need a <see cref="DocumentFormat.OpenXml.Packaging.PresentationDocument"/>.
+    /// Existing parts can be swapped wholesale with <see cref="ReplaceEntry"/>, e.g. to refresh a chart image.
+    /// </remarks>
+    public sealed class DeckPatchSession : IDisposable
+    {
+        private const string RelationshipNamespace = "http://schemas.openxmlformats.org/officeDocument/2006/relationships";
+        private const string PackageRelationshipNamespace = "http://schemas.openxmlformats.org/package/2006/relationships";
+
+        private static readonly byte[] XmlDeclaration = Encoding.UTF8.GetBytes(
+            "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>\r\n");
+
+        private static readonly XmlReaderSettings ReaderSettings = new() { CloseInput = true };
+
+        private readonly string _path;
+        private readonly List<string> _slideEntries;
+        private readonly LoadedSlide?[] _slides;
+        private readonly Dictionary<string, byte[]> _replacedEntries = new(StringComparer.Ordinal);
+        private ZipArchive? _archive;
+
+        private DeckPatchSession(string path, ZipArchive archive, List<string> slideEntries)
+        {
+            _path = path;
+            _archive = archive;
+            _slideEntries = slideEntries;
+            _slides = new LoadedSlide?[slideEntries.Count];
+        }
+
+        /// <summary>
+        /// Opens a session on a presentation file. The file stays open for reading until the session is committed or disposed.
+        /// </summary>
+        public static DeckPatchSession Open(string filepath)
+        {
+            if (filepath == null) throw new ArgumentNullException(nameof(filepath));
+
+            ZipArchive archive = ZipFile.OpenRead(filepath);
+            try
+            {
+                return new DeckPatchSession(filepath, archive, ReadSlideOrder(archive));
+            }
+            catch
+            {
+                archive.Dispose();
+                throw;
+            }
+        }
+
+        /// <summary>
+        /// Number of slides in the presentation
+        /// </summary>
+        public int SlideCount => _slides.Length;
+
+        /// <summary>
+        /// Number of slides parsed so far
+        /// </summary>
+        public int LoadedSlideCount => _slides.Count(slide => slide != null);
+
+        /// <summary>
+        /// ZIP entry name of the slide, e.g. "ppt/slides/slide3.xml"
+        /// </summary>
+        public string GetSlideEntryName(int slideNumber)
+        {
+            return _slideEntries[ToIndex(slideNumber)];
+        }
+
+        /// <summary>
+        /// Gets the slide (1-based, as PresentationDocExtensions.GetSlide), parsing it on first access.
+        /// Edit it with the usual slide extensions.
+        /// </summary>
+        public P.Slide GetSlide(int slideNumber)
+        {
+            int index = ToIndex(slideNumber);
+            LoadedSlide? loaded = _slides[index];
+            if (loaded == null)
+            {
+                string xml;
+                using (StreamReader reader = new StreamReader(GetEntry(_slideEntries[index]).Open(), Encoding.UTF8))
+                {
+                    xml = reader.ReadToEnd();
+                }
+
+                P.Slide slide = new P.Slide(StripDeclaration(xml));
+                // Parse now, so the baseline is serialized the same way as the slide will be on commit
+                _ = slide.ChildElements.Count;
+                loaded = new LoadedSlide(slide, slide.OuterXml);
+                _slides[index] = loaded;
+            }
+            return loaded.Slide;
+        }
+
+        /// <summary>
+        /// Replaces the text of the slide's title, keeping the formatting of its first run
+        /// </summary>
+        public void SetTitleText(int slideNumber, string text)
+        {
+            P.ShapeTree shapeTree = GetSlide(slideNumber).CommonSlideData?.ShapeTree
+                ?? throw new InvalidOperationException($"Slide {slideNumber} has no shape tree");
+
+            P.Shape title = shapeTree.Elements<P.Shape>().FirstOrDefault(IsTitle)
+                ?? shapeTree.Elements<P.Shape>().FirstOrDefault()
+                ?? throw new InvalidOperationException($"Slide {slideNumber} has no title shape");
+            ReplaceText(title.TextBody ?? throw new InvalidOperationException($"Slide {slideNumber} title has no text body"), text);
+        }
+
+        /// <summary>
+        /// Replaces the text of the named shape, keeping the formatting of its first run
+        /// </summary>
+        public void SetShapeText(int slideNumber, string shapeName, string text)
+        {
+            P.Shape shape = GetSlide(slideNumber).GetShape(shapeName);
+            ReplaceText(shape.TextBody ?? throw new InvalidOperationException($"Shape '{shapeName}' has no text body"), text);
+        }
+
+        /// <summary>
+        /// Replaces the text of a table cell, keeping the formatting of its first run
+        /// </summary>
+        /// <param name="slideNumber">1-based slide number</param>
+        /// <param name="row">1-based row</param>
+        /// <param name="column">1-based column</param>
+        /// <param name="text">New cell text</param>
+        /// <param name="tableNumber">Which table on the slide, 1-based in document order</param>
+        public void SetTableCell(int slideNumber, int row, int column, string text, int tableNumber = 1)
+        {
+            D.Table table = GetSlide(slideNumber).Descendants<D.Table>().ElementAtOrDefault(tableNumber - 1)
+                ?? throw new ArgumentOutOfRangeException(nameof(tableNumber), $"Slide {slideNumber} has no table {tableNumber}");
+            D.TableCell cell = table.GetCell(row, column);
+            ReplaceText(cell.TextBody ?? cell.AppendChild(new D.TextBody(new D.BodyProperties(), new D.ListStyle())), text);
+        }
+
+        /// <summary>
+        /// Replaces the content of an existing entry, e.g. "ppt/media/image4.png", without changing its content type
+        /// </summary>
+        public void ReplaceEntry(string entryName, byte[] content)
+        {
+            if (content == null) throw new ArgumentNullException(nameof(content));
+            GetEntry(entryName);
+            _replacedEntries[entryName] = content;
+        }
+
+        /// <summary>
+        /// Entry names of the slides changed since they were loaded and of the replaced entries
+        /// </summary>
+        public List<string> GetModifiedEntries()
+        {
+            List<string> modified = new();
+            for (int i = 0; i < _slides.Length; i++)
+            {
+                LoadedSlide? loaded = _slides[i];
+                if (loaded != null && !string.Equals(loaded.Slide.OuterXml, loaded.Baseline, StringComparison.Ordinal))
+                {
+                    modified.Add(_slideEntries[i]);
+                }
+            }
+            modified.AddRange(_replacedEntries.Keys);
+            return modified;
+        }
+
+        /// <summary>
+        /// Writes the modified entries and ends the session
+        /// </summary>
+        /// <param name="outputPath">Where to save the patched presentation (overwritten); null patches the file in place</param>
+        /// <returns>The number of entries written</returns>
+        public int Commit(string? outputPath = null)
+        {
+            if (_archive == null) throw new ObjectDisposedException(nameof(DeckPatchSession));
+
+            using PhaseScope phase = DocLayerDiagnostics.StartPhase(DocLayerDiagnostics.Phases.Serialize);
+
+            // Serialize while the slides are still at hand, then release the source before writing
+            Dictionary<string, byte[]> writes = new(_replacedEntries, StringComparer.Ordinal);
+            for (int i = 0; i < _slides.Length; i++)
+            {
+                LoadedSlide? loaded = _slides[i];
+                if (loaded == null) continue;
+
+                string xml = loaded.Slide.OuterXml;
+                if (string.Equals(xml, loaded.Baseline, StringComparison.Ordinal)) continue;
+
+                byte[] bytes = new byte[XmlDeclaration.Length + Encoding.UTF8.GetByteCount(xml)];
+                XmlDeclaration.CopyTo(bytes, 0);
+                Encoding.UTF8.GetBytes(xml, 0, xml.Length, bytes, XmlDeclaration.Length);
+                writes[_slideEntries[i]] = bytes;
+            }
+            Dispose();
+
+            string target = _path;
+            if (outputPath != null && !string.Equals(Path.GetFullPath(outputPath), Path.GetFullPath(_path), StringComparison.Ordinal))
+            {
+                File.Copy(_path, outputPath, true);
+                target = outputPath;
+            }
+
+            if (writes.Count == 0)
+            {
+                return 0;
+            }
+
+            // Update mode copies the compressed bytes of entries that are not replaced
+            long bytesWritten;
+            int entries;
+            using (FileStream stream = new FileStream(target, FileMode.Open, FileAccess.ReadWrite))
+            {
+                using (ZipArchive archive = new ZipArchive(stream, ZipArchiveMode.Update, leaveOpen: true))
+                {
+                    foreach (KeyValuePair<string, byte[]> write in writes)
+                    {
+                        archive.GetEntry(write.Key)?.Delete();
+                        using Stream entryStream = archive.CreateEntry(write.Key, CompressionLevel.Optimal).Open();
+                        entryStream.Write(write.Value, 0, write.Value.Length);
+                    }
+                    entries = archive.Entries.Count;
+                }
+                bytesWritten = stream.Length;
+            }
+
+            if (phase.IsActive)
+            {
+                DocLayerDiagnostics.RecordPackage(phase, bytesWritten, entries);
+            }
+            return writes.Count;
+        }
+
+        /// <summary>
+        /// Closes the source file; uncommitted changes are discarded
+        /// </summary>
+        public void Dispose()
+        {
+            _archive?.Dispose();
+            _archive = null;
+        }
+
+        private ZipArchiveEntry GetEntry(string entryName)
+        {
+            if (_archive == null) throw new ObjectDisposedException(nameof(DeckPatchSession));
+            return _archive.GetEntry(entryName)
+                ?? throw new ArgumentException($"The presentation has no entry '{entryName}'", nameof(entryName));
+        }
+
+        private int ToIndex(int slideNumber)
+        {
+            if (slideNumber < 1 || slideNumber > _slides.Length)
+            {
+                throw new ArgumentOutOfRangeException(nameof(slideNumber), $"Slide number {slideNumber} is out of range (1-{_slides.Length})");
+            }
+            return slideNumber - 1;
+        }
+
+        private static bool IsTitle(P.Shape shape)
+        {
+            P.PlaceholderShape? placeholder = shape.NonVisualShapeProperties?.ApplicationNonVisualDrawingProperties?.PlaceholderShape;
+            return placeholder?.Type != null
+                && (placeholder.Type == P.PlaceholderValues.Title || placeholder.Type == P.PlaceholderValues.CenteredTitle);
+        }
+
+        /// <summary>
+        /// Makes the text body hold one paragraph with one run of the text, keeping the first paragraph's
+        /// properties and the first run's formatting
+        /// </summary>
+        private static void ReplaceText(OpenXmlCompositeElement textBody, string text)
+        {
+            List<D.Paragraph> paragraphs = textBody.Elements<D.Paragraph>().ToList();
+            D.Paragraph paragraph = paragraphs.Count > 0 ? paragraphs[0] : textBody.AppendChild(new D.Paragraph());
+            for (int i = 1; i < paragraphs.Count; i++)
+            {
+                paragraphs[i].Remove();
+            }
+
+            D.Run? run = paragraph.Elements<D.Run>().FirstOrDefault();
+            foreach (OpenXmlElement child in paragraph.ChildElements.ToList())
+            {
+                if (child != run && (child is D.Run || child is D.Break || child is D.Field))
+                {
+                    child.Remove();
+                }
+            }
+
+            if (run == null)
+            {
+                run = new D.Run(new D.RunProperties { Language = "en-US", Dirty = false }, new D.Text(text));
+                D.EndParagraphRunProperties? end = paragraph.GetFirstChild<D.EndParagraphRunProperties>();
+                if (end != null) end.InsertBeforeSelf(run);
+                else paragraph.AppendChild(run);
+                return;
+            }
+
+            if (run.Text != null) run.Text.Text = text;
+            else run.AppendChild(new D.Text(text));
+        }
+
+        private static string StripDeclaration(string xml)
+        {
+            int start = xml.Length > 0 && xml[0] == '\uFEFF' ? 1 : 0;
+            if (string.CompareOrdinal(xml, start, "<?xml", 0, 5) == 0)
+            {
+                start = xml.IndexOf("?>", start, StringComparison.Ordinal) + 2;
+            }
+            while (start < xml.Length && char.IsWhiteSpace(xml[start])) start++;
+            return start == 0 ? xml : xml.Substring(start);
+        }
+
+        /// <summary>
+        /// Reads the slide entry names in presentation order from presentation.xml and its relationships
+        /// </summary>
+        private static List<string> ReadSlideOrder(ZipArchive archive)
+        {
+            string presentationEntry = "ppt/presentation.xml";
+            using (XmlReader reader = XmlReader.Create(OpenEntry(archive, "_rels/.rels"), ReaderSettings))
+            {
+                while (reader.ReadToFollowing("Relationship", PackageRelationshipNamespace))
+                {
+                    if (reader.GetAttribute("Type")?.EndsWith("/officeDocument", StringComparison.Ordinal) == true)
+                    {
+                        presentationEntry = ResolveTarget("", reader.GetAttribute("Target") ?? presentationEntry);
+                        break;
+                    }
+                }
+            }
+
+            string directory = presentationEntry.Contains('/') ? presentationEntry.Substring(0, presentationEntry.LastIndexOf('/') + 1) : "";
+            string relsEntry = $"{directory}_rels/{presentationEntry.Substring(directory.Length)}.rels";
+
+            Dictionary<string, string> targets = new(StringComparer.Ordinal);
+            using (XmlReader reader = XmlReader.Create(OpenEntry(archive, relsEntry), ReaderSettings))
+            {
+                while (reader.ReadToFollowing("Relationship", PackageRelationshipNamespace))
+                {
+                    string? id = reader.GetAttribute("Id");
+                    string? target = reader.GetAttribute("Target");
+                    if (id != null && target != null && reader.GetAttribute("TargetMode") != "External")
+                    {
+                        targets[id] = ResolveTarget(directory, target);
+                    }
+                }
+            }
+
+            List<string> slides = new();
+            using (XmlReader reader = XmlReader.Create(OpenEntry(archive, presentationEntry), ReaderSettings))
+            {
+                if (reader.ReadToFollowing("sldIdLst", "http://schemas.openxmlformats.org/presentationml/2006/main")
+                    && reader.ReadToDescendant("sldId", "http://schemas.openxmlformats.org/presentationml/2006/main"))
+                {
+                    do
+                    {
+                        string? relId = reader.GetAttribute("id", RelationshipNamespace);
+                        if (relId != null && targets.TryGetValue(relId, out string? entry))
+                        {
+                            slides.Add(entry);
+                        }
+                    }
+                    while (reader.ReadToNextSibling("sldId", "http://schemas.openxmlformats.org/presentationml/2006/main"));
+                }
+            }
+            return slides;
+        }
+
+        private static Stream OpenEntry(ZipArchive archive, string entryName)
+        {
+            ZipArchiveEntry entry = archive.GetEntry(entryName)
+                ?? throw new InvalidDataException($"The package has no '{entryName}' entry");
+            return entry.Open();
+        }
+
+        private static string ResolveTarget(string directory, string target)
+        {
+            // Absolute targets start at the package root; relative ones at the source part's folder
+            string path = target.StartsWith('/') ? target.Substring(1) : directory + target;
+            List<string> segments = new();
+            foreach (string segment in path.Split('/'))
+            {
+                if (segment == "..")
+                {
+                    if (segments.Count > 0) segments.RemoveAt(segments.Count - 1);
+                }
+                else if (segment.Length > 0 && segment != ".")
+                {
+                    segments.Add(segment);
+                }
+            }
+            return Uri.UnescapeDataString(string.Join('/', segments));
+        }
+
+        private sealed class LoadedSlide
+        {
+            public LoadedSlide(P.Slide slide, string baseline)
+            {
+                Slide = slide;
+                Baseline = baseline;
+            }
+
+            public P.Slide Slide { get; }
+
+            /// <summary>
+            /// OuterXml of the slide as loaded
+            /// </summary>
+            public string Baseline { get; }
+        }
+    }
+}
@@ -0,0 +1,218 @@
+using System.Buffers;
+using System.Text;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+using OpenXMLExtensions;
+
+namespace DocLayer.Core
+{
+    /// <summary>
+    /// Declarative description of a whole presentation, rendered by <see cref="PresentationBuilder.BuildDeck"/>
+    /// </summary>
+    /// <remarks>
+    /// Property names map to snake_case JSON keys (e.g. <c>font_name</c>, <c>accent_colors</c>) so the
+    /// same spec can be produced from Python dicts or TypeScript objects. Positions and sizes are in inches.
+    /// </remarks>
+    public class DeckSpec
+    {
+        internal static readonly JsonSerializerOptions JsonOptions = new()
+        {
+            PropertyNamingPolicy = JsonNamingPolicy.SnakeCaseLower,
+            PropertyNameCaseInsensitive = true,
+            DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull,
+            Converters = { new StringOrNumberConverter() },
+        };
+
+        /// <summary>
+        /// If true, uses 16:9 format; otherwise uses 4:3
+        /// </summary>
+        public bool Widescreen { get; set; } = true;
+
+        /// <summary>
+        /// Theme font typeface name - optional
+        /// </summary>
+        public string? FontName { get; set; }
+
+        /// <summary>
+        /// 4 hex color codes for the theme accent colors - optional
+        /// </summary>
+        public List<string>? AccentColors { get; set; }
+
+        /// <summary>
+        /// ZIP compression of the package: "optimal" (default), "fastest", "store" or "maximum"
+        /// </summary>
+        public string? Compression { get; set; }
+
+        /// <summary>
+        /// ZIP compression of PNG, JPEG and GIF images, which are already compressed - optional, defaults to <see cref="Compression"/>
+        /// </summary>
+        public string? ImageCompression { get; set; }
+
+        /// <summary>
+        /// Slides in presentation order
+        /// </summary>
+        public List<SlideSpec> Slides { get; set; } = new();
+
+        /// <summary>
+        /// Parses a deck spec from JSON
+        /// </summary>
+        public static DeckSpec FromJson(string json)
+        {
+            DeckSpec deck = JsonSerializer.Deserialize<DeckSpec>(json, JsonOptions)
+                ?? throw new ArgumentException("Deck spec JSON is empty", nameof(json));
+
+            if (deck.Slides.Count == 0)
+            {
+                throw new ArgumentException("Deck spec must contain at least one slide", nameof(json));
+            }
+
+            return deck;
+        }
+
+        public string ToJson()
+        {
+            return JsonSerializer.Serialize(this, JsonOptions);
+        }
+
+        /// <summary>
+        /// Package compression settings parsed from <see cref="Compression"/> and <see cref="ImageCompression"/>
+        /// </summary>
+        /// <returns>The settings, or null for the default compression</returns>
+        public PackageCompression? GetCompression()
+        {
+            return PackageCompression.Parse(Compression, ImageCompression);
+        }
+    }
+
+    /// <summary>
+    /// One slide of a <see cref="DeckSpec"/>, built on a title layout slide
+    /// </summary>
+    public class SlideSpec
+    {
+        /// <summary>
+        /// Parses a single slide spec from JSON, using the same keys as the entries of <see cref="DeckSpec.Slides"/>
+        /// </summary>
+        public static SlideSpec FromJson(string json)
+        {
+            return JsonSerializer.Deserialize<SlideSpec>(json, DeckSpec.JsonOptions)
+                ?? throw new ArgumentException("Slide spec JSON is empty", nameof(json));
+        }
+
+        public string? Title { get; set; }
+
+        public string? Subtitle { get; set; }
+
+        public string? Footnote { get; set; }
+
+        public List<TextboxSpec> Textboxes { get; set; } = new();
+
+        public List<ShapeSpec> Shapes { get; set; } = new();
+
+        public List<TableSpec> Tables { get; set; } = new();
+
+        public List<PictureSpec> Pictures { get; set; } = new();
+    }
+
+    public class TextboxSpec
+    {
+        public string Text { get; set; } = "";
+
+        public int Hpos { get; set; } = 1;
+
+        public int Vpos { get; set; } = 1;
+    }
+
+    public class ShapeSpec
+    {
+        /// <summary>
+        /// Shape kind: rectangle, rounded_rectangle, circle, triangle, chevron, pentagon_arrow,
+        /// right_arrow, left_arrow, up_arrow, down_arrow, line or harvey_ball
+        /// </summary>
+        public string Type { get; set; } = "rectangle";
+
+        public int Hpos { get; set; }
+
+        public int Vpos { get; set; }
+
+        public int Height { get; set; } = 1;
+
+        public int Width { get; set; } = 1;
+
+        public string? Text { get; set; }
+
+        /// <summary>
+        /// Hex fill color (e.g. "4472C4") - optional
+        /// </summary>
+        public string? Fill { get; set; }
+
+        /// <summary>
+        /// Theme accent number (1-6) used as the fill - optional, ignored when <see cref="Fill"/> is set
+        /// </summary>
+        public int? SchemeFill { get; set; }
+    }
+
+    public class TableSpec
+    {
+        public int Rows { get; set; }
+
+        public int Cols { get; set; }
+
+        /// <summary>
+        /// Cell text by row, then column. May be smaller than the table; JSON numbers are accepted as text
+        /// </summary>
+        public List<List<string?>>? Data { get; set; }
+
+        /// <summary>
+        /// Formatting for each column's data cells - optional
+        /// </summary>
+        public List<TableColumnFormat?>? ColumnFormats { get; set; }
+
+        /// <summary>
+        /// Number of leading header rows that column formats do not apply to
+        /// </summary>
+        public int HeaderRows { get; set; }
+
+        public int? Hpos { get; set; }
+
+        public int? Vpos { get; set; }
+    }
+
+    public class PictureSpec
+    {
+        /// <summary>
+        /// Path to a local image, or an http(s) url fetched through the on-disk image cache.
+        /// Slides that use the same image share one image part.
+        /// </summary>
+        public string Path { get; set; } = "";
+
+        public decimal Hpos { get; set; }
+
+        public decimal Vpos { get; set; }
+
+        public decimal? Height { get; set; }
+
+        public decimal? Width { get; set; }
+    }
+
+    /// <summary>
+    /// Reads JSON numbers into string properties using their literal text, so table data can carry raw numbers
+    /// </summary>
+    internal sealed class StringOrNumberConverter : JsonConverter<string>
+    {
+        public override string? Read(ref Utf8JsonReader reader, Type typeToConvert, JsonSerializerOptions options)
+        {
+            return reader.TokenType switch
+            {
+                JsonTokenType.Number => Encoding.UTF8.GetString(reader.HasValueSequence ? reader.ValueSequence.ToArray() : reader.ValueSpan),
+                JsonTokenType.True => "TRUE",
+                JsonTokenType.False => "FALSE",
+                _ => reader.GetString(),
+            };
+        }
+
+        public override void Write(Utf8JsonWriter writer, string value, JsonSerializerOptions options)
+        {
+            writer.WriteStringValue(value);
+        }
+    }
+}
@@ -0,0 +1,383 @@
+using System.IO.Compression;
+using System.Security;
+using System.Text;
+using System.Text.Json;
+using System.Text.RegularExpressions;
+using DocumentFormat.OpenXml;
+using DocumentFormat.OpenXml.Packaging;
+using D = DocumentFormat.OpenXml.Drawing;
+
+namespace DocLayer.Core
+{
+    /// <summary>
+    /// A presentation with <c>{{token}}</c> placeholders, compiled once and rendered for many records
+    /// </summary>
+    /// <remarks>
+    /// Compiling scans every slide once. Tokens split across runs (PowerPoint splits text where spell
+    /// checking or formatting changes) are joined into the run where they start, and each slide that holds
+    /// tokens is kept as UTF-8 segments of literal XML between the token positions. Rendering a record
+    /// copies the template package, whose untouched ZIP entries are copied without recompression, and
+    /// writes only the templated slides as literal segments interleaved with the XML-escaped values. No
+    /// slide DOM is built per record.
+    ///
+    /// Tokens match <c>{{name}}</c> (letters, digits, '_', '.' and '-', optionally padded with spaces)
+    /// in shape text, table cells and any attribute such as alt text. Tokens without a value render as
+    /// empty text. A compiled template is immutable, so records can be rendered in parallel
+    /// (see <see cref="RenderFiles"/>).
+    /// </remarks>
+    public sealed class DeckTemplate
+    {
+        private static readonly Regex TokenPattern = new Regex(
+            @"\{\{\s*([A-Za-z_][A-Za-z0-9_.\-]*)\s*\}\}", RegexOptions.Compiled | RegexOptions.CultureInvariant);
+
+        private static readonly byte[] XmlDeclaration = Encoding.UTF8.GetBytes(
+            "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>\r\n");
+
+        private readonly byte[] _package;
+        private readonly List<TemplatePart> _parts;
+
+        private DeckTemplate(byte[] package, List<TemplatePart> parts, List<string> tokens)
+        {
+            _package = package;
+            _parts = parts;
+            Tokens = tokens;
+        }
+
+        /// <summary>
+        /// Distinct token names, in order of first appearance
+        /// </summary>
+        public IReadOnlyList<string> Tokens { get; }
+
+        /// <summary>
+        /// Number of slides rewritten per record
+        /// </summary>
+        public int TemplatedSlideCount => _parts.Count;
+
+        /// <summary>
+        /// Compiles the presentation file
+        /// </summary>
+        public static DeckTemplate Compile(string templatePath)
+        {
+            return Compile(File.ReadAllBytes(templatePath));
+        }
+
+        /// <summary>
+        /// Compiles the presentation package. The bytes are kept as the base of every rendered deck.
+        /// </summary>
+        public static DeckTemplate Compile(byte[] templatePackage)
+        {
+            if (templatePackage == null) throw new ArgumentNullException(nameof(templatePackage));
+
+            List<TemplatePart> parts = new();
+            List<string> tokens = new();
+            HashSet<string> seen = new(StringComparer.Ordinal);
+
+            using MemoryStream stream = new MemoryStream(templatePackage, writable: false);
+            using PresentationDocument presentationDoc = PresentationDocument.Open(stream, false);
+            PresentationPart presentationPart = presentationDoc.PresentationPart
+                ?? throw new ArgumentException("The template presentation is empty", nameof(templatePackage));
+
+            foreach (SlidePart slidePart in presentationPart.SlideParts)
+            {
+                // Cheap check on the raw XML before building the slide DOM. It looks for a single brace, since
+                // a token split between its braces ("{" + "{name}}") never shows "{{" in the raw XML.
+                string rawXml;
+                using (StreamReader reader = new StreamReader(slidePart.GetStream(FileMode.Open, FileAccess.Read)))
+                {
+                    rawXml = reader.ReadToEnd();
+                }
+                if (!rawXml.Contains('{'))
+                {
+                    continue;
+                }
+
+                OpenXmlElement slide = slidePart.Slide;
+                foreach (D.Paragraph paragraph in slide.Descendants<D.Paragraph>())
+                {
+                    JoinSplitTokens(paragraph);
+                }
+
+                TemplatePart? part = TemplatePart.Create(slidePart.Uri.OriginalString.TrimStart('/'), slide.OuterXml);
+                if (part == null)
+                {
+                    continue;
+                }
+
+                parts.Add(part);
+                foreach (string token in part.Tokens)
+                {
+                    if (seen.Add(token))
+                    {
+                        tokens.Add(token);
+                    }
+                }
+            }
+
+            return new DeckTemplate(templatePackage, parts, tokens);
+        }
+
+        /// <summary>
+        /// Renders the template for one record
+        /// </summary>
+        /// <param name="values">Token values; missing tokens render as empty text</param>
+        /// <returns>Stream holding the presentation package, positioned at the start</returns>
+        public MemoryStream Render(IReadOnlyDictionary<string, string?> values)
+        {
+            if (values == null) throw new ArgumentNullException(nameof(values));
+
+            MemoryStream stream = new MemoryStream();
+            RenderTo(stream, values);
+            stream.Position = 0;
+            return stream;
+        }
+
+        /// <summary>
+        /// Renders the template for one record into a file, overwriting it
+        /// </summary>
+        public void RenderToFile(IReadOnlyDictionary<string, string?> values, string outputFile)
+        {
+            if (values == null) throw new ArgumentNullException(nameof(values));
+
+            using FileStream stream = new FileStream(outputFile, FileMode.Create, FileAccess.ReadWrite);
+            RenderTo(stream, values);
+        }
+
+        /// <summary>
+        /// Renders many records to files in parallel. Failures are reported per record instead of stopping
+        /// the batch.
+        /// </summary>
+        /// <param name="records">Output paths and token values</param>
+        /// <param name="maxDegreeOfParallelism">Number of records rendered at once (defaults to the processor count)</param>
+        /// <returns>One result per record, in input order</returns>
+        public List<TemplateRenderResult> RenderFiles(IEnumerable<TemplateRecord> records, int maxDegreeOfParallelism = 0)
+        {
+            if (records == null) throw new ArgumentNullException(nameof(records));
+
+            List<TemplateRecord> batch = records.ToList();
+            TemplateRenderResult[] results = new TemplateRenderResult[batch.Count];
+
+            Parallel.For(0, batch.Count,
+                new ParallelOptions { MaxDegreeOfParallelism = maxDegreeOfParallelism > 0 ? maxDegreeOfParallelism : Environment.ProcessorCount },
+                i =>
+                {
+                    TemplateRenderResult result = new TemplateRenderResult { Path = batch[i].Output };
+                    try
+                    {
+                        RenderToFile(batch[i].Values, batch[i].Output);
+                    }
+                    catch (Exception ex)
+                    {
+                        result.Error = ex.Message;
+                    }
+                    results[i] = result;
+                });
+
+            return results.ToList();
+        }
+
+        /// <summary>
+        /// Renders records given as snake_case JSON to files in parallel (used by the Python wrapper):
+        /// [{"output": "out/1.pptx", "values": {"name": "Ada"}}, ...]
+        /// </summary>
+        public List<TemplateRenderResult> RenderFilesJson(string recordsJson, int maxDegreeOfParallelism = 0)
+        {
+            List<TemplateRecord> records = JsonSerializer.Deserialize<List<TemplateRecord>>(recordsJson, DeckSpec.JsonOptions)
+                ?? throw new ArgumentException("Records JSON is empty", nameof(recordsJson));
+            return RenderFiles(records, maxDegreeOfParallelism);
+        }
+
+        /// <summary>
+        /// Renders a record given as a JSON object of token values (used by the Python wrapper)
+        /// </summary>
+        public MemoryStream RenderJson(string valuesJson)
+        {
+            Dictionary<string, string?> values = JsonSerializer.Deserialize<Dictionary<string, string?>>(valuesJson, DeckSpec.JsonOptions)
+                ?? throw new ArgumentException("Values JSON is empty", nameof(valuesJson));
+            return Render(values);
+        }
+
+        private void RenderTo(Stream stream, IReadOnlyDictionary<string, string?> values)
+        {
+            using PhaseScope phase = DocLayerDiagnostics.StartPhase(DocLayerDiagnostics.Phases.Serialize);
+
+            stream.Write(_package, 0, _package.Length);
+            stream.Position = 0;
+
+            // Update mode copies the compressed bytes of entries that are not replaced
+            int entries;
+            using (ZipArchive archive = new ZipArchive(stream, ZipArchiveMode.Update, leaveOpen: true))
+            {
+                foreach (TemplatePart part in _parts)
+                {
+                    archive.GetEntry(part.EntryName)?.Delete();
+                    using Stream entryStream = archive.CreateEntry(part.EntryName, CompressionLevel.Optimal).Open();
+                    part.WriteTo(entryStream, values);
+                }
+                entries = archive.Entries.Count;
+            }
+
+            if (phase.IsActive)
+            {
+                DocLayerDiagnostics.RecordPackage(phase, stream.Length, entries);
+            }
+        }
+
+        /// <summary>
+        /// Moves the text of tokens that span several runs into the run where each token starts, so every
+        /// token is contiguous in one a:t element. Runs left empty are removed.
+        /// </summary>
+        private static void JoinSplitTokens(D.Paragraph paragraph)
+        {
+            // Breaks and fields end a group: tokens do not span them
+            List<D.Run> group = new();
+            foreach (OpenXmlElement child in paragraph.ChildElements.ToList())
+            {
+                if (child is D.Run run)
+                {
+                    group.Add(run);
+                    continue;
+                }
+                JoinSplitTokens(group);
+                group.Clear();
+            }
+            JoinSplitTokens(group);
+        }
+
+        private static void JoinSplitTokens(List<D.Run> runs)
+        {
+            if (runs.Count < 2) return;
+
+            string[] texts = runs.Select(run => run.Text?.Text ?? "").ToArray();
+            string text = string.Concat(texts);
+            if (!text.Contains("{{", StringComparison.Ordinal)) return;
+
+            bool[] changed = new bool[texts.Length];
+            foreach (Match match in TokenPattern.Matches(text))
+            {
+                (int first, _) = Locate(texts, match.Index);
+                (int last, int lastOffset) = Locate(texts, match.Index + match.Length - 1);
+                if (first == last) continue;
+
+                // Moving text between runs leaves the concatenated text, and so later match offsets, unchanged
+                StringBuilder joined = new StringBuilder(texts[first]);
+                for (int i = first + 1; i < last; i++)
+                {
+                    joined.Append(texts[i]);
+                    texts[i] = "";
+                    changed[i] = true;
+                }
+                joined.Append(texts[last], 0, lastOffset + 1);
+                texts[first] = joined.ToString();
+                texts[last] = texts[last].Substring(lastOffset + 1);
+                changed[first] = changed[last] = true;
+            }
+
+            for (int i = 0; i < runs.Count; i++)
+            {
+                if (!changed[i]) continue;
+
+                if (texts[i].Length == 0)
+                {
+                    runs[i].Remove();
+                }
+                else
+                {
+                    runs[i].Text ??= new D.Text();
+                    runs[i].Text!.Text = texts[i];
+                }
+            }
+        }
+
+        private static (int Index, int Offset) Locate(string[] texts, int position)
+        {
+            for (int i = 0; i < texts.Length; i++)
+            {
+                if (position < texts[i].Length)
+                {
+                    return (i, position);
+                }
+                position -= texts[i].Length;
+            }
+            throw new ArgumentOutOfRangeException(nameof(position));
+        }
+
+        /// <summary>
+        /// A templated part: literal UTF-8 XML segments with a token between each pair
+        /// </summary>
+        private sealed class TemplatePart
+        {
+            private readonly byte[][] _literals;
+            private readonly string[] _tokens;
+
+            private TemplatePart(string entryName, byte[][] literals, string[] tokens)
+            {
+                EntryName = entryName;
+                _literals = literals;
+                _tokens = tokens;
+            }
+
+            public string EntryName { get; }
+
+            public IEnumerable<string> Tokens => _tokens;
+
+            public static TemplatePart? Create(string entryName, string xml)
+            {
+                MatchCollection matches = TokenPattern.Matches(xml);
+                if (matches.Count == 0) return null;
+
+                byte[][] literals = new byte[matches.Count + 1][];
+                string[] tokens = new string[matches.Count];
+                int position = 0;
+                for (int i = 0; i < matches.Count; i++)
+                {
+                    Match match = matches[i];
+                    literals[i] = Encoding.UTF8.GetBytes(xml.Substring(position, match.Index - position));
+                    tokens[i] = match.Groups[1].Value;
+                    position = match.Index + match.Length;
+                }
+                literals[^1] = Encoding.UTF8.GetBytes(xml.Substring(position));
+
+                return new TemplatePart(entryName, literals, tokens);
+            }
+
+            public void WriteTo(Stream stream, IReadOnlyDictionary<string, string?> values)
+            {
+                stream.Write(XmlDeclaration);
+                for (int i = 0; i < _tokens.Length; i++)
+                {
+                    stream.Write(_literals[i]);
+                    if (values.TryGetValue(_tokens[i], out string? value) && !string.IsNullOrEmpty(value))
+                    {
+                        stream.Write(Encoding.UTF8.GetBytes(SecurityElement.Escape(value)));
+                    }
+                }
+                stream.Write(_literals[^1]);
+            }
+        }
+    }
+
+    /// <summary>
+    /// Output path and token values of one record rendered by <see cref="DeckTemplate.RenderFiles"/>
+    /// </summary>
+    public class TemplateRecord
+    {
+        public string Output { get; set; } = "";
+
+        public Dictionary<string, string?> Values { get; set; } = new();
+    }
+
+    /// <summary>
+    /// Outcome of rendering one record with <see cref="DeckTemplate.RenderFiles"/>
+    /// </summary>
+    public class TemplateRenderResult
+    {
+        public string Path { get; set; } = "";
+
+        /// <summary>
+        /// Why the record could not be rendered; null on success
+        /// </summary>
+        public string? Error { get; set; }
+
+        public bool Ok => Error is null;
+    }
+}
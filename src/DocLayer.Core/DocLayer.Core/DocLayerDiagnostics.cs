@@ -0,0 +1,257 @@
+using System.Diagnostics;
+using System.Diagnostics.Metrics;
+using System.Text.Json;
+using DocumentFormat.OpenXml.Packaging;
+
+namespace DocLayer.Core
+{
+    /// <summary>
+    /// Opt-in timing and size instrumentation of presentation builds
+    /// </summary>
+    /// <remarks>
+    /// Each build phase (see <see cref="Phases"/>) is reported three ways, all off by default:
+    /// <list type="bullet">
+    /// <item>as an <see cref="Activity"/> of <see cref="ActivitySource"/>, when a listener samples it;</item>
+    /// <item>on the <c>doclayer.phase.duration</c> histogram and the <c>doclayer.bytes_written</c> and
+    /// <c>doclayer.parts_written</c> counters of <see cref="Meter"/>, when a MeterListener or exporter enables them;</item>
+    /// <item>on the <see cref="DiagnosticsCapture"/> returned by <see cref="BeginCapture"/>, for per-call numbers
+    /// (used by the Python wrapper).</item>
+    /// </list>
+    /// With none of these active a phase costs one AsyncLocal read and two flag checks.
+    /// Phases can nest: on a template cache miss, theme_edit and serialize run inside package_create.
+    /// </remarks>
+    public static class DocLayerDiagnostics
+    {
+        public const string SourceName = "DocLayer.Core";
+
+        /// <summary>
+        /// Names of the instrumented phases, used as activity names and as the "phase" tag
+        /// </summary>
+        public static class Phases
+        {
+            /// <summary>Creating or cloning the base package</summary>
+            public const string PackageCreate = "package_create";
+
+            /// <summary>Editing the theme part's fonts and accent colors</summary>
+            public const string ThemeEdit = "theme_edit";
+
+            /// <summary>Adding slides and their content</summary>
+            public const string SlideBuild = "slide_build";
+
+            /// <summary>Writing parts to the package and closing it</summary>
+            public const string Serialize = "serialize";
+        }
+
+        public static readonly ActivitySource ActivitySource = new ActivitySource(SourceName);
+
+        public static readonly Meter Meter = new Meter(SourceName);
+
+        private static readonly Histogram<double> PhaseDuration = Meter.CreateHistogram<double>(
+            "doclayer.phase.duration", "ms", "Duration of a presentation build phase");
+
+        private static readonly Counter<long> BytesWritten = Meter.CreateCounter<long>(
+            "doclayer.bytes_written", "By", "Size of saved presentation packages");
+
+        private static readonly Counter<long> PartsWritten = Meter.CreateCounter<long>(
+            "doclayer.parts_written", "{part}", "Parts in saved presentation packages");
+
+        private static readonly AsyncLocal<DiagnosticsCapture?> CurrentCapture = new();
+
+        /// <summary>
+        /// Starts collecting phase timings and package sizes on this thread and the tasks it starts.
+        /// Dispose the capture to stop; captures can nest and each receives everything recorded inside it.
+        /// </summary>
+        public static DiagnosticsCapture BeginCapture()
+        {
+            DiagnosticsCapture capture = new DiagnosticsCapture(CurrentCapture.Value);
+            CurrentCapture.Value = capture;
+            return capture;
+        }
+
+        /// <summary>
+        /// Whether anything is listening; callers skip optional measurement work when false
+        /// </summary>
+        public static bool IsEnabled => CurrentCapture.Value != null || PhaseDuration.Enabled || ActivitySource.HasListeners();
+
+        /// <summary>
+        /// Times a phase until the returned scope is disposed. Returns an inert scope when nothing is listening.
+        /// </summary>
+        public static PhaseScope StartPhase(string phase)
+        {
+            DiagnosticsCapture? capture = CurrentCapture.Value;
+            if (capture == null && !PhaseDuration.Enabled && !ActivitySource.HasListeners())
+            {
+                return default;
+            }
+
+            return new PhaseScope(phase, capture, ActivitySource.StartActivity(phase), Stopwatch.GetTimestamp());
+        }
+
+        internal static void RecordPackage(PhaseScope phase, long bytes, int parts)
+        {
+            if (bytes > 0) BytesWritten.Add(bytes);
+            PartsWritten.Add(parts);
+            phase.Activity?.SetTag("doclayer.bytes_written", bytes);
+            phase.Activity?.SetTag("doclayer.parts_written", parts);
+
+            for (DiagnosticsCapture? capture = phase.Capture; capture != null; capture = capture.Parent)
+            {
+                capture.AddPackage(bytes, parts);
+            }
+        }
+
+        internal static void RecordPhase(string phase, DiagnosticsCapture? capture, double milliseconds)
+        {
+            if (PhaseDuration.Enabled)
+            {
+                PhaseDuration.Record(milliseconds, new KeyValuePair<string, object?>("phase", phase));
+            }
+
+            for (; capture != null; capture = capture.Parent)
+            {
+                capture.AddPhase(phase, milliseconds);
+            }
+        }
+
+        internal static void EndCapture(DiagnosticsCapture capture)
+        {
+            if (CurrentCapture.Value == capture)
+            {
+                CurrentCapture.Value = capture.Parent;
+            }
+        }
+
+        internal static int CountParts(OpenXmlPackage package)
+        {
+            HashSet<OpenXmlPart> seen = new();
+            Stack<OpenXmlPartContainer> pending = new();
+            pending.Push(package);
+
+            while (pending.Count > 0)
+            {
+                foreach (IdPartPair pair in pending.Pop().Parts)
+                {
+                    if (seen.Add(pair.OpenXmlPart))
+                    {
+                        pending.Push(pair.OpenXmlPart);
+                    }
+                }
+            }
+            return seen.Count;
+        }
+    }
+
+    /// <summary>
+    /// A running phase; disposing it records the elapsed time. The default value is inert.
+    /// </summary>
+    public readonly struct PhaseScope : IDisposable
+    {
+        private readonly string? _phase;
+        private readonly long _start;
+
+        internal PhaseScope(string phase, DiagnosticsCapture? capture, Activity? activity, long start)
+        {
+            _phase = phase;
+            Capture = capture;
+            Activity = activity;
+            _start = start;
+        }
+
+        /// <summary>
+        /// False when nothing was listening as the phase started
+        /// </summary>
+        public bool IsActive => _phase != null;
+
+        internal DiagnosticsCapture? Capture { get; }
+
+        internal Activity? Activity { get; }
+
+        public void Dispose()
+        {
+            if (_phase == null) return;
+
+            DocLayerDiagnostics.RecordPhase(_phase, Capture, Stopwatch.GetElapsedTime(_start).TotalMilliseconds);
+            Activity?.Dispose();
+        }
+    }
+
+    /// <summary>
+    /// Phase timings and package sizes recorded between <see cref="DocLayerDiagnostics.BeginCapture"/> and Dispose.
+    /// Thread-safe, so parallel work started inside the capture can record into it.
+    /// </summary>
+    public sealed class DiagnosticsCapture : IDisposable
+    {
+        private readonly object _lock = new();
+        private readonly Dictionary<string, double> _phases = new();
+
+        internal DiagnosticsCapture(DiagnosticsCapture? parent)
+        {
+            Parent = parent;
+        }
+
+        internal DiagnosticsCapture? Parent { get; }
+
+        /// <summary>
+        /// Total milliseconds per phase
+        /// </summary>
+        public IReadOnlyDictionary<string, double> Phases
+        {
+            get
+            {
+                lock (_lock)
+                {
+                    return new Dictionary<string, double>(_phases);
+                }
+            }
+        }
+
+        /// <summary>
+        /// Bytes of the packages saved to streams
+        /// </summary>
+        public long BytesWritten { get; private set; }
+
+        /// <summary>
+        /// Parts in the saved packages
+        /// </summary>
+        public int PartsWritten { get; private set; }
+
+        internal void AddPhase(string phase, double milliseconds)
+        {
+            lock (_lock)
+            {
+                _phases[phase] = _phases.GetValueOrDefault(phase) + milliseconds;
+            }
+        }
+
+        internal void AddPackage(long bytes, int parts)
+        {
+            lock (_lock)
+            {
+                BytesWritten += bytes;
+                PartsWritten += parts;
+            }
+        }
+
+        /// <summary>
+        /// Snake_case JSON of the capture for the Python wrapper:
+        /// {"phases": {"slide_build": 1.2, ...}, "bytes_written": 28311, "parts_written": 41}
+        /// </summary>
+        public string ToJson()
+        {
+            lock (_lock)
+            {
+                return JsonSerializer.Serialize(new Dictionary<string, object>
+                {
+                    ["phases"] = _phases,
+                    ["bytes_written"] = BytesWritten,
+                    ["parts_written"] = PartsWritten,
+                });
+            }
+        }
+
+        public void Dispose()
+        {
+            DocLayerDiagnostics.EndCapture(this);
+        }
+    }
+}
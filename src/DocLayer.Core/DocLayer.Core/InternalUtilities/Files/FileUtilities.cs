@@ -16,7 +16,8 @@
         }
 
         /// <summary>
-        /// Downloads image from a web url to local disk
+        /// Downloads image from a web url to local disk. The download goes through
+        /// <see cref="ImageFetchCache.Shared"/>, so repeated urls are not fetched again.
         /// </summary>
         /// <param name="directoryPath"></param>
         /// <param name="fileName"></param>
@@ -24,8 +25,6 @@
         /// <returns> Filepath of the downloaded image </returns>
         public static async Task<string> DownloadImageAsync(string fileName, Uri imageUri)
         {
-            using var httpClient = new HttpClient();
-
             // Get the file extension
             var uriWithoutQuery = imageUri.GetLeftPart(UriPartial.Path);
             var fileExtension = Path.GetExtension(uriWithoutQuery);
@@ -35,8 +34,8 @@
 
             try
             {
-                // Download the image and write to the file
-                var imageBytes = await httpClient.GetByteArrayAsync(imageUri);
+                // Fetch the image (from the cache when possible) and write to the file
+                var imageBytes = await ImageFetchCache.Shared.GetBytesAsync(imageUri);
                 await File.WriteAllBytesAsync(path, imageBytes);
             }
             catch (Exception ex)
@@ -44,7 +43,6 @@
                 throw new Exception(ex.Message);
             }
 
-            httpClient.Dispose();
             return path;
         }
 
@@ -58,8 +56,8 @@
         {
             try
             {
-                string filePath = await DownloadImageAsync(fileName, imageUri);
-                return File.OpenRead(filePath);
+                byte[] imageBytes = await ImageFetchCache.Shared.GetBytesAsync(imageUri);
+                return new MemoryStream(imageBytes, writable: false);
             }
             catch (Exception ex)
             {                
@@ -0,0 +1,257 @@
+﻿using System.Collections.Concurrent;
+using System.Security.Cryptography;
+using System.Text;
+
+namespace InternalUtilities.Files
+{
+    /// <summary>
+    /// Bounded, content-addressed on-disk cache of downloaded images
+    /// </summary>
+    /// <remarks>
+    /// Downloads are stored once per content hash (<c>&lt;sha256&gt;.img</c>), with a small
+    /// <c>&lt;sha256 of url&gt;.url</c> file pointing each URL at its content, so the same image served
+    /// from several URLs takes disk space once. When the cache grows past <see cref="MaxBytes"/> the least
+    /// recently used images are deleted. Concurrent requests for the same URL share one download, and all
+    /// downloads go through one pooled HttpClient. All members are thread-safe.
+    /// </remarks>
+    public sealed class ImageFetchCache
+    {
+        private static readonly Lazy<HttpClient> SharedHttpClient = new(() => new HttpClient(new SocketsHttpHandler
+        {
+            // Recycle pooled connections so DNS changes are picked up
+            PooledConnectionLifetime = TimeSpan.FromMinutes(5),
+        }));
+
+        private static readonly Lazy<ImageFetchCache> SharedCache = new(() => new ImageFetchCache(
+            Path.Combine(Path.GetTempPath(), "doclayer", "image-cache"), 256L * 1024 * 1024));
+
+        private readonly HttpClient _httpClient;
+        private readonly ConcurrentDictionary<string, Lazy<Task<CachedImage>>> _inFlight = new();
+        private readonly object _trimLock = new();
+        private long _sizeBytes;
+        private long _hits;
+        private long _misses;
+
+        /// <summary>
+        /// Creates a cache in the given directory
+        /// </summary>
+        /// <param name="directory">Directory holding the cached images; created if missing</param>
+        /// <param name="maxBytes">Total size of cached images above which the least recently used are evicted</param>
+        /// <param name="httpClient">Client used for downloads - optional, defaults to a process-wide pooled client</param>
+        public ImageFetchCache(string directory, long maxBytes, HttpClient? httpClient = null)
+        {
+            if (maxBytes <= 0) throw new ArgumentOutOfRangeException(nameof(maxBytes), "Cache size must be positive");
+
+            Directory = System.IO.Directory.CreateDirectory(directory).FullName;
+            MaxBytes = maxBytes;
+            _httpClient = httpClient ?? SharedHttpClient.Value;
+            _sizeBytes = EnumerateImages().Sum(file => file.Length);
+        }
+
+        /// <summary>
+        /// Process-wide cache in the temp directory, bounded at 256 MB
+        /// </summary>
+        public static ImageFetchCache Shared => SharedCache.Value;
+
+        /// <summary>
+        /// Directory holding the cached images
+        /// </summary>
+        public string Directory { get; }
+
+        /// <summary>
+        /// Total size of cached images above which the least recently used are evicted
+        /// </summary>
+        public long MaxBytes { get; }
+
+        /// <summary>
+        /// Total size of the cached images
+        /// </summary>
+        public long SizeBytes => Interlocked.Read(ref _sizeBytes);
+
+        /// <summary>
+        /// Number of requests served from disk
+        /// </summary>
+        public long Hits => Interlocked.Read(ref _hits);
+
+        /// <summary>
+        /// Number of requests that downloaded the image
+        /// </summary>
+        public long Misses => Interlocked.Read(ref _misses);
+
+        /// <summary>
+        /// Gets the path of the cached image for the URL, downloading it on a miss
+        /// </summary>
+        /// <returns>Path of the cached file; it may be evicted later, so read it promptly</returns>
+        public async Task<string> GetFileAsync(Uri imageUri, CancellationToken cancellationToken = default)
+        {
+            if (imageUri == null) throw new ArgumentNullException(nameof(imageUri));
+
+            string urlKey = Hash(Encoding.UTF8.GetBytes(imageUri.AbsoluteUri));
+            string refPath = Path.Combine(Directory, urlKey + ".url");
+
+            if (TryGetCachedFile(refPath, out string? cachedPath))
+            {
+                Interlocked.Increment(ref _hits);
+                return cachedPath;
+            }
+
+            CachedImage image = await FetchAsync(imageUri, urlKey, refPath, cancellationToken).ConfigureAwait(false);
+            return image.Path;
+        }
+
+        /// <summary>
+        /// Gets the bytes of the image at the URL, downloading it on a miss
+        /// </summary>
+        public async Task<byte[]> GetBytesAsync(Uri imageUri, CancellationToken cancellationToken = default)
+        {
+            if (imageUri == null) throw new ArgumentNullException(nameof(imageUri));
+
+            string urlKey = Hash(Encoding.UTF8.GetBytes(imageUri.AbsoluteUri));
+            string refPath = Path.Combine(Directory, urlKey + ".url");
+
+            if (TryGetCachedFile(refPath, out string? cachedPath))
+            {
+                try
+                {
+                    byte[] cachedBytes = await File.ReadAllBytesAsync(cachedPath, cancellationToken).ConfigureAwait(false);
+                    Interlocked.Increment(ref _hits);
+                    return cachedBytes;
+                }
+                catch (Exception ex) when (ex is FileNotFoundException or DirectoryNotFoundException)
+                {
+                    // Evicted by another download's trim after the lookup; download it again
+                }
+            }
+
+            // The downloaded bytes are returned from memory, since the file may be evicted before it is read
+            CachedImage image = await FetchAsync(imageUri, urlKey, refPath, cancellationToken).ConfigureAwait(false);
+            return image.Bytes;
+        }
+
+        /// <summary>
+        /// Deletes every cached image
+        /// </summary>
+        public void Clear()
+        {
+            lock (_trimLock)
+            {
+                foreach (FileInfo file in new DirectoryInfo(Directory).EnumerateFiles())
+                {
+                    TryDelete(file);
+                }
+                Interlocked.Exchange(ref _sizeBytes, 0);
+            }
+        }
+
+        private async Task<CachedImage> FetchAsync(Uri imageUri, string urlKey, string refPath, CancellationToken cancellationToken)
+        {
+            // One download per URL; a waiter's cancellation does not cancel it for the others
+            Lazy<Task<CachedImage>> fetch = _inFlight.GetOrAdd(urlKey, _ => new Lazy<Task<CachedImage>>(() => DownloadAsync(imageUri, refPath)));
+            try
+            {
+                return await fetch.Value.WaitAsync(cancellationToken).ConfigureAwait(false);
+            }
+            finally
+            {
+                _inFlight.TryRemove(new KeyValuePair<string, Lazy<Task<CachedImage>>>(urlKey, fetch));
+            }
+        }
+
+        private async Task<CachedImage> DownloadAsync(Uri imageUri, string refPath)
+        {
+            Interlocked.Increment(ref _misses);
+
+            byte[] imageBytes = await _httpClient.GetByteArrayAsync(imageUri).ConfigureAwait(false);
+            string hash = Hash(imageBytes);
+            string imagePath = Path.Combine(Directory, hash + ".img");
+
+            if (!File.Exists(imagePath))
+            {
+                await WriteAtomicallyAsync(imagePath, imageBytes).ConfigureAwait(false);
+                Interlocked.Add(ref _sizeBytes, imageBytes.Length);
+            }
+            await WriteAtomicallyAsync(refPath, Encoding.ASCII.GetBytes(hash)).ConfigureAwait(false);
+
+            Trim(keepPath: imagePath);
+            return new CachedImage(imagePath, imageBytes);
+        }
+
+        private bool TryGetCachedFile(string refPath, [System.Diagnostics.CodeAnalysis.NotNullWhen(true)] out string? imagePath)
+        {
+            imagePath = null;
+            try
+            {
+                if (!File.Exists(refPath)) return false;
+
+                string path = Path.Combine(Directory, File.ReadAllText(refPath).Trim() + ".img");
+                if (!File.Exists(path)) return false;
+
+                // Access time drives eviction; set it explicitly since volumes may be mounted noatime
+                File.SetLastAccessTimeUtc(path, DateTime.UtcNow);
+                imagePath = path;
+                return true;
+            }
+            catch (IOException)
+            {
+                // Evicted or being replaced concurrently; treat as a miss
+                return false;
+            }
+        }
+
+        private void Trim(string keepPath)
+        {
+            if (SizeBytes <= MaxBytes) return;
+
+            lock (_trimLock)
+            {
+                List<FileInfo> images = EnumerateImages().OrderBy(file => file.LastAccessTimeUtc).ToList();
+                long size = images.Sum(file => file.Length);
+
+                foreach (FileInfo image in images)
+                {
+                    if (size <= MaxBytes) break;
+                    if (image.FullName == keepPath) continue;
+
+                    if (TryDelete(image))
+                    {
+                        size -= image.Length;
+                    }
+                }
+
+                Interlocked.Exchange(ref _sizeBytes, size);
+            }
+        }
+
+        private IEnumerable<FileInfo> EnumerateImages()
+        {
+            return new DirectoryInfo(Directory).EnumerateFiles("*.img");
+        }
+
+        private async Task WriteAtomicallyAsync(string path, byte[] content)
+        {
+            string tempPath = $"{path}.{Guid.NewGuid():N}.tmp";
+            await File.WriteAllBytesAsync(tempPath, content).ConfigureAwait(false);
+            File.Move(tempPath, path, overwrite: true);
+        }
+
+        private static bool TryDelete(FileInfo file)
+        {
+            try
+            {
+                file.Delete();
+                return true;
+            }
+            catch (IOException)
+            {
+                return false;
+            }
+        }
+
+        private static string Hash(byte[] content)
+        {
+            return Convert.ToHexString(SHA256.HashData(content));
+        }
+
+        private sealed record CachedImage(string Path, byte[] Bytes);
+    }
+}
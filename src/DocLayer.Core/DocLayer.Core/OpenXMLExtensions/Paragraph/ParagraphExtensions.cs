@@ -461,18 +461,8 @@ namespace OpenXMLExtensions
 
         public static string GetText(this D.Paragraph paragraph)
         {
-            string text = "";
-            if (paragraph.GetFirstChild<D.Run>() is not null)
-            {
-               foreach( D.Run run in paragraph.Elements<D.Run>())
-                {
-                    text += run.GetInnerText();
-                }
-
-               return text;
-            }
-
-            return text; // Unsafe: may be problematic to return empty string
+            // Empty string when the paragraph has no runs
+            return string.Concat(paragraph.Elements<D.Run>().Select(run => run.GetInnerText()));
         }
 
 
@@ -123,6 +123,16 @@ namespace OpenXMLExtensions
                     schemeColorVal = D.SchemeColorValues.Accent4;
                     break;
 
+                case 5:
+                    schemeColorVal = D.SchemeColorValues.Accent5;
+                    break;
+
+                case 6:
+                    schemeColorVal = D.SchemeColorValues.Accent6;
+                    break;
+
+                default:
+                    throw new ArgumentOutOfRangeException(nameof(accentNum), $"Accent color must be 1-6, got {accentNum}");
             }
 
             if (run.RunProperties != null)
@@ -235,18 +245,7 @@ namespace OpenXMLExtensions
 
         public static string GetInnerText(this D.Run run)
         {
-            string text = "";
-            if (run.GetFirstChild <D.Text>() != null)
-            {
-                foreach (D.Text t in run.Elements<D.Text>())
-                {
-                    text += t.InnerText.ToString();
-                }
-
-                return text;
-            }
-
-            return text;
+            return string.Concat(run.Elements<D.Text>().Select(t => t.Text));
         }
     }
 }
@@ -8,6 +8,14 @@ namespace OpenXMLExtensions
     public static class PictureCollectionExtensions
     {
         #pragma warning disable
+        /// <summary>
+        /// Starts a batched layout of the pictures; chain operations on it and call Commit to write the transforms once
+        /// </summary>
+        public static LayoutPass Layout(this List<Picture> pictures)
+        {
+            return new LayoutPass(pictures);
+        }
+
         public static void DistributeVertically(this List<Picture> pictures)
         {
             // Starting from this shape to the last element of shapes, distribute the horizontal positions equally
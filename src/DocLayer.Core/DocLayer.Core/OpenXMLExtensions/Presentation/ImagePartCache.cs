@@ -0,0 +1,323 @@
+﻿using System.Collections.Concurrent;
+using System.Runtime.CompilerServices;
+using System.Security.Cryptography;
+using System.IO.Packaging;
+using DocumentFormat.OpenXml.Packaging;
+
+namespace OpenXMLExtensions
+{
+    /// <summary>
+    /// Content-addressed index of a presentation's image parts
+    /// </summary>
+    /// <remarks>
+    /// Images are keyed on the SHA-256 of their bytes, so an image used on many slides is stored in one
+    /// ImagePart and every slide gets a relationship to that part instead of its own copy. The cache is
+    /// attached to the PresentationPart (see <see cref="For"/>) and seeded with a scan of the existing
+    /// image parts. Slides removed with <see cref="SlideIndex.Remove"/> are forgotten automatically; call
+    /// <see cref="Refresh"/> after adding or deleting image parts by other means.
+    ///
+    /// File hashes are also memoized per process (keyed on path, size and write time), so a file that a
+    /// document already holds is not read again.
+    /// </remarks>
+    public sealed class ImagePartCache
+    {
+        private static readonly ConditionalWeakTable<PresentationPart, ImagePartCache> Caches = new();
+        private static readonly ConcurrentDictionary<string, FileHash> FileHashes = new();
+        private static readonly ConditionalWeakTable<ImagePart, string> ImportedHashes = new();
+        private static readonly PartTypeInfo[] KnownImageTypes =
+        {
+            ImagePartType.Png, ImagePartType.Jpeg, ImagePartType.Gif, ImagePartType.Bmp, ImagePartType.Tiff,
+            ImagePartType.Emf, ImagePartType.Wmf, ImagePartType.Svg, ImagePartType.Icon, ImagePartType.Pcx,
+        };
+
+        private static ReadOnlySpan<byte> PngSignature => new byte[] { 0x89, 0x50, 0x4E, 0x47 };
+        private static ReadOnlySpan<byte> JpegSignature => new byte[] { 0xFF, 0xD8, 0xFF };
+        private static ReadOnlySpan<byte> EmfRecordType => new byte[] { 0x01, 0x00, 0x00, 0x00 };
+
+        private readonly PresentationPart _presentationPart;
+        private readonly Dictionary<string, Entry> _entries = new();
+
+        private ImagePartCache(PresentationPart presentationPart)
+        {
+            _presentationPart = presentationPart;
+            Refresh();
+        }
+
+        /// <summary>
+        /// Gets the image cache of the presentation, building it on first use
+        /// </summary>
+        public static ImagePartCache For(PresentationPart presentationPart)
+        {
+            if (presentationPart == null) throw new ArgumentNullException(nameof(presentationPart));
+
+            return Caches.GetValue(presentationPart, part => new ImagePartCache(part));
+        }
+
+        /// <summary>
+        /// Number of distinct images in the presentation
+        /// </summary>
+        public int Count => _entries.Count;
+
+        /// <summary>
+        /// ZIP compression of new image parts in formats that are already compressed (PNG, JPEG, GIF),
+        /// or null to use the package's <see cref="OpenXmlPackage.CompressionOption"/>
+        /// </summary>
+        public CompressionOption? CompressedImageOption { get; set; }
+
+        /// <summary>
+        /// Gets the relId of an image part holding the given bytes, adding the part only if the
+        /// presentation does not contain the image yet
+        /// </summary>
+        /// <param name="slidePart">Slide that uses the image</param>
+        /// <param name="imageBytes">Encoded image (PNG, JPEG, GIF, BMP, TIFF, SVG or EMF)</param>
+        /// <returns>RelId of the image part relative to the slide part</returns>
+        public string GetOrAddImage(SlidePart slidePart, byte[] imageBytes)
+        {
+            if (slidePart == null) throw new ArgumentNullException(nameof(slidePart));
+            if (imageBytes == null) throw new ArgumentNullException(nameof(imageBytes));
+
+            return GetOrAddImage(slidePart, imageBytes, ComputeHash(imageBytes));
+        }
+
+        /// <summary>
+        /// Gets the relId of an image part holding the file's image, reading the file only if its
+        /// content is not known to be in the presentation already
+        /// </summary>
+        /// <param name="slidePart">Slide that uses the image</param>
+        /// <param name="filePath">Path to a local image file</param>
+        /// <returns>RelId of the image part relative to the slide part</returns>
+        public string GetOrAddImageFile(SlidePart slidePart, string filePath)
+        {
+            if (slidePart == null) throw new ArgumentNullException(nameof(slidePart));
+
+            FileInfo file = new FileInfo(filePath);
+            if (FileHashes.TryGetValue(file.FullName, out FileHash known)
+                && known.Length == file.Length
+                && known.LastWriteTimeUtc == file.LastWriteTimeUtc
+                && _entries.TryGetValue(known.Hash, out Entry? entry))
+            {
+                return Relate(slidePart, entry);
+            }
+
+            byte[] imageBytes = File.ReadAllBytes(file.FullName);
+            string hash = ComputeHash(imageBytes);
+            FileHashes[file.FullName] = new FileHash(file.Length, file.LastWriteTimeUtc, hash);
+
+            return GetOrAddImage(slidePart, imageBytes, hash);
+        }
+
+        /// <summary>
+        /// Relates an image part of another presentation to the slide under the given relId, copying its
+        /// bytes only if the presentation does not contain the image yet
+        /// </summary>
+        /// <remarks>
+        /// The relId is kept so that slide XML copied verbatim from the source still points at the image.
+        /// The hash of each source part is memoized, so an image shared by many source slides is read once.
+        /// </remarks>
+        /// <param name="slidePart">Slide that uses the image</param>
+        /// <param name="sourcePart">Image part of another package</param>
+        /// <param name="relationshipId">RelId of the image relative to the source slide</param>
+        /// <returns>The image part of this presentation</returns>
+        public ImagePart ImportImage(SlidePart slidePart, ImagePart sourcePart, string relationshipId)
+        {
+            if (slidePart == null) throw new ArgumentNullException(nameof(slidePart));
+            if (sourcePart == null) throw new ArgumentNullException(nameof(sourcePart));
+
+            string hash = ImportedHashes.GetValue(sourcePart, HashPart);
+            bool related = _entries.TryGetValue(hash, out Entry? entry)
+                && slidePart.Parts.Any(pair => pair.OpenXmlPart == entry.Part);
+
+            if (entry != null && !related)
+            {
+                slidePart.AddPart(entry.Part, relationshipId);
+                entry.Users.Add(slidePart);
+                return entry.Part;
+            }
+
+            ImagePart imagePart = AddImagePart(slidePart, ImageTypeFor(sourcePart.ContentType), relationshipId);
+            using (Stream stream = sourcePart.GetStream(FileMode.Open, FileAccess.Read))
+            {
+                imagePart.FeedData(stream);
+            }
+
+            // A second relationship from the same slide to the same image needs its own part
+            if (entry == null)
+            {
+                entry = new Entry(imagePart);
+                _entries.Add(hash, entry);
+                entry.Users.Add(slidePart);
+            }
+            return imagePart;
+        }
+
+        /// <summary>
+        /// Drops the slide from the cache; images no other cached slide uses are forgotten
+        /// </summary>
+        public void Forget(SlidePart slidePart)
+        {
+            foreach (string hash in _entries.Keys.ToList())
+            {
+                Entry entry = _entries[hash];
+                if (entry.Users.Remove(slidePart) && entry.Users.Count == 0)
+                {
+                    _entries.Remove(hash);
+                }
+            }
+        }
+
+        /// <summary>
+        /// Rebuilds the cache from the image parts of the presentation's slides
+        /// </summary>
+        public void Refresh()
+        {
+            _entries.Clear();
+
+            foreach (SlidePart slidePart in _presentationPart.SlideParts)
+            {
+                foreach (ImagePart imagePart in slidePart.ImageParts)
+                {
+                    string hash = HashPart(imagePart);
+
+                    // Images already duplicated in the document keep their parts; the first one is reused
+                    if (!_entries.TryGetValue(hash, out Entry? entry))
+                    {
+                        entry = new Entry(imagePart);
+                        _entries.Add(hash, entry);
+                    }
+                    if (entry.Part == imagePart)
+                    {
+                        entry.Users.Add(slidePart);
+                    }
+                }
+            }
+        }
+
+        /// <summary>
+        /// Hex SHA-256 of the image bytes, used as the cache key
+        /// </summary>
+        public static string ComputeHash(ReadOnlySpan<byte> imageBytes)
+        {
+            return Convert.ToHexString(SHA256.HashData(imageBytes));
+        }
+
+        /// <summary>
+        /// Detects the image part type from the file signature. Unrecognized content is treated as PNG.
+        /// </summary>
+        public static PartTypeInfo DetectImageType(ReadOnlySpan<byte> imageBytes)
+        {
+            if (imageBytes.StartsWith(PngSignature)) return ImagePartType.Png;
+            if (imageBytes.StartsWith(JpegSignature)) return ImagePartType.Jpeg;
+            if (imageBytes.StartsWith("GIF8"u8)) return ImagePartType.Gif;
+            if (imageBytes.StartsWith("BM"u8)) return ImagePartType.Bmp;
+            if (imageBytes.StartsWith("II*\0"u8) || imageBytes.StartsWith("MM\0*"u8)) return ImagePartType.Tiff;
+            if (imageBytes.Length > 44 && imageBytes.StartsWith(EmfRecordType) && imageBytes.Slice(40, 4).SequenceEqual(" EMF"u8)) return ImagePartType.Emf;
+            if (imageBytes.Slice(0, Math.Min(imageBytes.Length, 512)).IndexOf("<svg"u8) >= 0) return ImagePartType.Svg;
+
+            return ImagePartType.Png;
+        }
+
+        /// <summary>
+        /// Image part type of a content type, falling back to PNG for unknown types
+        /// </summary>
+        public static PartTypeInfo ImageTypeFor(string contentType)
+        {
+            foreach (PartTypeInfo imageType in KnownImageTypes)
+            {
+                if (string.Equals(imageType.ContentType, contentType, StringComparison.OrdinalIgnoreCase))
+                {
+                    return imageType;
+                }
+            }
+            return ImagePartType.Png;
+        }
+
+        internal static void ForgetSlide(PresentationPart presentationPart, SlidePart slidePart)
+        {
+            if (Caches.TryGetValue(presentationPart, out ImagePartCache? cache))
+            {
+                cache.Forget(slidePart);
+            }
+        }
+
+        private string GetOrAddImage(SlidePart slidePart, byte[] imageBytes, string hash)
+        {
+            if (!_entries.TryGetValue(hash, out Entry? entry))
+            {
+                ImagePart imagePart = AddImagePart(slidePart, DetectImageType(imageBytes));
+                using (MemoryStream stream = new MemoryStream(imageBytes, writable: false))
+                {
+                    imagePart.FeedData(stream);
+                }
+
+                entry = new Entry(imagePart);
+                _entries.Add(hash, entry);
+            }
+
+            return Relate(slidePart, entry);
+        }
+
+        private static string HashPart(ImagePart imagePart)
+        {
+            using Stream stream = imagePart.GetStream(FileMode.Open, FileAccess.Read);
+            return Convert.ToHexString(SHA256.HashData(stream));
+        }
+
+        private ImagePart AddImagePart(SlidePart slidePart, PartTypeInfo imageType, string? relationshipId = null)
+        {
+            bool alreadyCompressed = imageType.ContentType is "image/png" or "image/jpeg" or "image/gif";
+            if (CompressedImageOption is not CompressionOption option || !alreadyCompressed)
+            {
+                return CreateImagePart(slidePart, imageType, relationshipId);
+            }
+
+            // The package applies its compression option to parts as they are created
+            OpenXmlPackage package = slidePart.OpenXmlPackage;
+            CompressionOption previous = package.CompressionOption;
+            package.CompressionOption = option;
+            try
+            {
+                return CreateImagePart(slidePart, imageType, relationshipId);
+            }
+            finally
+            {
+                package.CompressionOption = previous;
+            }
+        }
+
+        private static ImagePart CreateImagePart(SlidePart slidePart, PartTypeInfo imageType, string? relationshipId)
+        {
+            return relationshipId == null ? slidePart.AddImagePart(imageType) : slidePart.AddImagePart(imageType, relationshipId);
+        }
+
+        private static string Relate(SlidePart slidePart, Entry entry)
+        {
+            entry.Users.Add(slidePart);
+
+            foreach (IdPartPair pair in slidePart.Parts)
+            {
+                if (pair.OpenXmlPart == entry.Part)
+                {
+                    return pair.RelationshipId;
+                }
+            }
+
+            // Relates the existing part to this slide; the image bytes are not copied
+            slidePart.AddPart(entry.Part);
+            return slidePart.GetIdOfPart(entry.Part);
+        }
+
+        private sealed class Entry
+        {
+            public Entry(ImagePart part)
+            {
+                Part = part;
+            }
+
+            public ImagePart Part { get; }
+
+            public HashSet<SlidePart> Users { get; } = new();
+        }
+
+        private readonly record struct FileHash(long Length, DateTime LastWriteTimeUtc, string Hash);
+    }
+}
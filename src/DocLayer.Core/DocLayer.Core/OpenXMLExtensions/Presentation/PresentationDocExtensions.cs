@@ -53,6 +53,20 @@ namespace OpenXMLExtensions
         }
 
 
+        /// <summary>
+        /// Builds a slide index for the document with a single scan of the slide list.
+        /// Use it for repeated lookups or appends instead of GetSlide/GetLastSlide/GetSlideCount,
+        /// which each walk the slide list.
+        /// </summary>
+        /// <param name="presentationDocument"></param>
+        /// <returns></returns>
+        public static SlideIndex GetSlideIndex(this PresentationDocument presentationDocument)
+        {
+            PresentationPart presentationPart = presentationDocument.PresentationPart
+                ?? throw new InvalidOperationException("The presentation document is empty.");
+            return new SlideIndex(presentationPart);
+        }
+
         public static int GetSlideCount(this PresentationDocument presentationDocument)
         {
             int slidesCount = 0;
@@ -15,10 +15,12 @@ namespace OpenXMLExtensions
     public static class PresentationHelperMethods
     {
 
-        public static PresentationDocument CreatePresentation(string filepath)
+        public static PresentationDocument CreatePresentation(string filepath, CompressionOption compressionOption = CompressionOption.Normal)
             {
             // Create a presentation at a specified file path. The presentation document type is pptx, by default.
             PresentationDocument presentationDoc = PresentationDocument.Create(filepath, PresentationDocumentType.Presentation);
+            // Set before any part is added so the base parts are written with it too
+            presentationDoc.CompressionOption = compressionOption;
             PresentationPart presentationPart = presentationDoc.AddPresentationPart();
             presentationPart.Presentation = new Presentation();
 
@@ -30,6 +32,25 @@ namespace OpenXMLExtensions
             return presentationDoc;
         }
 
+        /// <summary>
+        /// Creates a presentation backed by the given stream instead of a file on disk.
+        /// The package is written to the stream when the returned document is saved or disposed.
+        /// </summary>
+        /// <param name="stream">Writable, seekable stream, typically a MemoryStream</param>
+        /// <param name="compressionOption">ZIP compression of the package parts</param>
+        /// <returns></returns>
+        public static PresentationDocument CreatePresentation(Stream stream, CompressionOption compressionOption = CompressionOption.Normal)
+        {
+            PresentationDocument presentationDoc = PresentationDocument.Create(stream, PresentationDocumentType.Presentation);
+            presentationDoc.CompressionOption = compressionOption;
+            PresentationPart presentationPart = presentationDoc.AddPresentationPart();
+            presentationPart.Presentation = new Presentation();
+
+            CreatePresentationParts(presentationPart);
+
+            return presentationDoc;
+        }
+
         static void CreatePresentationParts(PresentationPart presentationPart)
         {
             SlideMasterIdList slideMasterIdList1 = new SlideMasterIdList(new SlideMasterId() { Id = (UInt32Value)2147483648U, RelationshipId = "rId1" });
@@ -977,6 +998,21 @@ namespace OpenXMLExtensions
         /// <param name="presentationDocument"></param>
         /// <param name="position">Position to insert the slide (1-based index)</param>
         public static void AddTitleLayoutSlide(PresentationDocument presentationDocument, int position)
+        {
+            AddTitleLayoutSlidePart(presentationDocument, position);
+
+            // Save the modified presentation.
+            presentationDocument.PresentationPart!.Presentation.Save();
+        }
+
+        /// <summary>
+        /// Adds a slide with title layout to the presentation without saving the presentation part.
+        /// Use this when adding several slides and save once when done.
+        /// </summary>
+        /// <param name="presentationDocument"></param>
+        /// <param name="position">Position to insert the slide (1-based index)</param>
+        /// <returns>The SlidePart of the new slide</returns>
+        public static SlidePart AddTitleLayoutSlidePart(PresentationDocument presentationDocument, int position)
         {
             PresentationPart? presentationPart = presentationDocument.PresentationPart;
             Presentation presentation = presentationPart.Presentation;
@@ -1050,15 +1086,14 @@ namespace OpenXMLExtensions
             newSlideId.Id = maxSlideId;
             newSlideId.RelationshipId = presentationPart.GetIdOfPart(slidePart);
 
-            // Save the modified presentation.
-            presentationPart.Presentation.Save();
+            return slidePart;
         }
 
         /// <summary>
         /// Creates a new slide with title layout (centered title and subtitle placeholders)
         /// </summary>
         /// <returns>Slide object with title layout</returns>
-        private static Slide CreateTitleLayoutSlide()
+        internal static Slide CreateTitleLayoutSlide()
         {
             Slide slide = new Slide(
                 new CommonSlideData(
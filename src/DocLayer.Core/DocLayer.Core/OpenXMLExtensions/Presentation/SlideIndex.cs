@@ -0,0 +1,199 @@
+﻿using DocumentFormat.OpenXml.Packaging;
+using DocumentFormat.OpenXml.Presentation;
+using P = DocumentFormat.OpenXml.Presentation;
+
+namespace OpenXMLExtensions
+{
+    /// <summary>
+    /// In-memory index of a presentation's slides: the ordered slide parts, a relId to SlidePart map
+    /// and the highest slide id in use.
+    /// </summary>
+    /// <remarks>
+    /// The index is built with a single scan of the SlideIdList and is then kept up to date by its own
+    /// Append/Insert/Remove methods, so appending a slide, counting slides and looking a slide up by
+    /// number or relId do not rescan the slide list. Slides added or removed through other methods
+    /// (e.g. <see cref="PresentationHelperMethods.AddTitleLayoutSlide"/>) are not seen until
+    /// <see cref="Refresh"/> is called.
+    /// </remarks>
+    public sealed class SlideIndex
+    {
+        private readonly PresentationPart _presentationPart;
+        private readonly List<SlidePart> _slideParts = new();
+        private readonly Dictionary<string, SlidePart> _slidePartsByRelId = new();
+        private uint _maxSlideId;
+
+        public SlideIndex(PresentationPart presentationPart)
+        {
+            _presentationPart = presentationPart ?? throw new ArgumentNullException(nameof(presentationPart));
+            Refresh();
+        }
+
+        /// <summary>
+        /// Number of slides in the presentation
+        /// </summary>
+        public int Count => _slideParts.Count;
+
+        /// <summary>
+        /// Highest slide id in the SlideIdList
+        /// </summary>
+        public uint MaxSlideId => _maxSlideId;
+
+        /// <summary>
+        /// Slide parts in presentation order
+        /// </summary>
+        public IReadOnlyList<SlidePart> SlideParts => _slideParts;
+
+        /// <summary>
+        /// SlidePart of the last slide, or null if the presentation has no slides
+        /// </summary>
+        public SlidePart? LastSlidePart => _slideParts.Count > 0 ? _slideParts[^1] : null;
+
+        /// <summary>
+        /// Gets the SlidePart at the specified slide number (1-based)
+        /// </summary>
+        public SlidePart GetSlidePart(int slideNumber)
+        {
+            if (slideNumber <= 0 || slideNumber > _slideParts.Count)
+            {
+                throw new ArgumentOutOfRangeException(nameof(slideNumber), $"Slide number must be between 1 and {_slideParts.Count}");
+            }
+            return _slideParts[slideNumber - 1];
+        }
+
+        /// <summary>
+        /// Gets the SlidePart with the given relationship id from the presentation part
+        /// </summary>
+        public bool TryGetSlidePart(string relId, out SlidePart? slidePart)
+        {
+            return _slidePartsByRelId.TryGetValue(relId, out slidePart);
+        }
+
+        /// <summary>
+        /// Rebuilds the index from the SlideIdList
+        /// </summary>
+        public void Refresh()
+        {
+            _slideParts.Clear();
+            _slidePartsByRelId.Clear();
+            _maxSlideId = 0;
+
+            SlideIdList? slideIdList = _presentationPart.Presentation.SlideIdList;
+            if (slideIdList is null) return;
+
+            foreach (SlideId slideId in slideIdList.Elements<SlideId>())
+            {
+                if (slideId.Id is not null && slideId.Id > _maxSlideId)
+                {
+                    _maxSlideId = slideId.Id;
+                }
+
+                string? relId = slideId.RelationshipId;
+                if (relId is not null && _presentationPart.TryGetPartById(relId, out OpenXmlPart? part) && part is SlidePart slidePart)
+                {
+                    _slideParts.Add(slidePart);
+                    _slidePartsByRelId[relId] = slidePart;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Adds the slide part to the end of the SlideIdList
+        /// </summary>
+        /// <returns>The new SlideId</returns>
+        public SlideId Append(SlidePart slidePart)
+        {
+            return Insert(_slideParts.Count, slidePart);
+        }
+
+        /// <summary>
+        /// Adds the slide part to the SlideIdList after the slide at the given position
+        /// </summary>
+        /// <param name="position">1-based number of the slide to insert after; 0 inserts first and
+        /// positions past the last slide append</param>
+        /// <param name="slidePart">Slide part already added to the presentation part</param>
+        /// <returns>The new SlideId</returns>
+        public SlideId Insert(int position, SlidePart slidePart)
+        {
+            if (slidePart == null) throw new ArgumentNullException(nameof(slidePart));
+
+            P.Presentation presentation = _presentationPart.Presentation;
+            presentation.SlideIdList ??= new SlideIdList();
+
+            position = Math.Clamp(position, 0, _slideParts.Count);
+            string relId = _presentationPart.GetIdOfPart(slidePart);
+            SlideId slideId = new SlideId { Id = NextSlideId(), RelationshipId = relId };
+
+            if (position == _slideParts.Count)
+            {
+                presentation.SlideIdList.Append(slideId);
+            }
+            else
+            {
+                SlideId next = presentation.SlideIdList.Elements<SlideId>().ElementAt(position);
+                presentation.SlideIdList.InsertBefore(slideId, next);
+            }
+
+            _slideParts.Insert(position, slidePart);
+            _slidePartsByRelId[relId] = slidePart;
+            return slideId;
+        }
+
+        /// <summary>
+        /// Creates a title layout slide and appends it, reusing the layout of the last slide
+        /// </summary>
+        /// <returns>The SlidePart of the new slide</returns>
+        public SlidePart AppendTitleLayoutSlide()
+        {
+            return InsertTitleLayoutSlide(_slideParts.Count);
+        }
+
+        /// <summary>
+        /// Creates a title layout slide after the slide at the given position, reusing that slide's layout
+        /// </summary>
+        /// <param name="position">1-based number of the slide to insert after</param>
+        /// <returns>The SlidePart of the new slide</returns>
+        public SlidePart InsertTitleLayoutSlide(int position)
+        {
+            position = Math.Clamp(position, 0, _slideParts.Count);
+
+            SlidePart slidePart = _presentationPart.AddNewPart<SlidePart>();
+            PresentationHelperMethods.CreateTitleLayoutSlide().Save(slidePart);
+
+            // Use the same slide layout as the previous slide, or the first slide when inserting at the start
+            SlidePart? layoutSource = position > 0 ? _slideParts[position - 1] : _slideParts.FirstOrDefault();
+            SlideLayoutPart? slideLayoutPart = layoutSource?.SlideLayoutPart
+                ?? _presentationPart.SlideMasterParts.FirstOrDefault()?.SlideLayoutParts.FirstOrDefault();
+            if (slideLayoutPart is not null)
+            {
+                slidePart.AddPart(slideLayoutPart);
+            }
+
+            Insert(position, slidePart);
+            return slidePart;
+        }
+
+        /// <summary>
+        /// Removes the slide from the SlideIdList and deletes its part
+        /// </summary>
+        public void Remove(SlidePart slidePart)
+        {
+            string relId = _presentationPart.GetIdOfPart(slidePart);
+
+            SlideId? slideId = _presentationPart.Presentation.SlideIdList?.Elements<SlideId>()
+                .FirstOrDefault(s => s.RelationshipId == relId);
+            slideId?.Remove();
+
+            _slideParts.Remove(slidePart);
+            _slidePartsByRelId.Remove(relId);
+            ImagePartCache.ForgetSlide(_presentationPart, slidePart);
+            _presentationPart.DeletePart(slidePart);
+        }
+
+        private uint NextSlideId()
+        {
+            // Slide ids start at 256 (ECMA-376 Part 1, 19.2.1.33)
+            _maxSlideId = Math.Max(_maxSlideId, 255) + 1;
+            return _maxSlideId;
+        }
+    }
+}
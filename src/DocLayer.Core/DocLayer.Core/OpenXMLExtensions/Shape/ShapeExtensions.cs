@@ -57,24 +57,14 @@ namespace OpenXMLExtensions
         }
         public static string GetText(this P.Shape shape)
         {
-            string text = "";
-            if (shape.TextBody != null)
+            if (shape.TextBody == null)
             {
-                foreach (D.Paragraph paragraph in shape.TextBody.Elements<D.Paragraph>())
-                {
-                    foreach (D.Run run in paragraph.Elements<D.Run>())
-                    {
-                        if (run.GetFirstChild<D.Text>() is not null)
-                        {
-                            text+= run.GetFirstChild<D.Text>().InnerText.ToString();
-                                
-                        }
-
-                    }
-                }
+                return "";
             }
 
-            return text;
+            return string.Concat(shape.TextBody.Elements<D.Paragraph>()
+                .SelectMany(paragraph => paragraph.Elements<D.Run>())
+                .Select(run => run.GetFirstChild<D.Text>()?.Text));
         }
 
         public static void SetText(this P.Shape shape, string text)
@@ -0,0 +1,440 @@
+﻿using DocumentFormat.OpenXml;
+using D = DocumentFormat.OpenXml.Drawing;
+using P = DocumentFormat.OpenXml.Presentation;
+
+namespace OpenXMLExtensions
+{
+    /// <summary>
+    /// Position and size of a drawing element, in EMU
+    /// </summary>
+    public readonly record struct LayoutBox(long X, long Y, long Width, long Height)
+    {
+        public long Right => X + Width;
+
+        public long Bottom => Y + Height;
+    }
+
+    /// <summary>
+    /// Batched layout of a set of drawing elements
+    /// </summary>
+    /// <remarks>
+    /// The boxes of the elements are read once into EMU arrays; align, distribute, grid and scale
+    /// operations then only do arithmetic on those arrays, and <see cref="Commit"/> writes each changed
+    /// transform back exactly once. The operations follow the arithmetic of the one-element-at-a-time
+    /// PictureCollectionExtensions, so a chain of them lands every picture where the equivalent chain of
+    /// extension calls would; <see cref="Grid"/> matches DistributeAsGridInShape with equal paddings,
+    /// except that it leaves the aspect ratio locks alone.
+    ///
+    /// Pictures, shapes and connectors are laid out through their spPr transform and graphic frames
+    /// through their p:xfrm. Changes made to the elements between construction and Commit are
+    /// overwritten by Commit for the elements the pass moved or resized.
+    /// </remarks>
+    public sealed class LayoutPass
+    {
+        private const long EmuPerInch = 914_400;
+
+        private readonly OpenXmlElement[] _elements;
+        private readonly long[] _x;
+        private readonly long[] _y;
+        private readonly long[] _cx;
+        private readonly long[] _cy;
+        private readonly long[] _committed;
+        private readonly int _count;
+
+        public LayoutPass(IEnumerable<OpenXmlElement> elements)
+        {
+            if (elements == null) throw new ArgumentNullException(nameof(elements));
+
+            _elements = elements.ToArray();
+            _count = _elements.Length;
+            _x = new long[_count];
+            _y = new long[_count];
+            _cx = new long[_count];
+            _cy = new long[_count];
+
+            for (int i = 0; i < _count; i++)
+            {
+                OpenXmlCompositeElement? transform = FindTransform(_elements[i], create: false);
+                D.Offset? offset = transform?.GetFirstChild<D.Offset>();
+                D.Extents? extents = transform?.GetFirstChild<D.Extents>();
+                _x[i] = offset?.X?.Value ?? 0;
+                _y[i] = offset?.Y?.Value ?? 0;
+                _cx[i] = extents?.Cx?.Value ?? 0;
+                _cy[i] = extents?.Cy?.Value ?? 0;
+            }
+
+            // Snapshot of the boxes as read, so Commit only touches elements that changed
+            _committed = new long[_count * 4];
+            Snapshot();
+        }
+
+        /// <summary>
+        /// Number of elements in the pass
+        /// </summary>
+        public int Count => _count;
+
+        /// <summary>
+        /// Current (uncommitted) box of the element at the index
+        /// </summary>
+        public LayoutBox this[int index]
+        {
+            get
+            {
+                if ((uint)index >= (uint)_count) throw new ArgumentOutOfRangeException(nameof(index));
+                return new LayoutBox(_x[index], _y[index], _cx[index], _cy[index]);
+            }
+        }
+
+        /// <summary>
+        /// Reads the box of a single element, e.g. to use a shape as the bounds of a grid
+        /// </summary>
+        public static LayoutBox BoundsOf(OpenXmlElement element)
+        {
+            OpenXmlCompositeElement? transform = FindTransform(element, create: false);
+            D.Offset? offset = transform?.GetFirstChild<D.Offset>();
+            D.Extents? extents = transform?.GetFirstChild<D.Extents>();
+            return new LayoutBox(offset?.X?.Value ?? 0, offset?.Y?.Value ?? 0, extents?.Cx?.Value ?? 0, extents?.Cy?.Value ?? 0);
+        }
+
+        public LayoutPass AlignLeftToFirst()
+        {
+            if (_count == 0) return this;
+            Array.Fill(_x, _x[0], 1, _count - 1);
+            return this;
+        }
+
+        public LayoutPass AlignTopToFirst()
+        {
+            if (_count == 0) return this;
+            Array.Fill(_y, _y[0], 1, _count - 1);
+            return this;
+        }
+
+        public LayoutPass AlignRightToFirst()
+        {
+            if (_count == 0) return this;
+            long right = _x[0] + _cx[0];
+            for (int i = 1; i < _count; i++)
+            {
+                _x[i] = right - _cx[i];
+            }
+            return this;
+        }
+
+        public LayoutPass AlignBottomToFirst()
+        {
+            if (_count == 0) return this;
+            long bottom = _y[0] + _cy[0];
+            for (int i = 1; i < _count; i++)
+            {
+                _y[i] = bottom - _cy[i];
+            }
+            return this;
+        }
+
+        /// <summary>
+        /// Aligns the vertical centers of the elements to the first element's
+        /// </summary>
+        public LayoutPass AlignVerticalCenters()
+        {
+            if (_count == 0) return this;
+            long center = _y[0] + _cy[0] / 2;
+            for (int i = 0; i < _count; i++)
+            {
+                _y[i] = center - _cy[i] / 2;
+            }
+            return this;
+        }
+
+        /// <summary>
+        /// Aligns the horizontal centers of the elements to the first element's
+        /// </summary>
+        public LayoutPass AlignHorizontalCenters()
+        {
+            if (_count == 0) return this;
+            long center = _x[0] + _cx[0] / 2;
+            for (int i = 0; i < _count; i++)
+            {
+                _x[i] = center - _cx[i] / 2;
+            }
+            return this;
+        }
+
+        /// <summary>
+        /// Spreads the vertical positions out from the first element's towards the last element's,
+        /// stepping by the distance between them divided by the number of elements, plus the spacing
+        /// when the spacing fits
+        /// </summary>
+        /// <param name="spacing">Extra distance between elements, in inches</param>
+        public LayoutPass DistributeVertically(double spacing = 0)
+        {
+            Distribute(_y, (long)(spacing * EmuPerInch));
+            return this;
+        }
+
+        /// <summary>
+        /// Spreads the horizontal positions out from the first element's towards the last element's,
+        /// stepping by the distance between them divided by the number of elements, plus the spacing
+        /// when the spacing fits
+        /// </summary>
+        /// <param name="spacing">Extra distance between elements, in inches</param>
+        public LayoutPass DistributeHorizontally(double spacing = 0)
+        {
+            Distribute(_x, (long)(spacing * EmuPerInch));
+            return this;
+        }
+
+        /// <summary>
+        /// Stacks the elements down the bounds: the first at the top and left edge, the last at the bottom edge,
+        /// the rest distributed between them and all left aligned to the first
+        /// </summary>
+        /// <param name="padding">Inset from the top and bottom edges, in inches</param>
+        public LayoutPass DistributeVerticallyIn(LayoutBox bounds, double padding = 0.2)
+        {
+            if (_count == 0) return this;
+            long inset = (long)(padding * EmuPerInch);
+            _x[0] = bounds.X;
+            _y[0] = bounds.Y + inset;
+            _y[_count - 1] = bounds.Bottom - inset;
+            return DistributeVertically().AlignLeftToFirst();
+        }
+
+        /// <summary>
+        /// Spreads the elements across the bounds: the first at the left edge, the last at the right edge
+        /// and the rest distributed between them
+        /// </summary>
+        /// <param name="padding">Inset from the left and right edges, in inches</param>
+        public LayoutPass DistributeHorizontallyIn(LayoutBox bounds, double padding = 0.2)
+        {
+            if (_count == 0) return this;
+            long inset = (long)(padding * EmuPerInch);
+            _x[0] = bounds.X + inset;
+            _x[_count - 1] = bounds.Right - inset;
+            return DistributeHorizontally();
+        }
+
+        /// <summary>
+        /// Lays the elements out row by row in a grid of equal cells inside the bounds, shrinking any element
+        /// larger than a cell to fit while keeping its aspect ratio
+        /// </summary>
+        /// <param name="padding">Inset from each edge of the bounds, in inches</param>
+        /// <param name="gap">Distance between cells, in inches</param>
+        public LayoutPass Grid(LayoutBox bounds, int columns, int rows, double padding = 0.1, double gap = 0.1)
+        {
+            if (rows <= 0 || columns <= 0)
+                throw new ArgumentException("Number of rows and columns must be greater than zero.");
+            if (_count > rows * columns)
+                throw new ArgumentException("The number of objects exceeds the grid capacity.");
+
+            long inset = (long)(padding * EmuPerInch);
+            long gapEmu = (long)(gap * EmuPerInch);
+            long left = bounds.X + inset;
+            long top = bounds.Y + inset;
+            long cellWidth = (bounds.Width - 2 * inset - gapEmu * (columns - 1)) / columns;
+            long cellHeight = (bounds.Height - 2 * inset - gapEmu * (rows - 1)) / rows;
+
+            FitWithin(cellWidth, cellHeight);
+
+            for (int i = 0; i < _count; i++)
+            {
+                int row = i / columns;
+                int column = i - row * columns;
+                _x[i] = left + column * (cellWidth + gapEmu);
+                _y[i] = top + row * (cellHeight + gapEmu);
+            }
+            return this;
+        }
+
+        /// <summary>
+        /// Shrinks every element taller than the height or wider than the width, keeping its aspect ratio
+        /// </summary>
+        public LayoutPass FitWithin(long maxWidth, long maxHeight)
+        {
+            for (int i = 0; i < _count; i++)
+            {
+                if (_cy[i] > maxHeight)
+                {
+                    ScaleHeight(i, maxHeight);
+                }
+                if (_cx[i] > maxWidth)
+                {
+                    ScaleWidth(i, maxWidth);
+                }
+            }
+            return this;
+        }
+
+        /// <summary>
+        /// Scales every element to the height in EMU, keeping its aspect ratio
+        /// </summary>
+        public LayoutPass ScaleHeightTo(long height)
+        {
+            for (int i = 0; i < _count; i++)
+            {
+                ScaleHeight(i, height);
+            }
+            return this;
+        }
+
+        /// <summary>
+        /// Scales every element to the width in EMU, keeping its aspect ratio
+        /// </summary>
+        public LayoutPass ScaleWidthTo(long width)
+        {
+            for (int i = 0; i < _count; i++)
+            {
+                ScaleWidth(i, width);
+            }
+            return this;
+        }
+
+        /// <summary>
+        /// Scales the size of every element by the factor; positions are unchanged
+        /// </summary>
+        public LayoutPass ScaleBy(double factor)
+        {
+            for (int i = 0; i < _count; i++)
+            {
+                _cx[i] = (long)(factor * _cx[i]);
+                _cy[i] = (long)(factor * _cy[i]);
+            }
+            return this;
+        }
+
+        /// <summary>
+        /// Moves every element by the offsets, in EMU
+        /// </summary>
+        public LayoutPass Move(long dx, long dy)
+        {
+            for (int i = 0; i < _count; i++)
+            {
+                _x[i] += dx;
+                _y[i] += dy;
+            }
+            return this;
+        }
+
+        /// <summary>
+        /// Writes the boxes that changed since construction (or the previous commit) back to the elements
+        /// </summary>
+        /// <returns>The number of elements written</returns>
+        public int Commit()
+        {
+            int written = 0;
+            for (int i = 0; i < _count; i++)
+            {
+                int s = i * 4;
+                bool moved = _committed[s] != _x[i] || _committed[s + 1] != _y[i];
+                bool resized = _committed[s + 2] != _cx[i] || _committed[s + 3] != _cy[i];
+                if (!moved && !resized) continue;
+
+                OpenXmlCompositeElement transform = FindTransform(_elements[i], create: true)!;
+                if (moved)
+                {
+                    D.Offset? offset = transform.GetFirstChild<D.Offset>();
+                    if (offset == null)
+                    {
+                        offset = transform.PrependChild(new D.Offset());
+                    }
+                    offset.X = _x[i];
+                    offset.Y = _y[i];
+                }
+                if (resized)
+                {
+                    D.Extents? extents = transform.GetFirstChild<D.Extents>();
+                    if (extents == null)
+                    {
+                        extents = transform.AppendChild(new D.Extents());
+                    }
+                    extents.Cx = _cx[i];
+                    extents.Cy = _cy[i];
+                }
+                written++;
+            }
+
+            Snapshot();
+            return written;
+        }
+
+        private void Distribute(long[] positions, long spacing)
+        {
+            if (_count == 0) return;
+
+            long first = positions[0];
+            long last = positions[_count - 1];
+            long distance = Math.Abs(first - last);
+            long increment = distance / _count;
+            if (spacing * _count < distance) { increment += spacing; }
+            if (first > last) { increment = -increment; }
+
+            long position = first;
+            for (int i = 0; i < _count; i++)
+            {
+                positions[i] = position;
+                position += increment;
+            }
+        }
+
+        private void ScaleHeight(int i, long height)
+        {
+            // Widen to double before dividing, as PictureExtensions.ScaleHeightTo does
+            double factor = (double)height / (double)_cy[i];
+            _cy[i] = height;
+            _cx[i] = (long)(_cx[i] * factor);
+        }
+
+        private void ScaleWidth(int i, long width)
+        {
+            double factor = (double)width / (double)_cx[i];
+            _cx[i] = width;
+            _cy[i] = (long)(_cy[i] * factor);
+        }
+
+        private void Snapshot()
+        {
+            for (int i = 0; i < _count; i++)
+            {
+                int s = i * 4;
+                _committed[s] = _x[i];
+                _committed[s + 1] = _y[i];
+                _committed[s + 2] = _cx[i];
+                _committed[s + 3] = _cy[i];
+            }
+        }
+
+        private static OpenXmlCompositeElement? FindTransform(OpenXmlElement element, bool create)
+        {
+            switch (element)
+            {
+                case P.GraphicFrame frame:
+                    if (frame.Transform == null && create) frame.Transform = new P.Transform();
+                    return frame.Transform;
+                case P.Picture picture:
+                    return FindTransform(picture.ShapeProperties, create, element);
+                case P.Shape shape:
+                    return FindTransform(shape.ShapeProperties, create, element);
+                case P.ConnectionShape connector:
+                    return FindTransform(connector.ShapeProperties, create, element);
+                default:
+                    throw new ArgumentException($"Cannot lay out element of type {element.GetType().Name}.", nameof(element));
+            }
+        }
+
+        private static OpenXmlCompositeElement? FindTransform(P.ShapeProperties? shapeProperties, bool create, OpenXmlElement element)
+        {
+            if (shapeProperties == null)
+            {
+                if (!create) return null;
+                throw new ArgumentException($"{element.GetType().Name} has no shape properties to position.", nameof(element));
+            }
+
+            D.Transform2D? transform = shapeProperties.Transform2D;
+            if (transform == null && create)
+            {
+                transform = new D.Transform2D();
+                shapeProperties.Transform2D = transform;
+            }
+            return transform;
+        }
+    }
+}
@@ -10,6 +10,14 @@ namespace OpenXMLExtensions
 {
     public static class ShapeCollectionExtensions
     {
+        /// <summary>
+        /// Starts a batched layout of the shapes; chain operations on it and call Commit to write the transforms once
+        /// </summary>
+        public static LayoutPass Layout(this List<P.Shape> shapes)
+        {
+            return new LayoutPass(shapes);
+        }
+
         public static void DistributeVertically(this List<P.Shape> shapes)
         {
             // Starting from this shape to the last element of shapes, distribute the horizontal positions equally
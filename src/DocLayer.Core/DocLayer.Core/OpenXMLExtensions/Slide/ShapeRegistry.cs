@@ -0,0 +1,170 @@
+﻿using System.Runtime.CompilerServices;
+using DocumentFormat.OpenXml;
+using P = DocumentFormat.OpenXml.Presentation;
+
+namespace OpenXMLExtensions
+{
+    /// <summary>
+    /// Per-shape-tree registry of drawing element ids and names
+    /// </summary>
+    /// <remarks>
+    /// The registry is built with one scan of the shape tree the first time it is used and is then kept
+    /// up to date by <see cref="Append"/>, so allocating an id, numbering a new shape and looking a shape
+    /// up by name do not walk the tree. Names are indexed per element type, so a picture and a shape
+    /// sharing a name are both found. Ids are allocated monotonically from the highest id in use,
+    /// which keeps them unique even after shapes are deleted.
+    ///
+    /// Elements appended to the tree without going through the registry are detected on the next call
+    /// (the tree's last child no longer matches) and trigger a rescan. Name lookups that miss also
+    /// rescan once before failing.
+    /// </remarks>
+    public sealed class ShapeRegistry
+    {
+        private static readonly ConditionalWeakTable<P.ShapeTree, ShapeRegistry> Registries = new();
+
+        private readonly P.ShapeTree _shapeTree;
+        private readonly Dictionary<(Type Type, string Name), OpenXmlElement> _elementsByName = new();
+        private OpenXmlElement? _lastKnownChild;
+        private uint _maxId;
+        private int _drawingElementCount;
+
+        private ShapeRegistry(P.ShapeTree shapeTree)
+        {
+            _shapeTree = shapeTree;
+            Refresh();
+        }
+
+        /// <summary>
+        /// Gets the registry for the shape tree, building it on first use
+        /// </summary>
+        public static ShapeRegistry For(P.ShapeTree shapeTree)
+        {
+            if (shapeTree == null) throw new ArgumentNullException(nameof(shapeTree));
+
+            ShapeRegistry registry = Registries.GetValue(shapeTree, tree => new ShapeRegistry(tree));
+            if (!ReferenceEquals(shapeTree.LastChild, registry._lastKnownChild))
+            {
+                // The tree was changed outside the registry
+                registry.Refresh();
+            }
+            return registry;
+        }
+
+        /// <summary>
+        /// Highest drawing element id in use in the tree
+        /// </summary>
+        public uint MaxId => _maxId;
+
+        /// <summary>
+        /// Reserves the next unused drawing element id
+        /// </summary>
+        public uint AllocateId()
+        {
+            return ++_maxId;
+        }
+
+        /// <summary>
+        /// Number used to name the next shape (e.g. "Rectangle 4"): the count of shapes, graphic frames and pictures plus one
+        /// </summary>
+        public string NextShapeNumber()
+        {
+            return (_drawingElementCount + 1).ToString();
+        }
+
+        /// <summary>
+        /// Appends the element to the shape tree and records its id and name
+        /// </summary>
+        public T Append<T>(T element) where T : OpenXmlElement
+        {
+            _shapeTree.AppendChild(element);
+            Register(element);
+            _lastKnownChild = element;
+            return element;
+        }
+
+        /// <summary>
+        /// Looks up a top-level element of the tree by its drawing name
+        /// </summary>
+        public bool TryGet<T>(string name, out T? element) where T : OpenXmlElement
+        {
+            if (TryGetCurrent(name, out element)) return true;
+
+            // The element may have been renamed or added out of band
+            Refresh();
+            if (TryGetCurrent(name, out element)) return true;
+
+            // T may be a base type, which the index is not keyed by
+            element = _shapeTree.Elements<T>().FirstOrDefault(child => GetName(child) == name);
+            return element != null;
+        }
+
+        /// <summary>
+        /// Rebuilds the registry from the shape tree
+        /// </summary>
+        public void Refresh()
+        {
+            _elementsByName.Clear();
+            _drawingElementCount = 0;
+            _maxId = 0;
+
+            foreach (P.NonVisualDrawingProperties drawingProperties in _shapeTree.Descendants<P.NonVisualDrawingProperties>())
+            {
+                if (drawingProperties.Id is not null && drawingProperties.Id > _maxId)
+                {
+                    _maxId = drawingProperties.Id;
+                }
+            }
+
+            foreach (OpenXmlElement child in _shapeTree.ChildElements)
+            {
+                Register(child);
+            }
+
+            _lastKnownChild = _shapeTree.LastChild;
+        }
+
+        private bool TryGetCurrent<T>(string name, out T? element) where T : OpenXmlElement
+        {
+            if (_elementsByName.TryGetValue((typeof(T), name), out OpenXmlElement? found)
+                && found is T typed
+                && ReferenceEquals(found.Parent, _shapeTree)
+                && GetName(found) == name)
+            {
+                element = typed;
+                return true;
+            }
+            element = null;
+            return false;
+        }
+
+        private void Register(OpenXmlElement element)
+        {
+            if (element is P.Shape or P.GraphicFrame or P.Picture)
+            {
+                _drawingElementCount++;
+            }
+
+            if (element is not (P.Shape or P.GraphicFrame or P.Picture or P.GroupShape or P.ConnectionShape)) return;
+
+            P.NonVisualDrawingProperties? drawingProperties = element.FirstChild?.GetFirstChild<P.NonVisualDrawingProperties>();
+            if (drawingProperties is null) return;
+
+            if (drawingProperties.Id is not null && drawingProperties.Id > _maxId)
+            {
+                _maxId = drawingProperties.Id;
+            }
+
+            string? name = drawingProperties.Name;
+            if (!string.IsNullOrEmpty(name))
+            {
+                // Keep the first element of each type with a given name, matching document order
+                _elementsByName.TryAdd((element.GetType(), name), element);
+            }
+        }
+
+        private static string? GetName(OpenXmlElement element)
+        {
+            return element.FirstChild?.GetFirstChild<P.NonVisualDrawingProperties>()?.Name;
+        }
+    }
+}
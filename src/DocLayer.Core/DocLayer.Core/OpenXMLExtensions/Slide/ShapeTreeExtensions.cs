@@ -59,7 +59,7 @@ namespace OpenXMLExtensions
             textBody.AddChild(paragraph);
             shape.AddChild(textBody);
 
-            shapeTree.AppendChild(shape);
+            shapeTree.AppendElement(shape);
         }
 
         /// <summary>
@@ -123,7 +123,7 @@ namespace OpenXMLExtensions
             textBody.AddChild(paragraph);
             shape.AddChild(textBody);
 
-            shapeTree.AppendChild(shape);
+            shapeTree.AppendElement(shape);
         }
 
         public static void AddRectangle(this P.ShapeTree shapeTree, decimal hpos, decimal vpos, decimal height, decimal width)
@@ -179,7 +179,7 @@ namespace OpenXMLExtensions
             textBody.AddChild(paragraph);
             shape.AddChild(textBody);
 
-            shapeTree.AppendChild(shape);
+            shapeTree.AppendElement(shape);
         }
         public static void AddCircle(this P.ShapeTree shapeTree, int hpos, int vpos, int height, int width)
         {
@@ -234,7 +234,7 @@ namespace OpenXMLExtensions
             textBody.AddChild(paragraph);
             shape.AddChild(textBody);
 
-            shapeTree.AppendChild(shape);
+            shapeTree.AppendElement(shape);
         }
 
         public static void AddHarveyBall(this P.ShapeTree shapeTree, int hpos, int vpos, int height, int width)
@@ -291,7 +291,7 @@ namespace OpenXMLExtensions
             textBody.AddChild(paragraph);
             shape.AddChild(textBody);
 
-            shapeTree.AppendChild(shape);
+            shapeTree.AppendElement(shape);
 
         }
 
@@ -334,7 +334,7 @@ namespace OpenXMLExtensions
 
             shape.AddChild(style);
 
-            shapeTree.AppendChild(shape);
+            shapeTree.AppendElement(shape);
         }
 
 
@@ -391,7 +391,7 @@ namespace OpenXMLExtensions
             textBody.AddChild(paragraph);
             shape.AddChild(textBody);
 
-            shapeTree.AppendChild(shape);
+            shapeTree.AppendElement(shape);
         }
 
         public static void AddLeftArrow(this P.ShapeTree shapeTree, int hpos, int vpos, int height, int width)
@@ -447,7 +447,7 @@ namespace OpenXMLExtensions
             textBody.AddChild(paragraph);
             shape.AddChild(textBody);
 
-            shapeTree.AppendChild(shape);
+            shapeTree.AppendElement(shape);
         }
 
         public static void AddUpArrow(this P.ShapeTree shapeTree, int hpos, int vpos, int height, int width)
@@ -503,7 +503,7 @@ namespace OpenXMLExtensions
             textBody.AddChild(paragraph);
             shape.AddChild(textBody);
 
-            shapeTree.AppendChild(shape);
+            shapeTree.AppendElement(shape);
         }
 
         public static void AddDownArrow(this P.ShapeTree shapeTree, int hpos, int vpos, int height, int width)
@@ -559,7 +559,7 @@ namespace OpenXMLExtensions
             textBody.AddChild(paragraph);
             shape.AddChild(textBody);
 
-            shapeTree.AppendChild(shape);
+            shapeTree.AppendElement(shape);
         }
 
         public static void AddChevron(this P.ShapeTree shapeTree, int hpos, int vpos, int height, int width)
@@ -615,7 +615,7 @@ namespace OpenXMLExtensions
             textBody.AddChild(paragraph);
             shape.AddChild(textBody);
 
-            shapeTree.AppendChild(shape);
+            shapeTree.AppendElement(shape);
         }
 
         public static void AddPentagonArrow(this P.ShapeTree shapeTree, int hpos, int vpos, int height, int width)
@@ -671,7 +671,7 @@ namespace OpenXMLExtensions
             textBody.AddChild(paragraph);
             shape.AddChild(textBody);
 
-            shapeTree.AppendChild(shape);
+            shapeTree.AppendElement(shape);
         }
         public static void AddRoundedRectangle(this P.ShapeTree shapeTree, int hpos, int vpos, int height, int width)
         {
@@ -726,7 +726,7 @@ namespace OpenXMLExtensions
             textBody.AddChild(paragraph);
             shape.AddChild(textBody);
 
-            shapeTree.AppendChild(shape);
+            shapeTree.AppendElement(shape);
         }
 
         public static void AddTriangle(this P.ShapeTree shapeTree, int hpos, int vpos, int height, int width)
@@ -782,7 +782,7 @@ namespace OpenXMLExtensions
             textBody.AddChild(paragraph);
             shape.AddChild(textBody);
 
-            shapeTree.AppendChild(shape);
+            shapeTree.AppendElement(shape);
         }
 
         public static void AddTable(this P.ShapeTree shapeTree, int numRows, int numCols)
@@ -879,7 +879,7 @@ namespace OpenXMLExtensions
 
             graphicFrame.AddChild(new D.Graphic(new D.GraphicData(table) { Uri = "http://schemas.openxmlformats.org/drawingml/2006/table" }));
 
-            shapeTree.AppendChild(graphicFrame);
+            shapeTree.AppendElement(graphicFrame);
 
         }
 
@@ -940,7 +940,7 @@ namespace OpenXMLExtensions
             picture.AddChild(blipFill);
             picture.AddChild(shapeProperties);
 
-            shapeTree.AppendChild(picture);
+            shapeTree.AppendElement(picture);
 
         }
 
@@ -1001,7 +1001,7 @@ namespace OpenXMLExtensions
             picture.AddChild(blipFill);
             picture.AddChild(shapeProperties);
 
-            shapeTree.AppendChild(picture);
+            shapeTree.AppendElement(picture);
 
         }
 
@@ -1062,17 +1062,38 @@ namespace OpenXMLExtensions
             picture.AddChild(blipFill);
             picture.AddChild(shapeProperties);
 
-            shapeTree.AppendChild(picture);
+            shapeTree.AppendElement(picture);
 
         }
+        /// <summary>
+        /// Gets the number used to name the next shape added to the tree
+        /// </summary>
+        /// <param name="shapeTree"></param>
+        /// <returns></returns>
         public static string GetShapeNumber(this P.ShapeTree shapeTree)
         {
-            return (shapeTree.Elements<P.Shape>().Count() + shapeTree.Elements<P.GraphicFrame>().Count() + shapeTree.Elements<P.Picture>().Count() + 1).ToString();
+            return ShapeRegistry.For(shapeTree).NextShapeNumber();
         }
 
+        /// <summary>
+        /// Allocates an unused drawing element id for the next shape added to the tree
+        /// </summary>
+        /// <param name="shapeTree"></param>
+        /// <returns></returns>
         public static UInt32Value GetShapeId(this P.ShapeTree shapeTree)
         {
-            return (UInt32Value)UInt32.Parse((shapeTree.Elements<P.Shape>().Count() + shapeTree.Elements<P.NonVisualGroupShapeProperties>().Count() + shapeTree.Elements<P.GraphicFrame>().Count() + shapeTree.Elements<P.Picture>().Count() + 1).ToString());
+            return ShapeRegistry.For(shapeTree).AllocateId();
+        }
+
+        /// <summary>
+        /// Appends a shape, graphic frame or picture to the tree and records it in the tree's shape registry
+        /// </summary>
+        /// <param name="shapeTree"></param>
+        /// <param name="element"></param>
+        /// <returns>The appended element</returns>
+        public static T AppendElement<T>(this P.ShapeTree shapeTree, T element) where T : OpenXmlElement
+        {
+            return ShapeRegistry.For(shapeTree).Append(element);
         }
 
         /// <summary>
@@ -1,4 +1,5 @@
 ﻿using DocumentFormat.OpenXml.Presentation;
+using System.Text;
 using D = DocumentFormat.OpenXml.Drawing;
 using Microsoft.SemanticKernel;
 
@@ -9,17 +10,9 @@ namespace OpenXMLExtensions
 #pragma warning disable
         public static Shape GetShape(this Slide slide, string shapeName) 
         {
-            Dictionary<String, Shape> shapeCollection = new Dictionary<String, Shape>();
             Shape targetShape;
 
-            foreach (Shape shape in slide.CommonSlideData.ShapeTree.Elements<Shape>())
-            {
-                NonVisualShapeProperties nvShapeProps = shape.GetFirstChild<NonVisualShapeProperties>();
-                NonVisualDrawingProperties nvShapeDrawingProps = nvShapeProps.GetFirstChild<NonVisualDrawingProperties>();
-                shapeCollection.Add(nvShapeDrawingProps.Name, shape);
-            }
-
-            if (shapeCollection.TryGetValue(shapeName, out targetShape))
+            if (ShapeRegistry.For(slide.CommonSlideData.ShapeTree).TryGet(shapeName, out targetShape))
             {
                 return targetShape;
             }
@@ -100,15 +93,8 @@ namespace OpenXMLExtensions
 
         public static GraphicFrame GetGraphicFrame(this Slide slide, string tableName)
         {
-            Dictionary<string, GraphicFrame> tableCollection = new Dictionary<string, GraphicFrame>();
-
-            foreach (GraphicFrame graphicFrame in slide.CommonSlideData.ShapeTree.Elements<GraphicFrame>())
-            {
-                tableCollection.Add(graphicFrame.GetName(), graphicFrame);
-            }
-
             GraphicFrame targetGraphicFrame;
-            if (tableCollection.TryGetValue(tableName, out targetGraphicFrame))
+            if (ShapeRegistry.For(slide.CommonSlideData.ShapeTree).TryGet(tableName, out targetGraphicFrame))
             {
                 return targetGraphicFrame;
             }
@@ -204,21 +190,8 @@ namespace OpenXMLExtensions
         /// <exception cref="Exception"></exception>
         public static Picture GetPicture(this Slide slide, string pictureName)
         {
-            Dictionary<String, Picture> pictureCollection = new Dictionary<String, Picture>();
-           
-            foreach (Picture picture in slide.CommonSlideData.ShapeTree.Elements<Picture>())
-            {
-                
-                NonVisualPictureProperties? nvPicProps = picture.GetFirstChild<NonVisualPictureProperties>();
-                Verify.NotNull(nvPicProps);
-                NonVisualDrawingProperties? nvDrawingProps = nvPicProps.GetFirstChild<NonVisualDrawingProperties>();
-                Verify.NotNull(nvDrawingProps);
-                Verify.NotNull(nvDrawingProps.Name);
-                pictureCollection.Add(nvDrawingProps.Name, picture);
-            }
-
             Picture targetPicture;
-            if (pictureCollection.TryGetValue(pictureName, out targetPicture))
+            if (ShapeRegistry.For(slide.CommonSlideData.ShapeTree).TryGet(pictureName, out targetPicture))
             {
                 return targetPicture;
             }
@@ -228,22 +201,13 @@ namespace OpenXMLExtensions
 
         public static List<Picture> GetPictures(this Slide slide, List<string> pictureNames)
         {
-            Dictionary<String, Picture> pictureCollection = new Dictionary<String, Picture>();
+            ShapeRegistry registry = ShapeRegistry.For(slide.CommonSlideData.ShapeTree);
             List<Picture> pictures = new();
-            foreach (Picture picture in slide.CommonSlideData.ShapeTree.Elements<Picture>())
-            {
-                NonVisualPictureProperties? nvPicProps = picture.GetFirstChild<NonVisualPictureProperties>();
-                Verify.NotNull(nvPicProps);
-                NonVisualDrawingProperties? nvDrawingProps = nvPicProps.GetFirstChild<NonVisualDrawingProperties>();
-                Verify.NotNull(nvDrawingProps);
-                Verify.NotNull(nvDrawingProps.Name);
-                pictureCollection.Add(nvDrawingProps.Name, picture);
-            }
 
             foreach (string pictureName in pictureNames) 
             {
                 Picture targetPicture;
-                if (pictureCollection.TryGetValue(pictureName, out targetPicture))
+                if (registry.TryGet(pictureName, out targetPicture))
                 {
                     pictures.Add(targetPicture);
                 }
@@ -462,7 +426,7 @@ namespace OpenXMLExtensions
             {
                 Shape shape = new();
                 shape.InnerXml = shapeInfo;
-                slide.CommonSlideData.ShapeTree.AppendChild<Shape>(shape);
+                slide.CommonSlideData.ShapeTree.AppendElement(shape);
             }
         }
         /// <summary>
@@ -477,7 +441,7 @@ namespace OpenXMLExtensions
             {
                 Picture shape = new();
                 shape.InnerXml = shapeInfo;
-                slide.CommonSlideData.ShapeTree.AppendChild<Picture>(shape);
+                slide.CommonSlideData.ShapeTree.AppendElement(shape);
             }
         }
 
@@ -489,14 +453,15 @@ namespace OpenXMLExtensions
 
         public static string GetSlideText(this Slide slide) 
         {
-            string slideText = "";
+            StringBuilder slideText = new StringBuilder();
             foreach (Shape shape in slide.CommonSlideData.ShapeTree.Elements<Shape>()) 
             {
-                if (PresentationHelperMethods.IsTitleShape(shape)) {  slideText = "Title text:" + shape.GetText();}
-                slideText += "\r\n" + shape.GetText().Trim();
+                string shapeText = shape.GetText();
+                if (PresentationHelperMethods.IsTitleShape(shape)) { slideText.Clear().Append("Title text:").Append(shapeText); }
+                slideText.Append("\r\n").Append(shapeText.Trim());
             }
 
-            return slideText;
+            return slideText.ToString();
         }
     }
 }
@@ -1,4 +1,5 @@
-﻿using DocumentFormat.OpenXml.Presentation;
+﻿using DocumentFormat.OpenXml;
+using DocumentFormat.OpenXml.Presentation;
 using DocumentFormat.OpenXml.Packaging;
 using InternalUtilities.Files;
 
@@ -7,6 +8,28 @@ namespace OpenXMLExtensions
     public static class SlidePartExtensions
     {
 
+        /// <summary>
+        /// Writes the slide's element tree to the part with an OpenXmlWriter and releases it, so a finished
+        /// slide no longer keeps its DOM in memory. Reading <see cref="SlidePart.Slide"/> afterwards reloads
+        /// the slide from the part.
+        /// </summary>
+        public static void WriteAndUnloadSlide(this SlidePart slidePart)
+        {
+            if (slidePart == null) throw new ArgumentNullException(nameof(slidePart));
+
+            // Detach the DOM first so saving the package does not serialize the slide a second time
+            if (slidePart.UnloadRootElement() is not Slide slide)
+            {
+                return;
+            }
+
+            using (OpenXmlWriter writer = OpenXmlWriter.Create(slidePart))
+            {
+                writer.WriteStartDocument();
+                writer.WriteElement(slide);
+            }
+        }
+
         /// <summary>
         /// Adds an image to the image part and returns the relId of the image
         /// </summary>
@@ -25,35 +48,60 @@ namespace OpenXMLExtensions
             return relId;
         }
 
-        // TODO: add support for other extensions besides png
+        /// <summary>
+        /// Adds an image downloaded from a web url and returns the relId of the image. The download is cached
+        /// on disk and the image part is shared with other slides that use the same image.
+        /// </summary>
         public static async Task<string> AddImagePartFromUri(this SlidePart slidePart, Uri uri, string fileName)
         {
-            
-            ImagePart imagePart = slidePart.AddImagePart(ImagePartType.Png);
-            string path = await FileUtilities.DownloadImageAsync(fileName, uri);
-           
-            using (Stream imageStream = File.OpenRead(path))
-            {
-                imagePart.FeedData(imageStream);
-            }
+            return await slidePart.GetOrAddImagePartFromUri(uri);
+        }
 
-            string relId = slidePart.GetIdOfPart(imagePart);
-            return relId;
+        /// <summary>
+        /// Gets the relId of an image part holding the given image, reusing the presentation's existing part
+        /// when another slide already uses the same bytes
+        /// </summary>
+        /// <returns> RelId of the imagePart </returns>
+        public static string GetOrAddImagePart(this SlidePart slidePart, byte[] imageBytes)
+        {
+            return ImagePartCache.For(slidePart.GetPresentationPart()).GetOrAddImage(slidePart, imageBytes);
         }
 
-        // TODO: add support for other extensions besides png
-        public static async Task<string> AddImagePartFromLocalPath(this SlidePart slidePart, string filePath)
+        /// <summary>
+        /// Gets the relId of an image part holding the file's image, reusing the presentation's existing part
+        /// when another slide already uses the same image
+        /// </summary>
+        /// <returns> RelId of the imagePart </returns>
+        public static string GetOrAddImagePartFromFile(this SlidePart slidePart, string filePath)
         {
+            return ImagePartCache.For(slidePart.GetPresentationPart()).GetOrAddImageFile(slidePart, filePath);
+        }
 
-            ImagePart imagePart = slidePart.AddImagePart(ImagePartType.Png);
+        /// <summary>
+        /// Gets the relId of an image part holding the image at the url. The download goes through the on-disk
+        /// fetch cache and the image part is shared with other slides that use the same image.
+        /// </summary>
+        /// <param name="cache">Fetch cache to use - optional, defaults to <see cref="ImageFetchCache.Shared"/></param>
+        /// <returns> RelId of the imagePart </returns>
+        public static async Task<string> GetOrAddImagePartFromUri(this SlidePart slidePart, Uri uri, ImageFetchCache? cache = null, CancellationToken cancellationToken = default)
+        {
+            byte[] imageBytes = await (cache ?? ImageFetchCache.Shared).GetBytesAsync(uri, cancellationToken).ConfigureAwait(false);
+            return slidePart.GetOrAddImagePart(imageBytes);
+        }
 
-            using (Stream imageStream = File.OpenRead(filePath))
-            {
-                imagePart.FeedData(imageStream);
-            }
+        /// <summary>
+        /// Adds the image at the local path and returns the relId of the image. The image part is shared with
+        /// other slides that use the same image.
+        /// </summary>
+        public static Task<string> AddImagePartFromLocalPath(this SlidePart slidePart, string filePath)
+        {
+            return Task.FromResult(slidePart.GetOrAddImagePartFromFile(filePath));
+        }
 
-            string relId = slidePart.GetIdOfPart(imagePart);
-            return relId;
+        private static PresentationPart GetPresentationPart(this SlidePart slidePart)
+        {
+            return (slidePart.OpenXmlPackage as PresentationDocument)?.PresentationPart
+                ?? throw new InvalidOperationException("Slide part does not belong to a presentation");
         }
     }
 }
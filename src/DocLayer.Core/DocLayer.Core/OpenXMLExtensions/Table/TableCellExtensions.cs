@@ -8,24 +8,13 @@ namespace OpenXMLExtensions
     {
         public static string GetText(this TableCell cell)
         {
-            string text = "";
-            if (cell.GetFirstChild<D.TextBody>() != null)
+            D.TextBody? body = cell.GetFirstChild<D.TextBody>();
+            if (body == null)
             {
-
-                D.TextBody body = cell.GetFirstChild<D.TextBody>();
-                if (body.GetFirstChild<D.Paragraph>() is not null)
-                {
-                    foreach (D.Paragraph p in body.Elements<D.Paragraph>()) 
-                    {
-                        text += p.GetText();
-                    }
-                    return text;
-                }
-                return text;
-
+                return "";
             }
-            return text;
 
+            return string.Concat(body.Elements<D.Paragraph>().Select(p => p.GetText()));
         }
         public static void AddParagraph(this TableCell cell, string text)
         {
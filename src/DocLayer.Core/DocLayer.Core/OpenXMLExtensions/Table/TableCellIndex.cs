@@ -0,0 +1,134 @@
+﻿using System.Diagnostics.CodeAnalysis;
+using System.Runtime.CompilerServices;
+using DocumentFormat.OpenXml;
+using D = DocumentFormat.OpenXml.Drawing;
+
+namespace OpenXMLExtensions
+{
+    /// <summary>
+    /// Row/column index over the cells of a table
+    /// </summary>
+    /// <remarks>
+    /// One index is cached per table. It is built with a single pass over the rows, or seeded directly
+    /// by the bulk fill methods in <see cref="TableExtensions"/>, so cell lookups for follow-up styling
+    /// are constant time instead of re-enumerating rows and cells. Rows or columns appended to the table
+    /// are detected on the next <see cref="For"/> call, and cells that were removed from the table are
+    /// detected on access; either triggers a rebuild.
+    /// </remarks>
+    public sealed class TableCellIndex
+    {
+        private static readonly ConditionalWeakTable<D.Table, TableCellIndex> Indexes = new();
+
+        private readonly D.Table _table;
+        private D.TableCell[][] _cells = Array.Empty<D.TableCell[]>();
+        private int _columnCount;
+        private OpenXmlElement? _lastRow;
+        private OpenXmlElement? _lastGridColumn;
+
+        private TableCellIndex(D.Table table)
+        {
+            _table = table;
+            Refresh();
+        }
+
+        /// <summary>
+        /// Gets the cached index for the table, building it on first use
+        /// </summary>
+        public static TableCellIndex For(D.Table table)
+        {
+            if (table == null) throw new ArgumentNullException(nameof(table));
+
+            TableCellIndex index = Indexes.GetValue(table, t => new TableCellIndex(t));
+            if (!ReferenceEquals(table.LastChild, index._lastRow)
+                || !ReferenceEquals(table.GetFirstChild<D.TableGrid>()?.LastChild, index._lastGridColumn))
+            {
+                index.Refresh();
+            }
+            return index;
+        }
+
+        public int RowCount => _cells.Length;
+
+        public int ColumnCount => _columnCount;
+
+        /// <summary>
+        /// Gets the cell at the specified row and column (1-based)
+        /// </summary>
+        public D.TableCell this[int rowNum, int colNum]
+        {
+            get
+            {
+                if (rowNum <= 0 || rowNum > RowCount) throw new ArgumentException("Row number not valid");
+                if (colNum <= 0 || colNum > _columnCount) throw new ArgumentException("Column number not valid");
+                if (!TryGetCell(rowNum, colNum, out D.TableCell? cell)) throw new ArgumentException("Column number not valid");
+                return cell;
+            }
+        }
+
+        /// <summary>
+        /// Gets the cell at the specified row and column (1-based), or false if it is out of range
+        /// </summary>
+        public bool TryGetCell(int rowNum, int colNum, [NotNullWhen(true)] out D.TableCell? cell)
+        {
+            if (TryGetCurrent(rowNum, colNum, out cell)) return true;
+            if (cell is null) return false;
+
+            // The cell was moved or removed since the index was built
+            Refresh();
+            return TryGetCurrent(rowNum, colNum, out cell);
+        }
+
+        /// <summary>
+        /// Gets the cells of the specified row (1-based)
+        /// </summary>
+        public IReadOnlyList<D.TableCell> GetRow(int rowNum)
+        {
+            if (rowNum <= 0 || rowNum > RowCount) throw new ArgumentException("Row number not valid");
+            return _cells[rowNum - 1];
+        }
+
+        /// <summary>
+        /// Gets the cells of the specified column (1-based), top to bottom
+        /// </summary>
+        public IEnumerable<D.TableCell> GetColumn(int colNum)
+        {
+            if (colNum <= 0 || colNum > _columnCount) throw new ArgumentException("Column number not valid");
+            foreach (D.TableCell[] row in _cells)
+            {
+                if (colNum <= row.Length) yield return row[colNum - 1];
+            }
+        }
+
+        /// <summary>
+        /// Rebuilds the index from the table
+        /// </summary>
+        public void Refresh()
+        {
+            Load(_table.Elements<D.TableRow>().Select(row => row.Elements<D.TableCell>().ToArray()).ToArray());
+        }
+
+        /// <summary>
+        /// Seeds the index with cells that were just written to the table, avoiding a rescan
+        /// </summary>
+        internal void Load(D.TableCell[][] cells)
+        {
+            _cells = cells;
+            D.TableGrid? tableGrid = _table.GetFirstChild<D.TableGrid>();
+            _columnCount = tableGrid?.Elements<D.GridColumn>().Count() ?? 0;
+            _lastRow = _table.LastChild;
+            _lastGridColumn = tableGrid?.LastChild;
+        }
+
+        private bool TryGetCurrent(int rowNum, int colNum, [NotNullWhen(true)] out D.TableCell? cell)
+        {
+            cell = null;
+            if (rowNum <= 0 || rowNum > _cells.Length || colNum <= 0 || colNum > _columnCount) return false;
+
+            D.TableCell[] row = _cells[rowNum - 1];
+            if (colNum > row.Length) return false;
+
+            cell = row[colNum - 1];
+            return ReferenceEquals(cell.Parent?.Parent, _table);
+        }
+    }
+}
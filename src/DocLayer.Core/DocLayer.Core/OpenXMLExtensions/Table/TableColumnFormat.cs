@@ -0,0 +1,80 @@
+﻿using System.Globalization;
+using D = DocumentFormat.OpenXml.Drawing;
+
+namespace OpenXMLExtensions
+{
+    /// <summary>
+    /// Formatting applied to every data cell of a table column by the bulk fill methods in <see cref="TableExtensions"/>
+    /// </summary>
+    public class TableColumnFormat
+    {
+        /// <summary>
+        /// .NET numeric format string (e.g. "N2", "P1", "#,##0") applied to cells whose text parses as a number
+        /// </summary>
+        public string? NumberFormat { get; set; }
+
+        /// <summary>
+        /// Text alignment: "left", "center", "right" or "justify"
+        /// </summary>
+        public string? Alignment { get; set; }
+
+        /// <summary>
+        /// Font size in points (defaults to 14)
+        /// </summary>
+        public int? FontSize { get; set; }
+
+        public bool Bold { get; set; }
+
+        /// <summary>
+        /// Hex font color (e.g. "FFFFFF")
+        /// </summary>
+        public string? FontColor { get; set; }
+
+        /// <summary>
+        /// Hex cell fill color (e.g. "4472C4")
+        /// </summary>
+        public string? Fill { get; set; }
+
+        /// <summary>
+        /// Theme accent number (1-6) used as the cell fill; ignored when <see cref="Fill"/> is set
+        /// </summary>
+        public int? SchemeFill { get; set; }
+
+        /// <summary>
+        /// Applies <see cref="NumberFormat"/> to the text if it is numeric, otherwise returns it unchanged
+        /// </summary>
+        public string FormatText(string text)
+        {
+            if (string.IsNullOrEmpty(NumberFormat)) return text;
+
+            if (decimal.TryParse(text, NumberStyles.Float, CultureInfo.InvariantCulture, out decimal decimalValue))
+            {
+                return decimalValue.ToString(NumberFormat, CultureInfo.InvariantCulture);
+            }
+            if (double.TryParse(text, NumberStyles.Float, CultureInfo.InvariantCulture, out double doubleValue))
+            {
+                return doubleValue.ToString(NumberFormat, CultureInfo.InvariantCulture);
+            }
+            return text;
+        }
+
+        internal D.TextAlignmentTypeValues? GetAlignment()
+        {
+            switch (Alignment?.ToLowerInvariant())
+            {
+                case null:
+                    return null;
+                case "left":
+                    return D.TextAlignmentTypeValues.Left;
+                case "center":
+                    return D.TextAlignmentTypeValues.Center;
+                case "right":
+                    return D.TextAlignmentTypeValues.Right;
+                case "justify":
+                    return D.TextAlignmentTypeValues.Justified;
+                default:
+                    throw new ArgumentException($"Unknown alignment: {Alignment}");
+            }
+        }
+    }
+}
@@ -16,14 +16,156 @@ namespace OpenXMLExtensions
         {
             if (table == null) throw new ArgumentNullException(nameof(table));
 
-            var rows = table.Elements<D.TableRow>().ToList();
-            if (rowNum <= 0 || rowNum > rows.Count) throw new ArgumentException("Row number not valid");
+            return TableCellIndex.For(table)[rowNum, colNum];
+        }
 
-            var row = rows[rowNum - 1];
-            var cols = table.GetFirstChild<D.TableGrid>()?.Elements<D.GridColumn>().ToList();
-            if (cols == null || colNum <= 0 || colNum > cols.Count) throw new ArgumentException("Column number not valid");
+        /// <summary>
+        /// Gets the cached row/column index of the table's cells for repeated cell access.
+        /// </summary>
+        public static TableCellIndex GetCellIndex(this D.Table table)
+        {
+            return TableCellIndex.For(table);
+        }
 
-            return row.Elements<D.TableCell>().ElementAt(colNum - 1);
+        /// <summary>
+        /// Replaces the table's rows with the given cell text in a single pass, keeping the current row height
+        /// and column width. Per-column formats apply to every row after the first <paramref name="headerRows"/>.
+        /// </summary>
+        /// <returns>The cell index of the filled table, for follow-up styling</returns>
+        public static TableCellIndex SetTableData(this D.Table table, string?[,] data, IReadOnlyList<TableColumnFormat?>? columnFormats = null, int headerRows = 0)
+        {
+            if (data == null) throw new ArgumentNullException(nameof(data));
+            return table.SetTableData(data.GetLength(0), data.GetLength(1), (row, col) => data[row, col], columnFormats, headerRows);
+        }
+
+        /// <summary>
+        /// Replaces the table's rows with the given rows of cell text in a single pass. Rows shorter than the
+        /// longest row are padded with empty cells.
+        /// </summary>
+        /// <returns>The cell index of the filled table, for follow-up styling</returns>
+        public static TableCellIndex SetTableData(this D.Table table, IEnumerable<IEnumerable<string?>> rows, IReadOnlyList<TableColumnFormat?>? columnFormats = null, int headerRows = 0)
+        {
+            if (rows == null) throw new ArgumentNullException(nameof(rows));
+
+            List<string?[]> materialized = rows.Select(row => row?.ToArray() ?? Array.Empty<string?>()).ToList();
+            int numCols = materialized.Count == 0 ? 0 : materialized.Max(row => row.Length);
+
+            return table.SetTableData(materialized.Count, numCols,
+                (row, col) => col < materialized[row].Length ? materialized[row][col] : null,
+                columnFormats, headerRows);
+        }
+
+        /// <summary>
+        /// Replaces the table's rows with columnar data (column name to values) in a single pass.
+        /// The column names form a header row when <paramref name="includeHeader"/> is true.
+        /// </summary>
+        /// <returns>The cell index of the filled table, for follow-up styling</returns>
+        public static TableCellIndex SetTableColumns(this D.Table table, IEnumerable<KeyValuePair<string, IReadOnlyList<string?>>> columns, IReadOnlyList<TableColumnFormat?>? columnFormats = null, bool includeHeader = true)
+        {
+            if (columns == null) throw new ArgumentNullException(nameof(columns));
+
+            List<KeyValuePair<string, IReadOnlyList<string?>>> materialized = columns.ToList();
+            int headerRows = includeHeader ? 1 : 0;
+            int numRows = (materialized.Count == 0 ? 0 : materialized.Max(column => column.Value.Count)) + headerRows;
+
+            return table.SetTableData(numRows, materialized.Count, (row, col) =>
+            {
+                if (row < headerRows) return materialized[col].Key;
+                IReadOnlyList<string?> values = materialized[col].Value;
+                return row - headerRows < values.Count ? values[row - headerRows] : null;
+            }, columnFormats, headerRows);
+        }
+
+        private static TableCellIndex SetTableData(this D.Table table, int numRows, int numCols, Func<int, int, string?> cellText, IReadOnlyList<TableColumnFormat?>? columnFormats, int headerRows)
+        {
+            if (table == null) throw new ArgumentNullException(nameof(table));
+            if (numRows <= 0) throw new ArgumentException("Number of rows must be greater than zero");
+            if (numCols <= 0) throw new ArgumentException("Number of columns must be greater than zero");
+
+            // Keep the current row height and column width
+            long rowHeight = table.GetFirstChild<D.TableRow>()?.Height?.Value ?? 914_400;
+            D.TableGrid tableGrid = table.GetFirstChild<D.TableGrid>() ?? table.AppendChild(new D.TableGrid());
+            List<D.GridColumn> gridColumns = tableGrid.Elements<D.GridColumn>().ToList();
+            long colWidth = gridColumns.LastOrDefault()?.Width?.Value ?? 914_400;
+
+            for (int col = gridColumns.Count; col < numCols; col++)
+            {
+                tableGrid.AppendChild(new D.GridColumn(new D.ExtensionList()) { Width = colWidth });
+            }
+            for (int col = gridColumns.Count - 1; col >= numCols; col--)
+            {
+                gridColumns[col].Remove();
+            }
+
+            table.RemoveAllChildren<D.TableRow>();
+
+            D.TableCell[][] cells = new D.TableCell[numRows][];
+            for (int row = 0; row < numRows; row++)
+            {
+                D.TableRow tableRow = new D.TableRow() { Height = rowHeight };
+                D.TableCell[] rowCells = new D.TableCell[numCols];
+                for (int col = 0; col < numCols; col++)
+                {
+                    TableColumnFormat? format = row >= headerRows && columnFormats != null && col < columnFormats.Count ? columnFormats[col] : null;
+                    rowCells[col] = CreateCell(cellText(row, col), format);
+                    tableRow.AppendChild(rowCells[col]);
+                }
+                table.AppendChild(tableRow);
+                cells[row] = rowCells;
+            }
+
+            // Keep the enclosing graphic frame sized to the table
+            if (table.Parent?.Parent?.Parent is DocumentFormat.OpenXml.Presentation.GraphicFrame graphicFrame
+                && graphicFrame.Transform?.Extents is D.Extents extents)
+            {
+                extents.Cx = tableGrid.Elements<D.GridColumn>().Sum(col => col.Width?.Value ?? 0);
+                extents.Cy = rowHeight * numRows;
+            }
+
+            TableCellIndex index = TableCellIndex.For(table);
+            index.Load(cells);
+            return index;
+        }
+
+        private static D.TableCell CreateCell(string? text, TableColumnFormat? format)
+        {
+            D.Paragraph paragraph = new D.Paragraph();
+
+            D.TextAlignmentTypeValues? alignment = format?.GetAlignment();
+            if (alignment.HasValue)
+            {
+                paragraph.AppendChild(new D.ParagraphProperties() { Alignment = alignment.Value });
+            }
+
+            if (!string.IsNullOrEmpty(text))
+            {
+                D.RunProperties runProperties = new D.RunProperties() { Language = "en-US", FontSize = (format?.FontSize ?? 14) * 100, Dirty = false };
+                if (format?.Bold == true)
+                {
+                    runProperties.Bold = true;
+                }
+                if (!string.IsNullOrEmpty(format?.FontColor))
+                {
+                    runProperties.AppendChild(new D.SolidFill(new D.RgbColorModelHex() { Val = format.FontColor }));
+                }
+                paragraph.AppendChild(new D.Run(runProperties, new D.Text(format?.FormatText(text) ?? text)));
+            }
+
+            paragraph.AppendChild(new D.EndParagraphRunProperties() { Language = "en-US" });
+
+            D.TableCellProperties cellProperties = new D.TableCellProperties();
+            if (!string.IsNullOrEmpty(format?.Fill))
+            {
+                cellProperties.AppendChild(new D.SolidFill(new D.RgbColorModelHex() { Val = format.Fill }));
+            }
+            else if (format?.SchemeFill is int accentNum)
+            {
+                D.SolidFill fill = new D.SolidFill();
+                fill.SetSchemeFill(accentNum);
+                cellProperties.AppendChild(fill);
+            }
+
+            return new D.TableCell(new D.TextBody(new D.BodyProperties(), new D.ListStyle(), paragraph), cellProperties);
         }
 
 
@@ -523,56 +665,32 @@ namespace OpenXMLExtensions
 
         public static void SetTextToCell(this D.Table table, string text, int numRow, int numCol)
         {
-            if (table.Descendants < D.TableCell>().Count()>0
-                && numRow > 0
-                && numRow <= table.Elements<D.TableRow>().Count()
-                && numCol > 0
-                && numCol <= table.Descendants<D.GridColumn>().Count())
+            if (TableCellIndex.For(table).TryGetCell(numRow, numCol, out D.TableCell? cell))
             {
-                D.TableRow row = table.Elements<D.TableRow>().ElementAt(numRow - 1);
-                D.TableCell cell = row.Elements<D.TableCell>().ElementAt(numCol - 1);
                 cell.SetText(text);
             }            
         }
 
         public static void AddTextToCell(this D.Table table, string text, int numRow, int numCol)
         {
-            if (table.Descendants < D.TableCell>().Count()>0
-                && numRow > 0
-                && numRow <= table.Elements<D.TableRow>().Count()
-                && numCol > 0
-                && numCol <= table.Descendants<D.GridColumn>().Count())
+            if (TableCellIndex.For(table).TryGetCell(numRow, numCol, out D.TableCell? cell))
             {
-                D.TableRow row = table.Elements<D.TableRow>().ElementAt(numRow - 1);
-                D.TableCell cell = row.Elements<D.TableCell>().ElementAt(numCol - 1);
                 cell.AddParagraph(text);
             }
         }
 
         public static void AddCellTextAt(this D.Table table, string text, int numRow, int numCol, int pos)
         {
-            if (table.Descendants<D.TableCell>().Count() > 0
-                && numRow > 0
-                && numRow <= table.Elements<D.TableRow>().Count()
-                && numCol > 0
-                && numCol <= table.Descendants<D.GridColumn>().Count())
+            if (TableCellIndex.For(table).TryGetCell(numRow, numCol, out D.TableCell? cell))
             {
-                D.TableRow row = table.Elements<D.TableRow>().ElementAt(numRow - 1);
-                D.TableCell cell = row.Elements<D.TableCell>().ElementAt(numCol - 1);
                 cell.AddParagraphAt(text, pos);
             }
         }
 
         public static void DeleteAllTextInCell(this D.Table table, int numRow, int numCol)
         {
-            if (table.Descendants<D.TableCell>().Count() > 0
-                && numRow > 0
-                && numRow <= table.Elements<D.TableRow>().Count()
-                && numCol > 0
-                && numCol <= table.Descendants<D.GridColumn>().Count())
+            if (TableCellIndex.For(table).TryGetCell(numRow, numCol, out D.TableCell? cell))
             {
-                D.TableRow row = table.Elements<D.TableRow>().ElementAt(numRow - 1);
-                D.TableCell cell = row.Elements<D.TableCell>().ElementAt(numCol - 1);
                 cell.DeleteAllText();
             }
         }
@@ -617,15 +735,7 @@ namespace OpenXMLExtensions
         /// <returns></returns>
         public static string GetAllInnerText(this D.Table table)
         {
-            string innerText = "";
-
-            foreach (D.TableCell cell in table.Descendants<D.TableCell>())
-            {
-                innerText += cell.GetText();
-
-            }
-
-            return innerText;
+            return string.Concat(table.Descendants<D.TableCell>().Select(cell => cell.GetText()));
         }
 
         public static bool TryGetCellContaining(this D.Table table, string text, out D.TableCell cellContainingText)
@@ -0,0 +1,115 @@
+using System.IO.Packaging;
+using System.Runtime.CompilerServices;
+using DocumentFormat.OpenXml.Packaging;
+using OpenXMLExtensions;
+
+namespace DocLayer.Core
+{
+    /// <summary>
+    /// How much effort the ZIP deflate of a saved package gets
+    /// </summary>
+    public enum PackageCompressionLevel
+    {
+        /// <summary>Default deflate; the size PowerPoint itself produces</summary>
+        Optimal,
+
+        /// <summary>Fastest deflate: quicker saves, somewhat larger files</summary>
+        Fastest,
+
+        /// <summary>No compression: the quickest save, for intermediate files that are re-zipped downstream</summary>
+        Store,
+
+        /// <summary>Smallest output, slowest save</summary>
+        Maximum,
+    }
+
+    /// <summary>
+    /// Compression settings of a presentation package: one level for the XML parts and, optionally, a separate
+    /// level for images that are already compressed (PNG, JPEG, GIF), which deflate cannot shrink any further
+    /// </summary>
+    /// <remarks>
+    /// The settings apply to parts created after they are set. <see cref="PresentationHelper.CreatePresentation(Stream, bool, PackageCompression?)"/>
+    /// and <see cref="PresentationTemplateCache"/> set them before the base parts are written, so every part of the package
+    /// follows them; parts an existing package already holds keep the compression they were saved with.
+    /// </remarks>
+    public sealed record PackageCompression(PackageCompressionLevel Level = PackageCompressionLevel.Optimal, PackageCompressionLevel? Images = null)
+    {
+        private static readonly ConditionalWeakTable<PresentationDocument, PackageCompression> Settings = new();
+
+        /// <summary>Default compression for every part</summary>
+        public static PackageCompression Optimal { get; } = new();
+
+        /// <summary>Fastest deflate for every part</summary>
+        public static PackageCompression Fastest { get; } = new(PackageCompressionLevel.Fastest);
+
+        /// <summary>No compression for any part</summary>
+        public static PackageCompression Store { get; } = new(PackageCompressionLevel.Store);
+
+        /// <summary>Default compression for XML, stored images: about the same size as <see cref="Optimal"/>, saved faster</summary>
+        public static PackageCompression StoreImages { get; } = new(PackageCompressionLevel.Optimal, PackageCompressionLevel.Store);
+
+        /// <summary>
+        /// Parses the level names used by deck specs and the wrappers: "optimal", "fastest", "store" or "maximum"
+        /// </summary>
+        /// <param name="level">Level of the XML parts, or null/empty for optimal</param>
+        /// <param name="images">Level of already-compressed images, or null/empty to use <paramref name="level"/></param>
+        /// <returns>The settings, or null when both are unset (the default compression)</returns>
+        public static PackageCompression? Parse(string? level, string? images = null)
+        {
+            if (string.IsNullOrEmpty(level) && string.IsNullOrEmpty(images))
+            {
+                return null;
+            }
+
+            return new PackageCompression(
+                string.IsNullOrEmpty(level) ? PackageCompressionLevel.Optimal : ParseLevel(level, nameof(level)),
+                string.IsNullOrEmpty(images) ? null : ParseLevel(images, nameof(images)));
+        }
+
+        /// <summary>
+        /// Applies the settings to the parts created in the presentation from now on
+        /// </summary>
+        public void ApplyTo(PresentationDocument presentationDoc)
+        {
+            presentationDoc.CompressionOption = ToCompressionOption(Level);
+            if (presentationDoc.PresentationPart is PresentationPart presentationPart)
+            {
+                ImagePartCache.For(presentationPart).CompressedImageOption = Images is PackageCompressionLevel images
+                    ? ToCompressionOption(images)
+                    : null;
+            }
+            Settings.AddOrUpdate(presentationDoc, this);
+        }
+
+        /// <summary>
+        /// The settings applied to the presentation, or <see cref="Optimal"/> if none were
+        /// </summary>
+        public static PackageCompression For(PresentationDocument presentationDoc)
+        {
+            return Settings.TryGetValue(presentationDoc, out PackageCompression? compression) ? compression : Optimal;
+        }
+
+        internal static CompressionOption ToCompressionOption(PackageCompressionLevel level)
+        {
+            return level switch
+            {
+                PackageCompressionLevel.Store => CompressionOption.NotCompressed,
+                PackageCompressionLevel.Fastest => CompressionOption.SuperFast,
+                PackageCompressionLevel.Maximum => CompressionOption.Maximum,
+                _ => CompressionOption.Normal,
+            };
+        }
+
+        private static PackageCompressionLevel ParseLevel(string value, string paramName)
+        {
+            return value.ToLowerInvariant() switch
+            {
+                "optimal" => PackageCompressionLevel.Optimal,
+                "fastest" => PackageCompressionLevel.Fastest,
+                "store" => PackageCompressionLevel.Store,
+                "maximum" => PackageCompressionLevel.Maximum,
+                _ => throw new ArgumentException($"Unknown compression level '{value}'; expected optimal, fastest, store or maximum", paramName),
+            };
+        }
+    }
+}
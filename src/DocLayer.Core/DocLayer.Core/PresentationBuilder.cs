@@ -16,12 +16,29 @@ namespace DocLayer.Core
     {
         private readonly PresentationDocument _presentationDoc;
         private PresentationPart _presentationPart;
-        private uint _slideIdCounter = 256;
+        private readonly SlideIndex _slideIndex;
 
         public PresentationBuilder(PresentationDocument presentationDoc)
         {
             _presentationDoc = presentationDoc ?? throw new ArgumentNullException(nameof(presentationDoc));
             _presentationPart = _presentationDoc.PresentationPart ?? throw new InvalidOperationException("PresentationPart not found");
+            _slideIndex = new SlideIndex(_presentationPart);
+        }
+
+        /// <summary>
+        /// Index of the presentation's slides, kept up to date as the builder adds and removes slides.
+        /// Call <see cref="SlideIndex.Refresh"/> after changing the slide list outside the builder.
+        /// </summary>
+        public SlideIndex Slides => _slideIndex;
+
+        /// <summary>
+        /// ZIP compression of the parts the builder adds from now on (slides, images) when the package is saved.
+        /// Parts already in the package keep theirs; create the presentation with a compression to cover them too.
+        /// </summary>
+        public PackageCompression Compression
+        {
+            get => PackageCompression.For(_presentationDoc);
+            set => (value ?? throw new ArgumentNullException(nameof(value))).ApplyTo(_presentationDoc);
         }
 
         /// <summary>
@@ -33,27 +50,151 @@ namespace DocLayer.Core
         /// <returns>The created SlidePart</returns>
         public void CreateTitleSlide(string title, string? subtitle = null, string? footnote = "Source:")
         {
-            // Add a title layout slide at position 1
-            PresentationHelperMethods.AddTitleLayoutSlide(_presentationDoc, 1);
+            using (DocLayerDiagnostics.StartPhase(DocLayerDiagnostics.Phases.SlideBuild))
+            {
+                // Add a title layout slide at position 1
+                var slide = _slideIndex.InsertTitleLayoutSlide(1).Slide;
+
+                // Add title and subtitle text
+                slide.AddTitle(title);
+                if (!string.IsNullOrEmpty(subtitle))
+                {
+                    slide.AddSubtitle(subtitle);
+                }
 
-            // Get the last slide (the one we just added)
-            var slide = _presentationDoc.GetLastSlide();
+                // Optionally add a footnote
+                if (!string.IsNullOrEmpty(footnote))
+                {
+                    slide.AddFootnote(footnote);
+                }
+            }
 
-            // Add title and subtitle text
-            slide.AddTitle(title);
-            if (!string.IsNullOrEmpty(subtitle))
+            // Save the presentation
+            using (DocLayerDiagnostics.StartPhase(DocLayerDiagnostics.Phases.Serialize))
             {
-                slide.AddSubtitle(subtitle);
+                _presentationDoc.Save();
             }
+        }
+
+        /// <summary>
+        /// Builds every slide of the deck spec and saves the presentation once at the end
+        /// </summary>
+        /// <param name="deck">Deck spec describing the slides to add</param>
+        /// <param name="replaceExistingSlides">If true, slides already in the presentation (e.g. the starter
+        /// slide of a new document) are removed so the deck contains only the spec's slides</param>
+        /// <param name="streamSlides">If true, each slide is written to its part and released as soon as it is
+        /// built (see <see cref="WriteSlide"/>), so memory does not grow with the number of slides</param>
+        public void BuildDeck(DeckSpec deck, bool replaceExistingSlides = false, bool streamSlides = false)
+        {
+            if (deck == null) throw new ArgumentNullException(nameof(deck));
 
-            // Optionally add a footnote
-            if (!string.IsNullOrEmpty(footnote))
+            using (DocLayerDiagnostics.StartPhase(DocLayerDiagnostics.Phases.SlideBuild))
             {
-                slide.AddFootnote(footnote);
+                List<SlidePart> existingSlideParts = _slideIndex.SlideParts.ToList();
+
+                foreach (SlideSpec slideSpec in deck.Slides)
+                {
+                    if (streamSlides)
+                    {
+                        WriteSlide(slideSpec);
+                    }
+                    else
+                    {
+                        AddSlide(slideSpec);
+                    }
+                }
+
+                if (replaceExistingSlides)
+                {
+                    foreach (SlidePart slidePart in existingSlideParts)
+                    {
+                        _slideIndex.Remove(slidePart);
+                    }
+                }
             }
 
-            // Save the presentation
-            _presentationDoc.Save();
+            // One save for the whole deck instead of one per slide
+            using (DocLayerDiagnostics.StartPhase(DocLayerDiagnostics.Phases.Serialize))
+            {
+                _presentationDoc.Save();
+            }
+        }
+
+        /// <summary>
+        /// Appends a title layout slide built from the slide spec. The presentation is not saved;
+        /// call <see cref="BuildDeck"/> or save the document when all slides are added.
+        /// </summary>
+        /// <param name="slideSpec">Content of the slide</param>
+        /// <returns>The created SlidePart</returns>
+        public SlidePart AddSlide(SlideSpec slideSpec)
+        {
+            if (slideSpec == null) throw new ArgumentNullException(nameof(slideSpec));
+
+            SlidePart slidePart = _slideIndex.AppendTitleLayoutSlide();
+            Slide slide = slidePart.Slide;
+            P.ShapeTree shapeTree = slide.CommonSlideData!.ShapeTree!;
+
+            if (!string.IsNullOrEmpty(slideSpec.Title))
+            {
+                slide.SetTitleText(slideSpec.Title);
+            }
+
+            if (!string.IsNullOrEmpty(slideSpec.Subtitle))
+            {
+                slide.AddSubtitle(slideSpec.Subtitle);
+            }
+
+            foreach (TextboxSpec textbox in slideSpec.Textboxes)
+            {
+                shapeTree.AddTextbox(textbox.Text, textbox.Hpos, textbox.Vpos);
+            }
+
+            foreach (ShapeSpec shapeSpec in slideSpec.Shapes)
+            {
+                AddShape(shapeTree, shapeSpec);
+            }
+
+            foreach (TableSpec tableSpec in slideSpec.Tables)
+            {
+                AddTable(shapeTree, tableSpec);
+            }
+
+            foreach (PictureSpec pictureSpec in slideSpec.Pictures)
+            {
+                // Identical images share one part across the deck; urls go through the on-disk fetch cache
+                string relId = Uri.TryCreate(pictureSpec.Path, UriKind.Absolute, out Uri? uri) && (uri.Scheme == Uri.UriSchemeHttp || uri.Scheme == Uri.UriSchemeHttps)
+                    ? slidePart.GetOrAddImagePartFromUri(uri).GetAwaiter().GetResult()
+                    : slidePart.GetOrAddImagePartFromFile(pictureSpec.Path);
+                if (pictureSpec.Height.HasValue && pictureSpec.Width.HasValue)
+                {
+                    shapeTree.AddPicture(relId, pictureSpec.Height.Value, pictureSpec.Width.Value, pictureSpec.Hpos, pictureSpec.Vpos);
+                }
+                else
+                {
+                    shapeTree.AddPicture(relId, pictureSpec.Hpos, pictureSpec.Vpos);
+                }
+            }
+
+            if (!string.IsNullOrEmpty(slideSpec.Footnote))
+            {
+                AddFootnoteToShapeTree(shapeTree, slideSpec.Footnote);
+            }
+
+            return slidePart;
+        }
+
+        /// <summary>
+        /// Appends a slide built from the slide spec, then writes it to its part with an OpenXmlWriter and
+        /// releases its element tree. Only the presentation part and slide id list stay resident, so decks
+        /// with thousands of slides can be built with bounded memory.
+        /// </summary>
+        /// <param name="slideSpec">Content of the slide</param>
+        /// <returns>The created SlidePart, whose Slide is reloaded from the part if accessed again</returns>
+        public SlidePart WriteSlide(SlideSpec slideSpec)
+        {
+            SlidePart slidePart = AddSlide(slideSpec);
+            slidePart.WriteAndUnloadSlide();
+            return slidePart;
         }
 
         /// <summary>
@@ -63,6 +204,8 @@ namespace DocLayer.Core
         /// <param name="accentColors">List of 4 hex color codes for accent colors (e.g., "4472C4") - optional</param>
         public void SetPresentationTheme(string? fontName = null, List<string>? accentColors = null)
         {
+            using PhaseScope phase = DocLayerDiagnostics.StartPhase(DocLayerDiagnostics.Phases.ThemeEdit);
+
             // Get the theme from the first slide master
             var slideMasterPart = _presentationPart.SlideMasterParts.FirstOrDefault()
                 ?? throw new InvalidOperationException("No slide master found in presentation");
@@ -237,7 +380,7 @@ namespace DocLayer.Core
             P.Shape footnoteShape = new P.Shape();
 
             // Non-visual properties
-            uint shapeId = (uint)(shapeTree.Elements<P.Shape>().Count() + shapeTree.Elements<P.Picture>().Count() + 2);
+            uint shapeId = shapeTree.GetShapeId();
             P.NonVisualShapeProperties nvShapeProps = new P.NonVisualShapeProperties(
                 new P.NonVisualDrawingProperties { Id = shapeId, Name = $"Footnote {shapeId}" },
                 new P.NonVisualShapeDrawingProperties(new D.ShapeLocks { NoGrouping = true }),
@@ -287,25 +430,103 @@ namespace DocLayer.Core
             );
             footnoteShape.Append(textBody);
 
-            shapeTree.Append(footnoteShape);
+            shapeTree.AppendElement(footnoteShape);
         }
 
-        private void AddSlideToPresentation(SlidePart slidePart)
+        private static void AddShape(P.ShapeTree shapeTree, ShapeSpec shapeSpec)
         {
-            P.Presentation presentation = _presentationPart.Presentation;
-            
-            if (presentation.SlideIdList == null)
+            switch (shapeSpec.Type.ToLowerInvariant())
             {
-                presentation.SlideIdList = new SlideIdList();
+                case "rectangle":
+                    shapeTree.AddRectangle(shapeSpec.Hpos, shapeSpec.Vpos, shapeSpec.Height, shapeSpec.Width);
+                    break;
+                case "rounded_rectangle":
+                    shapeTree.AddRoundedRectangle(shapeSpec.Hpos, shapeSpec.Vpos, shapeSpec.Height, shapeSpec.Width);
+                    break;
+                case "circle":
+                    shapeTree.AddCircle(shapeSpec.Hpos, shapeSpec.Vpos, shapeSpec.Height, shapeSpec.Width);
+                    break;
+                case "triangle":
+                    shapeTree.AddTriangle(shapeSpec.Hpos, shapeSpec.Vpos, shapeSpec.Height, shapeSpec.Width);
+                    break;
+                case "chevron":
+                    shapeTree.AddChevron(shapeSpec.Hpos, shapeSpec.Vpos, shapeSpec.Height, shapeSpec.Width);
+                    break;
+                case "pentagon_arrow":
+                    shapeTree.AddPentagonArrow(shapeSpec.Hpos, shapeSpec.Vpos, shapeSpec.Height, shapeSpec.Width);
+                    break;
+                case "right_arrow":
+                    shapeTree.AddRightArrow(shapeSpec.Hpos, shapeSpec.Vpos, shapeSpec.Height, shapeSpec.Width);
+                    break;
+                case "left_arrow":
+                    shapeTree.AddLeftArrow(shapeSpec.Hpos, shapeSpec.Vpos, shapeSpec.Height, shapeSpec.Width);
+                    break;
+                case "up_arrow":
+                    shapeTree.AddUpArrow(shapeSpec.Hpos, shapeSpec.Vpos, shapeSpec.Height, shapeSpec.Width);
+                    break;
+                case "down_arrow":
+                    shapeTree.AddDownArrow(shapeSpec.Hpos, shapeSpec.Vpos, shapeSpec.Height, shapeSpec.Width);
+                    break;
+                case "line":
+                    // A line is a connection shape, which takes no fill or text
+                    shapeTree.AddLine(shapeSpec.Hpos, shapeSpec.Vpos, shapeSpec.Height, shapeSpec.Width);
+                    return;
+                case "harvey_ball":
+                    shapeTree.AddHarveyBall(shapeSpec.Hpos, shapeSpec.Vpos, shapeSpec.Height, shapeSpec.Width);
+                    break;
+                default:
+                    throw new ArgumentException($"Unknown shape type: {shapeSpec.Type}", nameof(shapeSpec));
             }
 
-            SlideId slideId = new SlideId
+            // The shape just added is the last one in the tree
+            P.Shape shape = (P.Shape)shapeTree.LastChild!;
+
+            if (!string.IsNullOrEmpty(shapeSpec.Fill))
             {
-                Id = _slideIdCounter++,
-                RelationshipId = _presentationPart.GetIdOfPart(slidePart)
-            };
+                shape.SetHexFill(shapeSpec.Fill);
+            }
+            else if (shapeSpec.SchemeFill.HasValue)
+            {
+                shape.SetSchemeFill(shapeSpec.SchemeFill.Value);
+            }
+
+            if (!string.IsNullOrEmpty(shapeSpec.Text))
+            {
+                shape.SetText(shapeSpec.Text);
+            }
+        }
 
-            presentation.SlideIdList.Append(slideId);
+        private static void AddTable(P.ShapeTree shapeTree, TableSpec tableSpec)
+        {
+            int numRows = Math.Max(tableSpec.Rows, tableSpec.Data?.Count ?? 0);
+            int numCols = Math.Max(tableSpec.Cols, tableSpec.Data == null || tableSpec.Data.Count == 0 ? 0 : tableSpec.Data.Max(row => row.Count));
+            if (numRows <= 0 || numCols <= 0)
+            {
+                throw new ArgumentException("Table spec needs rows and cols, or data to size the table from", nameof(tableSpec));
+            }
+
+            // Start from a single empty row and fill every row in one pass
+            shapeTree.AddTable(1, numCols);
+            P.GraphicFrame graphicFrame = (P.GraphicFrame)shapeTree.LastChild!;
+
+            List<List<string?>> data = tableSpec.Data ?? new();
+            graphicFrame.GetTable().SetTableData(
+                Enumerable.Range(0, numRows).Select(row => row < data.Count ? data[row] : new List<string?>()),
+                tableSpec.ColumnFormats, tableSpec.HeaderRows);
+
+            if (tableSpec.Hpos.HasValue)
+            {
+                graphicFrame.SetHorizontalPosition(tableSpec.Hpos.Value);
+            }
+            if (tableSpec.Vpos.HasValue)
+            {
+                graphicFrame.SetVerticalPosition(tableSpec.Vpos.Value);
+            }
+        }
+
+        private void AddSlideToPresentation(SlidePart slidePart)
+        {
+            _slideIndex.Append(slidePart);
         }
 
         #endregion
@@ -17,10 +17,14 @@ namespace DocLayer.Core
         /// </summary>
         /// <param name="filepath">Path where the presentation will be created</param>
         /// <param name="widescreen">If true, uses 16:9 format; otherwise uses 4:3</param>
+        /// <param name="compression">ZIP compression of the package - optional, defaults to <see cref="PackageCompression.Optimal"/></param>
         /// <returns>PresentationDocument instance ready for use</returns>
-        public static PresentationDocument CreatePresentation(string filepath, bool widescreen = true)
+        public static PresentationDocument CreatePresentation(string filepath, bool widescreen = true, PackageCompression? compression = null)
         {
-            PresentationDocument presentationDoc = PresentationHelperMethods.CreatePresentation(filepath);
+            using PhaseScope phase = DocLayerDiagnostics.StartPhase(DocLayerDiagnostics.Phases.PackageCreate);
+            PresentationDocument presentationDoc = PresentationHelperMethods.CreatePresentation(
+                filepath, PackageCompression.ToCompressionOption(compression?.Level ?? PackageCompressionLevel.Optimal));
+            compression?.ApplyTo(presentationDoc);
             if (widescreen) {
                 if (presentationDoc.PresentationPart!.Presentation is not null){
                     presentationDoc.PresentationPart!.Presentation.SetSlideSizeWidescreen();
@@ -29,5 +33,131 @@ namespace DocLayer.Core
             return presentationDoc;
         }
 
+        /// <summary>
+        /// Creates a new PowerPoint presentation in the given stream with basic structure
+        /// </summary>
+        /// <param name="stream">Writable, seekable stream that receives the package, typically a MemoryStream</param>
+        /// <param name="widescreen">If true, uses 16:9 format; otherwise uses 4:3</param>
+        /// <param name="compression">ZIP compression of the package - optional, defaults to <see cref="PackageCompression.Optimal"/></param>
+        /// <returns>PresentationDocument instance ready for use; dispose it to flush the package to the stream</returns>
+        public static PresentationDocument CreatePresentation(Stream stream, bool widescreen = true, PackageCompression? compression = null)
+        {
+            using PhaseScope phase = DocLayerDiagnostics.StartPhase(DocLayerDiagnostics.Phases.PackageCreate);
+            PresentationDocument presentationDoc = PresentationHelperMethods.CreatePresentation(
+                stream, PackageCompression.ToCompressionOption(compression?.Level ?? PackageCompressionLevel.Optimal));
+            compression?.ApplyTo(presentationDoc);
+            if (widescreen) {
+                if (presentationDoc.PresentationPart!.Presentation is not null){
+                    presentationDoc.PresentationPart!.Presentation.SetSlideSizeWidescreen();
+                }
+            }
+            return presentationDoc;
+        }
+
+        /// <summary>
+        /// Disposes (and so saves) the presentation, timed as the serialize phase of <see cref="DocLayerDiagnostics"/>.
+        /// When instrumentation is enabled the package size and part count are recorded too.
+        /// </summary>
+        /// <param name="presentationDoc">Presentation to close</param>
+        /// <param name="stream">Stream the package is written to, used for the byte count - optional</param>
+        public static void Close(PresentationDocument presentationDoc, Stream? stream = null)
+        {
+            using PhaseScope phase = DocLayerDiagnostics.StartPhase(DocLayerDiagnostics.Phases.Serialize);
+            if (!phase.IsActive)
+            {
+                presentationDoc.Dispose();
+                return;
+            }
+
+            int parts = DocLayerDiagnostics.CountParts(presentationDoc);
+            presentationDoc.Dispose();
+            DocLayerDiagnostics.RecordPackage(phase, stream?.Length ?? 0, parts);
+        }
+
+        /// <summary>
+        /// Creates an in-memory presentation, runs the build callback against it and returns the package bytes
+        /// </summary>
+        /// <param name="build">Callback that adds content to the presentation</param>
+        /// <param name="widescreen">If true, uses 16:9 format; otherwise uses 4:3</param>
+        /// <returns>The stream holding the complete package, positioned at 0</returns>
+        public static MemoryStream RenderToStream(Action<PresentationDocument> build, bool widescreen = true)
+        {
+            MemoryStream stream = new MemoryStream();
+            PresentationDocument presentationDoc = CreatePresentation(stream, widescreen);
+            try
+            {
+                build(presentationDoc);
+            }
+            finally
+            {
+                Close(presentationDoc, stream);
+            }
+            stream.Position = 0;
+            return stream;
+        }
+
+        /// <summary>
+        /// Renders a whole deck from its JSON spec in one call: the themed base package comes from
+        /// <see cref="PresentationTemplateCache.Shared"/>, every slide is built in memory and the
+        /// package is saved once
+        /// </summary>
+        /// <param name="deckJson">Deck spec serialized as JSON (see <see cref="DeckSpec"/>)</param>
+        /// <returns>The stream holding the complete package, positioned at 0</returns>
+        public static MemoryStream RenderDeck(string deckJson)
+        {
+            return RenderDeck(DeckSpec.FromJson(deckJson));
+        }
+
+        /// <summary>
+        /// Renders a whole deck from its spec in one open/save cycle
+        /// </summary>
+        /// <param name="deck">Deck spec describing the slides and theme</param>
+        /// <returns>The stream holding the complete package, positioned at 0</returns>
+        public static MemoryStream RenderDeck(DeckSpec deck)
+        {
+            MemoryStream stream = new MemoryStream();
+            try
+            {
+                PresentationDocument presentationDoc = PresentationTemplateCache.Shared.CreatePresentation(
+                    stream, deck.Widescreen, deck.FontName, deck.AccentColors, deck.GetCompression());
+                try
+                {
+                    PresentationBuilder builder = new(presentationDoc);
+                    builder.BuildDeck(deck, replaceExistingSlides: true);
+                }
+                finally
+                {
+                    Close(presentationDoc, stream);
+                }
+            }
+            catch
+            {
+                stream.Dispose();
+                throw;
+            }
+            stream.Position = 0;
+            return stream;
+        }
+
+        /// <summary>
+        /// Renders a deck from its JSON spec straight to a file, streaming each slide to its part as soon
+        /// as it is built so memory stays bounded for very large decks
+        /// </summary>
+        /// <param name="deckJson">Deck spec serialized as JSON (see <see cref="DeckSpec"/>)</param>
+        /// <param name="filepath">Path where the presentation will be created</param>
+        /// <returns>Number of slides written</returns>
+        public static int StreamDeck(string deckJson, string filepath)
+        {
+            DeckSpec deck = DeckSpec.FromJson(deckJson);
+
+            using StreamingDeckWriter writer = StreamingDeckWriter.Create(filepath, deck.Widescreen, deck.FontName, deck.AccentColors, deck.GetCompression());
+            foreach (SlideSpec slideSpec in deck.Slides)
+            {
+                writer.WriteSlide(slideSpec);
+            }
+            writer.Complete();
+            return writer.SlideCount;
+        }
+
     }
 }
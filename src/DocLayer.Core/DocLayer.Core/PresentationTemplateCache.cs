@@ -0,0 +1,176 @@
+using DocumentFormat.OpenXml.Packaging;
+
+namespace DocLayer.Core
+{
+    /// <summary>
+    /// Caches serialized base presentation packages so new documents are cloned from bytes
+    /// instead of being rebuilt element by element on every call
+    /// </summary>
+    /// <remarks>
+    /// A template is keyed on slide size, font, accent colors and compression. Templates are built once with
+    /// <see cref="PresentationHelper.CreatePresentation(Stream, bool, PackageCompression?)"/> and
+    /// <see cref="PresentationBuilder.SetPresentationTheme"/>, and the least recently used
+    /// entry is evicted once <see cref="Capacity"/> is exceeded. All members are thread-safe.
+    /// </remarks>
+    public sealed class PresentationTemplateCache
+    {
+        private readonly record struct TemplateKey(bool Widescreen, string? FontName, string? AccentColors, PackageCompression? Compression);
+
+        private readonly object _lock = new();
+        private readonly Dictionary<TemplateKey, LinkedListNode<(TemplateKey Key, byte[] Package)>> _entries = new();
+        private readonly LinkedList<(TemplateKey Key, byte[] Package)> _lru = new();
+
+        /// <summary>
+        /// Process-wide cache used by the Python and TypeScript wrappers
+        /// </summary>
+        public static PresentationTemplateCache Shared { get; } = new PresentationTemplateCache();
+
+        public PresentationTemplateCache(int capacity = 32)
+        {
+            if (capacity < 1)
+            {
+                throw new ArgumentOutOfRangeException(nameof(capacity), "Capacity must be at least 1");
+            }
+            Capacity = capacity;
+        }
+
+        /// <summary>
+        /// Maximum number of templates kept before the least recently used one is evicted
+        /// </summary>
+        public int Capacity { get; }
+
+        /// <summary>
+        /// Number of templates currently cached
+        /// </summary>
+        public int Count
+        {
+            get
+            {
+                lock (_lock)
+                {
+                    return _entries.Count;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Creates a presentation in the given stream from the cached template for the requested theme
+        /// </summary>
+        /// <param name="stream">Empty, writable, seekable stream that receives the package, typically a MemoryStream</param>
+        /// <param name="widescreen">If true, uses 16:9 format; otherwise uses 4:3</param>
+        /// <param name="fontName">Font typeface name (e.g., "Arial", "Calibri") - optional</param>
+        /// <param name="accentColors">List of 4 hex color codes for accent colors - optional</param>
+        /// <param name="compression">ZIP compression of the package - optional, defaults to <see cref="PackageCompression.Optimal"/></param>
+        /// <returns>PresentationDocument instance ready for use; dispose it to flush the package to the stream</returns>
+        public PresentationDocument CreatePresentation(Stream stream, bool widescreen = true, string? fontName = null, List<string>? accentColors = null, PackageCompression? compression = null)
+        {
+            using PhaseScope phase = DocLayerDiagnostics.StartPhase(DocLayerDiagnostics.Phases.PackageCreate);
+            byte[] package = GetTemplate(widescreen, fontName, accentColors, compression);
+
+            stream.Write(package, 0, package.Length);
+            stream.Position = 0;
+
+            return Open(PresentationDocument.Open(stream, true), compression);
+        }
+
+        /// <summary>
+        /// Creates a presentation file from the cached template for the requested theme
+        /// </summary>
+        /// <param name="filepath">Path where the presentation will be created</param>
+        /// <param name="widescreen">If true, uses 16:9 format; otherwise uses 4:3</param>
+        /// <param name="fontName">Font typeface name (e.g., "Arial", "Calibri") - optional</param>
+        /// <param name="accentColors">List of 4 hex color codes for accent colors - optional</param>
+        /// <param name="compression">ZIP compression of the package - optional, defaults to <see cref="PackageCompression.Optimal"/></param>
+        /// <returns>PresentationDocument instance ready for use</returns>
+        public PresentationDocument CreatePresentation(string filepath, bool widescreen = true, string? fontName = null, List<string>? accentColors = null, PackageCompression? compression = null)
+        {
+            using PhaseScope phase = DocLayerDiagnostics.StartPhase(DocLayerDiagnostics.Phases.PackageCreate);
+            byte[] package = GetTemplate(widescreen, fontName, accentColors, compression);
+
+            File.WriteAllBytes(filepath, package);
+
+            return Open(PresentationDocument.Open(filepath, true), compression);
+        }
+
+        /// <summary>
+        /// Removes all cached templates
+        /// </summary>
+        public void Clear()
+        {
+            lock (_lock)
+            {
+                _entries.Clear();
+                _lru.Clear();
+            }
+        }
+
+        private static PresentationDocument Open(PresentationDocument presentationDoc, PackageCompression? compression)
+        {
+            // The template's parts were written with this compression already; new parts need it set on the package
+            compression?.ApplyTo(presentationDoc);
+            return presentationDoc;
+        }
+
+        private byte[] GetTemplate(bool widescreen, string? fontName, List<string>? accentColors, PackageCompression? compression)
+        {
+            if (accentColors != null && accentColors.Count > 0 && accentColors.Count != 4)
+            {
+                throw new ArgumentException("Must provide exactly 4 accent colors", nameof(accentColors));
+            }
+
+            TemplateKey key = new TemplateKey(
+                widescreen,
+                string.IsNullOrEmpty(fontName) ? null : fontName,
+                accentColors == null || accentColors.Count == 0 ? null : string.Join(",", accentColors),
+                compression == PackageCompression.Optimal ? null : compression);
+
+            lock (_lock)
+            {
+                if (_entries.TryGetValue(key, out var node))
+                {
+                    _lru.Remove(node);
+                    _lru.AddFirst(node);
+                    return node.Value.Package;
+                }
+            }
+
+            // Build outside the lock; a concurrent miss on the same key builds an identical package
+            byte[] package = BuildTemplate(key, accentColors);
+
+            lock (_lock)
+            {
+                if (_entries.TryGetValue(key, out var existing))
+                {
+                    return existing.Value.Package;
+                }
+
+                _entries[key] = _lru.AddFirst((key, package));
+
+                while (_entries.Count > Capacity)
+                {
+                    var last = _lru.Last!;
+                    _lru.RemoveLast();
+                    _entries.Remove(last.Value.Key);
+                }
+            }
+
+            return package;
+        }
+
+        private static byte[] BuildTemplate(TemplateKey key, List<string>? accentColors)
+        {
+            using MemoryStream stream = new MemoryStream();
+
+            using (PresentationDocument presentationDoc = PresentationHelper.CreatePresentation(stream, key.Widescreen, key.Compression))
+            {
+                if (key.FontName != null || key.AccentColors != null)
+                {
+                    PresentationBuilder builder = new(presentationDoc);
+                    builder.SetPresentationTheme(key.FontName, key.AccentColors == null ? null : accentColors);
+                }
+            }
+
+            return stream.ToArray();
+        }
+    }
+}
@@ -0,0 +1,379 @@
+using System.Collections.Concurrent;
+using System.Text;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+using DocumentFormat.OpenXml;
+using DocumentFormat.OpenXml.Packaging;
+using D = DocumentFormat.OpenXml.Drawing;
+using P = DocumentFormat.OpenXml.Presentation;
+
+namespace DocLayer.Core
+{
+    /// <summary>
+    /// Extracts titles, body text, table cells and picture names from existing presentations
+    /// </summary>
+    /// <remarks>
+    /// Presentation and slide parts are read with <see cref="OpenXmlReader"/>, so no slide DOM is built and
+    /// text is gathered into reusable buffers instead of concatenated strings. <see cref="ExtractFiles"/>
+    /// processes many files in parallel and yields each deck as soon as it is done, in completion order.
+    /// </remarks>
+    public static class PresentationTextExtractor
+    {
+        private static readonly JsonSerializerOptions JsonOptions = new()
+        {
+            PropertyNamingPolicy = JsonNamingPolicy.SnakeCaseLower,
+            DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull,
+        };
+
+        /// <summary>
+        /// Extracts the presentation file. Failures are reported on <see cref="ExtractedDeck.Error"/> instead of thrown.
+        /// </summary>
+        /// <param name="filepath">Path to a .pptx file</param>
+        public static ExtractedDeck ExtractFile(string filepath)
+        {
+            ExtractedDeck deck = new ExtractedDeck { Path = filepath };
+            try
+            {
+                using PresentationDocument presentationDoc = PresentationDocument.Open(filepath, false);
+                Extract(presentationDoc, deck);
+            }
+            catch (Exception ex)
+            {
+                deck.Error = ex.Message;
+            }
+            return deck;
+        }
+
+        /// <summary>
+        /// Extracts an open presentation
+        /// </summary>
+        public static ExtractedDeck Extract(PresentationDocument presentationDoc)
+        {
+            if (presentationDoc == null) throw new ArgumentNullException(nameof(presentationDoc));
+
+            ExtractedDeck deck = new ExtractedDeck();
+            Extract(presentationDoc, deck);
+            return deck;
+        }
+
+        /// <summary>
+        /// Extracts many files in parallel, yielding each deck as it finishes
+        /// </summary>
+        /// <param name="filepaths">Paths to .pptx files, consumed lazily</param>
+        /// <param name="maxDegreeOfParallelism">Number of files read at once (defaults to the processor count)</param>
+        /// <param name="cancellationToken">Stops scheduling new files</param>
+        /// <returns>Extracted decks in completion order</returns>
+        public static IEnumerable<ExtractedDeck> ExtractFiles(IEnumerable<string> filepaths, int maxDegreeOfParallelism = 0, CancellationToken cancellationToken = default)
+        {
+            if (filepaths == null) throw new ArgumentNullException(nameof(filepaths));
+
+            int workers = maxDegreeOfParallelism > 0 ? maxDegreeOfParallelism : Environment.ProcessorCount;
+
+            // Bounded so a slow consumer holds back the readers instead of buffering every result
+            using BlockingCollection<ExtractedDeck> results = new BlockingCollection<ExtractedDeck>(workers * 4);
+            using CancellationTokenSource stop = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+
+            Task producer = Task.Run(() =>
+            {
+                try
+                {
+                    Parallel.ForEach(
+                        filepaths,
+                        new ParallelOptions { MaxDegreeOfParallelism = workers, CancellationToken = stop.Token },
+                        filepath => results.Add(ExtractFile(filepath), stop.Token));
+                }
+                finally
+                {
+                    results.CompleteAdding();
+                }
+            });
+
+            try
+            {
+                foreach (ExtractedDeck deck in results.GetConsumingEnumerable(cancellationToken))
+                {
+                    yield return deck;
+                }
+            }
+            finally
+            {
+                // Runs when the consumer stops early as well; unblocks readers waiting to add
+                stop.Cancel();
+                try
+                {
+                    producer.Wait();
+                }
+                catch (AggregateException ex) when (ex.InnerExceptions.All(e => e is OperationCanceledException))
+                {
+                }
+            }
+        }
+
+        /// <summary>
+        /// Same as <see cref="ExtractFiles"/>, with each deck serialized as snake_case JSON for the Python wrapper
+        /// </summary>
+        public static IEnumerable<string> ExtractFilesJson(IEnumerable<string> filepaths, int maxDegreeOfParallelism = 0)
+        {
+            return ExtractFiles(filepaths, maxDegreeOfParallelism).Select(deck => deck.ToJson());
+        }
+
+        internal static string ToJson(ExtractedDeck deck)
+        {
+            return JsonSerializer.Serialize(deck, JsonOptions);
+        }
+
+        private static void Extract(PresentationDocument presentationDoc, ExtractedDeck deck)
+        {
+            deck.Title = NullIfEmpty(presentationDoc.PackageProperties.Title);
+            deck.Author = NullIfEmpty(presentationDoc.PackageProperties.Creator);
+            deck.Modified = presentationDoc.PackageProperties.Modified;
+
+            PresentationPart presentationPart = presentationDoc.PresentationPart
+                ?? throw new InvalidOperationException("PresentationPart not found");
+
+            SlideReader reader = new SlideReader();
+            int number = 0;
+            foreach (string relId in ReadSlideRelIds(presentationPart))
+            {
+                number++;
+                if (presentationPart.TryGetPartById(relId, out OpenXmlPart? part) && part is SlidePart slidePart)
+                {
+                    deck.Slides.Add(reader.Read(slidePart, number));
+                }
+            }
+        }
+
+        private static List<string> ReadSlideRelIds(PresentationPart presentationPart)
+        {
+            List<string> relIds = new();
+
+            using OpenXmlReader reader = OpenXmlReader.Create(presentationPart);
+            while (reader.Read())
+            {
+                if (reader.ElementType == typeof(P.SlideId) && reader.IsStartElement)
+                {
+                    foreach (OpenXmlAttribute attribute in reader.Attributes)
+                    {
+                        if (attribute.LocalName == "id" && attribute.NamespaceUri == RelationshipNamespace)
+                        {
+                            relIds.Add(attribute.Value!);
+                        }
+                    }
+                }
+                else if (reader.ElementType == typeof(P.SlideIdList) && reader.IsEndElement)
+                {
+                    // The rest of presentation.xml holds no slide references
+                    break;
+                }
+            }
+
+            return relIds;
+        }
+
+        private static string? NullIfEmpty(string? value)
+        {
+            return string.IsNullOrEmpty(value) ? null : value;
+        }
+
+        private const string RelationshipNamespace = "http://schemas.openxmlformats.org/officeDocument/2006/relationships";
+
+        /// <summary>
+        /// Single forward pass over a slide part. Buffers are reused across slides of a deck.
+        /// </summary>
+        private sealed class SlideReader
+        {
+            private readonly StringBuilder _paragraph = new();
+            private readonly List<string> _shapeParagraphs = new();
+            private readonly List<string> _cellParagraphs = new();
+
+            public ExtractedSlide Read(SlidePart slidePart, int number)
+            {
+                ExtractedSlide slide = new ExtractedSlide { Number = number };
+
+                bool inShape = false;
+                bool isTitle = false;
+                bool inPicture = false;
+                List<List<string>>? table = null;
+                List<string>? row = null;
+                bool inCell = false;
+
+                using OpenXmlReader reader = OpenXmlReader.Create(slidePart);
+                while (reader.Read())
+                {
+                    Type type = reader.ElementType;
+
+                    if (reader.IsStartElement)
+                    {
+                        if (type == typeof(D.Text))
+                        {
+                            _paragraph.Append(reader.GetText());
+                        }
+                        else if (type == typeof(D.Break))
+                        {
+                            _paragraph.Append('\n');
+                        }
+                        else if (type == typeof(D.Paragraph))
+                        {
+                            _paragraph.Clear();
+                        }
+                        else if (type == typeof(P.Shape))
+                        {
+                            inShape = true;
+                            isTitle = false;
+                            _shapeParagraphs.Clear();
+                        }
+                        else if (type == typeof(P.PlaceholderShape) && inShape)
+                        {
+                            string? placeholderType = GetAttribute(reader, "type");
+                            isTitle = placeholderType == "title" || placeholderType == "ctrTitle";
+                        }
+                        else if (type == typeof(P.Picture))
+                        {
+                            inPicture = true;
+                        }
+                        else if (type == typeof(P.NonVisualDrawingProperties) && inPicture)
+                        {
+                            string? name = GetAttribute(reader, "name");
+                            if (!string.IsNullOrEmpty(name)) slide.Pictures.Add(name);
+                        }
+                        else if (type == typeof(D.Table))
+                        {
+                            table = new List<List<string>>();
+                        }
+                        else if (type == typeof(D.TableRow))
+                        {
+                            row = new List<string>();
+                        }
+                        else if (type == typeof(D.TableCell))
+                        {
+                            inCell = true;
+                            _cellParagraphs.Clear();
+                        }
+                    }
+                    else if (reader.IsEndElement)
+                    {
+                        if (type == typeof(D.Paragraph))
+                        {
+                            if (inCell)
+                            {
+                                _cellParagraphs.Add(_paragraph.ToString());
+                            }
+                            else if (inShape && _paragraph.Length > 0)
+                            {
+                                _shapeParagraphs.Add(_paragraph.ToString());
+                            }
+                        }
+                        else if (type == typeof(P.Shape))
+                        {
+                            if (isTitle)
+                            {
+                                slide.Title = string.Join("\n", _shapeParagraphs);
+                            }
+                            else
+                            {
+                                slide.Body.AddRange(_shapeParagraphs);
+                            }
+                            inShape = false;
+                        }
+                        else if (type == typeof(P.Picture))
+                        {
+                            inPicture = false;
+                        }
+                        else if (type == typeof(D.TableCell))
+                        {
+                            row?.Add(string.Join("\n", _cellParagraphs));
+                            inCell = false;
+                        }
+                        else if (type == typeof(D.TableRow))
+                        {
+                            if (row != null) table?.Add(row);
+                            row = null;
+                        }
+                        else if (type == typeof(D.Table))
+                        {
+                            if (table != null) slide.Tables.Add(table);
+                            table = null;
+                        }
+                    }
+                }
+
+                return slide;
+            }
+
+            private static string? GetAttribute(OpenXmlReader reader, string localName)
+            {
+                foreach (OpenXmlAttribute attribute in reader.Attributes)
+                {
+                    if (attribute.LocalName == localName && string.IsNullOrEmpty(attribute.NamespaceUri))
+                    {
+                        return attribute.Value;
+                    }
+                }
+                return null;
+            }
+        }
+    }
+
+    /// <summary>
+    /// Text and metadata extracted from one presentation
+    /// </summary>
+    public class ExtractedDeck
+    {
+        public string? Path { get; set; }
+
+        /// <summary>
+        /// Document title from the package core properties
+        /// </summary>
+        public string? Title { get; set; }
+
+        /// <summary>
+        /// Document author from the package core properties
+        /// </summary>
+        public string? Author { get; set; }
+
+        public DateTime? Modified { get; set; }
+
+        public List<ExtractedSlide> Slides { get; set; } = new();
+
+        /// <summary>
+        /// Why the file could not be read; null on success
+        /// </summary>
+        public string? Error { get; set; }
+
+        public string ToJson()
+        {
+            return PresentationTextExtractor.ToJson(this);
+        }
+    }
+
+    /// <summary>
+    /// Text extracted from one slide, in document order
+    /// </summary>
+    public class ExtractedSlide
+    {
+        /// <summary>
+        /// 1-based position of the slide in the presentation
+        /// </summary>
+        public int Number { get; set; }
+
+        /// <summary>
+        /// Text of the title placeholder; paragraphs are separated by newlines
+        /// </summary>
+        public string? Title { get; set; }
+
+        /// <summary>
+        /// Non-empty paragraphs of every other shape
+        /// </summary>
+        public List<string> Body { get; set; } = new();
+
+        /// <summary>
+        /// Cell text of each table, by row then column
+        /// </summary>
+        public List<List<List<string>>> Tables { get; set; } = new();
+
+        /// <summary>
+        /// Names of the pictures on the slide
+        /// </summary>
+        public List<string> Pictures { get; set; } = new();
+    }
+}
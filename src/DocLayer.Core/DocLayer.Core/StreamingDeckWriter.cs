@@ -0,0 +1,137 @@
+using DocumentFormat.OpenXml.Packaging;
+using OpenXMLExtensions;
+
+namespace DocLayer.Core
+{
+    /// <summary>
+    /// Writes a deck one slide at a time: each slide is built with <see cref="PresentationBuilder"/>,
+    /// streamed to its package part and released, so only the presentation part and slide id list
+    /// stay resident however many slides are written
+    /// </summary>
+    /// <remarks>
+    /// Slides are appended in call order. <see cref="Complete"/> removes the starter slide of the base
+    /// package and saves the presentation; it must be called before the writer is disposed. Disposing
+    /// a writer that was not completed, e.g. when a slide throws inside a <c>using</c> block, closes
+    /// the package without completing the deck: a file created by <c>Create(filepath)</c> is deleted,
+    /// and a stream holds an incomplete package that should be discarded.
+    /// </remarks>
+    public sealed class StreamingDeckWriter : IDisposable
+    {
+        private readonly PresentationDocument _presentationDoc;
+        private readonly PresentationBuilder _builder;
+        private readonly List<SlidePart> _existingSlideParts;
+        private string? _createdFile;
+        private bool _completed;
+        private bool _disposed;
+
+        /// <summary>
+        /// Creates a writer over an open presentation
+        /// </summary>
+        /// <param name="presentationDoc">Presentation to write slides into; it is disposed with the writer</param>
+        /// <param name="replaceExistingSlides">If true, slides already in the presentation are removed on completion</param>
+        public StreamingDeckWriter(PresentationDocument presentationDoc, bool replaceExistingSlides = true)
+        {
+            _presentationDoc = presentationDoc ?? throw new ArgumentNullException(nameof(presentationDoc));
+            _builder = new PresentationBuilder(presentationDoc);
+            _existingSlideParts = replaceExistingSlides ? _builder.Slides.SlideParts.ToList() : new List<SlidePart>();
+        }
+
+        /// <summary>
+        /// Creates a presentation file from the cached template for the requested theme and a writer for it
+        /// </summary>
+        /// <param name="filepath">Path where the presentation will be created</param>
+        /// <param name="widescreen">If true, uses 16:9 format; otherwise uses 4:3</param>
+        /// <param name="fontName">Font typeface name (e.g., "Arial", "Calibri") - optional</param>
+        /// <param name="accentColors">List of 4 hex color codes for accent colors - optional</param>
+        /// <param name="compression">ZIP compression of the package - optional</param>
+        public static StreamingDeckWriter Create(string filepath, bool widescreen = true, string? fontName = null, List<string>? accentColors = null, PackageCompression? compression = null)
+        {
+            return new StreamingDeckWriter(PresentationTemplateCache.Shared.CreatePresentation(filepath, widescreen, fontName, accentColors, compression))
+            {
+                _createdFile = filepath,
+            };
+        }
+
+        /// <summary>
+        /// Creates a presentation in the given stream from the cached template for the requested theme and a writer for it
+        /// </summary>
+        /// <param name="stream">Empty, writable, seekable stream that receives the package</param>
+        /// <param name="widescreen">If true, uses 16:9 format; otherwise uses 4:3</param>
+        /// <param name="fontName">Font typeface name (e.g., "Arial", "Calibri") - optional</param>
+        /// <param name="accentColors">List of 4 hex color codes for accent colors - optional</param>
+        /// <param name="compression">ZIP compression of the package - optional</param>
+        public static StreamingDeckWriter Create(Stream stream, bool widescreen = true, string? fontName = null, List<string>? accentColors = null, PackageCompression? compression = null)
+        {
+            return new StreamingDeckWriter(PresentationTemplateCache.Shared.CreatePresentation(stream, widescreen, fontName, accentColors, compression));
+        }
+
+        /// <summary>
+        /// Number of slides written so far
+        /// </summary>
+        public int SlideCount { get; private set; }
+
+        /// <summary>
+        /// Builds the slide, writes it to its part and releases its element tree
+        /// </summary>
+        /// <param name="slideSpec">Content of the slide</param>
+        /// <returns>The created SlidePart</returns>
+        public SlidePart WriteSlide(SlideSpec slideSpec)
+        {
+            if (_completed) throw new InvalidOperationException("The deck has already been completed");
+
+            SlidePart slidePart;
+            using (DocLayerDiagnostics.StartPhase(DocLayerDiagnostics.Phases.SlideBuild))
+            {
+                slidePart = _builder.WriteSlide(slideSpec);
+            }
+            SlideCount++;
+            return slidePart;
+        }
+
+        /// <summary>
+        /// Builds the slide from its JSON spec (see <see cref="SlideSpec.FromJson"/>), writes it and releases it
+        /// </summary>
+        /// <param name="slideJson">Slide spec serialized as JSON</param>
+        /// <returns>The created SlidePart</returns>
+        public SlidePart WriteSlide(string slideJson)
+        {
+            return WriteSlide(SlideSpec.FromJson(slideJson));
+        }
+
+        /// <summary>
+        /// Removes the starter slides and saves the presentation. No further slides can be written.
+        /// </summary>
+        public void Complete()
+        {
+            if (_completed) return;
+            _completed = true;
+
+            foreach (SlidePart slidePart in _existingSlideParts)
+            {
+                _builder.Slides.Remove(slidePart);
+            }
+
+            using (DocLayerDiagnostics.StartPhase(DocLayerDiagnostics.Phases.Serialize))
+            {
+                _presentationDoc.Save();
+            }
+        }
+
+        /// <summary>
+        /// Closes the package; see the remarks for a deck that was not completed
+        /// </summary>
+        public void Dispose()
+        {
+            if (_disposed) return;
+            _disposed = true;
+
+            _presentationDoc.Dispose();
+
+            // Never leave a truncated deck that looks valid at the path the caller asked for
+            if (!_completed && _createdFile != null)
+            {
+                File.Delete(_createdFile);
+            }
+        }
+    }
+}
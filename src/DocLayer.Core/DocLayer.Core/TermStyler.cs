@@ -0,0 +1,328 @@
+using System.Text.Json;
+using DocumentFormat.OpenXml;
+using DocumentFormat.OpenXml.Packaging;
+using OpenXMLExtensions;
+using D = DocumentFormat.OpenXml.Drawing;
+
+namespace DocLayer.Core
+{
+    /// <summary>
+    /// Formatting applied to every occurrence of a term by <see cref="TermStyler"/>
+    /// </summary>
+    public class TextStyle
+    {
+        public bool Bold { get; set; }
+
+        public bool Italic { get; set; }
+
+        /// <summary>
+        /// Hex text color, e.g. "1F4E79" - optional
+        /// </summary>
+        public string? Color { get; set; }
+
+        /// <summary>
+        /// Theme accent color 1-6, used when <see cref="Color"/> is not set - optional
+        /// </summary>
+        public int? AccentColor { get; set; }
+
+        /// <summary>
+        /// Font size in points - optional
+        /// </summary>
+        public int? Size { get; set; }
+
+        internal void ApplyTo(D.Run run)
+        {
+            if (Bold) run.SetRunBold();
+            if (Italic) run.SetRunItalic();
+            if (Color != null) run.SetRunHexFill(Color.TrimStart('#'));
+            else if (AccentColor is int accent) run.SetRunSchemeFill(accent);
+            if (Size is int size) run.SetRunSize(size);
+        }
+    }
+
+    /// <summary>
+    /// Styles many terms across slides, tables and text boxes in one pass over the text runs
+    /// </summary>
+    /// <remarks>
+    /// The terms are compiled once into a multi-pattern (Aho-Corasick) matcher, so each run's text is
+    /// scanned once however many terms there are, where <c>BoldSelectedText</c> and friends rescan every
+    /// run for every term. Matching is case-insensitive and finds every occurrence within a run; where
+    /// terms overlap, the leftmost and then the longest wins. A run holding matches is split once into
+    /// runs that keep its formatting, and the style of each matched term is applied to its run. Terms
+    /// split across runs are not matched, as with the single-term methods.
+    ///
+    /// A compiled styler is immutable and can be shared between threads.
+    /// </remarks>
+    public sealed class TermStyler
+    {
+        private readonly TermMatcher _matcher;
+        private readonly TextStyle[] _styles;
+
+        private TermStyler(TermMatcher matcher, TextStyle[] styles)
+        {
+            _matcher = matcher;
+            _styles = styles;
+        }
+
+        /// <summary>
+        /// Number of distinct terms
+        /// </summary>
+        public int TermCount => _styles.Length;
+
+        /// <summary>
+        /// Compiles the terms and their styles; empty and whitespace-only terms are ignored, accent colors must be 1-6
+        /// </summary>
+        public static TermStyler Compile(IReadOnlyDictionary<string, TextStyle> terms)
+        {
+            if (terms == null) throw new ArgumentNullException(nameof(terms));
+
+            // Terms differing only in case are one term; the last style given wins
+            Dictionary<string, int> index = new(StringComparer.OrdinalIgnoreCase);
+            List<string> patterns = new();
+            List<TextStyle> styles = new();
+            foreach (KeyValuePair<string, TextStyle> term in terms)
+            {
+                if (string.IsNullOrWhiteSpace(term.Key)) continue;
+                if (term.Value?.AccentColor is int accent && (accent < 1 || accent > 6))
+                {
+                    throw new ArgumentOutOfRangeException(nameof(terms), $"Accent color for '{term.Key}' must be 1-6, got {accent}");
+                }
+
+                if (index.TryGetValue(term.Key, out int existing))
+                {
+                    styles[existing] = term.Value;
+                    continue;
+                }
+                index.Add(term.Key, patterns.Count);
+                patterns.Add(term.Key);
+                styles.Add(term.Value);
+            }
+
+            return new TermStyler(new TermMatcher(patterns), styles.ToArray());
+        }
+
+        /// <summary>
+        /// Compiles terms from JSON: {"EBITDA": {"bold": true, "color": "1F4E79"}, "churn": {"italic": true}}
+        /// </summary>
+        public static TermStyler FromJson(string termsJson)
+        {
+            Dictionary<string, TextStyle> terms = JsonSerializer.Deserialize<Dictionary<string, TextStyle>>(termsJson, DeckSpec.JsonOptions)
+                ?? throw new ArgumentException("Terms JSON is empty", nameof(termsJson));
+            return Compile(terms);
+        }
+
+        /// <summary>
+        /// Styles the terms in every run under the element (a slide, shape tree, table or paragraph)
+        /// </summary>
+        /// <returns>The number of occurrences styled</returns>
+        public int Apply(OpenXmlElement root)
+        {
+            if (root == null) throw new ArgumentNullException(nameof(root));
+
+            List<TermMatch> matches = new();
+            int styled = 0;
+            IEnumerable<D.Paragraph> paragraphs = root is D.Paragraph paragraph ? new[] { paragraph } : root.Descendants<D.Paragraph>();
+            foreach (D.Paragraph current in paragraphs)
+            {
+                D.Run? next;
+                for (D.Run? run = current.GetFirstChild<D.Run>(); run != null; run = next)
+                {
+                    // Read before the run is split and removed
+                    next = run.NextSibling<D.Run>();
+                    styled += StyleRun(run, matches);
+                }
+            }
+            return styled;
+        }
+
+        /// <summary>
+        /// Styles the terms on every slide of the presentation
+        /// </summary>
+        /// <returns>The number of occurrences styled</returns>
+        public int Apply(PresentationDocument presentationDoc)
+        {
+            if (presentationDoc == null) throw new ArgumentNullException(nameof(presentationDoc));
+
+            int styled = 0;
+            PresentationPart presentationPart = presentationDoc.PresentationPart
+                ?? throw new ArgumentException("Presentation has no presentation part", nameof(presentationDoc));
+            foreach (SlidePart slidePart in presentationPart.SlideParts)
+            {
+                styled += Apply(slidePart.Slide);
+            }
+            return styled;
+        }
+
+        /// <summary>
+        /// Styles the terms on every slide of a presentation file
+        /// </summary>
+        /// <param name="filepath">Path to a .pptx file</param>
+        /// <param name="outputPath">Where to save the result (overwritten); null edits the file in place</param>
+        /// <returns>The number of occurrences styled</returns>
+        public int ApplyToFile(string filepath, string? outputPath = null)
+        {
+            string target = filepath;
+            if (outputPath != null && !string.Equals(Path.GetFullPath(outputPath), Path.GetFullPath(filepath), StringComparison.Ordinal))
+            {
+                File.Copy(filepath, outputPath, true);
+                target = outputPath;
+            }
+
+            using PresentationDocument presentationDoc = PresentationDocument.Open(target, true);
+            return Apply(presentationDoc);
+        }
+
+        private int StyleRun(D.Run run, List<TermMatch> matches)
+        {
+            D.Text? text = run.Text;
+            if (text == null || string.IsNullOrEmpty(text.Text)) return 0;
+
+            string value = text.Text;
+            matches.Clear();
+            _matcher.FindAll(value, matches);
+            if (matches.Count == 0) return 0;
+
+            if (matches.Count == 1 && matches[0].Start == 0 && matches[0].Length == value.Length)
+            {
+                _styles[matches[0].Term].ApplyTo(run);
+                return 1;
+            }
+
+            // Split into the text between matches and the matches themselves, each a copy of the run
+            int position = 0;
+            foreach (TermMatch match in matches)
+            {
+                if (match.Start > position)
+                {
+                    InsertCopy(run, value.Substring(position, match.Start - position));
+                }
+                D.Run matched = InsertCopy(run, value.Substring(match.Start, match.Length));
+                _styles[match.Term].ApplyTo(matched);
+                position = match.Start + match.Length;
+            }
+            if (position < value.Length)
+            {
+                InsertCopy(run, value.Substring(position));
+            }
+            run.Remove();
+            return matches.Count;
+        }
+
+        private static D.Run InsertCopy(D.Run run, string text)
+        {
+            D.Run copy = (D.Run)run.CloneNode(true);
+            copy.Text!.Text = text;
+            run.InsertBeforeSelf(copy);
+            return copy;
+        }
+    }
+
+    internal readonly record struct TermMatch(int Start, int Length, int Term);
+
+    /// <summary>
+    /// Case-insensitive Aho-Corasick automaton over a fixed set of terms
+    /// </summary>
+    internal sealed class TermMatcher
+    {
+        private readonly List<Dictionary<char, int>> _next = new();
+        private readonly List<int> _fail = new();
+        // Longest term ending at each state, and the nearest state down the fail chain that ends a term
+        private readonly List<int> _term = new();
+        private readonly List<int> _output = new();
+        private readonly int[] _lengths;
+
+        public TermMatcher(IReadOnlyList<string> terms)
+        {
+            _lengths = new int[terms.Count];
+            AddState();
+
+            for (int t = 0; t < terms.Count; t++)
+            {
+                int state = 0;
+                foreach (char c in terms[t])
+                {
+                    char key = char.ToUpperInvariant(c);
+                    if (!_next[state].TryGetValue(key, out int target))
+                    {
+                        target = AddState();
+                        _next[state].Add(key, target);
+                    }
+                    state = target;
+                }
+                _term[state] = t;
+                _lengths[t] = terms[t].Length;
+            }
+
+            // Breadth-first, so every state's fail target is finished before the state itself
+            Queue<int> pending = new();
+            foreach (int child in _next[0].Values)
+            {
+                pending.Enqueue(child);
+            }
+            while (pending.Count > 0)
+            {
+                int state = pending.Dequeue();
+                foreach (KeyValuePair<char, int> edge in _next[state])
+                {
+                    int fail = _fail[state];
+                    int target;
+                    while (!_next[fail].TryGetValue(edge.Key, out target) && fail != 0)
+                    {
+                        fail = _fail[fail];
+                    }
+                    int child = edge.Value;
+                    _fail[child] = target != child ? target : 0;
+                    _output[child] = _term[_fail[child]] >= 0 ? _fail[child] : _output[_fail[child]];
+                    pending.Enqueue(child);
+                }
+            }
+        }
+
+        /// <summary>
+        /// Adds the leftmost-longest non-overlapping matches in the text to the list, in order
+        /// </summary>
+        public void FindAll(string text, List<TermMatch> matches)
+        {
+            int state = 0;
+            for (int i = 0; i < text.Length; i++)
+            {
+                char key = char.ToUpperInvariant(text[i]);
+                int target;
+                while (!_next[state].TryGetValue(key, out target) && state != 0)
+                {
+                    state = _fail[state];
+                }
+                // target is the root when no state down the fail chain continues with the character
+                state = target;
+
+                for (int s = _term[state] >= 0 ? state : _output[state]; s > 0; s = _output[s])
+                {
+                    int length = _lengths[_term[s]];
+                    matches.Add(new TermMatch(i - length + 1, length, _term[s]));
+                }
+            }
+
+            if (matches.Count < 2) return;
+
+            matches.Sort((a, b) => a.Start != b.Start ? a.Start.CompareTo(b.Start) : b.Length.CompareTo(a.Length));
+            int kept = 0;
+            int end = 0;
+            foreach (TermMatch match in matches)
+            {
+                if (match.Start < end) continue;
+                matches[kept++] = match;
+                end = match.Start + match.Length;
+            }
+            matches.RemoveRange(kept, matches.Count - kept);
+        }
+
+        private int AddState()
+        {
+            _next.Add(new Dictionary<char, int>());
+            _fail.Add(0);
+            _term.Add(-1);
+            _output.Add(0);
+            return _next.Count - 1;
+        }
+    }
+}
@@ -0,0 +1,320 @@
+using DocumentFormat.OpenXml;
+using DocumentFormat.OpenXml.Packaging;
+using P = DocumentFormat.OpenXml.Presentation;
+
+namespace DocLayer.Core
+{
+    /// <summary>
+    /// Library of named themes that are prepared once and applied to many presentations
+    /// </summary>
+    /// <remarks>
+    /// Registering a theme reads its source presentation once, applies any font and accent color overrides
+    /// to its theme part once, and records which slide layout of the master serves each layout name. The
+    /// prepared package is kept as bytes, so applying the theme copies the master, theme and layout parts
+    /// into the target without re-parsing or re-editing the source. Each target slide is mapped to the new
+    /// layout with the same name, falling back to "Title and Content" (or the first layout).
+    ///
+    /// All members are thread-safe, and <see cref="ApplyToFiles"/> re-themes files in parallel.
+    /// </remarks>
+    public sealed class ThemeRegistry
+    {
+        private const string DefaultLayoutName = "Title and Content";
+
+        private readonly object _lock = new();
+        private readonly Dictionary<string, ThemeEntry> _themes = new(StringComparer.OrdinalIgnoreCase);
+
+        /// <summary>
+        /// Process-wide registry used by the Python wrapper
+        /// </summary>
+        public static ThemeRegistry Shared { get; } = new ThemeRegistry();
+
+        /// <summary>
+        /// Number of registered themes
+        /// </summary>
+        public int Count
+        {
+            get
+            {
+                lock (_lock)
+                {
+                    return _themes.Count;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Registers (or replaces) a theme from a presentation file whose first slide master provides the theme
+        /// </summary>
+        /// <param name="name">Name the theme is applied by</param>
+        /// <param name="themePresentation">Path to the presentation holding the theme</param>
+        /// <param name="fontName">Font typeface name overriding the theme fonts - optional</param>
+        /// <param name="accentColors">List of 4 hex color codes overriding accents 1 to 4 - optional</param>
+        public void Register(string name, string themePresentation, string? fontName = null, List<string>? accentColors = null)
+        {
+            Register(name, File.ReadAllBytes(themePresentation), fontName, accentColors);
+        }
+
+        /// <summary>
+        /// Registers (or replaces) a theme from the bytes of a presentation package
+        /// </summary>
+        /// <param name="name">Name the theme is applied by</param>
+        /// <param name="themePackage">Presentation package whose first slide master provides the theme</param>
+        /// <param name="fontName">Font typeface name overriding the theme fonts - optional</param>
+        /// <param name="accentColors">List of 4 hex color codes overriding accents 1 to 4 - optional</param>
+        public void Register(string name, byte[] themePackage, string? fontName = null, List<string>? accentColors = null)
+        {
+            if (string.IsNullOrEmpty(name)) throw new ArgumentException("Theme name is required", nameof(name));
+            if (themePackage == null) throw new ArgumentNullException(nameof(themePackage));
+
+            ThemeEntry entry = Prepare(themePackage, fontName, accentColors);
+
+            lock (_lock)
+            {
+                _themes[name] = entry;
+            }
+        }
+
+        /// <summary>
+        /// Whether a theme is registered under the name
+        /// </summary>
+        public bool Contains(string name)
+        {
+            lock (_lock)
+            {
+                return _themes.ContainsKey(name);
+            }
+        }
+
+        /// <summary>
+        /// Removes the theme; returns false if no theme was registered under the name
+        /// </summary>
+        public bool Remove(string name)
+        {
+            lock (_lock)
+            {
+                return _themes.Remove(name);
+            }
+        }
+
+        /// <summary>
+        /// Replaces the slide master, theme and slide layouts of the open presentation with the named theme.
+        /// The presentation is not saved.
+        /// </summary>
+        public void Apply(string name, PresentationDocument presentationDoc)
+        {
+            if (presentationDoc == null) throw new ArgumentNullException(nameof(presentationDoc));
+
+            Apply(GetEntry(name), presentationDoc);
+        }
+
+        /// <summary>
+        /// Applies the named theme to a presentation file in place
+        /// </summary>
+        public void ApplyToFile(string name, string presentationFile)
+        {
+            ThemeEntry entry = GetEntry(name);
+
+            using PresentationDocument presentationDoc = PresentationDocument.Open(presentationFile, true);
+            Apply(entry, presentationDoc);
+        }
+
+        /// <summary>
+        /// Applies the named theme to many presentation files in place, in parallel. Failures are reported
+        /// per file instead of stopping the batch.
+        /// </summary>
+        /// <param name="name">Registered theme name</param>
+        /// <param name="presentationFiles">Paths of the presentations to re-theme</param>
+        /// <param name="maxDegreeOfParallelism">Number of files processed at once (defaults to the processor count)</param>
+        /// <returns>One result per file, in input order</returns>
+        public List<ThemeApplyResult> ApplyToFiles(string name, IEnumerable<string> presentationFiles, int maxDegreeOfParallelism = 0)
+        {
+            if (presentationFiles == null) throw new ArgumentNullException(nameof(presentationFiles));
+
+            ThemeEntry entry = GetEntry(name);
+            List<string> files = presentationFiles.ToList();
+            ThemeApplyResult[] results = new ThemeApplyResult[files.Count];
+
+            Parallel.For(0, files.Count,
+                new ParallelOptions { MaxDegreeOfParallelism = maxDegreeOfParallelism > 0 ? maxDegreeOfParallelism : Environment.ProcessorCount },
+                i =>
+                {
+                    ThemeApplyResult result = new ThemeApplyResult { Path = files[i] };
+                    try
+                    {
+                        using PresentationDocument presentationDoc = PresentationDocument.Open(files[i], true);
+                        Apply(entry, presentationDoc);
+                    }
+                    catch (Exception ex)
+                    {
+                        result.Error = ex.Message;
+                    }
+                    results[i] = result;
+                });
+
+            return results.ToList();
+        }
+
+        private ThemeEntry GetEntry(string name)
+        {
+            lock (_lock)
+            {
+                if (_themes.TryGetValue(name, out ThemeEntry? entry))
+                {
+                    return entry;
+                }
+            }
+            throw new KeyNotFoundException($"Theme '{name}' is not registered");
+        }
+
+        private static ThemeEntry Prepare(byte[] themePackage, string? fontName, List<string>? accentColors)
+        {
+            byte[] package = themePackage;
+
+            if (!string.IsNullOrEmpty(fontName) || (accentColors != null && accentColors.Count > 0))
+            {
+                // Edit the theme part once here instead of in every target deck
+                using MemoryStream stream = new MemoryStream();
+                stream.Write(themePackage, 0, themePackage.Length);
+                stream.Position = 0;
+                using (PresentationDocument themeDoc = PresentationDocument.Open(stream, true))
+                {
+                    new PresentationBuilder(themeDoc).SetPresentationTheme(fontName, accentColors);
+                }
+                package = stream.ToArray();
+            }
+
+            using MemoryStream readStream = new MemoryStream(package, writable: false);
+            using PresentationDocument document = PresentationDocument.Open(readStream, false);
+
+            SlideMasterPart master = document.PresentationPart?.SlideMasterParts.FirstOrDefault()
+                ?? throw new ArgumentException("Theme presentation has no slide master", nameof(themePackage));
+
+            Dictionary<string, string> layoutRelIds = new(StringComparer.Ordinal);
+            string? firstLayoutRelId = null;
+            foreach (IdPartPair pair in master.Parts)
+            {
+                if (pair.OpenXmlPart is SlideLayoutPart layoutPart)
+                {
+                    firstLayoutRelId ??= pair.RelationshipId;
+                    string? layoutName = ReadLayoutName(layoutPart);
+                    if (layoutName != null)
+                    {
+                        layoutRelIds.TryAdd(layoutName, pair.RelationshipId);
+                    }
+                }
+            }
+
+            string defaultLayoutRelId = layoutRelIds.TryGetValue(DefaultLayoutName, out string? relId) ? relId
+                : firstLayoutRelId ?? throw new ArgumentException("Theme slide master has no slide layouts", nameof(themePackage));
+
+            return new ThemeEntry(package, layoutRelIds, defaultLayoutRelId);
+        }
+
+        private static void Apply(ThemeEntry entry, PresentationDocument presentationDoc)
+        {
+            PresentationPart presentationPart = presentationDoc.PresentationPart
+                ?? throw new InvalidOperationException("PresentationPart not found");
+            SlideMasterPart oldMaster = presentationPart.SlideMasterParts.First();
+            string masterRelId = presentationPart.GetIdOfPart(oldMaster);
+
+            // Read each old layout's name once, however many slides use it
+            Dictionary<SlideLayoutPart, string?> oldLayoutNames = new();
+            List<(SlidePart SlidePart, string? LayoutName)> slides = new();
+            foreach (SlidePart slidePart in presentationPart.SlideParts)
+            {
+                string? layoutName = null;
+                if (slidePart.SlideLayoutPart is SlideLayoutPart layoutPart && !oldLayoutNames.TryGetValue(layoutPart, out layoutName))
+                {
+                    layoutName = ReadLayoutName(layoutPart);
+                    oldLayoutNames.Add(layoutPart, layoutName);
+                }
+                slides.Add((slidePart, layoutName));
+            }
+
+            using MemoryStream themeStream = new MemoryStream(entry.Package, writable: false);
+            using PresentationDocument themeDoc = PresentationDocument.Open(themeStream, false);
+            SlideMasterPart sourceMaster = themeDoc.PresentationPart!.SlideMasterParts.First();
+
+            if (presentationPart.ThemePart is not null)
+            {
+                presentationPart.DeletePart(presentationPart.ThemePart);
+            }
+            presentationPart.DeletePart(oldMaster);
+
+            // Import the new master (with its theme and layouts) under the old relationship id
+            SlideMasterPart newMaster = presentationPart.AddPart(sourceMaster, masterRelId);
+            if (newMaster.ThemePart is not null)
+            {
+                presentationPart.AddPart(newMaster.ThemePart);
+            }
+
+            Dictionary<string, SlideLayoutPart>? importedLayouts = null;
+            foreach ((SlidePart slidePart, string? layoutName) in slides)
+            {
+                if (slidePart.SlideLayoutPart is not null)
+                {
+                    slidePart.DeletePart(slidePart.SlideLayoutPart);
+                }
+
+                string layoutRelId = layoutName != null && entry.LayoutRelIds.TryGetValue(layoutName, out string? relId)
+                    ? relId
+                    : entry.DefaultLayoutRelId;
+
+                if (!newMaster.TryGetPartById(layoutRelId, out OpenXmlPart? part) || part is not SlideLayoutPart newLayout)
+                {
+                    // Relationship ids were not preserved on import; fall back to matching by name
+                    importedLayouts ??= newMaster.SlideLayoutParts
+                        .Select(layoutPart => (Name: ReadLayoutName(layoutPart), Part: layoutPart))
+                        .Where(layout => layout.Name != null)
+                        .GroupBy(layout => layout.Name!)
+                        .ToDictionary(group => group.Key, group => group.First().Part);
+                    newLayout = layoutName != null && importedLayouts.TryGetValue(layoutName, out SlideLayoutPart? byName) ? byName
+                        : importedLayouts.TryGetValue(DefaultLayoutName, out SlideLayoutPart? fallback) ? fallback
+                        : newMaster.SlideLayoutParts.First();
+                }
+
+                slidePart.AddPart(newLayout);
+            }
+        }
+
+        /// <summary>
+        /// Reads the layout name (p:cSld/@name) with a forward-only reader instead of loading the layout DOM
+        /// </summary>
+        internal static string? ReadLayoutName(SlideLayoutPart layoutPart)
+        {
+            using OpenXmlReader reader = OpenXmlReader.Create(layoutPart);
+            while (reader.Read())
+            {
+                if (reader.ElementType == typeof(P.CommonSlideData) && reader.IsStartElement)
+                {
+                    foreach (OpenXmlAttribute attribute in reader.Attributes)
+                    {
+                        if (attribute.LocalName == "name")
+                        {
+                            return attribute.Value;
+                        }
+                    }
+                    return null;
+                }
+            }
+            return null;
+        }
+
+        private sealed record ThemeEntry(byte[] Package, Dictionary<string, string> LayoutRelIds, string DefaultLayoutRelId);
+    }
+
+    /// <summary>
+    /// Outcome of re-theming one file with <see cref="ThemeRegistry.ApplyToFiles"/>
+    /// </summary>
+    public class ThemeApplyResult
+    {
+        public string Path { get; set; } = "";
+
+        /// <summary>
+        /// Why the file could not be re-themed; null on success
+        /// </summary>
+        public string? Error { get; set; }
+
+        public bool Ok => Error is null;
+    }
+}
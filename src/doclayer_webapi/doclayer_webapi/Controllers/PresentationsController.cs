@@ -0,0 +1,128 @@
+using System.Threading.RateLimiting;
+using doclayer_webapi.Services;
+using Microsoft.AspNetCore.Mvc;
+
+namespace doclayer_webapi.Controllers
+{
+    [ApiController]
+    [Route("[controller]")]
+    public class PresentationsController : ControllerBase
+    {
+        private const string PresentationContentType = "application/vnd.openxmlformats-officedocument.presentationml.presentation";
+
+        private readonly PresentationGenerator _generator;
+        private readonly GenerationLimiter _limiter;
+        private readonly GenerationMetrics _metrics;
+        private readonly ILogger<PresentationsController> _logger;
+
+        public PresentationsController(
+            PresentationGenerator generator,
+            GenerationLimiter limiter,
+            GenerationMetrics metrics,
+            ILogger<PresentationsController> logger)
+        {
+            _generator = generator;
+            _limiter = limiter;
+            _metrics = metrics;
+            _logger = logger;
+        }
+
+        /// <summary>
+        /// Builds a presentation with a title slide and the requested theme and streams the PPTX back.
+        /// Identical specs are served from the output cache (X-Cache: HIT). Returns 503 when the build
+        /// queue is full.
+        /// </summary>
+        [HttpPost(Name = "GeneratePresentation")]
+        [Produces(PresentationContentType)]
+        [ProducesResponseType(StatusCodes.Status200OK)]
+        [ProducesResponseType(StatusCodes.Status400BadRequest)]
+        [ProducesResponseType(StatusCodes.Status503ServiceUnavailable)]
+        public async Task<IActionResult> Generate([FromBody] PresentationRequest request, CancellationToken cancellationToken)
+        {
+            _metrics.RecordRequest();
+
+            if (request.AccentColors is { Count: > 0 } && request.AccentColors.Count != 4)
+            {
+                ModelState.AddModelError(nameof(request.AccentColors), "Must provide exactly 4 accent colors");
+                return ValidationProblem(ModelState);
+            }
+
+            string cacheKey = PresentationGenerator.GetCacheKey(request);
+
+            // Cache hits never wait for a build slot
+            if (_generator.TryGetCached(cacheKey, out byte[] cached))
+            {
+                _metrics.RecordCacheHit();
+                await WritePresentationAsync(cached, "HIT", cancellationToken);
+                return new EmptyResult();
+            }
+
+            PooledPresentation presentation;
+            try
+            {
+                using (RateLimitLease lease = await _limiter.AcquireAsync(cancellationToken))
+                {
+                    if (!lease.IsAcquired)
+                    {
+                        Response.Headers.RetryAfter = "1";
+                        return StatusCode(StatusCodes.Status503ServiceUnavailable);
+                    }
+
+                    // An identical request may have been built while this one was queued
+                    if (_generator.TryGetCached(cacheKey, out cached))
+                    {
+                        _metrics.RecordCacheHit();
+                        await WritePresentationAsync(cached, "HIT", cancellationToken);
+                        return new EmptyResult();
+                    }
+
+                    _metrics.RecordCacheMiss();
+                    presentation = _generator.Build(request, cacheKey);
+                }
+            }
+            catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+            {
+                _metrics.RecordCancelled();
+                return new EmptyResult();
+            }
+            catch (Exception ex) when (ex is ArgumentException or FormatException)
+            {
+                _metrics.RecordFailed();
+                return Problem(ex.Message, statusCode: StatusCodes.Status400BadRequest);
+            }
+            catch (Exception ex)
+            {
+                _metrics.RecordFailed();
+                _logger.LogError(ex, "Presentation generation failed");
+                throw;
+            }
+
+            // The build slot is released before the response is sent, so slow clients do not hold it
+            using (presentation)
+            {
+                await WritePresentationAsync(presentation.Content, "MISS", cancellationToken);
+            }
+            return new EmptyResult();
+        }
+
+        /// <summary>
+        /// Request, queue, build and output cache counters of the generation endpoint
+        /// </summary>
+        [HttpGet("metrics", Name = "GetGenerationMetrics")]
+        public GenerationMetricsSnapshot Metrics()
+        {
+            return _metrics.Snapshot(_limiter.GetStatistics(), _generator.GetCacheStatistics());
+        }
+
+        private async Task WritePresentationAsync(ReadOnlyMemory<byte> package, string cacheStatus, CancellationToken cancellationToken)
+        {
+            Response.StatusCode = StatusCodes.Status200OK;
+            Response.ContentType = PresentationContentType;
+            Response.ContentLength = package.Length;
+            Response.Headers.ContentDisposition = "attachment; filename=\"presentation.pptx\"";
+            Response.Headers["X-Cache"] = cacheStatus;
+
+            await Response.Body.WriteAsync(package, cancellationToken);
+        }
+    }
+}
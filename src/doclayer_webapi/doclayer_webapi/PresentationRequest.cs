@@ -0,0 +1,33 @@
+using System.ComponentModel.DataAnnotations;
+
+namespace doclayer_webapi
+{
+    /// <summary>
+    /// Title slide and theme of a generated presentation. Uses the same snake_case keys as the
+    /// Python and TypeScript batch specs (title, subtitle, footnote, font_name, accent_colors).
+    /// </summary>
+    public class PresentationRequest
+    {
+        [Required]
+        public string Title { get; set; } = "";
+
+        public string? Subtitle { get; set; }
+
+        public string? Footnote { get; set; } = "Source:";
+
+        /// <summary>
+        /// Theme font typeface name - optional
+        /// </summary>
+        public string? FontName { get; set; }
+
+        /// <summary>
+        /// Exactly 4 hex color codes for the theme accent colors - optional
+        /// </summary>
+        public List<string>? AccentColors { get; set; }
+
+        /// <summary>
+        /// If true, uses 16:9 format; otherwise uses 4:3
+        /// </summary>
+        public bool Widescreen { get; set; } = true;
+    }
+}
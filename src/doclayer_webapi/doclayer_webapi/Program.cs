@@ -1,14 +1,29 @@
+using System.Text.Json;
+using doclayer_webapi.Services;
+
 var builder = WebApplication.CreateBuilder(args);
 
 // Add services to the container.
 
-builder.Services.AddControllers();
+builder.Services.AddControllers()
+    .AddJsonOptions(options =>
+    {
+        // Same snake_case keys as the Python and TypeScript specs
+        options.JsonSerializerOptions.PropertyNamingPolicy = JsonNamingPolicy.SnakeCaseLower;
+    });
+builder.Services.Configure<GenerationOptions>(builder.Configuration.GetSection(GenerationOptions.SectionName));
+builder.Services.AddSingleton<GenerationMetrics>();
+builder.Services.AddSingleton<GenerationLimiter>();
+builder.Services.AddSingleton<PresentationGenerator>();
 // Learn more about configuring Swagger/OpenAPI at https://aka.ms/aspnetcore/swashbuckle
 builder.Services.AddEndpointsApiExplorer();
 builder.Services.AddSwaggerGen();
 
 var app = builder.Build();
 
+// Pre-JIT the build path so the first request is not slower than the rest
+app.Services.GetRequiredService<PresentationGenerator>().Warmup();
+
 // Configure the HTTP request pipeline.
 if (app.Environment.IsDevelopment())
 {
@@ -0,0 +1,65 @@
+using System.Diagnostics;
+using System.Threading.RateLimiting;
+using Microsoft.Extensions.Options;
+
+namespace doclayer_webapi.Services
+{
+    /// <summary>
+    /// Bounds the number of presentations built at once. Requests beyond the limit wait in a FIFO
+    /// queue of <see cref="GenerationOptions.QueueLimit"/> entries; once it is full they are rejected.
+    /// </summary>
+    public sealed class GenerationLimiter : IDisposable
+    {
+        private readonly ConcurrencyLimiter _limiter;
+        private readonly GenerationMetrics _metrics;
+
+        public GenerationLimiter(IOptions<GenerationOptions> options, GenerationMetrics metrics)
+        {
+            GenerationOptions settings = options.Value;
+            PermitLimit = settings.MaxConcurrency > 0 ? settings.MaxConcurrency : Environment.ProcessorCount;
+
+            _metrics = metrics;
+            _limiter = new ConcurrencyLimiter(new ConcurrencyLimiterOptions
+            {
+                PermitLimit = PermitLimit,
+                QueueLimit = Math.Max(0, settings.QueueLimit),
+                QueueProcessingOrder = QueueProcessingOrder.OldestFirst,
+            });
+        }
+
+        /// <summary>
+        /// Number of builds allowed to run at once
+        /// </summary>
+        public int PermitLimit { get; }
+
+        /// <summary>
+        /// Waits for a build slot. Check <see cref="RateLimitLease.IsAcquired"/>: false means the queue was full.
+        /// Dispose the lease to release the slot.
+        /// </summary>
+        public async ValueTask<RateLimitLease> AcquireAsync(CancellationToken cancellationToken)
+        {
+            long start = Stopwatch.GetTimestamp();
+            RateLimitLease lease = await _limiter.AcquireAsync(1, cancellationToken);
+
+            if (lease.IsAcquired)
+            {
+                _metrics.RecordQueueWait(Stopwatch.GetElapsedTime(start));
+            }
+            else
+            {
+                _metrics.RecordRejected();
+            }
+            return lease;
+        }
+
+        public RateLimiterStatistics? GetStatistics()
+        {
+            return _limiter.GetStatistics();
+        }
+
+        public void Dispose()
+        {
+            _limiter.Dispose();
+        }
+    }
+}
@@ -0,0 +1,102 @@
+using System.Threading.RateLimiting;
+using Microsoft.Extensions.Caching.Memory;
+
+namespace doclayer_webapi.Services
+{
+    /// <summary>
+    /// Counters of the generation endpoint, updated lock-free from concurrent requests
+    /// </summary>
+    public sealed class GenerationMetrics
+    {
+        private long _requests;
+        private long _cacheHits;
+        private long _cacheMisses;
+        private long _rejected;
+        private long _cancelled;
+        private long _failed;
+        private long _builds;
+        private long _buildsInFlight;
+        private long _buildTicks;
+        private long _queueWaits;
+        private long _queueWaitTicks;
+        private long _maxQueueWaitTicks;
+
+        public void RecordRequest() => Interlocked.Increment(ref _requests);
+
+        public void RecordCacheHit() => Interlocked.Increment(ref _cacheHits);
+
+        public void RecordCacheMiss() => Interlocked.Increment(ref _cacheMisses);
+
+        public void RecordRejected() => Interlocked.Increment(ref _rejected);
+
+        public void RecordCancelled() => Interlocked.Increment(ref _cancelled);
+
+        public void RecordFailed() => Interlocked.Increment(ref _failed);
+
+        public void RecordQueueWait(TimeSpan wait)
+        {
+            Interlocked.Increment(ref _queueWaits);
+            Interlocked.Add(ref _queueWaitTicks, wait.Ticks);
+
+            long max = Interlocked.Read(ref _maxQueueWaitTicks);
+            while (wait.Ticks > max)
+            {
+                long seen = Interlocked.CompareExchange(ref _maxQueueWaitTicks, wait.Ticks, max);
+                if (seen == max) break;
+                max = seen;
+            }
+        }
+
+        public void BuildStarted() => Interlocked.Increment(ref _buildsInFlight);
+
+        public void BuildFinished(TimeSpan elapsed)
+        {
+            Interlocked.Decrement(ref _buildsInFlight);
+            Interlocked.Increment(ref _builds);
+            Interlocked.Add(ref _buildTicks, elapsed.Ticks);
+        }
+
+        /// <summary>
+        /// Point-in-time view of the counters, the limiter queue and the output cache
+        /// </summary>
+        public GenerationMetricsSnapshot Snapshot(RateLimiterStatistics? limiter, MemoryCacheStatistics? cache)
+        {
+            long builds = Interlocked.Read(ref _builds);
+            long queueWaits = Interlocked.Read(ref _queueWaits);
+
+            return new GenerationMetricsSnapshot(
+                Requests: Interlocked.Read(ref _requests),
+                CacheHits: Interlocked.Read(ref _cacheHits),
+                CacheMisses: Interlocked.Read(ref _cacheMisses),
+                Rejected: Interlocked.Read(ref _rejected),
+                Cancelled: Interlocked.Read(ref _cancelled),
+                Failed: Interlocked.Read(ref _failed),
+                Builds: builds,
+                BuildsInFlight: Interlocked.Read(ref _buildsInFlight),
+                Queued: limiter?.CurrentQueuedCount ?? 0,
+                AvailablePermits: limiter?.CurrentAvailablePermits ?? 0,
+                AverageBuildMs: builds == 0 ? 0 : TimeSpan.FromTicks(Interlocked.Read(ref _buildTicks) / builds).TotalMilliseconds,
+                AverageQueueWaitMs: queueWaits == 0 ? 0 : TimeSpan.FromTicks(Interlocked.Read(ref _queueWaitTicks) / queueWaits).TotalMilliseconds,
+                MaxQueueWaitMs: TimeSpan.FromTicks(Interlocked.Read(ref _maxQueueWaitTicks)).TotalMilliseconds,
+                CacheEntries: cache?.CurrentEntryCount ?? 0,
+                CacheSizeBytes: cache?.CurrentEstimatedSize ?? 0);
+        }
+    }
+
+    public record GenerationMetricsSnapshot(
+        long Requests,
+        long CacheHits,
+        long CacheMisses,
+        long Rejected,
+        long Cancelled,
+        long Failed,
+        long Builds,
+        long BuildsInFlight,
+        long Queued,
+        long AvailablePermits,
+        double AverageBuildMs,
+        double AverageQueueWaitMs,
+        double MaxQueueWaitMs,
+        long CacheEntries,
+        long CacheSizeBytes);
+}
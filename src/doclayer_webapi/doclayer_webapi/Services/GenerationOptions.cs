@@ -0,0 +1,35 @@
+namespace doclayer_webapi.Services
+{
+    /// <summary>
+    /// Settings of the "Generation" configuration section
+    /// </summary>
+    public class GenerationOptions
+    {
+        public const string SectionName = "Generation";
+
+        /// <summary>
+        /// Presentations built at once; 0 uses the processor count
+        /// </summary>
+        public int MaxConcurrency { get; set; }
+
+        /// <summary>
+        /// Requests allowed to wait for a build slot; further requests get 503
+        /// </summary>
+        public int QueueLimit { get; set; } = 256;
+
+        /// <summary>
+        /// Total size of cached outputs for identical specs; 0 disables the cache
+        /// </summary>
+        public long CacheSizeBytes { get; set; } = 256L * 1024 * 1024;
+
+        /// <summary>
+        /// How long a cached output is kept after its last use
+        /// </summary>
+        public TimeSpan CacheSlidingExpiration { get; set; } = TimeSpan.FromMinutes(30);
+
+        /// <summary>
+        /// Build streams that grew beyond this capacity are dropped instead of returned to the pool
+        /// </summary>
+        public int MaxPooledStreamBytes { get; set; } = 4 * 1024 * 1024;
+    }
+}
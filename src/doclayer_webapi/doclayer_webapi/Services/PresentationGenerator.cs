@@ -0,0 +1,196 @@
+using System.Diagnostics;
+using System.Security.Cryptography;
+using System.Text.Json;
+using DocLayer.Core;
+using DocumentFormat.OpenXml.Packaging;
+using Microsoft.Extensions.Caching.Memory;
+using Microsoft.Extensions.ObjectPool;
+using Microsoft.Extensions.Options;
+
+namespace doclayer_webapi.Services
+{
+    /// <summary>
+    /// Builds title presentations with <see cref="PresentationBuilder"/> into pooled memory streams and
+    /// keeps the packages of recent specs in a size-bounded output cache
+    /// </summary>
+    /// <remarks>
+    /// The themed base package is cloned from <see cref="PresentationTemplateCache.Shared"/>, so a build
+    /// only adds the title slide and saves. Build streams are reused across requests; streams that grew
+    /// past <see cref="GenerationOptions.MaxPooledStreamBytes"/> are dropped instead of being pooled.
+    /// </remarks>
+    public sealed class PresentationGenerator : IDisposable
+    {
+        private readonly ObjectPool<MemoryStream> _streams;
+        private readonly MemoryCache? _cache;
+        private readonly TimeSpan _cacheSlidingExpiration;
+        private readonly GenerationMetrics _metrics;
+
+        public PresentationGenerator(IOptions<GenerationOptions> options, GenerationMetrics metrics)
+        {
+            GenerationOptions settings = options.Value;
+
+            _metrics = metrics;
+            _streams = new DefaultObjectPoolProvider { MaximumRetained = Environment.ProcessorCount * 2 }
+                .Create(new MemoryStreamPolicy(settings.MaxPooledStreamBytes));
+
+            if (settings.CacheSizeBytes > 0)
+            {
+                _cache = new MemoryCache(new MemoryCacheOptions { SizeLimit = settings.CacheSizeBytes, TrackStatistics = true });
+                _cacheSlidingExpiration = settings.CacheSlidingExpiration;
+            }
+        }
+
+        /// <summary>
+        /// Hash identifying the output of a request; requests with equal keys produce identical packages
+        /// </summary>
+        public static string GetCacheKey(PresentationRequest request)
+        {
+            byte[] canonical = JsonSerializer.SerializeToUtf8Bytes(new
+            {
+                request.Title,
+                request.Subtitle,
+                request.Footnote,
+                FontName = string.IsNullOrEmpty(request.FontName) ? null : request.FontName,
+                AccentColors = request.AccentColors is { Count: > 0 } ? request.AccentColors : null,
+                request.Widescreen,
+            });
+            return Convert.ToHexString(SHA256.HashData(canonical));
+        }
+
+        /// <summary>
+        /// Looks up the package built earlier for the same spec
+        /// </summary>
+        public bool TryGetCached(string cacheKey, out byte[] package)
+        {
+            if (_cache != null && _cache.TryGetValue(cacheKey, out byte[]? cached) && cached != null)
+            {
+                package = cached;
+                return true;
+            }
+            package = Array.Empty<byte>();
+            return false;
+        }
+
+        /// <summary>
+        /// Builds the presentation into a pooled stream and caches a copy of the package under the key
+        /// </summary>
+        /// <returns>The built package; dispose it to return the stream to the pool</returns>
+        public PooledPresentation Build(PresentationRequest request, string cacheKey)
+        {
+            MemoryStream stream = _streams.Get();
+            long start = Stopwatch.GetTimestamp();
+            _metrics.BuildStarted();
+            try
+            {
+                using (PresentationDocument presentationDoc = PresentationTemplateCache.Shared.CreatePresentation(
+                    stream, request.Widescreen, request.FontName, request.AccentColors is { Count: > 0 } ? request.AccentColors : null))
+                {
+                    PresentationBuilder builder = new(presentationDoc);
+                    builder.CreateTitleSlide(request.Title, request.Subtitle, request.Footnote);
+                }
+            }
+            catch
+            {
+                _streams.Return(stream);
+                throw;
+            }
+            finally
+            {
+                _metrics.BuildFinished(Stopwatch.GetElapsedTime(start));
+            }
+
+            PooledPresentation presentation = new PooledPresentation(stream, _streams);
+
+            _cache?.Set(cacheKey, presentation.Content.ToArray(), new MemoryCacheEntryOptions
+            {
+                Size = stream.Length,
+                SlidingExpiration = _cacheSlidingExpiration,
+            });
+
+            return presentation;
+        }
+
+        /// <summary>
+        /// Builds and discards one presentation so the first request does not pay for JIT compilation
+        /// </summary>
+        public void Warmup()
+        {
+            using MemoryStream stream = new MemoryStream();
+            using (PresentationDocument presentationDoc = PresentationTemplateCache.Shared.CreatePresentation(stream))
+            {
+                new PresentationBuilder(presentationDoc).CreateTitleSlide("warmup", "warmup");
+            }
+        }
+
+        public MemoryCacheStatistics? GetCacheStatistics()
+        {
+            return _cache?.GetCurrentStatistics();
+        }
+
+        public void Dispose()
+        {
+            _cache?.Dispose();
+        }
+
+        private sealed class MemoryStreamPolicy : PooledObjectPolicy<MemoryStream>
+        {
+            private readonly int _maxCapacity;
+
+            public MemoryStreamPolicy(int maxCapacity)
+            {
+                _maxCapacity = maxCapacity;
+            }
+
+            public override MemoryStream Create()
+            {
+                return new MemoryStream();
+            }
+
+            public override bool Return(MemoryStream stream)
+            {
+                if (stream.Capacity > _maxCapacity)
+                {
+                    return false;
+                }
+                stream.SetLength(0);
+                return true;
+            }
+        }
+    }
+
+    /// <summary>
+    /// A built package held in a pooled stream until the response has been written
+    /// </summary>
+    public sealed class PooledPresentation : IDisposable
+    {
+        private MemoryStream? _stream;
+        private readonly ObjectPool<MemoryStream> _pool;
+
+        internal PooledPresentation(MemoryStream stream, ObjectPool<MemoryStream> pool)
+        {
+            _stream = stream;
+            _pool = pool;
+        }
+
+        /// <summary>
+        /// The package bytes, read straight from the stream's buffer
+        /// </summary>
+        public ReadOnlyMemory<byte> Content
+        {
+            get
+            {
+                MemoryStream stream = _stream ?? throw new ObjectDisposedException(nameof(PooledPresentation));
+                return stream.GetBuffer().AsMemory(0, (int)stream.Length);
+            }
+        }
+
+        public void Dispose()
+        {
+            MemoryStream? stream = Interlocked.Exchange(ref _stream, null);
+            if (stream != null)
+            {
+                _pool.Return(stream);
+            }
+        }
+    }
+}
@@ -0,0 +1,218 @@
+using System.Globalization;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+using BenchmarkDotNet.Reports;
+
+namespace DocLayer.Benchmarks
+{
+    /// <summary>
+    /// Command line options for recording and checking benchmark baselines; the remaining arguments go to BenchmarkDotNet
+    /// </summary>
+    public sealed class BaselineOptions
+    {
+        public const string DefaultPath = "baselines/dotnet.json";
+        public const double DefaultThresholdPercent = 10;
+
+        public bool Save { get; private set; }
+
+        public bool Check { get; private set; }
+
+        public string Path { get; private set; } = DefaultPath;
+
+        /// <summary>
+        /// Allowed slowdown or allocation growth over the baseline, in percent
+        /// </summary>
+        public double ThresholdPercent { get; private set; } = DefaultThresholdPercent;
+
+        public string[] BenchmarkArgs { get; private set; } = Array.Empty<string>();
+
+        public static BaselineOptions Parse(string[] args)
+        {
+            BaselineOptions options = new();
+            List<string> remaining = new();
+
+            for (int i = 0; i < args.Length; i++)
+            {
+                switch (args[i])
+                {
+                    case "--save-baseline":
+                        options.Save = true;
+                        break;
+                    case "--check-baseline":
+                        options.Check = true;
+                        break;
+                    case "--baseline-path" when i + 1 < args.Length:
+                        options.Path = args[++i];
+                        break;
+                    case "--threshold" when i + 1 < args.Length:
+                        options.ThresholdPercent = double.Parse(args[++i], CultureInfo.InvariantCulture);
+                        break;
+                    default:
+                        remaining.Add(args[i]);
+                        break;
+                }
+            }
+
+            options.BenchmarkArgs = remaining.ToArray();
+            return options;
+        }
+    }
+
+    /// <summary>
+    /// Mean time and allocations of one benchmark case as stored in a baseline file
+    /// </summary>
+    public sealed class BaselineEntry
+    {
+        public double MeanNs { get; set; }
+
+        public long? AllocatedBytes { get; set; }
+    }
+
+    /// <summary>
+    /// Baseline file: the environment it was recorded on and one entry per benchmark case
+    /// </summary>
+    public sealed class BaselineFile
+    {
+        public string? Environment { get; set; }
+
+        public DateTime RecordedAt { get; set; }
+
+        public SortedDictionary<string, BaselineEntry> Benchmarks { get; set; } = new();
+    }
+
+    /// <summary>
+    /// Records BenchmarkDotNet results as a baseline and compares later runs against it. A case regresses
+    /// when its mean time or its allocated bytes per operation exceed the baseline by more than the threshold.
+    /// </summary>
+    /// <remarks>
+    /// Baselines are only comparable on the machine and runtime they were recorded on; record one per CI
+    /// runner and check it into <c>baselines/</c>. Saving merges into the existing file, so a filtered run
+    /// only replaces the cases it ran.
+    /// </remarks>
+    public static class BaselineComparer
+    {
+        // Allocation differences below this are noise from the runtime, not from our code
+        private const long AllocationNoiseBytes = 1024;
+
+        private static readonly JsonSerializerOptions JsonOptions = new()
+        {
+            PropertyNamingPolicy = JsonNamingPolicy.SnakeCaseLower,
+            DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull,
+            WriteIndented = true,
+        };
+
+        /// <summary>
+        /// Saves and/or checks the baseline as requested by the options
+        /// </summary>
+        /// <returns>Process exit code: 1 if a regression was found, otherwise 0</returns>
+        public static int Run(BaselineOptions options, IEnumerable<Summary> summaries)
+        {
+            Dictionary<string, BaselineEntry> results = Collect(summaries);
+            int exitCode = 0;
+
+            if (options.Check)
+            {
+                BaselineFile? baseline = Load(options.Path);
+                if (baseline == null)
+                {
+                    Console.WriteLine($"No baseline at {options.Path}; run with --save-baseline first");
+                }
+                else
+                {
+                    exitCode = Compare(baseline, results, options.ThresholdPercent) ? 1 : 0;
+                }
+            }
+
+            if (options.Save)
+            {
+                BaselineFile baseline = Load(options.Path) ?? new BaselineFile();
+                baseline.Environment = $"{System.Runtime.InteropServices.RuntimeInformation.OSDescription}, " +
+                    $"{System.Runtime.InteropServices.RuntimeInformation.FrameworkDescription}, {System.Environment.ProcessorCount} cores";
+                baseline.RecordedAt = DateTime.UtcNow;
+                foreach ((string name, BaselineEntry entry) in results)
+                {
+                    baseline.Benchmarks[name] = entry;
+                }
+
+                Directory.CreateDirectory(System.IO.Path.GetDirectoryName(System.IO.Path.GetFullPath(options.Path))!);
+                File.WriteAllText(options.Path, JsonSerializer.Serialize(baseline, JsonOptions));
+                Console.WriteLine($"Saved {results.Count} benchmark(s) to {options.Path}");
+            }
+
+            return exitCode;
+        }
+
+        /// <summary>
+        /// Key of a benchmark case in the baseline file, e.g. "SlideBenchmarks.SingleSave [Slides=10]"
+        /// </summary>
+        public static string GetKey(BenchmarkReport report)
+        {
+            string parameters = report.BenchmarkCase.Parameters.DisplayInfo;
+            string key = $"{report.BenchmarkCase.Descriptor.Type.Name}.{report.BenchmarkCase.Descriptor.WorkloadMethod.Name}";
+            return string.IsNullOrEmpty(parameters) ? key : $"{key} {parameters}";
+        }
+
+        private static Dictionary<string, BaselineEntry> Collect(IEnumerable<Summary> summaries)
+        {
+            Dictionary<string, BaselineEntry> results = new();
+            foreach (BenchmarkReport report in summaries.SelectMany(summary => summary.Reports))
+            {
+                if (!report.Success || report.ResultStatistics == null) continue;
+
+                results[GetKey(report)] = new BaselineEntry
+                {
+                    MeanNs = report.ResultStatistics.Mean,
+                    AllocatedBytes = report.GcStats.GetBytesAllocatedPerOperation(report.BenchmarkCase),
+                };
+            }
+            return results;
+        }
+
+        /// <returns>True if any benchmark regressed</returns>
+        private static bool Compare(BaselineFile baseline, Dictionary<string, BaselineEntry> results, double thresholdPercent)
+        {
+            double limit = 1 + thresholdPercent / 100;
+            bool regressed = false;
+
+            Console.WriteLine();
+            Console.WriteLine($"Baseline comparison (threshold {thresholdPercent.ToString(CultureInfo.InvariantCulture)}%, recorded {baseline.RecordedAt:u} on {baseline.Environment})");
+            Console.WriteLine($"{"Benchmark",-60} {"Time",10} {"Alloc",10}  Status");
+
+            foreach ((string name, BaselineEntry current) in results.OrderBy(pair => pair.Key, StringComparer.Ordinal))
+            {
+                if (!baseline.Benchmarks.TryGetValue(name, out BaselineEntry? previous))
+                {
+                    Console.WriteLine($"{name,-60} {"",10} {"",10}  new");
+                    continue;
+                }
+
+                double timeRatio = current.MeanNs / previous.MeanNs;
+                bool slower = timeRatio > limit;
+
+                string allocation = "";
+                bool allocatesMore = false;
+                if (current.AllocatedBytes is long allocated && previous.AllocatedBytes is long previousAllocated)
+                {
+                    allocatesMore = allocated - previousAllocated > AllocationNoiseBytes && allocated > previousAllocated * limit;
+                    allocation = previousAllocated == 0 ? $"{allocated} B" : $"{(double)allocated / previousAllocated:0.00}x";
+                }
+
+                string status = slower || allocatesMore
+                    ? "REGRESSED" + (slower ? " (time)" : "") + (allocatesMore ? " (alloc)" : "")
+                    : timeRatio < 1 / limit ? "improved" : "ok";
+                regressed |= slower || allocatesMore;
+
+                Console.WriteLine($"{name,-60} {timeRatio,9:0.00}x {allocation,10}  {status}");
+            }
+
+            Console.WriteLine(regressed ? "Benchmarks regressed against the baseline" : "No regressions against the baseline");
+            return regressed;
+        }
+
+        private static BaselineFile? Load(string path)
+        {
+            if (!File.Exists(path)) return null;
+            return JsonSerializer.Deserialize<BaselineFile>(File.ReadAllText(path), JsonOptions);
+        }
+    }
+}
@@ -0,0 +1,72 @@
+using BenchmarkDotNet.Attributes;
+using DocLayer.Core;
+
+namespace DocLayer.Benchmarks
+{
+    /// <summary>
+    /// Save time against output size for each package compression setting, on a RenderDeck of N text
+    /// slides that each carry a picture. The pictures are random bytes, which deflate cannot shrink,
+    /// like real PNG and JPEG data. The output size of each setting is printed in the global setup.
+    /// </summary>
+    [MemoryDiagnoser]
+    public class CompressionBenchmarks
+    {
+        [Params(20, 100)]
+        public int Slides { get; set; }
+
+        [Params("optimal", "fastest", "store", "store_images")]
+        public string Compression { get; set; } = "optimal";
+
+        private readonly List<string> _images = new();
+        private DeckSpec _deck = new();
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            Random random = new Random(42);
+            for (int i = 0; i < 5; i++)
+            {
+                byte[] bytes = new byte[64 * 1024];
+                random.NextBytes(bytes);
+                string path = Path.Combine(Path.GetTempPath(), $"doclayer-bench-{Guid.NewGuid():N}.png");
+                File.WriteAllBytes(path, bytes);
+                _images.Add(path);
+            }
+
+            _deck = new DeckSpec
+            {
+                Compression = Compression == "store_images" ? null : Compression,
+                ImageCompression = Compression == "store_images" ? "store" : null,
+            };
+            for (int i = 0; i < Slides; i++)
+            {
+                _deck.Slides.Add(new SlideSpec
+                {
+                    Title = $"Slide {i + 1}",
+                    Textboxes = { new TextboxSpec { Text = string.Join(" ", Enumerable.Repeat($"Body text for slide {i + 1}.", 20)) } },
+                    Tables = { new TableSpec { Data = Enumerable.Range(0, 10).Select(r => new List<string?> { $"Row {r}", $"{r * i}", $"{r + i}" }).ToList() } },
+                    Pictures = { new PictureSpec { Path = _images[i % _images.Count], Hpos = 7, Vpos = 2, Height = 3, Width = 4 } },
+                });
+            }
+
+            Console.WriteLine($"// {Compression}, {Slides} slides: {Render()} bytes");
+        }
+
+        [Benchmark]
+        public long Render()
+        {
+            using MemoryStream stream = PresentationHelper.RenderDeck(_deck);
+            return stream.Length;
+        }
+
+        [GlobalCleanup]
+        public void Cleanup()
+        {
+            foreach (string path in _images)
+            {
+                File.Delete(path);
+            }
+            _images.Clear();
+        }
+    }
+}
@@ -0,0 +1,49 @@
+using BenchmarkDotNet.Attributes;
+using DocLayer.Core;
+using DocumentFormat.OpenXml.Packaging;
+
+namespace DocLayer.Benchmarks
+{
+    /// <summary>
+    /// Compares building the base package from scratch against cloning it from the template cache
+    /// </summary>
+    [MemoryDiagnoser]
+    public class CreatePresentationBenchmarks
+    {
+        private static readonly List<string> AccentColors = new() { "FF5733", "33FF57", "3357FF", "F3FF33" };
+
+        private readonly PresentationTemplateCache _cache = new();
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            // Populate the cache so the cached benchmark measures steady state
+            _cache.CreatePresentation(new MemoryStream(), true, "Arial", AccentColors).Dispose();
+        }
+
+        [Benchmark(Baseline = true)]
+        public long FromScratch()
+        {
+            using MemoryStream stream = new MemoryStream();
+            using (PresentationDocument presentationDoc = PresentationHelper.CreatePresentation(stream, true))
+            {
+                PresentationBuilder builder = new(presentationDoc);
+                builder.SetPresentationTheme("Arial", AccentColors);
+                builder.CreateTitleSlide("Benchmark", "From scratch");
+            }
+            return stream.Length;
+        }
+
+        [Benchmark]
+        public long FromTemplateCache()
+        {
+            using MemoryStream stream = new MemoryStream();
+            using (PresentationDocument presentationDoc = _cache.CreatePresentation(stream, true, "Arial", AccentColors))
+            {
+                PresentationBuilder builder = new(presentationDoc);
+                builder.CreateTitleSlide("Benchmark", "From template cache");
+            }
+            return stream.Length;
+        }
+    }
+}
@@ -0,0 +1,68 @@
+using System.Diagnostics.Metrics;
+using BenchmarkDotNet.Attributes;
+using DocLayer.Core;
+
+namespace DocLayer.Benchmarks
+{
+    /// <summary>
+    /// Cost of the instrumentation hooks on a small RenderDeck: with nothing listening (the default),
+    /// with a per-call capture as the Python wrapper uses, and with a MeterListener consuming every measurement
+    /// </summary>
+    [MemoryDiagnoser]
+    public class DiagnosticsBenchmarks
+    {
+        private readonly DeckSpec _deck = new DeckSpec
+        {
+            Slides =
+            {
+                new SlideSpec { Title = "Instrumented", Subtitle = "Overhead" },
+                new SlideSpec { Title = "Body", Textboxes = { new TextboxSpec { Text = "Body text" } } },
+            },
+        };
+
+        private MeterListener? _listener;
+
+        [GlobalSetup(Target = nameof(MeterListenerEnabled))]
+        public void StartListener()
+        {
+            _listener = new MeterListener
+            {
+                InstrumentPublished = (instrument, listener) =>
+                {
+                    if (instrument.Meter.Name == DocLayerDiagnostics.SourceName) listener.EnableMeasurementEvents(instrument);
+                },
+            };
+            _listener.SetMeasurementEventCallback<double>((instrument, value, tags, state) => { });
+            _listener.SetMeasurementEventCallback<long>((instrument, value, tags, state) => { });
+            _listener.Start();
+        }
+
+        [GlobalCleanup(Target = nameof(MeterListenerEnabled))]
+        public void StopListener()
+        {
+            _listener?.Dispose();
+        }
+
+        [Benchmark(Baseline = true)]
+        public long Disabled()
+        {
+            using MemoryStream stream = PresentationHelper.RenderDeck(_deck);
+            return stream.Length;
+        }
+
+        [Benchmark]
+        public long PerCallCapture()
+        {
+            using DiagnosticsCapture capture = DocLayerDiagnostics.BeginCapture();
+            using MemoryStream stream = PresentationHelper.RenderDeck(_deck);
+            return capture.BytesWritten;
+        }
+
+        [Benchmark]
+        public long MeterListenerEnabled()
+        {
+            using MemoryStream stream = PresentationHelper.RenderDeck(_deck);
+            return stream.Length;
+        }
+    }
+}
@@ -0,0 +1,65 @@
+using BenchmarkDotNet.Attributes;
+using DocLayer.Core;
+using DocumentFormat.OpenXml.Packaging;
+using OpenXMLExtensions;
+
+namespace DocLayer.Benchmarks
+{
+    /// <summary>
+    /// Puts the same logo on every slide of a SlideCount-slide deck, comparing one image part per slide
+    /// (AddImagePartFromStream) with the content-addressed ImagePartCache. Returns the package size.
+    /// </summary>
+    [MemoryDiagnoser]
+    public class ImagePartCacheBenchmarks
+    {
+        [Params(100, 300)]
+        public int SlideCount { get; set; }
+
+        private string _logoPath = "";
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            // A 256 KB payload behind a PNG signature stands in for a typical logo
+            byte[] logo = new byte[256 * 1024];
+            new Random(42).NextBytes(logo);
+            new byte[] { 0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A }.CopyTo(logo, 0);
+
+            _logoPath = Path.Combine(Path.GetTempPath(), $"doclayer-bench-logo-{Guid.NewGuid():N}.png");
+            File.WriteAllBytes(_logoPath, logo);
+        }
+
+        [GlobalCleanup]
+        public void Cleanup()
+        {
+            File.Delete(_logoPath);
+        }
+
+        [Benchmark(Baseline = true)]
+        public long PartPerSlide()
+        {
+            return Build(slidePart => slidePart.AddImagePartFromStream(File.OpenRead(_logoPath)));
+        }
+
+        [Benchmark]
+        public long SharedPart()
+        {
+            return Build(slidePart => slidePart.GetOrAddImagePartFromFile(_logoPath));
+        }
+
+        private long Build(Func<SlidePart, string> addImage)
+        {
+            using MemoryStream stream = new MemoryStream();
+            using (PresentationDocument presentationDoc = PresentationHelper.CreatePresentation(stream, true))
+            {
+                PresentationBuilder builder = new(presentationDoc);
+                for (int i = 0; i < SlideCount; i++)
+                {
+                    SlidePart slidePart = builder.AddSlide(new SlideSpec { Title = $"Slide {i + 1}" });
+                    slidePart.Slide.AddPicture(addImage(slidePart), 1m, 1m);
+                }
+            }
+            return stream.Length;
+        }
+    }
+}
@@ -0,0 +1,86 @@
+using BenchmarkDotNet.Attributes;
+using OpenXMLExtensions;
+using D = DocumentFormat.OpenXml.Drawing;
+using P = DocumentFormat.OpenXml.Presentation;
+
+namespace DocLayer.Benchmarks
+{
+    /// <summary>
+    /// Lays out a slide of thumbnails with a chain of scale, grid and align operations, comparing the
+    /// per-element collection extensions (each call rewrites every transform) with one LayoutPass
+    /// that writes each transform once
+    /// </summary>
+    [MemoryDiagnoser]
+    public class LayoutPassBenchmarks
+    {
+        [Params(100, 400)]
+        public int Pictures { get; set; }
+
+        private int _columns;
+        private int _rows;
+        private P.Shape _anchor = null!;
+        private List<P.Picture> _pictures = null!;
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            _columns = (int)Math.Ceiling(Math.Sqrt(Pictures));
+            _rows = (Pictures + _columns - 1) / _columns;
+
+            P.ShapeTree shapeTree = new P.ShapeTree();
+            shapeTree.AddRectangle(0, 0, 7, 13);
+            _anchor = shapeTree.Elements<P.Shape>().Last();
+        }
+
+        [IterationSetup]
+        public void CreatePictures()
+        {
+            _pictures = new List<P.Picture>(Pictures);
+            for (int i = 0; i < Pictures; i++)
+            {
+                _pictures.Add(CreatePicture((uint)i + 10, 2_743_200, 1_828_800));
+            }
+        }
+
+        [Benchmark(Baseline = true)]
+        public long CollectionExtensions()
+        {
+            foreach (P.Picture picture in _pictures)
+            {
+                picture.ScaleSizeBy(0.5);
+            }
+            _pictures.DistributeAsGridInShape(_anchor, _columns, _rows);
+            _pictures.AlignLeftToFirst();
+            _pictures.DistributeVertically();
+            _pictures.AlignHorizontalCenters();
+            return _pictures[^1].GetVerticalPosition();
+        }
+
+        [Benchmark]
+        public long LayoutPass()
+        {
+            _pictures.Layout()
+                .ScaleBy(0.5)
+                .Grid(OpenXMLExtensions.LayoutPass.BoundsOf(_anchor), _columns, _rows)
+                .AlignLeftToFirst()
+                .DistributeVertically()
+                .AlignHorizontalCenters()
+                .Commit();
+            return _pictures[^1].GetVerticalPosition();
+        }
+
+        private static P.Picture CreatePicture(uint id, long width, long height)
+        {
+            // A picture without an image part; the layout only reads and writes the transform
+            return new P.Picture(
+                new P.NonVisualPictureProperties(
+                    new P.NonVisualDrawingProperties { Id = id, Name = $"Picture {id}" },
+                    new P.NonVisualPictureDrawingProperties(new D.PictureLocks { NoChangeAspect = true }),
+                    new P.ApplicationNonVisualDrawingProperties()),
+                new P.BlipFill(new D.Blip(), new D.Stretch(new D.FillRectangle())),
+                new P.ShapeProperties(
+                    new D.Transform2D(new D.Offset { X = 0, Y = 0 }, new D.Extents { Cx = width, Cy = height }),
+                    new D.PresetGeometry(new D.AdjustValueList()) { Preset = D.ShapeTypeValues.Rectangle }));
+        }
+    }
+}
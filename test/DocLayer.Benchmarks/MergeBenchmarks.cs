@@ -0,0 +1,105 @@
+using BenchmarkDotNet.Attributes;
+using DocLayer.Core;
+using DocumentFormat.OpenXml.Packaging;
+using OpenXMLExtensions;
+
+namespace DocLayer.Benchmarks
+{
+    /// <summary>
+    /// Merges Decks 10-slide decks (text, a table and a shared picture per slide) into one new presentation
+    /// and saves it once. The baseline copies each slide the XML-string way: a new title layout slide per
+    /// source slide, filled with GetShapesXml/AddShapesByXml and GetPicturesXml/AddPicturesByXml, which
+    /// parses every slide and loses the images. DeckMerger copies slide parts as raw streams and shares
+    /// the master and the image.
+    /// </summary>
+    [MemoryDiagnoser]
+    public class MergeBenchmarks
+    {
+        [Params(10, 100)]
+        public int Decks { get; set; }
+
+        private string _directory = "";
+        private List<string> _paths = new();
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            _directory = Path.Combine(Path.GetTempPath(), $"doclayer-bench-merge-{Guid.NewGuid():N}");
+            Directory.CreateDirectory(_directory);
+
+            string imagePath = Path.Combine(_directory, "image.png");
+            byte[] image = new byte[32 * 1024];
+            new Random(42).NextBytes(image);
+            File.WriteAllBytes(imagePath, image);
+
+            DeckSpec deck = new DeckSpec();
+            for (int i = 0; i < 10; i++)
+            {
+                deck.Slides.Add(new SlideSpec
+                {
+                    Title = $"Slide {i + 1}",
+                    Textboxes = { new TextboxSpec { Text = "Body text for the slide" } },
+                    Tables = { new TableSpec { Data = Enumerable.Range(0, 5).Select(r => Enumerable.Range(0, 4).Select(c => (string?)$"{r},{c}").ToList()).ToList() } },
+                    Pictures = { new PictureSpec { Path = imagePath, Hpos = 8, Vpos = 2, Height = 2, Width = 3 } },
+                });
+            }
+
+            byte[] package;
+            using (MemoryStream stream = PresentationHelper.RenderDeck(deck))
+            {
+                package = stream.ToArray();
+            }
+
+            _paths = new List<string>();
+            for (int i = 0; i < Decks; i++)
+            {
+                string path = Path.Combine(_directory, $"deck{i}.pptx");
+                File.WriteAllBytes(path, package);
+                _paths.Add(path);
+            }
+        }
+
+        [GlobalCleanup]
+        public void Cleanup()
+        {
+            Directory.Delete(_directory, recursive: true);
+        }
+
+        [Benchmark(Baseline = true)]
+        public long XmlStringCopy()
+        {
+            using MemoryStream stream = new MemoryStream();
+            using (PresentationDocument target = PresentationHelper.CreatePresentation(stream, true))
+            {
+                SlideIndex targetSlides = target.GetSlideIndex();
+                foreach (string path in _paths)
+                {
+                    using PresentationDocument source = PresentationDocument.Open(path, false);
+                    foreach (SlidePart sourceSlide in source.GetSlideIndex().SlideParts)
+                    {
+                        SlidePart slidePart = targetSlides.AppendTitleLayoutSlide();
+                        slidePart.Slide.AddShapesByXml(sourceSlide.Slide.GetShapesXml());
+                        slidePart.Slide.AddPicturesByXml(sourceSlide.Slide.GetPicturesXml());
+                    }
+                }
+            }
+            return stream.Length;
+        }
+
+        [Benchmark]
+        public long PartCopy()
+        {
+            using MemoryStream stream = new MemoryStream();
+            using (PresentationDocument target = PresentationHelper.CreatePresentation(stream, true))
+            {
+                DeckMerger merger = new DeckMerger(target);
+                foreach (string path in _paths)
+                {
+                    using PresentationDocument source = PresentationDocument.Open(path, false);
+                    merger.AppendPresentation(source);
+                }
+            }
+            return stream.Length;
+        }
+    }
+}
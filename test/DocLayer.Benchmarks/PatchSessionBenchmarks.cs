@@ -0,0 +1,91 @@
+using BenchmarkDotNet.Attributes;
+using DocLayer.Core;
+using DocumentFormat.OpenXml.Packaging;
+using OpenXMLExtensions;
+using D = DocumentFormat.OpenXml.Drawing;
+
+namespace DocLayer.Benchmarks
+{
+    /// <summary>
+    /// Refreshes one title and one table cell in an image-heavy deck (a distinct 32 KB image on every slide)
+    /// and saves it to a new file. The baseline opens the package with the SDK, edits the DOM and saves;
+    /// DeckPatchSession parses only the two slides and copies every other entry without recompressing it.
+    /// </summary>
+    [MemoryDiagnoser]
+    public class PatchSessionBenchmarks
+    {
+        // 1x1 red PNG
+        private static readonly byte[] RedPng = Convert.FromBase64String(
+            "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR4nGP4z8DwHwAFAAH/iZk9HQAAAABJRU5ErkJggg==");
+
+        [Params(100, 500)]
+        public int Slides { get; set; }
+
+        private string _directory = "";
+        private string _source = "";
+        private string _output = "";
+        private int _target;
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            _directory = Path.Combine(Path.GetTempPath(), $"doclayer-patch-bench-{Guid.NewGuid():N}");
+            Directory.CreateDirectory(_directory);
+            _source = Path.Combine(_directory, "source.pptx");
+            _output = Path.Combine(_directory, "patched.pptx");
+            _target = Slides / 2;
+
+            // Random bytes after IEND keep each image distinct and incompressible
+            Random random = new Random(42);
+            DeckSpec deck = new DeckSpec();
+            for (int i = 0; i < Slides; i++)
+            {
+                byte[] image = new byte[RedPng.Length + 32 * 1024];
+                RedPng.CopyTo(image, 0);
+                random.NextBytes(image.AsSpan(RedPng.Length));
+                string imagePath = Path.Combine(_directory, $"image{i}.png");
+                File.WriteAllBytes(imagePath, image);
+
+                deck.Slides.Add(new SlideSpec
+                {
+                    Title = $"Region {i}",
+                    Tables = { new TableSpec { Data = new List<List<string?>> { new() { "Metric", "Value" }, new() { "Revenue", "1.0" } } } },
+                    Pictures = { new PictureSpec { Path = imagePath, Hpos = 6, Vpos = 2, Height = 3, Width = 3 } },
+                });
+            }
+
+            using MemoryStream stream = PresentationHelper.RenderDeck(deck);
+            File.WriteAllBytes(_source, stream.ToArray());
+        }
+
+        [GlobalCleanup]
+        public void Cleanup()
+        {
+            Directory.Delete(_directory, true);
+        }
+
+        [Benchmark(Baseline = true)]
+        public long OpenEditSave()
+        {
+            File.Copy(_source, _output, true);
+            using (PresentationDocument presentationDoc = PresentationDocument.Open(_output, true))
+            {
+                presentationDoc.GetSlide(_target).SetTitleText("Refreshed");
+                presentationDoc.GetSlide(_target + 1).Descendants<D.Table>().First().SetTextToCell("2.5", 2, 2);
+            }
+            return new FileInfo(_output).Length;
+        }
+
+        [Benchmark]
+        public long PatchSession()
+        {
+            using (DeckPatchSession session = DeckPatchSession.Open(_source))
+            {
+                session.SetTitleText(_target, "Refreshed");
+                session.SetTableCell(_target + 1, 2, 2, "2.5");
+                session.Commit(_output);
+            }
+            return new FileInfo(_output).Length;
+        }
+    }
+}
@@ -0,0 +1,56 @@
+using BenchmarkDotNet.Attributes;
+using OpenXMLExtensions;
+using D = DocumentFormat.OpenXml.Drawing;
+using P = DocumentFormat.OpenXml.Presentation;
+
+namespace DocLayer.Benchmarks
+{
+    /// <summary>
+    /// Lays out N pictures as a square grid inside an anchor rectangle with DistributeAsGridInShape
+    /// </summary>
+    [MemoryDiagnoser]
+    public class PictureGridBenchmarks
+    {
+        [Params(4, 16, 64)]
+        public int Pictures { get; set; }
+
+        private int _columns;
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            _columns = (int)Math.Ceiling(Math.Sqrt(Pictures));
+        }
+
+        [Benchmark]
+        public long DistributeAsGridInShape()
+        {
+            P.ShapeTree shapeTree = new P.ShapeTree();
+            shapeTree.AddRectangle(1, 1, 5, 8);
+            P.Shape anchor = shapeTree.Elements<P.Shape>().Last();
+
+            List<P.Picture> pictures = new(Pictures);
+            for (int i = 0; i < Pictures; i++)
+            {
+                pictures.Add(CreatePicture((uint)i + 10, 2_743_200, 1_828_800));
+            }
+
+            pictures.DistributeAsGridInShape(anchor, _columns, (Pictures + _columns - 1) / _columns);
+            return pictures[^1].GetHorizontalPosition();
+        }
+
+        private static P.Picture CreatePicture(uint id, long width, long height)
+        {
+            // A picture without an image part; the layout only reads and writes the transform
+            return new P.Picture(
+                new P.NonVisualPictureProperties(
+                    new P.NonVisualDrawingProperties { Id = id, Name = $"Picture {id}" },
+                    new P.NonVisualPictureDrawingProperties(new D.PictureLocks { NoChangeAspect = true }),
+                    new P.ApplicationNonVisualDrawingProperties()),
+                new P.BlipFill(new D.Blip(), new D.Stretch(new D.FillRectangle())),
+                new P.ShapeProperties(
+                    new D.Transform2D(new D.Offset { X = 0, Y = 0 }, new D.Extents { Cx = width, Cy = height }),
+                    new D.PresetGeometry(new D.AdjustValueList()) { Preset = D.ShapeTypeValues.Rectangle }));
+        }
+    }
+}
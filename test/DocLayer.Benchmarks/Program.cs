@@ -0,0 +1,11 @@
+using BenchmarkDotNet.Reports;
+using BenchmarkDotNet.Running;
+using DocLayer.Benchmarks;
+
+// Run all benchmarks:        dotnet run -c Release
+// Run a subset by filter:    dotnet run -c Release -- --filter *CreatePresentation*
+// Record a baseline:         dotnet run -c Release -- --filter * --save-baseline
+// Check for regressions:     dotnet run -c Release -- --filter * --check-baseline [--threshold 10] [--baseline-path baselines/dotnet.json]
+BaselineOptions options = BaselineOptions.Parse(args);
+IEnumerable<Summary> summaries = BenchmarkSwitcher.FromAssembly(typeof(Program).Assembly).Run(options.BenchmarkArgs);
+return BaselineComparer.Run(options, summaries);
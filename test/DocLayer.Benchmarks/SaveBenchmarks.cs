@@ -0,0 +1,53 @@
+using BenchmarkDotNet.Attributes;
+using DocLayer.Core;
+using DocumentFormat.OpenXml.Packaging;
+
+namespace DocLayer.Benchmarks
+{
+    /// <summary>
+    /// Cost of closing a presentation of N built slides: writing the parts and the zip. Each invocation
+    /// saves a different deck, built in the iteration setup, so only the save is measured.
+    /// </summary>
+    [MemoryDiagnoser]
+    [InvocationCount(1)]
+    public class SaveBenchmarks
+    {
+        [Params(10, 100)]
+        public int Slides { get; set; }
+
+        private MemoryStream _stream = new();
+        private PresentationDocument? _presentationDoc;
+
+        [IterationSetup]
+        public void BuildDeck()
+        {
+            DeckSpec deck = new DeckSpec();
+            for (int i = 0; i < Slides; i++)
+            {
+                deck.Slides.Add(new SlideSpec
+                {
+                    Title = $"Slide {i + 1}",
+                    Textboxes = { new TextboxSpec { Text = "Body text for the slide" } },
+                    Shapes = { new ShapeSpec { Hpos = 1, Vpos = 2, Height = 2, Width = 3, Text = "Shape" } },
+                });
+            }
+
+            _stream = new MemoryStream();
+            _presentationDoc = PresentationHelper.CreatePresentation(_stream, true);
+            new PresentationBuilder(_presentationDoc).BuildDeck(deck);
+        }
+
+        [Benchmark]
+        public long Save()
+        {
+            PresentationHelper.Close(_presentationDoc!, _stream);
+            return _stream.Length;
+        }
+
+        [IterationCleanup]
+        public void DisposeDeck()
+        {
+            _stream.Dispose();
+        }
+    }
+}
@@ -0,0 +1,63 @@
+using BenchmarkDotNet.Attributes;
+using DocLayer.Core;
+using DocumentFormat.OpenXml.Packaging;
+using DocumentFormat.OpenXml.Presentation;
+using OpenXMLExtensions;
+
+namespace DocLayer.Benchmarks
+{
+    /// <summary>
+    /// Builds a dense slide and looks every shape up by name, comparing a per-lookup scan of the tree
+    /// with the registry-backed GetShape
+    /// </summary>
+    [MemoryDiagnoser]
+    public class ShapeRegistryBenchmarks
+    {
+        [Params(100, 500)]
+        public int ShapeCount { get; set; }
+
+        [Benchmark(Baseline = true)]
+        public int ScanPerLookup()
+        {
+            return BuildAndLookUp((slide, name) =>
+            {
+                // What GetShape did before the registry: index the whole tree on every call
+                Dictionary<string, Shape> shapes = new();
+                foreach (Shape shape in slide.CommonSlideData!.ShapeTree!.Elements<Shape>())
+                {
+                    shapes.Add(shape.GetName(), shape);
+                }
+                return shapes[name];
+            });
+        }
+
+        [Benchmark]
+        public int Registry()
+        {
+            return BuildAndLookUp((slide, name) => slide.GetShape(name));
+        }
+
+        private int BuildAndLookUp(Func<Slide, string, Shape> lookUp)
+        {
+            using MemoryStream stream = new MemoryStream();
+            using PresentationDocument presentationDoc = PresentationHelper.CreatePresentation(stream, true);
+
+            PresentationBuilder builder = new(presentationDoc);
+            Slide slide = builder.AddSlide(new SlideSpec { Title = "Dense slide" }).Slide;
+            ShapeTree shapeTree = slide.CommonSlideData!.ShapeTree!;
+
+            for (int i = 0; i < ShapeCount; i++)
+            {
+                shapeTree.AddRectangle(i % 10, i / 10 % 5, 1, 1);
+            }
+
+            int found = 0;
+            for (int i = 0; i < ShapeCount; i++)
+            {
+                // Title layout slides start with two placeholders, so rectangles are numbered from 3
+                if (lookUp(slide, $"Rectangle {i + 3}") is not null) found++;
+            }
+            return found;
+        }
+    }
+}
@@ -0,0 +1,49 @@
+using BenchmarkDotNet.Attributes;
+using DocumentFormat.OpenXml.Presentation;
+using OpenXMLExtensions;
+
+namespace DocLayer.Benchmarks
+{
+    /// <summary>
+    /// Adds N rectangles or textboxes to an empty shape tree. The tree is not part of a package, so this
+    /// measures element construction and id allocation without any save.
+    /// </summary>
+    [MemoryDiagnoser]
+    public class ShapeTreeBenchmarks
+    {
+        [Params(10, 100, 500)]
+        public int Shapes { get; set; }
+
+        [Benchmark(Baseline = true)]
+        public int AddRectangle()
+        {
+            ShapeTree shapeTree = CreateShapeTree();
+            for (int i = 0; i < Shapes; i++)
+            {
+                shapeTree.AddRectangle(i % 10, i / 10 % 5, 1, 1);
+            }
+            return shapeTree.ChildElements.Count;
+        }
+
+        [Benchmark]
+        public int AddTextbox()
+        {
+            ShapeTree shapeTree = CreateShapeTree();
+            for (int i = 0; i < Shapes; i++)
+            {
+                shapeTree.AddTextbox("Body text", i % 10, i / 10 % 5);
+            }
+            return shapeTree.ChildElements.Count;
+        }
+
+        private static ShapeTree CreateShapeTree()
+        {
+            return new ShapeTree(
+                new NonVisualGroupShapeProperties(
+                    new NonVisualDrawingProperties { Id = 1U, Name = "" },
+                    new NonVisualGroupShapeDrawingProperties(),
+                    new ApplicationNonVisualDrawingProperties()),
+                new GroupShapeProperties());
+        }
+    }
+}
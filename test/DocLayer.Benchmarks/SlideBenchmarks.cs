@@ -0,0 +1,47 @@
+using BenchmarkDotNet.Attributes;
+using DocLayer.Core;
+using DocumentFormat.OpenXml.Packaging;
+using OpenXMLExtensions;
+
+namespace DocLayer.Benchmarks
+{
+    /// <summary>
+    /// Adds N title layout slides to a new presentation, comparing AddTitleLayoutSlide, which saves the
+    /// presentation part after every slide, with AddTitleLayoutSlidePart and a single save
+    /// </summary>
+    [MemoryDiagnoser]
+    public class SlideBenchmarks
+    {
+        [Params(10, 100)]
+        public int Slides { get; set; }
+
+        [Benchmark(Baseline = true)]
+        public long SavePerSlide()
+        {
+            using MemoryStream stream = new MemoryStream();
+            using (PresentationDocument presentationDoc = PresentationHelper.CreatePresentation(stream, true))
+            {
+                for (int i = 1; i <= Slides; i++)
+                {
+                    PresentationHelperMethods.AddTitleLayoutSlide(presentationDoc, i);
+                }
+            }
+            return stream.Length;
+        }
+
+        [Benchmark]
+        public long SingleSave()
+        {
+            using MemoryStream stream = new MemoryStream();
+            using (PresentationDocument presentationDoc = PresentationHelper.CreatePresentation(stream, true))
+            {
+                for (int i = 1; i <= Slides; i++)
+                {
+                    PresentationHelperMethods.AddTitleLayoutSlidePart(presentationDoc, i);
+                }
+                presentationDoc.PresentationPart!.Presentation.Save();
+            }
+            return stream.Length;
+        }
+    }
+}
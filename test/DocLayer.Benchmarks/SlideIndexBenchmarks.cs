@@ -0,0 +1,49 @@
+using BenchmarkDotNet.Attributes;
+using DocLayer.Core;
+using DocumentFormat.OpenXml.Packaging;
+using OpenXMLExtensions;
+
+namespace DocLayer.Benchmarks
+{
+    /// <summary>
+    /// Builds an N-slide deck by rescanning the slide list for every append against the incremental slide index
+    /// </summary>
+    [MemoryDiagnoser]
+    public class SlideIndexBenchmarks
+    {
+        [Params(100, 1000)]
+        public int SlideCount { get; set; }
+
+        [Benchmark(Baseline = true)]
+        public long RescanPerSlide()
+        {
+            using MemoryStream stream = new MemoryStream();
+            using (PresentationDocument presentationDoc = PresentationHelper.CreatePresentation(stream, true))
+            {
+                for (int i = 0; i < SlideCount; i++)
+                {
+                    // Scans the SlideIdList for the max id and insertion point, then saves
+                    PresentationHelperMethods.AddTitleLayoutSlide(presentationDoc, presentationDoc.GetSlideCount());
+                    presentationDoc.GetLastSlide().SetTitleText($"Slide {i + 1}");
+                }
+            }
+            return stream.Length;
+        }
+
+        [Benchmark]
+        public long IndexedAppend()
+        {
+            using MemoryStream stream = new MemoryStream();
+            using (PresentationDocument presentationDoc = PresentationHelper.CreatePresentation(stream, true))
+            {
+                PresentationBuilder builder = new(presentationDoc);
+                for (int i = 0; i < SlideCount; i++)
+                {
+                    builder.AddSlide(new SlideSpec { Title = $"Slide {i + 1}" });
+                }
+                presentationDoc.Save();
+            }
+            return stream.Length;
+        }
+    }
+}
@@ -0,0 +1,64 @@
+using BenchmarkDotNet.Attributes;
+using DocLayer.Core;
+using DocumentFormat.OpenXml.Packaging;
+
+namespace DocLayer.Benchmarks
+{
+    /// <summary>
+    /// Builds a SlideCount-slide deck, comparing BuildDeck, which keeps every slide DOM live until the
+    /// final save, with StreamingDeckWriter, which writes and releases each slide as it is finished
+    /// </summary>
+    [MemoryDiagnoser]
+    public class StreamingDeckBenchmarks
+    {
+        [Params(500, 2000)]
+        public int SlideCount { get; set; }
+
+        private DeckSpec _deck = new();
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            _deck = new DeckSpec();
+            for (int i = 0; i < SlideCount; i++)
+            {
+                _deck.Slides.Add(new SlideSpec
+                {
+                    Title = $"Slide {i + 1}",
+                    Textboxes = { new TextboxSpec { Text = $"Body text for slide {i + 1}", Hpos = 1, Vpos = 2 } },
+                    Shapes = { new ShapeSpec { Type = "rounded_rectangle", Hpos = 6, Vpos = 2, Height = 2, Width = 3, Text = "Callout" } },
+                    Footnote = "Source: generated",
+                });
+            }
+        }
+
+        [Benchmark(Baseline = true)]
+        public int DomBuildDeck()
+        {
+            using MemoryStream stream = new MemoryStream();
+            using (PresentationDocument presentationDoc = PresentationTemplateCache.Shared.CreatePresentation(stream))
+            {
+                PresentationBuilder builder = new(presentationDoc);
+                foreach (SlideSpec slideSpec in _deck.Slides)
+                {
+                    builder.AddSlide(slideSpec);
+                }
+                presentationDoc.Save();
+                return builder.Slides.Count;
+            }
+        }
+
+        [Benchmark]
+        public int StreamingWriter()
+        {
+            using MemoryStream stream = new MemoryStream();
+            using StreamingDeckWriter writer = StreamingDeckWriter.Create(stream);
+            foreach (SlideSpec slideSpec in _deck.Slides)
+            {
+                writer.WriteSlide(slideSpec);
+            }
+            writer.Complete();
+            return writer.SlideCount;
+        }
+    }
+}
@@ -0,0 +1,94 @@
+using BenchmarkDotNet.Attributes;
+using DocLayer.Core;
+using DocumentFormat.OpenXml.Packaging;
+using OpenXMLExtensions;
+using D = DocumentFormat.OpenXml.Drawing;
+using P = DocumentFormat.OpenXml.Presentation;
+
+namespace DocLayer.Benchmarks
+{
+    /// <summary>
+    /// Fills a Rows x Columns table, comparing per-cell writes through a rescanning GetCell, per-cell writes
+    /// through the cached cell index, and a single-pass SetTableData
+    /// </summary>
+    [MemoryDiagnoser]
+    public class TableFillBenchmarks
+    {
+        [Params(50, 200)]
+        public int Rows { get; set; }
+
+        [Params(5, 20)]
+        public int Columns { get; set; }
+
+        private string?[,] _data = new string?[0, 0];
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            _data = new string?[Rows, Columns];
+            for (int row = 0; row < Rows; row++)
+            {
+                for (int col = 0; col < Columns; col++)
+                {
+                    _data[row, col] = (row * Columns + col).ToString();
+                }
+            }
+        }
+
+        [Benchmark(Baseline = true)]
+        public int ScanPerCell()
+        {
+            return Fill(table =>
+            {
+                table.AddRows(Rows - 1);
+                table.AddColumns(Columns - 1);
+                for (int row = 0; row < Rows; row++)
+                {
+                    for (int col = 0; col < Columns; col++)
+                    {
+                        // What GetCell did before the index: walk rows, then cells, on every call
+                        D.TableCell cell = table.Elements<D.TableRow>().ElementAt(row).Elements<D.TableCell>().ElementAt(col);
+                        cell.SetText(_data[row, col]!);
+                    }
+                }
+            });
+        }
+
+        [Benchmark]
+        public int IndexedPerCell()
+        {
+            return Fill(table =>
+            {
+                table.AddRows(Rows - 1);
+                table.AddColumns(Columns - 1);
+                for (int row = 0; row < Rows; row++)
+                {
+                    for (int col = 0; col < Columns; col++)
+                    {
+                        table.SetTextToCell(_data[row, col]!, row + 1, col + 1);
+                    }
+                }
+            });
+        }
+
+        [Benchmark]
+        public int BulkSetTableData()
+        {
+            return Fill(table => table.SetTableData(_data));
+        }
+
+        private int Fill(Action<D.Table> fill)
+        {
+            using MemoryStream stream = new MemoryStream();
+            using PresentationDocument presentationDoc = PresentationHelper.CreatePresentation(stream, true);
+
+            PresentationBuilder builder = new(presentationDoc);
+            P.ShapeTree shapeTree = builder.AddSlide(new SlideSpec { Title = "Table" }).Slide.CommonSlideData!.ShapeTree!;
+            shapeTree.AddTable(1, 1);
+            D.Table table = ((P.GraphicFrame)shapeTree.LastChild!).GetTable();
+
+            fill(table);
+            return table.GetRowCount() * table.GetColumnCount();
+        }
+    }
+}
@@ -0,0 +1,86 @@
+using BenchmarkDotNet.Attributes;
+using DocLayer.Core;
+using DocumentFormat.OpenXml.Packaging;
+using OpenXMLExtensions;
+using D = DocumentFormat.OpenXml.Drawing;
+
+namespace DocLayer.Benchmarks
+{
+    /// <summary>
+    /// Renders one record of a Slides-slide template with three tokens per slide (title, textbox and
+    /// table cell) plus untouched slides. The baseline clones the package and searches every paragraph
+    /// for every token with TryBreakAndGetRunContainingText; DeckTemplate scans the template once and
+    /// only writes the token slides per record.
+    /// </summary>
+    [MemoryDiagnoser]
+    public class TemplateBenchmarks
+    {
+        private static readonly string[] TokenNames = { "name", "account", "balance" };
+
+        [Params(10, 50)]
+        public int Slides { get; set; }
+
+        private byte[] _template = Array.Empty<byte>();
+        private DeckTemplate _compiled = null!;
+        private readonly Dictionary<string, string?> _values = new()
+        {
+            ["name"] = "Ada Lovelace",
+            ["account"] = "ACC-0001",
+            ["balance"] = "1,200.50",
+        };
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            DeckSpec deck = new DeckSpec();
+            for (int i = 0; i < Slides; i++)
+            {
+                deck.Slides.Add(new SlideSpec
+                {
+                    Title = $"Dear {{{{name}}}}, page {i + 1}",
+                    Textboxes = { new TextboxSpec { Text = "Account {{account}}" } },
+                    Tables = { new TableSpec { Data = new List<List<string?>> { new() { "Balance", "{{balance}}" }, new() { "Rate", "2.5%" } } } },
+                });
+                deck.Slides.Add(new SlideSpec { Title = $"Appendix {i + 1}", Textboxes = { new TextboxSpec { Text = "Static text" } } });
+            }
+
+            using (MemoryStream stream = PresentationHelper.RenderDeck(deck))
+            {
+                _template = stream.ToArray();
+            }
+            _compiled = DeckTemplate.Compile(_template);
+        }
+
+        [Benchmark(Baseline = true)]
+        public long SearchAndReplace()
+        {
+            using MemoryStream stream = new MemoryStream();
+            stream.Write(_template, 0, _template.Length);
+            using (PresentationDocument presentationDoc = PresentationDocument.Open(stream, true))
+            {
+                foreach (SlidePart slidePart in presentationDoc.PresentationPart!.SlideParts)
+                {
+                    foreach (D.Paragraph paragraph in slidePart.Slide.Descendants<D.Paragraph>().ToList())
+                    {
+                        foreach (string token in TokenNames)
+                        {
+                            string placeholder = $"{{{{{token}}}}}";
+                            if (paragraph.TryBreakAndGetRunContainingText(placeholder, out D.Run run))
+                            {
+                                run.Text!.Text = _values[token]!;
+                            }
+                        }
+                    }
+                }
+            }
+            return stream.Length;
+        }
+
+        [Benchmark]
+        public long Compiled()
+        {
+            using MemoryStream stream = _compiled.Render(_values);
+            return stream.Length;
+        }
+    }
+}
@@ -0,0 +1,84 @@
+using BenchmarkDotNet.Attributes;
+using DocLayer.Core;
+using DocumentFormat.OpenXml.Packaging;
+using OpenXMLExtensions;
+using D = DocumentFormat.OpenXml.Drawing;
+
+namespace DocLayer.Benchmarks
+{
+    /// <summary>
+    /// Bolds a glossary of Terms terms across a 100-slide deck (title, textbox and table text per slide).
+    /// The baseline calls BoldSelectedText for every term on every paragraph; TermStyler compiles the
+    /// glossary into one matcher and walks each run once.
+    /// </summary>
+    [MemoryDiagnoser]
+    public class TermStylingBenchmarks
+    {
+        private const int Slides = 100;
+
+        [Params(20, 200)]
+        public int Terms { get; set; }
+
+        private byte[] _deck = Array.Empty<byte>();
+        private List<string> _terms = new();
+        private TermStyler _styler = null!;
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            _terms = Enumerable.Range(0, Terms).Select(i => $"metric{i:D3}").ToList();
+
+            DeckSpec deck = new DeckSpec();
+            for (int i = 0; i < Slides; i++)
+            {
+                string a = _terms[i % Terms];
+                string b = _terms[(i * 7 + 3) % Terms];
+                deck.Slides.Add(new SlideSpec
+                {
+                    Title = $"Review of {a} for region {i}",
+                    Textboxes = { new TextboxSpec { Text = $"{b} moved while {a} held; see appendix for unrelated notes" } },
+                    Tables = { new TableSpec { Data = new List<List<string?>> { new() { "Metric", "Value" }, new() { b, "12.4" }, new() { "Other", "3.1" } } } },
+                });
+            }
+
+            using (MemoryStream stream = PresentationHelper.RenderDeck(deck))
+            {
+                _deck = stream.ToArray();
+            }
+            _styler = TermStyler.Compile(_terms.ToDictionary(term => term, _ => new TextStyle { Bold = true }));
+        }
+
+        [Benchmark(Baseline = true)]
+        public long BoldSelectedTextPerTerm()
+        {
+            using MemoryStream stream = new MemoryStream();
+            stream.Write(_deck, 0, _deck.Length);
+            using (PresentationDocument presentationDoc = PresentationDocument.Open(stream, true))
+            {
+                foreach (SlidePart slidePart in presentationDoc.PresentationPart!.SlideParts)
+                {
+                    foreach (D.Paragraph paragraph in slidePart.Slide.Descendants<D.Paragraph>().ToList())
+                    {
+                        foreach (string term in _terms)
+                        {
+                            paragraph.BoldSelectedText(term);
+                        }
+                    }
+                }
+            }
+            return stream.Length;
+        }
+
+        [Benchmark]
+        public long CompiledMatcher()
+        {
+            using MemoryStream stream = new MemoryStream();
+            stream.Write(_deck, 0, _deck.Length);
+            using (PresentationDocument presentationDoc = PresentationDocument.Open(stream, true))
+            {
+                _styler.Apply(presentationDoc);
+            }
+            return stream.Length;
+        }
+    }
+}
@@ -0,0 +1,95 @@
+using BenchmarkDotNet.Attributes;
+using DocLayer.Core;
+using DocumentFormat.OpenXml.Packaging;
+using DocumentFormat.OpenXml.Presentation;
+using System.Text;
+using D = DocumentFormat.OpenXml.Drawing;
+
+namespace DocLayer.Benchmarks
+{
+    /// <summary>
+    /// Extracts text from a corpus of FileCount 20-slide decks. Times are reported per file
+    /// (OperationsPerInvoke), so files/sec is 1 / Mean. The baseline loads each slide DOM the way
+    /// GetSlideIdAndText does; the extractor streams parts with OpenXmlReader, sequentially and in parallel.
+    /// </summary>
+    [MemoryDiagnoser]
+    public class TextExtractionBenchmarks
+    {
+        private const int FileCount = 64;
+
+        private string _directory = "";
+        private List<string> _paths = new();
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            _directory = Path.Combine(Path.GetTempPath(), $"doclayer-bench-extract-{Guid.NewGuid():N}");
+            Directory.CreateDirectory(_directory);
+
+            DeckSpec deck = new DeckSpec();
+            for (int i = 0; i < 20; i++)
+            {
+                deck.Slides.Add(new SlideSpec
+                {
+                    Title = $"Slide {i + 1}",
+                    Textboxes = { new TextboxSpec { Text = "Body text for the slide" } },
+                    Tables = { new TableSpec { Data = Enumerable.Range(0, 10).Select(r => Enumerable.Range(0, 5).Select(c => (string?)$"{r},{c}").ToList()).ToList() } },
+                    Footnote = "Source: generated",
+                });
+            }
+
+            byte[] package;
+            using (MemoryStream stream = PresentationHelper.RenderDeck(deck))
+            {
+                package = stream.ToArray();
+            }
+
+            for (int i = 0; i < FileCount; i++)
+            {
+                string path = Path.Combine(_directory, $"deck{i}.pptx");
+                File.WriteAllBytes(path, package);
+                _paths.Add(path);
+            }
+        }
+
+        [GlobalCleanup]
+        public void Cleanup()
+        {
+            Directory.Delete(_directory, recursive: true);
+        }
+
+        [Benchmark(Baseline = true, OperationsPerInvoke = FileCount)]
+        public int DomSequential()
+        {
+            int length = 0;
+            foreach (string path in _paths)
+            {
+                using PresentationDocument presentationDoc = PresentationDocument.Open(path, false);
+                PresentationPart presentationPart = presentationDoc.PresentationPart!;
+                foreach (SlideId slideId in presentationPart.Presentation.SlideIdList!.Elements<SlideId>())
+                {
+                    SlidePart slidePart = (SlidePart)presentationPart.GetPartById(slideId.RelationshipId!);
+                    StringBuilder text = new StringBuilder();
+                    foreach (D.Text t in slidePart.Slide.Descendants<D.Text>())
+                    {
+                        text.Append(t.Text);
+                    }
+                    length += text.Length;
+                }
+            }
+            return length;
+        }
+
+        [Benchmark(OperationsPerInvoke = FileCount)]
+        public int ReaderSequential()
+        {
+            return PresentationTextExtractor.ExtractFiles(_paths, maxDegreeOfParallelism: 1).Sum(deck => deck.Slides.Count);
+        }
+
+        [Benchmark(OperationsPerInvoke = FileCount)]
+        public int ReaderParallel()
+        {
+            return PresentationTextExtractor.ExtractFiles(_paths).Sum(deck => deck.Slides.Count);
+        }
+    }
+}
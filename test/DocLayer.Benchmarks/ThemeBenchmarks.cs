@@ -0,0 +1,34 @@
+using BenchmarkDotNet.Attributes;
+using DocLayer.Core;
+using DocumentFormat.OpenXml.Packaging;
+
+namespace DocLayer.Benchmarks
+{
+    /// <summary>
+    /// Cost of applying fonts and accent colors to the theme of a new presentation, on top of creating it
+    /// </summary>
+    [MemoryDiagnoser]
+    public class ThemeBenchmarks
+    {
+        private static readonly List<string> AccentColors = new() { "FF5733", "33FF57", "3357FF", "F3FF33" };
+
+        [Benchmark(Baseline = true)]
+        public long CreatePresentation()
+        {
+            using MemoryStream stream = new MemoryStream();
+            PresentationHelper.CreatePresentation(stream, true).Dispose();
+            return stream.Length;
+        }
+
+        [Benchmark]
+        public long CreateAndApplyTheme()
+        {
+            using MemoryStream stream = new MemoryStream();
+            using (PresentationDocument presentationDoc = PresentationHelper.CreatePresentation(stream, true))
+            {
+                new PresentationBuilder(presentationDoc).SetPresentationTheme("Arial", AccentColors);
+            }
+            return stream.Length;
+        }
+    }
+}
@@ -0,0 +1,97 @@
+using BenchmarkDotNet.Attributes;
+using DocLayer.Core;
+using DocumentFormat.OpenXml.Packaging;
+using OpenXMLExtensions;
+
+namespace DocLayer.Benchmarks
+{
+    /// <summary>
+    /// Re-themes FileCount 20-slide decks with a font and accent override. Times are reported per file
+    /// (OperationsPerInvoke). The baseline opens the theme presentation, edits its theme and runs
+    /// ApplyThemeToPresentationDocument for every deck; the registry prepares the theme once and applies
+    /// the cached copy sequentially and in parallel.
+    /// </summary>
+    [MemoryDiagnoser]
+    public class ThemeRegistryBenchmarks
+    {
+        private const int FileCount = 32;
+        private static readonly List<string> AccentColors = new() { "FF5733", "33FF57", "3357FF", "F3FF33" };
+
+        private string _directory = "";
+        private string _themePath = "";
+        private byte[] _deck = Array.Empty<byte>();
+        private List<string> _paths = new();
+        private readonly ThemeRegistry _registry = new ThemeRegistry();
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            _directory = Path.Combine(Path.GetTempPath(), $"doclayer-bench-theme-{Guid.NewGuid():N}");
+            Directory.CreateDirectory(_directory);
+
+            _themePath = Path.Combine(_directory, "theme.pptx");
+            PresentationTemplateCache.Shared.CreatePresentation(_themePath).Dispose();
+            _registry.Register("corporate", _themePath, "Georgia", AccentColors);
+
+            DeckSpec deck = new DeckSpec();
+            for (int i = 0; i < 20; i++)
+            {
+                deck.Slides.Add(new SlideSpec { Title = $"Slide {i + 1}", Textboxes = { new TextboxSpec { Text = "Body text" } } });
+            }
+            using (MemoryStream stream = PresentationHelper.RenderDeck(deck))
+            {
+                _deck = stream.ToArray();
+            }
+
+            for (int i = 0; i < FileCount; i++)
+            {
+                _paths.Add(Path.Combine(_directory, $"deck{i}.pptx"));
+            }
+        }
+
+        [IterationSetup]
+        public void ResetDecks()
+        {
+            foreach (string path in _paths)
+            {
+                File.WriteAllBytes(path, _deck);
+            }
+        }
+
+        [GlobalCleanup]
+        public void Cleanup()
+        {
+            Directory.Delete(_directory, recursive: true);
+        }
+
+        [Benchmark(Baseline = true, OperationsPerInvoke = FileCount)]
+        public void ThemeFilePerDeck()
+        {
+            foreach (string path in _paths)
+            {
+                using MemoryStream themeStream = new MemoryStream();
+                using (FileStream file = File.OpenRead(_themePath))
+                {
+                    file.CopyTo(themeStream);
+                }
+                using PresentationDocument themeDoc = PresentationDocument.Open(themeStream, true);
+                new PresentationBuilder(themeDoc).SetPresentationTheme("Georgia", AccentColors);
+
+                using PresentationDocument presentationDoc = PresentationDocument.Open(path, true);
+                PresentationHelperMethods.ApplyThemeToPresentationDocument(presentationDoc, themeDoc);
+            }
+        }
+
+        [Benchmark(OperationsPerInvoke = FileCount)]
+        public void RegistrySequential()
+        {
+            _registry.ApplyToFiles("corporate", _paths, maxDegreeOfParallelism: 1);
+        }
+
+        [Benchmark(OperationsPerInvoke = FileCount)]
+        public void RegistryParallel()
+        {
+            _registry.ApplyToFiles("corporate", _paths);
+        }
+    }
+}
@@ -0,0 +1,109 @@
+using System.Diagnostics;
+using System.Net.Http.Json;
+using System.Text.Json;
+
+// Load test for the doclayer_webapi generation endpoint. Start the API first:
+//   cd src/doclayer_webapi/doclayer_webapi && dotnet run -c Release --launch-profile http
+// then:
+//   dotnet run -c Release -- [--url http://localhost:5245] [--requests 2000] [--concurrency 32] [--distinct 50]
+// --distinct is the number of different specs sent; 0 makes every request unique (no cache hits).
+
+Dictionary<string, string> options = ParseArgs(args);
+string baseUrl = options.GetValueOrDefault("url", "http://localhost:5245").TrimEnd('/');
+int requests = int.Parse(options.GetValueOrDefault("requests", "2000"));
+int concurrency = int.Parse(options.GetValueOrDefault("concurrency", "32"));
+int distinct = int.Parse(options.GetValueOrDefault("distinct", "50"));
+int warmup = int.Parse(options.GetValueOrDefault("warmup", "20"));
+
+using HttpClient client = new HttpClient(new SocketsHttpHandler { MaxConnectionsPerServer = concurrency })
+{
+    BaseAddress = new Uri(baseUrl),
+    Timeout = TimeSpan.FromMinutes(2),
+};
+
+Console.WriteLine($"DocLayer web API load test: {requests} requests, {concurrency} concurrent, " +
+    (distinct > 0 ? $"{distinct} distinct specs" : "all specs unique") + $", against {baseUrl}");
+
+// Warm up connections and the server outside the measured run
+for (int i = 0; i < warmup; i++)
+{
+    await SendAsync(client, -1 - i);
+}
+
+double[] latencies = new double[requests];
+int[] statuses = new int[requests];
+bool[] hits = new bool[requests];
+int next = -1;
+
+Stopwatch total = Stopwatch.StartNew();
+await Task.WhenAll(Enumerable.Range(0, concurrency).Select(async _ =>
+{
+    int index;
+    while ((index = Interlocked.Increment(ref next)) < requests)
+    {
+        long start = Stopwatch.GetTimestamp();
+        (int status, bool hit) = await SendAsync(client, distinct > 0 ? index % distinct : index);
+        latencies[index] = Stopwatch.GetElapsedTime(start).TotalMilliseconds;
+        statuses[index] = status;
+        hits[index] = hit;
+    }
+}));
+total.Stop();
+
+double[] ok = latencies.Where((_, i) => statuses[i] == 200).OrderBy(ms => ms).ToArray();
+Console.WriteLine();
+Console.WriteLine($"Throughput   {requests / total.Elapsed.TotalSeconds,10:F1} req/s   ({total.Elapsed.TotalSeconds:F2} s)");
+if (ok.Length > 0)
+{
+    Console.WriteLine($"Latency      p50 {Percentile(ok, 0.50),8:F2} ms   p90 {Percentile(ok, 0.90),8:F2} ms   " +
+        $"p99 {Percentile(ok, 0.99),8:F2} ms   max {ok[^1],8:F2} ms");
+}
+Console.WriteLine("Status       " + string.Join("   ", statuses.GroupBy(s => s).OrderBy(g => g.Key).Select(g => $"{g.Key}: {g.Count()}")));
+Console.WriteLine($"Cache hits   {hits.Count(h => h)} / {requests}");
+
+JsonElement metrics = await client.GetFromJsonAsync<JsonElement>("/presentations/metrics");
+Console.WriteLine();
+Console.WriteLine("Server metrics");
+foreach (JsonProperty property in metrics.EnumerateObject())
+{
+    Console.WriteLine($"  {property.Name,-24} {property.Value}");
+}
+
+static async Task<(int Status, bool Hit)> SendAsync(HttpClient client, int spec)
+{
+    var body = new Dictionary<string, object?>
+    {
+        ["title"] = $"Load test deck {spec}",
+        ["subtitle"] = "Generated by DocLayer.LoadTest",
+        ["font_name"] = spec % 2 == 0 ? "Arial" : null,
+        ["accent_colors"] = new[] { "FF5733", "33FF57", "3357FF", "F3FF33" },
+    };
+
+    try
+    {
+        using HttpResponseMessage response = await client.PostAsJsonAsync("/presentations", body);
+        // Read the whole package so the measurement includes the transfer
+        await response.Content.ReadAsByteArrayAsync();
+        bool hit = response.Headers.TryGetValues("X-Cache", out var values) && values.Contains("HIT");
+        return ((int)response.StatusCode, hit);
+    }
+    catch (HttpRequestException)
+    {
+        return (0, false);
+    }
+}
+
+static double Percentile(double[] sorted, double percentile)
+{
+    return sorted[Math.Min(sorted.Length - 1, (int)(sorted.Length * percentile))];
+}
+
+static Dictionary<string, string> ParseArgs(string[] args)
+{
+    Dictionary<string, string> options = new(StringComparer.OrdinalIgnoreCase);
+    for (int i = 0; i + 1 < args.Length; i += 2)
+    {
+        options[args[i].TrimStart('-')] = args[i + 1];
+    }
+    return options;
+}
@@ -17,6 +17,102 @@ try
     TestTheme.Run();
     Console.WriteLine();
 
+    // Test 3: Template Cache
+    Console.WriteLine("[Test 3] Template Cache");
+    Console.WriteLine(new string('-', 40));
+    TestTemplateCache.Run();
+    Console.WriteLine();
+
+    // Test 4: Deck Spec
+    Console.WriteLine("[Test 4] Deck Spec");
+    Console.WriteLine(new string('-', 40));
+    TestDeckSpec.Run();
+    Console.WriteLine();
+
+    // Test 5: Slide Index
+    Console.WriteLine("[Test 5] Slide Index");
+    Console.WriteLine(new string('-', 40));
+    TestSlideIndex.Run();
+    Console.WriteLine();
+
+    // Test 6: Shape Registry
+    Console.WriteLine("[Test 6] Shape Registry");
+    Console.WriteLine(new string('-', 40));
+    TestShapeRegistry.Run();
+    Console.WriteLine();
+
+    // Test 7: Bulk Table Fill
+    Console.WriteLine("[Test 7] Bulk Table Fill");
+    Console.WriteLine(new string('-', 40));
+    TestTableFill.Run();
+    Console.WriteLine();
+
+    // Test 8: Streaming Deck Writer
+    Console.WriteLine("[Test 8] Streaming Deck Writer");
+    Console.WriteLine(new string('-', 40));
+    TestStreamingDeck.Run();
+    Console.WriteLine();
+
+    // Test 9: Image Part Cache
+    Console.WriteLine("[Test 9] Image Part Cache");
+    Console.WriteLine(new string('-', 40));
+    TestImageCache.Run();
+    Console.WriteLine();
+
+    // Test 10: Text Extraction
+    Console.WriteLine("[Test 10] Text Extraction");
+    Console.WriteLine(new string('-', 40));
+    TestTextExtraction.Run();
+    Console.WriteLine();
+
+    // Test 11: Theme Registry
+    Console.WriteLine("[Test 11] Theme Registry");
+    Console.WriteLine(new string('-', 40));
+    TestThemeRegistry.Run();
+    Console.WriteLine();
+
+    // Test 12: Instrumentation
+    Console.WriteLine("[Test 12] Instrumentation");
+    Console.WriteLine(new string('-', 40));
+    TestDiagnostics.Run();
+    Console.WriteLine();
+
+    // Test 13: Package Compression
+    Console.WriteLine("[Test 13] Package Compression");
+    Console.WriteLine(new string('-', 40));
+    TestPackageCompression.Run();
+    Console.WriteLine();
+
+    // Test 14: Deck Merger
+    Console.WriteLine("[Test 14] Deck Merger");
+    Console.WriteLine(new string('-', 40));
+    TestDeckMerger.Run();
+    Console.WriteLine();
+
+    // Test 15: Deck Template
+    Console.WriteLine("[Test 15] Deck Template");
+    Console.WriteLine(new string('-', 40));
+    TestDeckTemplate.Run();
+    Console.WriteLine();
+
+    // Test 16: Layout Pass
+    Console.WriteLine("[Test 16] Layout Pass");
+    Console.WriteLine(new string('-', 40));
+    TestLayoutPass.Run();
+    Console.WriteLine();
+
+    // Test 17: Term Styler
+    Console.WriteLine("[Test 17] Term Styler");
+    Console.WriteLine(new string('-', 40));
+    TestTermStyler.Run();
+    Console.WriteLine();
+
+    // Test 18: Deck Patch Session
+    Console.WriteLine("[Test 18] Deck Patch Session");
+    Console.WriteLine(new string('-', 40));
+    TestDeckPatchSession.Run();
+    Console.WriteLine();
+
     Console.WriteLine("\n" + "=".PadRight(50, '='));
     Console.WriteLine("✓ All tests completed successfully!");
 }
@@ -0,0 +1,142 @@
+using DocumentFormat.OpenXml.Packaging;
+using OpenXMLExtensions;
+using D = DocumentFormat.OpenXml.Drawing;
+using P = DocumentFormat.OpenXml.Presentation;
+
+namespace DocLayer.Core.Examples
+{
+    public class TestDeckMerger
+    {
+        // 1x1 red PNG
+        private static readonly byte[] RedPng = Convert.FromBase64String(
+            "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR4nGP4z8DwHwAFAAH/iZk9HQAAAABJRU5ErkJggg==");
+
+        public static void Run()
+        {
+            string directory = Path.Combine(Path.GetTempPath(), $"doclayer-merge-{Guid.NewGuid():N}");
+            Directory.CreateDirectory(directory);
+            try
+            {
+                string imagePath = Path.Combine(directory, "red.png");
+                File.WriteAllBytes(imagePath, RedPng);
+
+                // Two decks on the default theme and two on an Arial theme, all using the same image
+                List<string> paths = new();
+                for (int i = 0; i < 4; i++)
+                {
+                    DeckSpec deck = new DeckSpec
+                    {
+                        FontName = i % 2 == 0 ? null : "Arial",
+                        Slides =
+                        {
+                            new SlideSpec { Title = $"Deck {i}", Subtitle = "Cover" },
+                            new SlideSpec
+                            {
+                                Title = "Picture",
+                                Pictures = { new PictureSpec { Path = imagePath, Hpos = 1, Vpos = 2, Height = 2, Width = 2 } },
+                            },
+                        },
+                    };
+                    string path = Path.Combine(directory, $"deck{i}.pptx");
+                    using (MemoryStream stream = PresentationHelper.RenderDeck(deck))
+                    {
+                        File.WriteAllBytes(path, stream.ToArray());
+                    }
+                    paths.Add(path);
+                }
+
+                string merged = Path.Combine(directory, "merged.pptx");
+                int slideCount = DeckMerger.MergeFiles(paths, merged);
+                if (slideCount != 8)
+                {
+                    throw new Exception($"Expected 8 slides, got {slideCount}");
+                }
+
+                using (PresentationDocument presentationDoc = PresentationDocument.Open(merged, false))
+                {
+                    PresentationPart presentationPart = presentationDoc.PresentationPart!;
+                    CheckMerged(presentationPart, expectedMasters: 2);
+
+                    bool copied = presentationPart.SlideParts
+                        .SelectMany(slidePart => slidePart.Slide.Descendants<D.Text>())
+                        .Any(text => text.Text == "Deck 3");
+                    if (!copied)
+                    {
+                        throw new Exception("Slide text was not copied");
+                    }
+                }
+
+                // Destination theme: every slide uses the base deck's layouts
+                string themed = Path.Combine(directory, "themed.pptx");
+                DeckMerger.MergeFiles(paths, themed, LayoutMergeMode.UseDestinationTheme);
+                using (PresentationDocument presentationDoc = PresentationDocument.Open(themed, false))
+                {
+                    CheckMerged(presentationDoc.PresentationPart!, expectedMasters: 1);
+                }
+
+                // Single slides into an open presentation
+                using (MemoryStream stream = new MemoryStream())
+                {
+                    using (PresentationDocument target = PresentationHelper.CreatePresentation(stream, true))
+                    using (PresentationDocument source = PresentationDocument.Open(paths[1], false))
+                    {
+                        DeckMerger merger = new DeckMerger(target);
+                        merger.AppendSlide(source.GetSlideIndex().GetSlidePart(2));
+                        if (merger.SlideCount != 1 || merger.MastersImported != 1)
+                        {
+                            throw new Exception($"Expected 1 slide and 1 imported master, got {merger.SlideCount} and {merger.MastersImported}");
+                        }
+                    }
+
+                    stream.Position = 0;
+                    using PresentationDocument reopened = PresentationDocument.Open(stream, false);
+                    CheckMerged(reopened.PresentationPart!, expectedMasters: 2);
+                }
+
+                Console.WriteLine("✓ 4 decks merged into 8 slides with 2 masters and 1 image part");
+            }
+            finally
+            {
+                Directory.Delete(directory, recursive: true);
+            }
+        }
+
+        private static void CheckMerged(PresentationPart presentationPart, int expectedMasters)
+        {
+            P.Presentation presentation = presentationPart.Presentation;
+            int masters = presentation.SlideMasterIdList!.Elements<P.SlideMasterId>().Count();
+            if (masters != expectedMasters || presentationPart.SlideMasterParts.Count() != expectedMasters)
+            {
+                throw new Exception($"Expected {expectedMasters} slide masters, got {masters}");
+            }
+
+            // Master and layout ids share one id space
+            List<uint> ids = presentation.SlideMasterIdList.Elements<P.SlideMasterId>().Select(id => id.Id!.Value).ToList();
+            foreach (SlideMasterPart master in presentationPart.SlideMasterParts)
+            {
+                ids.AddRange(master.SlideMaster.SlideLayoutIdList!.Elements<P.SlideLayoutId>().Select(id => id.Id!.Value));
+            }
+            if (ids.Distinct().Count() != ids.Count)
+            {
+                throw new Exception("Slide master and layout ids are not unique");
+            }
+
+            HashSet<ImagePart> images = new();
+            foreach (SlidePart slidePart in presentationPart.SlideParts)
+            {
+                if (slidePart.SlideLayoutPart?.SlideMasterPart is null)
+                {
+                    throw new Exception("Slide has no layout");
+                }
+                foreach (D.Blip blip in slidePart.Slide.Descendants<D.Blip>())
+                {
+                    images.Add((ImagePart)slidePart.GetPartById(blip.Embed!.Value!));
+                }
+            }
+            if (images.Count != 1)
+            {
+                throw new Exception($"Expected the image to be stored once, found {images.Count} image parts");
+            }
+        }
+    }
+}
@@ -0,0 +1,98 @@
+using System.IO.Compression;
+using DocumentFormat.OpenXml.Packaging;
+using OpenXMLExtensions;
+using D = DocumentFormat.OpenXml.Drawing;
+
+namespace DocLayer.Core.Examples
+{
+    public class TestDeckPatchSession
+    {
+        public static void Run()
+        {
+            string directory = Path.Combine(Path.GetTempPath(), $"doclayer-patch-{Guid.NewGuid():N}");
+            Directory.CreateDirectory(directory);
+            try
+            {
+                DeckSpec deck = new DeckSpec();
+                for (int i = 1; i <= 5; i++)
+                {
+                    deck.Slides.Add(new SlideSpec
+                    {
+                        Title = $"Slide {i}",
+                        Tables = { new TableSpec { Data = new List<List<string?>> { new() { "Metric", "Value" }, new() { "Revenue", $"{i}.0" } } } },
+                    });
+                }
+
+                string source = Path.Combine(directory, "source.pptx");
+                string output = Path.Combine(directory, "patched.pptx");
+                using (MemoryStream stream = PresentationHelper.RenderDeck(deck))
+                {
+                    File.WriteAllBytes(source, stream.ToArray());
+                }
+
+                int written;
+                HashSet<string> patched;
+                using (DeckPatchSession session = DeckPatchSession.Open(source))
+                {
+                    if (session.SlideCount != 5 || session.LoadedSlideCount != 0)
+                    {
+                        throw new Exception($"Expected 5 unloaded slides, got {session.SlideCount} with {session.LoadedSlideCount} loaded");
+                    }
+
+                    session.SetTitleText(3, "Patched title");
+                    session.SetTableCell(2, 2, 2, "99.9");
+                    session.GetSlide(4); // loaded but left unchanged
+
+                    List<string> modified = session.GetModifiedEntries();
+                    if (session.LoadedSlideCount != 3 || modified.Count != 2)
+                    {
+                        throw new Exception($"Expected 3 loaded and 2 modified slides, got {session.LoadedSlideCount} and {modified.Count}");
+                    }
+                    patched = new HashSet<string>(modified);
+                    written = session.Commit(output);
+                }
+                Console.WriteLine($"✓ Loaded 3 of 5 slides and wrote {written} modified entries");
+
+                using (PresentationDocument presentationDoc = PresentationDocument.Open(output, false))
+                {
+                    string title = presentationDoc.GetSlide(3).CommonSlideData!.ShapeTree!.Descendants<D.Run>().First().Text!.Text;
+                    string cell = presentationDoc.GetSlide(2).Descendants<D.Table>().First().GetCell(2, 2).GetText();
+                    if (title != "Patched title" || cell != "99.9")
+                    {
+                        throw new Exception($"Patched text not found: title '{title}', cell '{cell}'");
+                    }
+                }
+                Console.WriteLine("✓ Patched title and table cell read back through the SDK");
+
+                // Every entry other than the two patched slides keeps its compressed size and content
+                using ZipArchive before = ZipFile.OpenRead(source);
+                using ZipArchive after = ZipFile.OpenRead(output);
+                int unchanged = 0;
+                foreach (ZipArchiveEntry entry in before.Entries)
+                {
+                    ZipArchiveEntry copy = after.GetEntry(entry.FullName) ?? throw new Exception($"{entry.FullName} is missing");
+                    if (patched.Contains(entry.FullName)) continue;
+
+                    if (copy.CompressedLength != entry.CompressedLength || !ReadAll(copy).SequenceEqual(ReadAll(entry)))
+                    {
+                        throw new Exception($"{entry.FullName} was rewritten");
+                    }
+                    unchanged++;
+                }
+                Console.WriteLine($"✓ {unchanged} untouched entries copied byte for byte");
+            }
+            finally
+            {
+                Directory.Delete(directory, true);
+            }
+        }
+
+        private static byte[] ReadAll(ZipArchiveEntry entry)
+        {
+            using Stream stream = entry.Open();
+            using MemoryStream buffer = new MemoryStream();
+            stream.CopyTo(buffer);
+            return buffer.ToArray();
+        }
+    }
+}
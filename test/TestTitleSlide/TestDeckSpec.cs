@@ -0,0 +1,61 @@
+using DocumentFormat.OpenXml.Packaging;
+using OpenXMLExtensions;
+using P = DocumentFormat.OpenXml.Presentation;
+
+namespace DocLayer.Core.Examples
+{
+    public class TestDeckSpec
+    {
+        public static void Run()
+        {
+            string outputPath = "test_outputs\\test_deck_spec.pptx";
+
+            string deckJson = """
+            {
+              "font_name": "Arial",
+              "slides": [
+                { "title": "Deck Spec", "subtitle": "Rendered in one pass" },
+                {
+                  "title": "Details",
+                  "footnote": "Source: test",
+                  "textboxes": [ { "text": "Body text", "hpos": 1, "vpos": 3 } ],
+                  "shapes": [
+                    { "type": "rectangle", "hpos": 6, "vpos": 3, "height": 1, "width": 2, "text": "Callout", "fill": "4472C4" },
+                    { "type": "line", "hpos": 1, "vpos": 5, "height": 0, "width": 8 }
+                  ],
+                  "tables": [ { "data": [ [ "Region", "Q3" ], [ "EMEA", "4.2" ] ] } ]
+                }
+              ]
+            }
+            """;
+
+            using (MemoryStream stream = PresentationHelper.RenderDeck(deckJson))
+            {
+                File.WriteAllBytes(outputPath, stream.ToArray());
+            }
+
+            using (var presentationDoc = PresentationDocument.Open(outputPath, false))
+            {
+                int slideCount = presentationDoc.GetSlideCount();
+                if (slideCount != 2)
+                {
+                    throw new Exception($"Expected 2 slides, found {slideCount}");
+                }
+
+                string slideText = presentationDoc.GetSlide(2).GetSlideText();
+                if (!slideText.Contains("Callout") || !slideText.Contains("Body text"))
+                {
+                    throw new Exception("Deck spec content missing from the second slide");
+                }
+
+                if (!presentationDoc.GetSlide(2).Descendants<P.ConnectionShape>().Any())
+                {
+                    throw new Exception("Line shape missing from the second slide");
+                }
+            }
+
+            Console.WriteLine($"✓ Deck spec rendered successfully: {outputPath}");
+            Console.WriteLine($"✓ File size: {new FileInfo(outputPath).Length} bytes");
+        }
+    }
+}
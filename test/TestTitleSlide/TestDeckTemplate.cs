@@ -0,0 +1,125 @@
+using DocumentFormat.OpenXml.Packaging;
+using D = DocumentFormat.OpenXml.Drawing;
+
+namespace DocLayer.Core.Examples
+{
+    public class TestDeckTemplate
+    {
+        public static void Run()
+        {
+            DeckSpec deck = new DeckSpec
+            {
+                Slides =
+                {
+                    new SlideSpec { Title = "Dear {{name}}", Subtitle = "Statement for {{ period }}" },
+                    new SlideSpec
+                    {
+                        Title = "Balance",
+                        Textboxes = { new TextboxSpec { Text = "Office: {{city}}" } },
+                        Tables = { new TableSpec { Data = new List<List<string?>> { new() { "Account", "Amount" }, new() { "{{account}}", "{{amount}}" } } } },
+                    },
+                    new SlideSpec { Title = "No tokens here" },
+                    new SlideSpec { Title = "Signed {{signer}}" },
+                },
+            };
+
+            byte[] template;
+            using (MemoryStream stream = PresentationHelper.RenderDeck(deck))
+            {
+                // Split "{{city}}" across two runs, as PowerPoint does when formatting changes mid-word
+                using (PresentationDocument presentationDoc = PresentationDocument.Open(stream, true))
+                {
+                    D.Run run = presentationDoc.PresentationPart!.SlideParts
+                        .SelectMany(slidePart => slidePart.Slide.Descendants<D.Run>())
+                        .First(r => r.Text?.Text == "Office: {{city}}");
+                    D.Run tail = (D.Run)run.CloneNode(true);
+                    run.Text!.Text = "Office: {{ci";
+                    tail.Text!.Text = "ty}}";
+                    run.InsertAfterSelf(tail);
+
+                    // Split "{{signer}}" between its braces, so the slide XML never holds "{{"
+                    run = presentationDoc.PresentationPart!.SlideParts
+                        .SelectMany(slidePart => slidePart.Slide.Descendants<D.Run>())
+                        .First(r => r.Text?.Text == "Signed {{signer}}");
+                    tail = (D.Run)run.CloneNode(true);
+                    run.Text!.Text = "Signed {";
+                    tail.Text!.Text = "{signer}}";
+                    run.InsertAfterSelf(tail);
+                }
+                template = stream.ToArray();
+            }
+
+            DeckTemplate compiled = DeckTemplate.Compile(template);
+            string tokens = string.Join(",", compiled.Tokens.OrderBy(token => token));
+            if (tokens != "account,amount,city,name,period,signer" || compiled.TemplatedSlideCount != 3)
+            {
+                throw new Exception($"Unexpected tokens '{tokens}' on {compiled.TemplatedSlideCount} slides");
+            }
+
+            using (MemoryStream rendered = compiled.Render(new Dictionary<string, string?>
+            {
+                ["name"] = "Ada & <Co>",
+                ["period"] = "Q3",
+                ["city"] = "Zürich",
+                ["account"] = "ACC-1",
+                ["amount"] = "42.00",
+                ["signer"] = "Grace",
+            }))
+            {
+                string text = ReadText(rendered);
+                foreach (string expected in new[] { "Dear Ada & <Co>", "Statement for Q3", "Office: Zürich", "ACC-1", "42.00", "No tokens here", "Signed Grace" })
+                {
+                    if (!text.Contains(expected))
+                    {
+                        throw new Exception($"Rendered deck is missing '{expected}'");
+                    }
+                }
+                if (text.Contains("{{"))
+                {
+                    throw new Exception("Rendered deck still contains a token");
+                }
+            }
+
+            // Records rendered in parallel; a missing value renders as empty text
+            string directory = Path.Combine(Path.GetTempPath(), $"doclayer-template-{Guid.NewGuid():N}");
+            Directory.CreateDirectory(directory);
+            try
+            {
+                List<TemplateRecord> records = Enumerable.Range(0, 50).Select(i => new TemplateRecord
+                {
+                    Output = Path.Combine(directory, $"customer{i}.pptx"),
+                    Values = { ["name"] = $"Customer {i}", ["amount"] = $"{i * 10}" },
+                }).ToList();
+                records.Add(new TemplateRecord { Output = Path.Combine(directory, "missing", "bad.pptx") });
+
+                List<TemplateRenderResult> results = compiled.RenderFiles(records, maxDegreeOfParallelism: 4);
+                if (results.Take(50).Any(result => !result.Ok) || results[50].Ok)
+                {
+                    throw new Exception("Unexpected per-record results");
+                }
+
+                using (FileStream stream = File.OpenRead(records[7].Output))
+                {
+                    string text = ReadText(stream);
+                    if (!text.Contains("Dear Customer 7") || !text.Contains("70") || text.Contains("{{"))
+                    {
+                        throw new Exception("Record 7 was not rendered");
+                    }
+                }
+            }
+            finally
+            {
+                Directory.Delete(directory, recursive: true);
+            }
+
+            Console.WriteLine($"✓ Compiled {compiled.Tokens.Count} tokens on {compiled.TemplatedSlideCount} slides and rendered 50 records");
+        }
+
+        private static string ReadText(Stream stream)
+        {
+            using PresentationDocument presentationDoc = PresentationDocument.Open(stream, false);
+            return string.Join("\n", presentationDoc.PresentationPart!.SlideParts
+                .Select(slidePart => string.Concat(slidePart.Slide.Descendants<D.Text>().Select(text => text.Text))));
+        }
+    }
+}
@@ -0,0 +1,78 @@
+using System.Diagnostics.Metrics;
+
+namespace DocLayer.Core.Examples
+{
+    public class TestDiagnostics
+    {
+        public static void Run()
+        {
+            DeckSpec deck = new DeckSpec
+            {
+                FontName = "Georgia",
+                Slides = { new SlideSpec { Title = "Instrumented", Textboxes = { new TextboxSpec { Text = "Body" } } } },
+            };
+
+            if (DocLayerDiagnostics.IsEnabled)
+            {
+                throw new Exception("Instrumentation should be off without a capture or listener");
+            }
+
+            // Per-call capture, as used by the Python wrapper
+            long length;
+            DiagnosticsCapture capture;
+            using (capture = DocLayerDiagnostics.BeginCapture())
+            {
+                using MemoryStream stream = PresentationHelper.RenderDeck(deck);
+                length = stream.Length;
+            }
+
+            foreach (string phase in new[] { DocLayerDiagnostics.Phases.PackageCreate, DocLayerDiagnostics.Phases.SlideBuild, DocLayerDiagnostics.Phases.Serialize })
+            {
+                if (!capture.Phases.ContainsKey(phase))
+                {
+                    throw new Exception($"Phase {phase} not captured");
+                }
+            }
+            if (capture.BytesWritten != length || capture.PartsWritten == 0)
+            {
+                throw new Exception($"Package size not captured: {capture.BytesWritten} bytes, {capture.PartsWritten} parts");
+            }
+            if (DocLayerDiagnostics.IsEnabled)
+            {
+                throw new Exception("Disposing the capture should stop instrumentation");
+            }
+
+            // Meter instruments, as seen by an exporter
+            HashSet<string> phases = new();
+            long bytes = 0;
+            using (MeterListener listener = new MeterListener())
+            {
+                listener.InstrumentPublished = (instrument, l) =>
+                {
+                    if (instrument.Meter.Name == DocLayerDiagnostics.SourceName) l.EnableMeasurementEvents(instrument);
+                };
+                listener.SetMeasurementEventCallback<double>((instrument, value, tags, state) =>
+                {
+                    foreach (KeyValuePair<string, object?> tag in tags)
+                    {
+                        if (tag.Key == "phase") lock (phases) phases.Add((string)tag.Value!);
+                    }
+                });
+                listener.SetMeasurementEventCallback<long>((instrument, value, tags, state) =>
+                {
+                    if (instrument.Name == "doclayer.bytes_written") Interlocked.Add(ref bytes, value);
+                });
+                listener.Start();
+
+                PresentationHelper.RenderDeck(deck).Dispose();
+            }
+
+            if (!phases.Contains(DocLayerDiagnostics.Phases.SlideBuild) || !phases.Contains(DocLayerDiagnostics.Phases.Serialize) || bytes == 0)
+            {
+                throw new Exception("Meter instruments not recorded");
+            }
+
+            Console.WriteLine($"✓ Captured {capture.Phases.Count} phases, {capture.BytesWritten} bytes in {capture.PartsWritten} parts; meter recorded {phases.Count} phases");
+        }
+    }
+}
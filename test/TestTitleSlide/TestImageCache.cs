@@ -0,0 +1,125 @@
+using System.Net;
+using DocumentFormat.OpenXml.Packaging;
+using InternalUtilities.Files;
+using OpenXMLExtensions;
+
+namespace DocLayer.Core.Examples
+{
+    public class TestImageCache
+    {
+        // 1x1 PNG images, one red and one blue
+        private static readonly byte[] RedPng = Convert.FromBase64String(
+            "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR4nGP4z8DwHwAFAAH/iZk9HQAAAABJRU5ErkJggg==");
+        private static readonly byte[] BluePng = Convert.FromBase64String(
+            "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR4nGNgYPj/HwADAgH/5ncLrgAAAABJRU5ErkJggg==");
+
+        public static void Run()
+        {
+            const int slideCount = 50;
+
+            int requests = 0;
+            using HttpListener server = StartServer(path =>
+            {
+                Interlocked.Increment(ref requests);
+                return path.StartsWith("/blue") ? BluePng : RedPng;
+            }, out string baseUrl);
+
+            string cacheDir = Path.Combine(Path.GetTempPath(), $"doclayer-test-cache-{Guid.NewGuid():N}");
+            ImageFetchCache cache = new ImageFetchCache(cacheDir, maxBytes: RedPng.Length + BluePng.Length - 1);
+
+            try
+            {
+                using MemoryStream stream = new MemoryStream();
+                using (var presentationDoc = PresentationHelper.CreatePresentation(stream, widescreen: true))
+                {
+                    PresentationBuilder builder = new(presentationDoc);
+                    for (int i = 0; i < slideCount; i++)
+                    {
+                        SlidePart slidePart = builder.AddSlide(new SlideSpec { Title = $"Slide {i + 1}" });
+                        string relId = slidePart.GetOrAddImagePartFromUri(new Uri($"{baseUrl}logo.png"), cache).GetAwaiter().GetResult();
+                        slidePart.Slide.AddPicture(relId, 1m, 1m);
+                    }
+
+                    // Same bytes from another url and from memory reuse the part as well
+                    SlidePart extra = builder.AddSlide(new SlideSpec { Title = "Alias" });
+                    extra.GetOrAddImagePartFromUri(new Uri($"{baseUrl}logo-copy.png"), cache).GetAwaiter().GetResult();
+                    extra.GetOrAddImagePart(RedPng);
+
+                    int distinctImageParts = presentationDoc.PresentationPart!.SlideParts
+                        .SelectMany(slidePart => slidePart.ImageParts).Distinct().Count();
+                    if (distinctImageParts != 1)
+                    {
+                        throw new Exception($"Expected 1 shared image part, found {distinctImageParts}");
+                    }
+                    if (requests != 2 || cache.Hits != slideCount - 1 || cache.SizeBytes != RedPng.Length)
+                    {
+                        throw new Exception($"Expected 2 downloads and {slideCount - 1} hits, got {requests} downloads, {cache.Hits} hits, {cache.SizeBytes} bytes");
+                    }
+
+                    // A second image pushes the cache over its budget and evicts the least recently used one
+                    cache.GetBytesAsync(new Uri($"{baseUrl}blue.png")).GetAwaiter().GetResult();
+                    if (cache.SizeBytes != BluePng.Length)
+                    {
+                        throw new Exception($"Expected the red image to be evicted, cache holds {cache.SizeBytes} bytes");
+                    }
+                    cache.GetBytesAsync(new Uri($"{baseUrl}logo.png")).GetAwaiter().GetResult();
+                    if (requests != 4)
+                    {
+                        throw new Exception($"Evicted image should be downloaded again, got {requests} downloads");
+                    }
+                }
+            }
+            finally
+            {
+                Directory.Delete(cacheDir, recursive: true);
+            }
+
+            Console.WriteLine($"✓ {slideCount} slides share one image part; {requests} downloads");
+        }
+
+        private static HttpListener StartServer(Func<string, byte[]> respond, out string baseUrl)
+        {
+            // Local stand-in for an image host; retry on the rare port collision
+            for (int attempt = 0; ; attempt++)
+            {
+                int port = Random.Shared.Next(20000, 60000);
+                HttpListener listener = new HttpListener();
+                listener.Prefixes.Add($"http://127.0.0.1:{port}/");
+                try
+                {
+                    listener.Start();
+                }
+                catch (HttpListenerException) when (attempt < 10)
+                {
+                    listener.Close();
+                    continue;
+                }
+
+                _ = Task.Run(async () =>
+                {
+                    while (listener.IsListening)
+                    {
+                        HttpListenerContext context;
+                        try
+                        {
+                            context = await listener.GetContextAsync();
+                        }
+                        catch (Exception) when (!listener.IsListening)
+                        {
+                            return;
+                        }
+
+                        byte[] body = respond(context.Request.Url!.AbsolutePath);
+                        context.Response.ContentType = "image/png";
+                        context.Response.ContentLength64 = body.Length;
+                        await context.Response.OutputStream.WriteAsync(body);
+                        context.Response.Close();
+                    }
+                });
+
+                baseUrl = $"http://127.0.0.1:{port}/";
+                return listener;
+            }
+        }
+    }
+}
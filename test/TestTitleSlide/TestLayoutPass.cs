@@ -0,0 +1,103 @@
+using DocumentFormat.OpenXml.Presentation;
+using OpenXMLExtensions;
+using D = DocumentFormat.OpenXml.Drawing;
+
+namespace DocLayer.Core.Examples
+{
+    public class TestLayoutPass
+    {
+        public static void Run()
+        {
+            // The same chain, once through the per-element extensions and once through a layout pass
+            List<Picture> expected = CreatePictures(12);
+            List<Picture> actual = CreatePictures(12);
+
+            foreach (Picture picture in expected)
+            {
+                picture.ScaleSizeBy(0.5);
+            }
+            expected.AlignTopToFirst();
+            expected.DistributeHorizontally();
+            expected.AlignVerticalCenters();
+
+            int written = actual.Layout()
+                .ScaleBy(0.5)
+                .AlignTopToFirst()
+                .DistributeHorizontally()
+                .AlignVerticalCenters()
+                .Commit();
+
+            if (written != actual.Count)
+            {
+                throw new Exception($"Expected {actual.Count} transforms written, got {written}");
+            }
+            AssertSameBoxes(expected, actual);
+            Console.WriteLine($"✓ Chained layout matches the per-element extensions ({written} transforms written once)");
+
+            // Grid matches DistributeAsGridInShape
+            ShapeTree shapeTree = new ShapeTree();
+            shapeTree.AddRectangle(1, 1, 5, 8);
+            Shape anchor = shapeTree.Elements<Shape>().Last();
+
+            expected = CreatePictures(10);
+            actual = CreatePictures(10);
+            expected.DistributeAsGridInShape(anchor, 4, 3);
+            actual.Layout().Grid(LayoutPass.BoundsOf(anchor), 4, 3).Commit();
+            AssertSameBoxes(expected, actual);
+
+            LayoutBox bounds = LayoutPass.BoundsOf(anchor);
+            foreach (Picture picture in actual)
+            {
+                LayoutBox box = LayoutPass.BoundsOf(picture);
+                if (box.X < bounds.X || box.Right > bounds.Right || box.Y < bounds.Y || box.Bottom > bounds.Bottom)
+                {
+                    throw new Exception($"{picture.GetName()} is outside the grid bounds");
+                }
+            }
+            Console.WriteLine("✓ Grid matches DistributeAsGridInShape and stays inside the anchor");
+
+            // Untouched elements are not rewritten
+            LayoutPass pass = actual.Layout().AlignLeftToFirst();
+            int moved = actual.Count(picture => picture.GetHorizontalPosition() != actual[0].GetHorizontalPosition());
+            if (pass.Commit() != moved || pass.Commit() != 0)
+            {
+                throw new Exception("Commit should only write the elements whose box changed");
+            }
+            Console.WriteLine($"✓ Commit writes only changed transforms ({moved} of {actual.Count})");
+        }
+
+        private static void AssertSameBoxes(List<Picture> expected, List<Picture> actual)
+        {
+            for (int i = 0; i < expected.Count; i++)
+            {
+                LayoutBox want = LayoutPass.BoundsOf(expected[i]);
+                LayoutBox got = LayoutPass.BoundsOf(actual[i]);
+                if (want != got)
+                {
+                    throw new Exception($"Picture {i}: expected {want}, got {got}");
+                }
+            }
+        }
+
+        private static List<Picture> CreatePictures(int count)
+        {
+            List<Picture> pictures = new(count);
+            for (int i = 0; i < count; i++)
+            {
+                uint id = (uint)i + 10;
+                pictures.Add(new Picture(
+                    new NonVisualPictureProperties(
+                        new NonVisualDrawingProperties { Id = id, Name = $"Picture {id}" },
+                        new NonVisualPictureDrawingProperties(new D.PictureLocks { NoChangeAspect = true }),
+                        new ApplicationNonVisualDrawingProperties()),
+                    new BlipFill(new D.Blip(), new D.Stretch(new D.FillRectangle())),
+                    new ShapeProperties(
+                        new D.Transform2D(
+                            new D.Offset { X = 457_200L * i, Y = 228_600L * (i % 3) },
+                            new D.Extents { Cx = 2_743_200L + 91_440L * i, Cy = 1_828_800L }),
+                        new D.PresetGeometry(new D.AdjustValueList()) { Preset = D.ShapeTypeValues.Rectangle })));
+            }
+            return pictures;
+        }
+    }
+}
@@ -0,0 +1,119 @@
+using System.IO.Compression;
+using DocumentFormat.OpenXml.Packaging;
+
+namespace DocLayer.Core.Examples
+{
+    public class TestPackageCompression
+    {
+        // 1x1 red PNG
+        private static readonly byte[] RedPng = Convert.FromBase64String(
+            "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR4nGP4z8DwHwAFAAH/iZk9HQAAAABJRU5ErkJggg==");
+
+        public static void Run()
+        {
+            string imagePath = Path.Combine(Path.GetTempPath(), $"doclayer-test-{Guid.NewGuid():N}.png");
+            File.WriteAllBytes(imagePath, RedPng);
+
+            try
+            {
+                DeckSpec deck = new DeckSpec
+                {
+                    FontName = "Arial",
+                    Slides =
+                    {
+                        new SlideSpec { Title = "Compression", Subtitle = "Store" },
+                        new SlideSpec
+                        {
+                            Title = "Picture",
+                            Textboxes = { new TextboxSpec { Text = string.Join(" ", Enumerable.Repeat("Body text", 50)) } },
+                            Pictures = { new PictureSpec { Path = imagePath, Hpos = 1, Vpos = 2 } },
+                        },
+                    },
+                };
+
+                // Default: every XML part is deflated
+                long optimalSize = Render(deck, entries =>
+                {
+                    ExpectCompressed(entries["ppt/slides/slide2.xml"], true);
+                    ExpectCompressed(entries["ppt/theme/theme1.xml"], true);
+                });
+
+                // Store: template parts and new parts alike are written uncompressed
+                deck.Compression = "store";
+                long storeSize = Render(deck, entries =>
+                {
+                    ExpectCompressed(entries["ppt/slides/slide2.xml"], false);
+                    ExpectCompressed(entries["ppt/theme/theme1.xml"], false);
+                    ExpectCompressed(entries["ppt/slideMasters/slideMaster1.xml"], false);
+                    ExpectCompressed(MediaEntry(entries), false);
+                });
+
+                // Per-part rule: XML deflated, already-compressed images stored
+                deck.Compression = null;
+                deck.ImageCompression = "store";
+                Render(deck, entries =>
+                {
+                    ExpectCompressed(entries["ppt/slides/slide2.xml"], true);
+                    ExpectCompressed(MediaEntry(entries), false);
+                });
+
+                if (storeSize <= optimalSize)
+                {
+                    throw new Exception($"Stored package ({storeSize} bytes) should be larger than the deflated one ({optimalSize} bytes)");
+                }
+
+                // The builder reports and changes the compression of parts it adds
+                using (MemoryStream stream = new MemoryStream())
+                using (PresentationDocument presentationDoc = PresentationHelper.CreatePresentation(stream, true, PackageCompression.Fastest))
+                {
+                    PresentationBuilder builder = new(presentationDoc);
+                    if (builder.Compression != PackageCompression.Fastest)
+                    {
+                        throw new Exception($"Expected Fastest, got {builder.Compression}");
+                    }
+                    builder.Compression = PackageCompression.Store;
+                }
+
+                try
+                {
+                    PackageCompression.Parse("zip");
+                    throw new Exception("Expected an unknown level to be rejected");
+                }
+                catch (ArgumentException)
+                {
+                }
+
+                Console.WriteLine($"✓ optimal {optimalSize} bytes, store {storeSize} bytes; image rule applied");
+            }
+            finally
+            {
+                File.Delete(imagePath);
+            }
+        }
+
+        private static long Render(DeckSpec deck, Action<Dictionary<string, ZipArchiveEntry>> check)
+        {
+            using MemoryStream stream = PresentationHelper.RenderDeck(deck);
+            using (ZipArchive archive = new ZipArchive(stream, ZipArchiveMode.Read, leaveOpen: true))
+            {
+                check(archive.Entries.ToDictionary(entry => entry.FullName));
+            }
+            return stream.Length;
+        }
+
+        private static ZipArchiveEntry MediaEntry(Dictionary<string, ZipArchiveEntry> entries)
+        {
+            return entries.Values.Single(entry => entry.FullName.StartsWith("ppt/media/"));
+        }
+
+        private static void ExpectCompressed(ZipArchiveEntry entry, bool compressed)
+        {
+            // A stored entry's compressed length equals its length; deflated XML is always smaller
+            bool isCompressed = entry.CompressedLength < entry.Length;
+            if (isCompressed != compressed)
+            {
+                throw new Exception($"{entry.FullName}: expected {(compressed ? "deflated" : "stored")}, got {entry.CompressedLength}/{entry.Length} bytes");
+            }
+        }
+    }
+}
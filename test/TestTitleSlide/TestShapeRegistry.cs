@@ -0,0 +1,57 @@
+using DocumentFormat.OpenXml.Presentation;
+using OpenXMLExtensions;
+using P = DocumentFormat.OpenXml.Presentation;
+
+namespace DocLayer.Core.Examples
+{
+    public class TestShapeRegistry
+    {
+        public static void Run()
+        {
+            const int shapeCount = 300;
+
+            using MemoryStream stream = new MemoryStream();
+            using (var presentationDoc = PresentationHelper.CreatePresentation(stream, widescreen: true))
+            {
+                PresentationBuilder builder = new(presentationDoc);
+                Slide slide = builder.AddSlide(new SlideSpec { Title = "Dense slide" }).Slide;
+                P.ShapeTree shapeTree = slide.CommonSlideData!.ShapeTree!;
+
+                for (int i = 0; i < shapeCount; i++)
+                {
+                    shapeTree.AddRectangle(i % 10, i / 10 % 5, 1, 1);
+                }
+
+                // Deleting a shape must not let the next id collide with an existing one
+                slide.GetShape("Rectangle 10").Remove();
+                shapeTree.AddCircle(1, 1, 1, 1);
+
+                List<uint> ids = shapeTree.Descendants<P.NonVisualDrawingProperties>().Select(p => p.Id!.Value).ToList();
+                if (ids.Distinct().Count() != ids.Count)
+                {
+                    throw new Exception("Duplicate shape ids on the slide");
+                }
+
+                Shape last = slide.GetShape($"Rectangle {shapeCount + 2}");
+                if (last.GetName() != $"Rectangle {shapeCount + 2}")
+                {
+                    throw new Exception("Shape lookup by name returned the wrong shape");
+                }
+
+                // A table and a shape sharing a name are each found by their type
+                shapeTree.AddTable(1, 2);
+                P.GraphicFrame table = (P.GraphicFrame)shapeTree.LastChild!;
+                table.NonVisualGraphicFrameProperties!.NonVisualDrawingProperties!.Name = "Shared name";
+                shapeTree.AddRectangle(1, 1, 1, 1);
+                Shape named = (Shape)shapeTree.LastChild!;
+                named.NonVisualShapeProperties!.NonVisualDrawingProperties!.Name = "Shared name";
+                if (slide.GetShape("Shared name") != named || slide.GetGraphicFrame("Shared name") != table)
+                {
+                    throw new Exception("Elements of different types sharing a name were not both found");
+                }
+            }
+
+            Console.WriteLine($"✓ {shapeCount} shapes added with unique ids and indexed names");
+        }
+    }
+}
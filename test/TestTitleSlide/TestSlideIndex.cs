@@ -0,0 +1,45 @@
+using DocumentFormat.OpenXml.Packaging;
+using DocumentFormat.OpenXml.Presentation;
+using OpenXMLExtensions;
+
+namespace DocLayer.Core.Examples
+{
+    public class TestSlideIndex
+    {
+        public static void Run()
+        {
+            const int slideCount = 200;
+
+            using MemoryStream stream = new MemoryStream();
+            using (var presentationDoc = PresentationHelper.CreatePresentation(stream, widescreen: true))
+            {
+                PresentationBuilder builder = new(presentationDoc);
+                for (int i = 0; i < slideCount; i++)
+                {
+                    builder.AddSlide(new SlideSpec { Title = $"Slide {i + 1}" });
+                }
+                presentationDoc.Save();
+
+                // The index must agree with a fresh scan of the document
+                SlideIndex scanned = presentationDoc.GetSlideIndex();
+                if (builder.Slides.Count != slideCount + 1 || scanned.Count != builder.Slides.Count)
+                {
+                    throw new Exception($"Expected {slideCount + 1} slides, index has {builder.Slides.Count}, document has {scanned.Count}");
+                }
+                if (builder.Slides.LastSlidePart != scanned.LastSlidePart || builder.Slides.MaxSlideId != scanned.MaxSlideId)
+                {
+                    throw new Exception("Slide index is out of sync with the slide list");
+                }
+
+                List<uint> ids = presentationDoc.PresentationPart!.Presentation.SlideIdList!.Elements<SlideId>()
+                    .Select(s => s.Id!.Value).ToList();
+                if (ids.Distinct().Count() != ids.Count)
+                {
+                    throw new Exception("Duplicate slide ids");
+                }
+            }
+
+            Console.WriteLine($"✓ Slide index tracked {slideCount} appended slides");
+        }
+    }
+}
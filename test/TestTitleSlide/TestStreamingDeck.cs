@@ -0,0 +1,65 @@
+using DocumentFormat.OpenXml.Packaging;
+using OpenXMLExtensions;
+
+namespace DocLayer.Core.Examples
+{
+    public class TestStreamingDeck
+    {
+        public static void Run()
+        {
+            const int slideCount = 2000;
+
+            using MemoryStream stream = new MemoryStream();
+            using (StreamingDeckWriter writer = StreamingDeckWriter.Create(stream, widescreen: true, fontName: "Arial"))
+            {
+                for (int i = 0; i < slideCount; i++)
+                {
+                    writer.WriteSlide(new SlideSpec
+                    {
+                        Title = $"Slide {i + 1}",
+                        Shapes = { new ShapeSpec { Type = "rectangle", Hpos = 1, Vpos = 2, Text = $"Item {i + 1}" } },
+                        Footnote = "Source: generated",
+                    });
+                }
+                writer.Complete();
+            }
+
+            stream.Position = 0;
+            using (PresentationDocument presentationDoc = PresentationDocument.Open(stream, false))
+            {
+                SlideIndex slides = presentationDoc.GetSlideIndex();
+                if (slides.Count != slideCount)
+                {
+                    throw new Exception($"Expected {slideCount} slides, found {slides.Count}");
+                }
+
+                // Streamed slides must read back exactly like DOM-saved ones
+                string lastSlideText = slides.LastSlidePart!.Slide.InnerText;
+                if (!lastSlideText.Contains($"Slide {slideCount}") || !lastSlideText.Contains($"Item {slideCount}"))
+                {
+                    throw new Exception("Last slide content was not written");
+                }
+            }
+
+            Console.WriteLine($"✓ {slideCount} slides streamed to the package");
+
+            // A slide failing mid-deck must not leave a truncated file behind
+            string failedPath = "test_outputs\\test_streaming_failed.pptx";
+            try
+            {
+                using StreamingDeckWriter writer = StreamingDeckWriter.Create(failedPath);
+                writer.WriteSlide(new SlideSpec { Title = "Written" });
+                writer.WriteSlide(new SlideSpec { Title = "Broken", Shapes = { new ShapeSpec { Type = "no_such_shape" } } });
+                writer.Complete();
+            }
+            catch (ArgumentException)
+            {
+            }
+            if (File.Exists(failedPath))
+            {
+                throw new Exception("An incomplete deck was saved");
+            }
+            Console.WriteLine("✓ Incomplete deck discarded");
+        }
+    }
+}
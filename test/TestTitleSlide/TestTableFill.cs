@@ -0,0 +1,52 @@
+using OpenXMLExtensions;
+using D = DocumentFormat.OpenXml.Drawing;
+using P = DocumentFormat.OpenXml.Presentation;
+
+namespace DocLayer.Core.Examples
+{
+    public class TestTableFill
+    {
+        public static void Run()
+        {
+            const int numRows = 200;
+            const int numCols = 20;
+
+            using MemoryStream stream = new MemoryStream();
+            using (var presentationDoc = PresentationHelper.CreatePresentation(stream, widescreen: true))
+            {
+                PresentationBuilder builder = new(presentationDoc);
+                P.ShapeTree shapeTree = builder.AddSlide(new SlideSpec { Title = "Large table" }).Slide.CommonSlideData!.ShapeTree!;
+                shapeTree.AddTable(1, 1);
+                D.Table table = ((P.GraphicFrame)shapeTree.LastChild!).GetTable();
+
+                string?[,] data = new string?[numRows, numCols];
+                for (int row = 0; row < numRows; row++)
+                {
+                    for (int col = 0; col < numCols; col++)
+                    {
+                        data[row, col] = row == 0 ? $"Col {col + 1}" : (row * 1000.5 + col).ToString(System.Globalization.CultureInfo.InvariantCulture);
+                    }
+                }
+
+                List<TableColumnFormat?> formats = Enumerable.Repeat<TableColumnFormat?>(
+                    new TableColumnFormat { NumberFormat = "N1", Alignment = "right", Fill = "F2F2F2" }, numCols).ToList();
+                TableCellIndex cells = table.SetTableData(data, formats, headerRows: 1);
+
+                if (table.GetRowCount() != numRows || table.GetColumnCount() != numCols)
+                {
+                    throw new Exception($"Expected {numRows}x{numCols} table, found {table.GetRowCount()}x{table.GetColumnCount()}");
+                }
+                if (cells[2, 3].GetText() != "1,002.5" || table.GetCell(1, 1).GetText() != "Col 1")
+                {
+                    throw new Exception("Cell text or number format not applied");
+                }
+
+                // Follow-up styling goes through the cached index
+                table.SetTextToCell("Total", numRows, 1);
+                cells[numRows, 1].SetFontColorHex("C00000");
+            }
+
+            Console.WriteLine($"✓ {numRows}x{numCols} table filled in one pass");
+        }
+    }
+}
@@ -0,0 +1,50 @@
+using DocumentFormat.OpenXml.Packaging;
+using OpenXMLExtensions;
+
+namespace DocLayer.Core.Examples
+{
+    public class TestTemplateCache
+    {
+        public static void Run()
+        {
+            PresentationTemplateCache cache = new(capacity: 2);
+            List<string> accentColors = new() { "FF5733", "33FF57", "3357FF", "F3FF33" };
+
+            // Two decks with the same theme share one cached template
+            for (int i = 0; i < 2; i++)
+            {
+                using MemoryStream stream = new MemoryStream();
+                using (var presentationDoc = cache.CreatePresentation(stream, true, "Arial", accentColors))
+                {
+                    PresentationBuilder builder = new(presentationDoc);
+                    builder.CreateTitleSlide($"Cached Template {i + 1}", "Cloned from cached bytes");
+                }
+
+                using (var reopened = PresentationDocument.Open(new MemoryStream(stream.ToArray()), false))
+                {
+                    string typeface = reopened.PresentationPart!.SlideMasterParts.First().ThemePart!.Theme
+                        .ThemeElements!.FontScheme!.MajorFont!.LatinFont!.Typeface!;
+                    if (typeface != "Arial")
+                    {
+                        throw new Exception($"Expected Arial theme font, found {typeface}");
+                    }
+                }
+            }
+
+            if (cache.Count != 1)
+            {
+                throw new Exception($"Expected 1 cached template, found {cache.Count}");
+            }
+            Console.WriteLine("✓ Identical themes reuse one template");
+
+            // Least recently used template is evicted past capacity
+            cache.CreatePresentation(new MemoryStream(), true, "Calibri").Dispose();
+            cache.CreatePresentation(new MemoryStream(), true, "Georgia").Dispose();
+            if (cache.Count != 2)
+            {
+                throw new Exception($"Expected 2 cached templates after eviction, found {cache.Count}");
+            }
+            Console.WriteLine("✓ Least recently used template evicted at capacity");
+        }
+    }
+}
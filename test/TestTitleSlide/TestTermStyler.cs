@@ -0,0 +1,85 @@
+using DocumentFormat.OpenXml.Packaging;
+using D = DocumentFormat.OpenXml.Drawing;
+
+namespace DocLayer.Core.Examples
+{
+    public class TestTermStyler
+    {
+        public static void Run()
+        {
+            DeckSpec deck = new DeckSpec
+            {
+                Slides =
+                {
+                    new SlideSpec { Title = "EBITDA and EBIT bridge", Subtitle = "Churn fell as ebitda rose" },
+                    new SlideSpec
+                    {
+                        Title = "Detail",
+                        Textboxes = { new TextboxSpec { Text = "Net churn, gross churn and EBITDA margin" } },
+                        Tables = { new TableSpec { Data = new List<List<string?>> { new() { "Metric", "Value" }, new() { "EBITDA", "12.4" } } } },
+                    },
+                },
+            };
+
+            TermStyler styler = TermStyler.FromJson(
+                "{\"EBITDA\": {\"bold\": true, \"color\": \"#1F4E79\"}, \"EBIT\": {\"italic\": true}, \"churn\": {\"accent_color\": 2}, \"margin\": {\"accent_color\": 5}}");
+            if (styler.TermCount != 4)
+            {
+                throw new Exception($"Expected 4 terms, got {styler.TermCount}");
+            }
+
+            try
+            {
+                TermStyler.FromJson("{\"EBITDA\": {\"accent_color\": 7}}");
+                throw new Exception("Accent color 7 should be rejected");
+            }
+            catch (ArgumentOutOfRangeException)
+            {
+            }
+
+            using MemoryStream stream = PresentationHelper.RenderDeck(deck);
+            using PresentationDocument presentationDoc = PresentationDocument.Open(stream, true);
+
+            int styled = styler.Apply(presentationDoc);
+            // EBITDA x4 (one lower case), EBIT x1, churn x3, margin x1
+            if (styled != 9)
+            {
+                throw new Exception($"Expected 9 occurrences styled, got {styled}");
+            }
+            Console.WriteLine($"✓ Styled {styled} occurrences of {styler.TermCount} terms in one pass");
+
+            List<D.Run> runs = presentationDoc.PresentationPart!.SlideParts
+                .SelectMany(slidePart => slidePart.Slide.Descendants<D.Run>())
+                .ToList();
+
+            List<D.Run> ebitda = runs.Where(run => string.Equals(run.Text?.Text, "EBITDA", StringComparison.OrdinalIgnoreCase)).ToList();
+            if (ebitda.Count != 4 || ebitda.Any(run => run.RunProperties?.Bold?.Value != true
+                || run.RunProperties.GetFirstChild<D.SolidFill>()?.RgbColorModelHex?.Val != "1F4E79"))
+            {
+                throw new Exception("Every EBITDA should be its own bold, colored run");
+            }
+
+            D.Run margin = runs.Single(run => run.Text?.Text == "margin");
+            if (margin.RunProperties?.GetFirstChild<D.SolidFill>()?.SchemeColor?.Val?.Value != D.SchemeColorValues.Accent5)
+            {
+                throw new Exception("margin should use accent color 5");
+            }
+
+            // The longest term wins where terms overlap, so EBITDA is never italic
+            D.Run ebit = runs.Single(run => run.Text?.Text == "EBIT");
+            if (ebit.RunProperties?.Italic?.Value != true || ebitda.Any(run => run.RunProperties!.Italic?.Value == true))
+            {
+                throw new Exception("EBIT should be italic and EBITDA should not");
+            }
+            Console.WriteLine("✓ Overlapping terms resolve to the longest match");
+
+            D.Paragraph title = runs.First(run => run.Text?.Text == "EBITDA").Ancestors<D.Paragraph>().First();
+            string titleText = string.Concat(title.Elements<D.Run>().Select(run => run.Text?.Text));
+            if (titleText != "EBITDA and EBIT bridge" || title.Elements<D.Run>().Count() != 4)
+            {
+                throw new Exception($"Split runs should keep the paragraph text, got '{titleText}'");
+            }
+            Console.WriteLine("✓ Runs split around matches keep the original text");
+        }
+    }
+}
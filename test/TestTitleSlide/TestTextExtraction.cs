@@ -0,0 +1,72 @@
+namespace DocLayer.Core.Examples
+{
+    public class TestTextExtraction
+    {
+        public static void Run()
+        {
+            const int deckCount = 8;
+
+            string directory = Path.Combine(Path.GetTempPath(), $"doclayer-extract-{Guid.NewGuid():N}");
+            Directory.CreateDirectory(directory);
+            try
+            {
+                List<string> paths = new();
+                for (int i = 0; i < deckCount; i++)
+                {
+                    string path = Path.Combine(directory, $"deck{i}.pptx");
+                    DeckSpec deck = new DeckSpec
+                    {
+                        Slides =
+                        {
+                            new SlideSpec { Title = $"Deck {i}", Subtitle = "Overview" },
+                            new SlideSpec
+                            {
+                                Title = "Revenue",
+                                Textboxes = { new TextboxSpec { Text = "Up 12%" } },
+                                Tables = { new TableSpec { Data = new() { new() { "Region", "Q3" }, new() { "EMEA", "4.2" } } } },
+                            },
+                        },
+                    };
+                    using (MemoryStream stream = PresentationHelper.RenderDeck(deck))
+                    {
+                        File.WriteAllBytes(path, stream.ToArray());
+                    }
+                    paths.Add(path);
+                }
+
+                string corrupt = Path.Combine(directory, "corrupt.pptx");
+                File.WriteAllText(corrupt, "not a package");
+                paths.Add(corrupt);
+
+                List<ExtractedDeck> decks = PresentationTextExtractor.ExtractFiles(paths, maxDegreeOfParallelism: 4).ToList();
+                if (decks.Count != deckCount + 1)
+                {
+                    throw new Exception($"Expected {deckCount + 1} records, got {decks.Count}");
+                }
+
+                ExtractedDeck failed = decks.Single(d => d.Path == corrupt);
+                if (failed.Error is null)
+                {
+                    throw new Exception("Corrupt file should be reported on its record");
+                }
+
+                ExtractedDeck first = decks.Single(d => d.Path == paths[0]);
+                ExtractedSlide revenue = first.Slides[1];
+                if (first.Slides.Count != 2 || first.Slides[0].Title != "Deck 0" || !first.Slides[0].Body.Contains("Overview"))
+                {
+                    throw new Exception("Title slide not extracted");
+                }
+                if (revenue.Title != "Revenue" || !revenue.Body.Contains("Up 12%") || revenue.Tables.Single()[1][0] != "EMEA")
+                {
+                    throw new Exception("Body text or table cells not extracted");
+                }
+            }
+            finally
+            {
+                Directory.Delete(directory, recursive: true);
+            }
+
+            Console.WriteLine($"✓ {deckCount} decks extracted in parallel; unreadable file reported");
+        }
+    }
+}
@@ -0,0 +1,90 @@
+using DocumentFormat.OpenXml.Packaging;
+using D = DocumentFormat.OpenXml.Drawing;
+
+namespace DocLayer.Core.Examples
+{
+    public class TestThemeRegistry
+    {
+        public static void Run()
+        {
+            const int deckCount = 6;
+
+            string directory = Path.Combine(Path.GetTempPath(), $"doclayer-theme-{Guid.NewGuid():N}");
+            Directory.CreateDirectory(directory);
+            try
+            {
+                string themePath = Path.Combine(directory, "theme.pptx");
+                PresentationTemplateCache.Shared.CreatePresentation(themePath).Dispose();
+
+                ThemeRegistry registry = new ThemeRegistry();
+                registry.Register("corporate", themePath, fontName: "Georgia",
+                    accentColors: new List<string> { "FF5733", "33FF57", "3357FF", "F3FF33" });
+                if (!registry.Contains("CORPORATE") || registry.Count != 1)
+                {
+                    throw new Exception("Theme not registered");
+                }
+
+                List<string> paths = new();
+                for (int i = 0; i < deckCount; i++)
+                {
+                    string path = Path.Combine(directory, $"deck{i}.pptx");
+                    DeckSpec deck = new DeckSpec
+                    {
+                        Slides =
+                        {
+                            new SlideSpec { Title = $"Deck {i}" },
+                            new SlideSpec { Title = "Details", Textboxes = { new TextboxSpec { Text = "Body" } } },
+                        },
+                    };
+                    using (MemoryStream stream = PresentationHelper.RenderDeck(deck))
+                    {
+                        File.WriteAllBytes(path, stream.ToArray());
+                    }
+                    paths.Add(path);
+                }
+
+                string corrupt = Path.Combine(directory, "corrupt.pptx");
+                File.WriteAllText(corrupt, "not a package");
+                paths.Add(corrupt);
+
+                List<ThemeApplyResult> results = registry.ApplyToFiles("corporate", paths, maxDegreeOfParallelism: 3);
+                if (results.Count != deckCount + 1 || results[deckCount].Ok || results.Take(deckCount).Any(r => !r.Ok))
+                {
+                    throw new Exception("Unexpected per-file results");
+                }
+
+                foreach (string path in paths.Take(deckCount))
+                {
+                    using PresentationDocument presentationDoc = PresentationDocument.Open(path, false);
+                    PresentationPart presentationPart = presentationDoc.PresentationPart!;
+
+                    string? typeface = presentationPart.SlideMasterParts.Single().ThemePart!.Theme
+                        .Descendants<D.MajorFont>().Single().GetFirstChild<D.LatinFont>()?.Typeface;
+                    if (typeface != "Georgia")
+                    {
+                        throw new Exception($"Theme font not applied to {Path.GetFileName(path)}: {typeface}");
+                    }
+                    if (presentationPart.SlideParts.Count() != 2 || presentationPart.SlideParts.Any(s => s.SlideLayoutPart is null))
+                    {
+                        throw new Exception("Slides lost their layouts");
+                    }
+                }
+
+                try
+                {
+                    registry.ApplyToFile("missing", paths[0]);
+                    throw new Exception("Unknown theme name should throw");
+                }
+                catch (KeyNotFoundException)
+                {
+                }
+            }
+            finally
+            {
+                Directory.Delete(directory, recursive: true);
+            }
+
+            Console.WriteLine($"✓ Registered theme applied to {deckCount} decks in parallel; unreadable file reported");
+        }
+    }
+}
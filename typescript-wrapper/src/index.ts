@@ -7,8 +7,22 @@ import { spawn } from 'child_process';
 import { promises as fs } from 'fs';
 import * as path from 'path';
 import * as os from 'os';
+import { DocLayerWorkerPool } from './workerPool';
 
-export interface TitleSlideOptions {
+export { DocLayerWorkerPool, WorkerPoolError } from './workerPool';
+export type { WorkerPoolOptions, WorkerThemeOptions } from './workerPool';
+
+/**
+ * ZIP compression of package parts. 'store' writes them uncompressed: the fastest save and the largest file.
+ */
+export type CompressionLevel = 'optimal' | 'fastest' | 'store' | 'maximum';
+
+export interface CompressionOptions {
+  compression?: CompressionLevel; // Defaults to 'optimal'
+  imageCompression?: CompressionLevel; // PNG, JPEG and GIF parts; defaults to compression
+}
+
+export interface TitleSlideOptions extends CompressionOptions {
   title: string;
   subtitle?: string;
   footnote?: string;
@@ -33,16 +47,22 @@ export class DocLayerError extends Error {
 /**
  * Main DocLayer client for TypeScript/JavaScript applications
  * Uses Python bridge to generate PowerPoint files
+ *
+ * By default each call spawns a Python process. With poolSize set, calls are served by
+ * that many warm worker processes (see DocLayerWorkerPool) instead; call close() when done.
  */
 export class DocLayerClient {
   private pythonPath: string;
   private pythonWrapperPath: string;
   private tempDir: string;
+  private pool?: DocLayerWorkerPool;
 
   constructor(options: {
     pythonPath?: string;
     pythonWrapperPath?: string;
     tempDir?: string;
+    poolSize?: number; // Number of persistent worker processes; omit to spawn Python per call
+    requestTimeoutMs?: number; // Per-request timeout when using worker processes
   } = {}) {
     // Default to system Python
     this.pythonPath = options.pythonPath || 'python';
@@ -52,6 +72,22 @@ export class DocLayerClient {
       path.join(__dirname, '..', '..', 'python-wrapper');
     
     this.tempDir = options.tempDir || os.tmpdir();
+
+    if (options.poolSize) {
+      this.pool = new DocLayerWorkerPool({
+        pythonPath: this.pythonPath,
+        pythonWrapperPath: this.pythonWrapperPath,
+        poolSize: options.poolSize,
+        requestTimeoutMs: options.requestTimeoutMs
+      });
+    }
+  }
+
+  /**
+   * Stop the worker processes, if any; the client cannot be used afterwards
+   */
+  close(): void {
+    this.pool?.close();
   }
 
   /**
@@ -61,9 +97,20 @@ export class DocLayerClient {
     filepath: string,
     options: TitleSlideOptions
   ): Promise<Buffer> {
+    if (this.pool) {
+      const pool = this.pool;
+      return await this._writeFromWorker(filepath, () =>
+        pool.createTitleSlide(options.title, options.subtitle, options.footnote, options)
+      );
+    }
+
     const script = this._generatePythonScript('create_title_slide', {
       filepath,
-      ...options
+      title: options.title,
+      subtitle: options.subtitle,
+      footnote: options.footnote,
+      compression: options.compression,
+      image_compression: options.imageCompression
     });
 
     return await this._executePythonScript(script, filepath);
@@ -83,18 +130,53 @@ export class DocLayerClient {
       }
     }
 
+    if (this.pool) {
+      const pool = this.pool;
+      return await this._writeFromWorker(filepath, () =>
+        pool.createPresentationWithTheme(options.title, {
+          subtitle: options.subtitle,
+          footnote: options.footnote,
+          fontName: options.theme?.fontName,
+          accentColors: options.theme?.accentColors,
+          compression: options.compression,
+          imageCompression: options.imageCompression
+        })
+      );
+    }
+
     const script = this._generatePythonScript('create_presentation_with_theme', {
       filepath,
       title: options.title,
       subtitle: options.subtitle,
       footnote: options.footnote,
       font_name: options.theme?.fontName,
-      accent_colors: options.theme?.accentColors
+      accent_colors: options.theme?.accentColors,
+      compression: options.compression,
+      image_compression: options.imageCompression
     });
 
     return await this._executePythonScript(script, filepath);
   }
 
+  /**
+   * Run a worker pool request and save the returned bytes to filepath
+   */
+  private async _writeFromWorker(filepath: string, request: () => Promise<Buffer>): Promise<Buffer> {
+    let buffer: Buffer;
+    try {
+      buffer = await request();
+    } catch (error: any) {
+      throw new DocLayerError(error.message, 'WORKER_ERROR');
+    }
+
+    try {
+      await fs.writeFile(filepath, buffer);
+    } catch (error) {
+      throw new DocLayerError(`Failed to write output file: ${error}`, 'FILE_WRITE_ERROR');
+    }
+    return buffer;
+  }
+
   /**
    * Generate Python script to call doclayer_python package
    */
@@ -260,10 +342,11 @@ export async function createTitleSlide(
   filepath: string,
   title: string,
   subtitle?: string,
-  footnote?: string
+  footnote?: string,
+  compression?: CompressionOptions
 ): Promise<Buffer> {
   const client = new DocLayerClient();
-  return await client.createTitleSlide(filepath, { title, subtitle, footnote });
+  return await client.createTitleSlide(filepath, { title, subtitle, footnote, ...compression });
 }
 
 /**
@@ -277,6 +360,8 @@ export async function createPresentationWithTheme(
     footnote?: string;
     fontName?: string;
     accentColors?: [string, string, string, string];
+    compression?: CompressionLevel;
+    imageCompression?: CompressionLevel;
   }
 ): Promise<Buffer> {
   const client = new DocLayerClient();
@@ -287,7 +372,9 @@ export async function createPresentationWithTheme(
     theme: {
       fontName: options?.fontName,
       accentColors: options?.accentColors
-    }
+    },
+    compression: options?.compression,
+    imageCompression: options?.imageCompression
   });
 }
 
@@ -0,0 +1,343 @@
+/**
+ * Persistent worker pool for the DocLayer Python bridge.
+ *
+ * Instead of spawning `python -c <script>` per presentation, the pool keeps
+ * N long-lived `python -m doclayer_python.worker` processes, each holding a
+ * warm DocLayerClient, and exchanges length-prefixed frames with them over
+ * stdin/stdout. PPTX bytes come back in the response body; no temp files.
+ */
+
+import { spawn, ChildProcessWithoutNullStreams } from 'child_process';
+import * as path from 'path';
+import type { CompressionLevel, CompressionOptions } from './index';
+
+// Longest wait between restarts of a worker that keeps failing to start
+const MAX_RESTART_BACKOFF_MS = 10000;
+
+// Amount of worker stderr kept to explain a failed start
+const STDERR_TAIL_LENGTH = 2000;
+
+export interface WorkerPoolOptions {
+  /** Path to Python executable (default: "python") */
+  pythonPath?: string;
+  /** Path to the python-wrapper directory, added to PYTHONPATH (for source installations) */
+  pythonWrapperPath?: string;
+  /** Number of worker processes (default: 2) */
+  poolSize?: number;
+  /** Maximum number of requests waiting for a free worker before new requests are rejected (default: 256) */
+  maxQueueSize?: number;
+  /** Per-request timeout in milliseconds; the worker is restarted on timeout (default: 60000) */
+  requestTimeoutMs?: number;
+  /** Delay before restarting a worker that failed to start, doubled on each further failure (default: 100) */
+  restartBackoffMs?: number;
+  /** Consecutive worker start failures after which the pool stops restarting and rejects all requests (default: 5) */
+  maxStartupFailures?: number;
+}
+
+export interface WorkerThemeOptions {
+  subtitle?: string;
+  footnote?: string;
+  fontName?: string;
+  accentColors?: string[];
+  compression?: CompressionLevel;
+  imageCompression?: CompressionLevel;
+}
+
+export class WorkerPoolError extends Error {
+  constructor(message: string) {
+    super(message);
+    this.name = 'WorkerPoolError';
+  }
+}
+
+interface PendingRequest {
+  method: string;
+  params: Record<string, unknown>;
+  resolve: (value: Buffer) => void;
+  reject: (reason: Error) => void;
+}
+
+type ResolvedOptions = Required<Omit<WorkerPoolOptions, 'pythonWrapperPath'>> & { pythonWrapperPath?: string };
+
+class Worker {
+  private child: ChildProcessWithoutNullStreams;
+  private buffer: Buffer = Buffer.alloc(0);
+  private current: PendingRequest | null = null;
+  private timer: NodeJS.Timeout | null = null;
+  private nextId = 1;
+  private closing = false;
+  private exited = false;
+  alive = true;
+  /** Whether the worker has started and answered its startup ping */
+  ready = false;
+  /** Why the worker could not start or run, for the pool's error message */
+  lastError = '';
+
+  constructor(
+    private readonly options: ResolvedOptions,
+    private readonly onIdle: (worker: Worker) => void,
+    private readonly onExit: (worker: Worker) => void
+  ) {
+    const env = { ...process.env };
+    if (options.pythonWrapperPath) {
+      env.PYTHONPATH = [options.pythonWrapperPath, env.PYTHONPATH].filter(Boolean).join(path.delimiter);
+    }
+
+    this.child = spawn(options.pythonPath, ['-m', 'doclayer_python.worker'], { env });
+    this.child.stdout.on('data', (chunk: Buffer) => this.onData(chunk));
+    this.child.stderr.on('data', (chunk: Buffer) => {
+      // Only the tail is kept, to explain a worker that fails to start
+      this.lastError = (this.lastError + chunk.toString('utf8')).slice(-STDERR_TAIL_LENGTH);
+    });
+    // Writing to a worker that has died emits EPIPE here rather than throwing
+    this.child.stdin.on('error', (error: Error) => {
+      this.alive = false;
+      this.fail(new WorkerPoolError(`Failed to send request to worker: ${error.message}`));
+      this.child.kill();
+    });
+    this.child.on('exit', () => this.handleExit());
+    this.child.on('error', (error: Error) => {
+      this.lastError = error.message;
+      this.handleExit();
+    });
+
+    // Requests are dispatched only after the startup ping, so a worker that cannot start fails none of them
+    this.send({
+      method: 'ping',
+      params: {},
+      resolve: () => { this.ready = true; },
+      reject: () => this.child.kill(),
+    });
+  }
+
+  get busy(): boolean {
+    return this.current !== null;
+  }
+
+  send(request: PendingRequest): void {
+    this.current = request;
+    const payload = Buffer.from(JSON.stringify({ id: this.nextId++, method: request.method, params: request.params }), 'utf8');
+    const prefix = Buffer.alloc(4);
+    prefix.writeUInt32BE(payload.length, 0);
+    this.child.stdin.write(Buffer.concat([prefix, payload]));
+
+    this.timer = setTimeout(() => {
+      // Taken out of dispatch before the rejection runs, since a caller may retry from its handler
+      this.alive = false;
+      this.fail(new WorkerPoolError(`Request timed out after ${this.options.requestTimeoutMs} ms`));
+      this.child.kill();
+    }, this.options.requestTimeoutMs);
+  }
+
+  kill(): void {
+    this.closing = true;
+    this.alive = false;
+    this.child.stdin.end();
+    this.child.kill();
+  }
+
+  private onData(chunk: Buffer): void {
+    this.buffer = Buffer.concat([this.buffer, chunk]);
+
+    // Frame: <u32 header length><JSON header><u32 body length><body>
+    if (this.buffer.length < 4) return;
+    const headerLength = this.buffer.readUInt32BE(0);
+    if (this.buffer.length < 4 + headerLength + 4) return;
+    const bodyLength = this.buffer.readUInt32BE(4 + headerLength);
+    const frameLength = 4 + headerLength + 4 + bodyLength;
+    if (this.buffer.length < frameLength) return;
+
+    const header = JSON.parse(this.buffer.subarray(4, 4 + headerLength).toString('utf8'));
+    const body = Buffer.from(this.buffer.subarray(8 + headerLength, frameLength));
+    this.buffer = this.buffer.subarray(frameLength);
+
+    const request = this.finish();
+    if (request) {
+      if (header.ok) {
+        request.resolve(body);
+      } else {
+        request.reject(new WorkerPoolError(header.error ?? 'Unknown worker error'));
+      }
+    }
+    this.onIdle(this);
+  }
+
+  private finish(): PendingRequest | null {
+    if (this.timer) {
+      clearTimeout(this.timer);
+      this.timer = null;
+    }
+    const request = this.current;
+    this.current = null;
+    return request;
+  }
+
+  private fail(error: Error): void {
+    const request = this.finish();
+    request?.reject(error);
+  }
+
+  private handleExit(): void {
+    // A failed spawn can report both 'error' and 'exit'
+    if (this.exited) return;
+    this.exited = true;
+    this.alive = false;
+
+    if (this.closing) {
+      this.fail(new WorkerPoolError('Worker pool was closed'));
+      return;
+    }
+    this.fail(new WorkerPoolError('Worker process exited unexpectedly'));
+    this.onExit(this);
+  }
+}
+
+/**
+ * Pool of warm DocLayer worker processes with request queuing, back-pressure and crash restart.
+ *
+ * A worker takes requests once it has answered a startup ping. A worker that exits after that is
+ * replaced at once; one that exits before (a missing Python, pythonnet or .NET runtime) is restarted
+ * with exponential backoff, and after maxStartupFailures such exits in a row the pool gives up and
+ * rejects every request.
+ */
+export class DocLayerWorkerPool {
+  private readonly options: ResolvedOptions;
+  private readonly workers: Worker[] = [];
+  private readonly queue: PendingRequest[] = [];
+  private readonly restartTimers = new Set<NodeJS.Timeout>();
+  private startupFailures = 0;
+  private failure: WorkerPoolError | null = null;
+  private closed = false;
+
+  constructor(options: WorkerPoolOptions = {}) {
+    this.options = {
+      pythonPath: options.pythonPath ?? 'python',
+      pythonWrapperPath: options.pythonWrapperPath,
+      poolSize: Math.max(1, options.poolSize ?? 2),
+      maxQueueSize: options.maxQueueSize ?? 256,
+      requestTimeoutMs: options.requestTimeoutMs ?? 60000,
+      restartBackoffMs: options.restartBackoffMs ?? 100,
+      maxStartupFailures: Math.max(1, options.maxStartupFailures ?? 5),
+    };
+
+    for (let i = 0; i < this.options.poolSize; i++) {
+      this.workers.push(this.startWorker());
+    }
+  }
+
+  /** Number of requests waiting for a free worker */
+  get queueLength(): number {
+    return this.queue.length;
+  }
+
+  createTitleSlide(title: string, subtitle?: string, footnote?: string, compression: CompressionOptions = {}): Promise<Buffer> {
+    return this.request('create_title_slide', {
+      title,
+      subtitle: subtitle ?? null,
+      footnote: footnote ?? 'Source:',
+      compression: compression.compression ?? null,
+      image_compression: compression.imageCompression ?? null,
+    });
+  }
+
+  createPresentationWithTheme(title: string, options: WorkerThemeOptions = {}): Promise<Buffer> {
+    return this.request('create_presentation_with_theme', {
+      title,
+      subtitle: options.subtitle ?? null,
+      footnote: options.footnote ?? 'Source:',
+      font_name: options.fontName ?? null,
+      accent_colors: options.accentColors ?? null,
+      compression: options.compression ?? null,
+      image_compression: options.imageCompression ?? null,
+    });
+  }
+
+  /** Renders a multi-slide deck spec (snake_case keys, see DocLayerClient.render_deck) in one worker call */
+  renderDeck(deck: Record<string, unknown>): Promise<Buffer> {
+    return this.request('render_deck', { deck });
+  }
+
+  /** Stops all workers; queued requests are rejected */
+  close(): void {
+    this.closed = true;
+    this.shutdown(new WorkerPoolError('Worker pool was closed'));
+  }
+
+  private shutdown(error: WorkerPoolError): void {
+    for (const timer of this.restartTimers) {
+      clearTimeout(timer);
+    }
+    this.restartTimers.clear();
+    for (const request of this.queue.splice(0)) {
+      request.reject(error);
+    }
+    for (const worker of this.workers) {
+      worker.kill();
+    }
+  }
+
+  private request(method: string, params: Record<string, unknown>): Promise<Buffer> {
+    if (this.closed) {
+      return Promise.reject(new WorkerPoolError('Worker pool was closed'));
+    }
+    if (this.failure) {
+      return Promise.reject(this.failure);
+    }
+    if (this.queue.length >= this.options.maxQueueSize) {
+      return Promise.reject(new WorkerPoolError(`Worker pool queue is full (${this.options.maxQueueSize} requests)`));
+    }
+
+    return new Promise<Buffer>((resolve, reject) => {
+      this.queue.push({ method, params, resolve, reject });
+      this.dispatch();
+    });
+  }
+
+  private dispatch(): void {
+    for (const worker of this.workers) {
+      if (this.queue.length === 0) return;
+      if (worker.alive && worker.ready && !worker.busy) {
+        worker.send(this.queue.shift()!);
+      }
+    }
+  }
+
+  private startWorker(): Worker {
+    return new Worker(
+      this.options,
+      () => this.dispatch(),
+      (dead) => this.restartWorker(dead)
+    );
+  }
+
+  private restartWorker(dead: Worker): void {
+    const index = this.workers.indexOf(dead);
+    if (index < 0 || this.closed || this.failure) return;
+
+    let delay = 0;
+    if (dead.ready) {
+      this.startupFailures = 0;
+    } else {
+      this.startupFailures++;
+      if (this.startupFailures >= this.options.maxStartupFailures) {
+        // The last line of a Python traceback names the error
+        const detail = dead.lastError.trim().split('\n').pop() ?? '';
+        this.failure = new WorkerPoolError(
+          `Worker processes failed to start ${this.startupFailures} times in a row` + (detail ? `: ${detail}` : '')
+        );
+        this.shutdown(this.failure);
+        return;
+      }
+      delay = Math.min(this.options.restartBackoffMs * 2 ** (this.startupFailures - 1), MAX_RESTART_BACKOFF_MS);
+    }
+
+    // Replace the worker so the pool keeps its configured size
+    const timer = setTimeout(() => {
+      this.restartTimers.delete(timer);
+      if (this.closed || this.failure) return;
+      this.workers[index] = this.startWorker();
+      this.dispatch();
+    }, delay);
+    this.restartTimers.add(timer);
+  }
+}
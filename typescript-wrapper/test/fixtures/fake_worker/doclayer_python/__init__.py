@@ -0,0 +1 @@
+"""Stand-in for doclayer_python used by the worker pool tests; needs no .NET runtime"""
@@ -0,0 +1,40 @@
+"""
+Fake DocLayer worker speaking the doclayer_python.worker protocol
+
+Answers every request with the title as the body, and exits without a
+response when the title is "crash", to exercise the pool's restart path.
+A title of "sleep" stalls the worker, to exercise the request timeout.
+"""
+
+import json
+import os
+import struct
+import sys
+import time
+
+_LENGTH = struct.Struct(">I")
+
+
+def main() -> None:
+    stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+    while True:
+        prefix = stdin.read(_LENGTH.size)
+        if len(prefix) < _LENGTH.size:
+            return
+        (length,) = _LENGTH.unpack(prefix)
+        request = json.loads(stdin.read(length))
+
+        title = request["params"].get("title", "")
+        if title == "crash":
+            os._exit(1)
+        if title == "sleep":
+            time.sleep(60)
+
+        header = json.dumps({"id": request["id"], "ok": True}).encode("utf-8")
+        body = title.encode("utf-8")
+        stdout.write(_LENGTH.pack(len(header)) + header + _LENGTH.pack(len(body)) + body)
+        stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
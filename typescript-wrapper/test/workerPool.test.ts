@@ -0,0 +1,72 @@
+/**
+ * Test suite for the DocLayer worker pool, run against a fake worker that needs no .NET runtime
+ */
+
+import { DocLayerClient, DocLayerWorkerPool, WorkerPoolError } from '../src/index';
+import * as path from 'path';
+import * as fs from 'fs';
+
+const FAKE_WORKER_PATH = path.join(__dirname, 'fixtures', 'fake_worker');
+const TEST_OUTPUT_DIR = path.join(__dirname, 'test_outputs');
+
+describe('DocLayer Worker Pool', () => {
+  test('Crashed worker fails its request and is restarted', async () => {
+    const pool = new DocLayerWorkerPool({ pythonWrapperPath: FAKE_WORKER_PATH, poolSize: 1 });
+    try {
+      expect((await pool.createTitleSlide('before')).toString()).toBe('before');
+
+      await expect(pool.createTitleSlide('crash')).rejects.toThrow('Worker process exited unexpectedly');
+
+      // Served by the replacement worker
+      expect((await pool.createTitleSlide('after')).toString()).toBe('after');
+    } finally {
+      pool.close();
+    }
+  }, 30000);
+
+  test('Timed-out worker is not handed a retried request', async () => {
+    const pool = new DocLayerWorkerPool({ pythonWrapperPath: FAKE_WORKER_PATH, poolSize: 1, requestTimeoutMs: 500 });
+    try {
+      const retried = await pool.createTitleSlide('sleep').then(
+        () => { throw new Error('Expected the request to time out'); },
+        (error: Error) => {
+          expect(error.message).toMatch(/timed out/);
+          // Queued while the timed-out worker is still exiting
+          return pool.createTitleSlide('retried');
+        }
+      );
+      expect(retried.toString()).toBe('retried');
+    } finally {
+      pool.close();
+    }
+  }, 30000);
+
+  test('Pool gives up after repeated startup failures', async () => {
+    const pool = new DocLayerWorkerPool({
+      pythonPath: path.join(__dirname, 'no-such-python'),
+      poolSize: 1,
+      restartBackoffMs: 10,
+      maxStartupFailures: 3
+    });
+    try {
+      await expect(pool.createTitleSlide('queued')).rejects.toThrow(/failed to start 3 times in a row/);
+      await expect(pool.createTitleSlide('later')).rejects.toBeInstanceOf(WorkerPoolError);
+    } finally {
+      pool.close();
+    }
+  }, 30000);
+
+  test('Client routes calls through the pool when poolSize is set', async () => {
+    fs.mkdirSync(TEST_OUTPUT_DIR, { recursive: true });
+    const outputPath = path.join(TEST_OUTPUT_DIR, 'ts_test_pooled.pptx');
+
+    const client = new DocLayerClient({ pythonWrapperPath: FAKE_WORKER_PATH, poolSize: 1 });
+    try {
+      const buffer = await client.createTitleSlide(outputPath, { title: 'pooled' });
+      expect(buffer.toString()).toBe('pooled');
+      expect(fs.readFileSync(outputPath).toString()).toBe('pooled');
+    } finally {
+      client.close();
+    }
+  }, 30000);
+});